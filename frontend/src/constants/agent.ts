@@ -42,6 +42,13 @@ export const AGENT_SECTION_COMPONENT_TYPE = [
   "filtered_card_push_notification",
 ] as const;
 
+// rows appended to an existing filtered_line_chart, merged into it
+export const LINE_CHART_DELTA_COMPONENT_TYPE = "filtered_line_chart_delta";
+
+// notifications appended to an existing filtered_card_push_notification
+export const CARD_PUSH_DELTA_COMPONENT_TYPE =
+  "filtered_card_push_notification_delta";
+
 // multi section component type
 export const AGENT_MULTI_SECTION_COMPONENT_TYPE = ["report"] as const;
 
@@ -1,5 +1,9 @@
 import { create } from "mutative";
-import { AGENT_SECTION_COMPONENT_TYPE } from "@/constants/agent";
+import {
+  AGENT_SECTION_COMPONENT_TYPE,
+  CARD_PUSH_DELTA_COMPONENT_TYPE,
+  LINE_CHART_DELTA_COMPONENT_TYPE,
+} from "@/constants/agent";
 import type {
   AgentConversationsStore,
   ChatItem,
@@ -110,6 +114,58 @@ function handleChatItemEvent(
   addOrUpdateItem(task, data, event);
 }
 
+// Merge the rows of a line chart delta into the chart it belongs to.
+// A row with the same x axis value as the chart's last row replaces it.
+function mergeLineChartDelta(draft: AgentConversationsStore, data: ChatItem) {
+  if (!hasContent(data)) return;
+  const { conversation } = ensurePath(draft, data);
+  const { chart_id, data: rows } = JSON.parse(data.payload.content);
+
+  const section = conversation.sections.filtered_line_chart;
+  const chart = section?.tasks[data.task_id]?.items.find(
+    (item) => item.item_id === chart_id,
+  );
+  if (!chart || !hasContent(chart)) return;
+
+  const content = JSON.parse(chart.payload.content);
+  const table: unknown[][] = JSON.parse(content.data);
+  for (const row of JSON.parse(rows) as unknown[][]) {
+    const last = table[table.length - 1];
+    if (table.length > 1 && last[0] === row[0]) {
+      table[table.length - 1] = row;
+    } else {
+      table.push(row);
+    }
+  }
+  content.data = JSON.stringify(table);
+  chart.payload.content = JSON.stringify(content);
+}
+
+// Append the notifications of a card push delta to the card they extend,
+// skipping ids the card already holds (e.g. after a replay)
+function mergeCardPushDelta(draft: AgentConversationsStore, data: ChatItem) {
+  if (!hasContent(data)) return;
+  const { conversation } = ensurePath(draft, data);
+  const { card_id, notifications } = JSON.parse(data.payload.content);
+
+  const section = conversation.sections.filtered_card_push_notification;
+  const card = section?.tasks[data.task_id]?.items.find(
+    (item) => item.item_id === card_id,
+  );
+  if (!card || !hasContent(card)) return;
+
+  const existing: { notification_id?: number }[] = JSON.parse(
+    card.payload.content,
+  );
+  const lastId = Math.max(0, ...existing.map((n) => n.notification_id ?? 0));
+  for (const notification of notifications) {
+    if ((notification.notification_id ?? 0) > lastId) {
+      existing.push(notification);
+    }
+  }
+  card.payload.content = JSON.stringify(existing);
+}
+
 // Core event processor - processes a single SSE event
 function processSSEEvent(draft: AgentConversationsStore, sseData: SSEData) {
   const { event, data } = sseData;
@@ -119,6 +175,15 @@ function processSSEEvent(draft: AgentConversationsStore, sseData: SSEData) {
     case "component_generator": {
       const component_type = data.payload.component_type;
 
+      if ((component_type as string) === LINE_CHART_DELTA_COMPONENT_TYPE) {
+        mergeLineChartDelta(draft, { ...data, component_type });
+        break;
+      }
+      if ((component_type as string) === CARD_PUSH_DELTA_COMPONENT_TYPE) {
+        mergeCardPushDelta(draft, { ...data, component_type });
+        break;
+      }
+
       switch (component_type) {
         case "scheduled_task_result":
         case "filtered_line_chart":
@@ -29,7 +29,8 @@ Usage Example:
     ```
 """
 
-from .akshare_adapter import AKShareAdapter
+# Asset info cache
+from .asset_metadata import AssetMetadataCache
 
 # Base adapter classes
 from .base import (
@@ -53,6 +54,26 @@ from .manager import (
     reset_managers,
 )
 
+# Market calendars
+from .market_calendar import (
+    MarketCalendar,
+    get_market_calendar,
+    is_market_open,
+    reset_market_calendars,
+)
+
+# Upstream rate limiting
+from .rate_limit import (
+    Priority,
+    RateLimiter,
+    get_rate_limiter,
+    request_priority,
+    reset_rate_limiter,
+)
+
+# Offline search index
+from .search_index import IndexedAsset, LocalAssetIndex
+
 # Core types and data structures
 from .types import (
     Asset,
@@ -69,14 +90,29 @@ from .types import (
     WatchlistItem,
 )
 
-# Specific adapter implementations
-from .yfinance_adapter import YFinanceAdapter
-
 # Note: High-level asset service functions have been moved to valuecell.services.assets
 # Import from there for asset search, price retrieval, and watchlist operations
 
 __version__ = "1.0.0"
 
+# Specific adapter implementations, imported on first access because their
+# data libraries (yfinance, akshare, pandas) take seconds to import
+_LAZY_ADAPTERS = {
+    "AKShareAdapter": ".akshare_adapter",
+    "YFinanceAdapter": ".yfinance_adapter",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ADAPTERS:
+        from importlib import import_module
+
+        adapter = getattr(import_module(_LAZY_ADAPTERS[name], __name__), name)
+        globals()[name] = adapter
+        return adapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Types
     "Asset",
@@ -107,4 +143,20 @@ __all__ = [
     "AssetI18nService",
     "get_asset_i18n_service",
     "reset_asset_i18n_service",
+    # Search
+    "IndexedAsset",
+    "LocalAssetIndex",
+    # Asset info cache
+    "AssetMetadataCache",
+    # Market calendars
+    "MarketCalendar",
+    "get_market_calendar",
+    "is_market_open",
+    "reset_market_calendars",
+    # Rate limiting
+    "Priority",
+    "RateLimiter",
+    "get_rate_limiter",
+    "request_priority",
+    "reset_rate_limiter",
 ]
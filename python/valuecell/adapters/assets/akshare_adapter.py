@@ -17,7 +17,9 @@ try:
 except ImportError:
     ak = None
 
+from .akshare_snapshot import SnapshotMarket, SpotSnapshotCache
 from .base import AdapterCapability, BaseDataAdapter
+from .market_calendar import get_market_calendar
 from .types import (
     Asset,
     AssetPrice,
@@ -34,6 +36,25 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Rate limit buckets of the hosts AKShare scrapes
+EASTMONEY_UPSTREAM = "eastmoney"
+XUEQIU_UPSTREAM = "xueqiu"
+SINA_UPSTREAM = "sina"
+
+# Exchange whose trading calendar governs each spot snapshot
+SNAPSHOT_MARKET_EXCHANGES = {
+    SnapshotMarket.A_SHARES: Exchange.SSE,
+    SnapshotMarket.HK_STOCKS: Exchange.HKEX,
+    SnapshotMarket.HK_INDICES: Exchange.HKEX,
+    SnapshotMarket.US_STOCKS: Exchange.NASDAQ,
+}
+
+
+def is_snapshot_market_open(market: SnapshotMarket) -> bool:
+    """Check whether a snapshot market is trading, per its calendar."""
+    calendar = get_market_calendar(SNAPSHOT_MARKET_EXCHANGES[market])
+    return calendar is None or calendar.is_open()
+
 
 class AKShareAdapter(BaseDataAdapter):
     """AKShare data adapter for Chinese financial markets."""
@@ -42,7 +63,9 @@ class AKShareAdapter(BaseDataAdapter):
         """Initialize AKShare adapter.
 
         Args:
-            **kwargs: Additional configuration parameters
+            **kwargs: Additional configuration parameters, e.g. ``snapshot_enabled``
+                (serve real-time prices from whole-market spot tables),
+                ``snapshot_interval`` and ``snapshot_max_stale`` (seconds)
         """
         super().__init__(DataSource.AKSHARE, **kwargs)
 
@@ -129,6 +152,29 @@ class AKShareAdapter(BaseDataAdapter):
         # Special exchange code for US indices
         self.us_index_exchange_code = "100"
 
+        # Whole-market spot snapshots: one upstream call per market per interval
+        # instead of one minute-history download per ticker
+        self.snapshot_enabled = self.config.get("snapshot_enabled", True)
+        self.snapshot_cache = SpotSnapshotCache(
+            loaders={
+                SnapshotMarket.A_SHARES: lambda: self.call_upstream(
+                    EASTMONEY_UPSTREAM, ak.stock_zh_a_spot_em
+                ),
+                SnapshotMarket.HK_STOCKS: lambda: self.call_upstream(
+                    EASTMONEY_UPSTREAM, ak.stock_hk_spot_em
+                ),
+                SnapshotMarket.HK_INDICES: lambda: self.call_upstream(
+                    EASTMONEY_UPSTREAM, ak.stock_hk_index_spot_em
+                ),
+                SnapshotMarket.US_STOCKS: lambda: self.call_upstream(
+                    EASTMONEY_UPSTREAM, ak.stock_us_spot_em
+                ),
+            },
+            refresh_interval=self.config.get("snapshot_interval", 30),
+            max_stale=self.config.get("snapshot_max_stale", 300),
+            is_open=is_snapshot_market_open,
+        )
+
         # Reverse mapping for converting AKShare format back to internal format
         self.us_exchange_codes_reverse = {
             v: k for k, v in self.us_exchange_codes.items()
@@ -289,6 +335,69 @@ class AKShareAdapter(BaseDataAdapter):
         """AKShare does not support search assets."""
         return []
 
+    def get_symbol_list(self) -> List[AssetSearchResult]:
+        """List all securities from the whole-market spot snapshots.
+
+        Returns:
+            Search results for every A-share, HK stock, HK index and US stock
+            listed in the spot tables
+        """
+        # market -> (asset type, name language, country, code -> internal ticker)
+        markets = {
+            SnapshotMarket.A_SHARES: (
+                AssetType.STOCK,
+                "zh-Hans",
+                "CN",
+                lambda code: self.convert_to_internal_ticker(code),
+            ),
+            SnapshotMarket.HK_STOCKS: (
+                AssetType.STOCK,
+                "zh-Hant",
+                "HK",
+                lambda code: f"{Exchange.HKEX.value}:{code}",
+            ),
+            SnapshotMarket.HK_INDICES: (
+                AssetType.INDEX,
+                "zh-Hant",
+                "HK",
+                lambda code: f"{Exchange.HKEX.value}:{code}",
+            ),
+            SnapshotMarket.US_STOCKS: (
+                AssetType.STOCK,
+                "zh-Hans",
+                "US",
+                lambda code: self.convert_to_internal_ticker(code),
+            ),
+        }
+
+        results = []
+        for market, (asset_type, language, country, to_ticker) in markets.items():
+            snapshot = self.snapshot_cache.get_snapshot(market)
+            if snapshot is None:
+                continue
+
+            for code, quote in snapshot.quotes.items():
+                ticker = to_ticker(code)
+                exchange_str = ticker.split(":", 1)[0]
+                try:
+                    exchange = Exchange(exchange_str)
+                except ValueError:
+                    continue
+
+                names = {language: quote.name} if quote.name else {}
+                results.append(
+                    AssetSearchResult(
+                        ticker=ticker,
+                        asset_type=asset_type,
+                        names=names,
+                        exchange=exchange.value,
+                        country=country,
+                        currency=self._get_currency(exchange),
+                    )
+                )
+
+        return results
+
     def __get_xq_symbol(self, ticker: str) -> str:
         """Get XQ symbol for a specific asset.
         Args:
@@ -364,8 +473,12 @@ class AKShareAdapter(BaseDataAdapter):
             # A-shares market (SSE, SZSE, BSE)
             if exchange in [Exchange.SSE, Exchange.SZSE, Exchange.BSE]:
                 try:
-                    df = ak.stock_individual_basic_info_xq(
-                        symbol=xq_symbol, token=os.getenv("XUEQIU_TOKEN", None)
+                    df = self.call_upstream(
+                        XUEQIU_UPSTREAM,
+                        ak.stock_individual_basic_info_xq,
+                        symbol=xq_symbol,
+                        token=os.getenv("XUEQIU_TOKEN", None),
+                        expect_data=False,
                     )
                 except Exception as e:
                     logger.error(
@@ -377,8 +490,12 @@ class AKShareAdapter(BaseDataAdapter):
             # Hong Kong stock market
             elif exchange == Exchange.HKEX:
                 try:
-                    df = ak.stock_individual_basic_info_hk_xq(
-                        symbol=xq_symbol, token=os.getenv("XUEQIU_TOKEN", None)
+                    df = self.call_upstream(
+                        XUEQIU_UPSTREAM,
+                        ak.stock_individual_basic_info_hk_xq,
+                        symbol=xq_symbol,
+                        token=os.getenv("XUEQIU_TOKEN", None),
+                        expect_data=False,
                     )
                 except Exception as e:
                     logger.error(
@@ -390,8 +507,12 @@ class AKShareAdapter(BaseDataAdapter):
             # US stock market (NASDAQ, NYSE, AMEX)
             elif exchange in [Exchange.NASDAQ, Exchange.NYSE, Exchange.AMEX]:
                 try:
-                    df = ak.stock_individual_basic_info_us_xq(
-                        symbol=xq_symbol, token=os.getenv("XUEQIU_TOKEN", None)
+                    df = self.call_upstream(
+                        XUEQIU_UPSTREAM,
+                        ak.stock_individual_basic_info_us_xq,
+                        symbol=xq_symbol,
+                        token=os.getenv("XUEQIU_TOKEN", None),
+                        expect_data=False,
                     )
                 except Exception as e:
                     logger.error(
@@ -592,10 +713,94 @@ class AKShareAdapter(BaseDataAdapter):
             )
             return None
 
+    def _get_snapshot_target(
+        self, ticker: str, exchange: Exchange, symbol: str
+    ) -> Optional[tuple]:
+        """Resolve which spot snapshot (and row code) can price a ticker.
+
+        Args:
+            ticker: Asset ticker in internal format
+            exchange: Exchange enum
+            symbol: Symbol part of the ticker
+
+        Returns:
+            (SnapshotMarket, code) tuple, or None if no snapshot covers the ticker
+        """
+        if exchange == Exchange.HKEX:
+            # HK indices always come from the index spot table
+            if self._is_hk_index(ticker):
+                return SnapshotMarket.HK_INDICES, symbol
+            if self.snapshot_enabled:
+                return SnapshotMarket.HK_STOCKS, symbol
+            return None
+
+        if not self.snapshot_enabled:
+            return None
+
+        if exchange in [Exchange.SSE, Exchange.SZSE, Exchange.BSE]:
+            # The A-share spot table only lists stocks and codes are shared
+            # across exchanges (SSE:000001 is an index, SZSE:000001 a stock),
+            # so only use it when the code prefix belongs to this exchange
+            if self.convert_to_internal_ticker(symbol) != ticker:
+                return None
+            return SnapshotMarket.A_SHARES, symbol
+
+        if exchange in [Exchange.NASDAQ, Exchange.NYSE, Exchange.AMEX]:
+            # US indices are not part of the US spot table
+            if self._is_us_index(ticker):
+                return None
+            return SnapshotMarket.US_STOCKS, self.convert_to_source_ticker(ticker)
+
+        return None
+
+    def _get_snapshot_price(
+        self, ticker: str, exchange: Exchange, symbol: str
+    ) -> Optional[AssetPrice]:
+        """Get real-time price for a ticker from its market's spot snapshot.
+
+        Args:
+            ticker: Asset ticker in internal format
+            exchange: Exchange enum
+            symbol: Symbol part of the ticker
+
+        Returns:
+            AssetPrice built from the snapshot row, or None if not covered
+        """
+        target = self._get_snapshot_target(ticker, exchange, symbol)
+        if target is None:
+            return None
+
+        market, code = target
+        snapshot = self.snapshot_cache.get_snapshot(market)
+        if snapshot is None:
+            return None
+
+        quote = snapshot.get(code)
+        # Suspended securities are listed without a latest price
+        if quote is None or quote.price is None:
+            return None
+
+        return AssetPrice(
+            ticker=ticker,
+            price=quote.price,
+            currency=self._get_currency(exchange),
+            timestamp=snapshot.as_of,
+            volume=quote.volume,
+            open_price=quote.open if quote.open else None,
+            high_price=quote.high,
+            low_price=quote.low,
+            close_price=quote.price,
+            change=quote.change,
+            change_percent=quote.change_percent,
+            market_cap=quote.market_cap,
+            source=DataSource.AKSHARE,
+        )
+
     def get_real_time_price(self, ticker: str) -> Optional[AssetPrice]:
-        """Get real-time price data for an asset using Eastmoney 1-minute API.
+        """Get real-time price data for an asset.
 
-        This method fetches the latest 1-minute price data to get real-time information.
+        Prices are served from the whole-market spot snapshot when the ticker's
+        market has one; otherwise the latest 1-minute price data is fetched.
         Supports US stocks, Hong Kong stocks, and A-shares.
 
         Args:
@@ -617,6 +822,10 @@ class AKShareAdapter(BaseDataAdapter):
                 logger.warning(f"Unknown exchange: {exchange_str}")
                 return None
 
+            snapshot_price = self._get_snapshot_price(ticker, exchange, symbol)
+            if snapshot_price:
+                return snapshot_price
+
             # Convert to AKShare format
             source_ticker = self.convert_to_source_ticker(ticker)
 
@@ -630,7 +839,9 @@ class AKShareAdapter(BaseDataAdapter):
             if exchange in [Exchange.SSE, Exchange.SZSE, Exchange.BSE]:
                 try:
                     # Get 1-minute data (returns recent 5 trading days, no adjustment)
-                    df = ak.stock_zh_a_hist_min_em(
+                    df = self.call_upstream(
+                        EASTMONEY_UPSTREAM,
+                        ak.stock_zh_a_hist_min_em,
                         symbol=symbol,
                         start_date=start_date.strftime("%Y-%m-%d %H:%M:%S"),
                         end_date=end_date.strftime("%Y-%m-%d %H:%M:%S"),
@@ -649,50 +860,16 @@ class AKShareAdapter(BaseDataAdapter):
                 is_index = self._is_hk_index(ticker)
 
                 if is_index:
-                    try:
-                        # For HK indices, use index spot data API
-                        df_spot = ak.stock_hk_index_spot_em()
-                        if df_spot is not None and not df_spot.empty:
-                            # Find the matching index
-                            # Try different possible column names
-                            code_col = None
-                            for col in ["代码", "symbol", "code"]:
-                                if col in df_spot.columns:
-                                    code_col = col
-                                    break
-
-                            if code_col:
-                                mask = (
-                                    df_spot[code_col].astype(str).str.upper()
-                                    == symbol.upper()
-                                )
-                                matching_rows = df_spot[mask]
-
-                                if not matching_rows.empty:
-                                    row = matching_rows.iloc[0]
-                                    # Extract price data
-                                    price_col = (
-                                        self._get_field_name(df_spot, "price", exchange)
-                                        or "最新价"
-                                    )
-                                    if price_col in row:
-                                        price = AssetPrice(
-                                            ticker=ticker,
-                                            price=Decimal(str(row[price_col])),
-                                            currency=self._get_currency(exchange),
-                                            timestamp=datetime.now(),
-                                            source=DataSource.AKSHARE,
-                                        )
-                                        return price
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching HK index spot data for {symbol}: {e}"
-                        )
-                        return None
+                    # HK indices are only available from the index spot table,
+                    # which was already consulted through the snapshot cache
+                    logger.warning(f"No HK index spot data found for {symbol}")
+                    return None
                 else:
                     try:
                         # Get 1-minute data for HK stocks
-                        df = ak.stock_hk_hist_min_em(
+                        df = self.call_upstream(
+                            EASTMONEY_UPSTREAM,
+                            ak.stock_hk_hist_min_em,
                             symbol=symbol,
                             period="1",
                             adjust="",
@@ -716,7 +893,11 @@ class AKShareAdapter(BaseDataAdapter):
                     try:
                         sina_symbol = self._get_us_index_symbol_for_sina(ticker)
                         if sina_symbol:
-                            df_hist = ak.index_us_stock_sina(symbol=sina_symbol)
+                            df_hist = self.call_upstream(
+                                SINA_UPSTREAM,
+                                ak.index_us_stock_sina,
+                                symbol=sina_symbol,
+                            )
                             if df_hist is not None and not df_hist.empty:
                                 # Get the latest row
                                 latest = df_hist.iloc[-1]
@@ -749,7 +930,11 @@ class AKShareAdapter(BaseDataAdapter):
                 else:
                     try:
                         # US stock minute data API returns latest data
-                        df = ak.stock_us_hist_min_em(symbol=source_ticker)
+                        df = self.call_upstream(
+                            EASTMONEY_UPSTREAM,
+                            ak.stock_us_hist_min_em,
+                            symbol=source_ticker,
+                        )
                     except Exception as e:
                         logger.error(
                             f"Error fetching US stock real-time data for {source_ticker}: {e}"
@@ -781,6 +966,42 @@ class AKShareAdapter(BaseDataAdapter):
             )
             return None
 
+    def get_multiple_prices(
+        self, tickers: List[str]
+    ) -> Dict[str, Optional[AssetPrice]]:
+        """Get real-time prices for multiple assets.
+
+        Tickers covered by a spot snapshot are answered from it, so each market
+        costs at most one upstream call. Remaining tickers fall back to
+        individual lookups.
+
+        Args:
+            tickers: List of asset tickers in internal format
+
+        Returns:
+            Dictionary mapping tickers to price data
+        """
+        results: Dict[str, Optional[AssetPrice]] = {}
+        remaining: List[str] = []
+
+        for ticker in tickers:
+            try:
+                exchange_str, symbol = ticker.split(":", 1)
+                price = self._get_snapshot_price(ticker, Exchange(exchange_str), symbol)
+            except Exception as e:
+                logger.debug(f"Snapshot lookup failed for {ticker}: {e}")
+                price = None
+
+            if price:
+                results[ticker] = price
+            else:
+                remaining.append(ticker)
+
+        if remaining:
+            results.update(super().get_multiple_prices(remaining))
+
+        return results
+
     def get_historical_prices(
         self,
         ticker: str,
@@ -870,7 +1091,9 @@ class AKShareAdapter(BaseDataAdapter):
             # A-shares (SSE, SZSE, BSE)
             if exchange in [Exchange.SSE, Exchange.SZSE, Exchange.BSE]:
                 try:
-                    df = ak.stock_zh_a_hist(
+                    df = self.call_upstream(
+                        EASTMONEY_UPSTREAM,
+                        ak.stock_zh_a_hist,
                         symbol=symbol,
                         period=period,
                         start_date=start_date_str,
@@ -891,7 +1114,11 @@ class AKShareAdapter(BaseDataAdapter):
                 if is_index:
                     try:
                         # For HK indices, use index daily data API
-                        df = ak.stock_hk_index_daily_em(symbol=symbol)
+                        df = self.call_upstream(
+                            EASTMONEY_UPSTREAM,
+                            ak.stock_hk_index_daily_em,
+                            symbol=symbol,
+                        )
                         # Note: This API returns all available historical data
                         # We need to filter by date range
                         if df is not None and not df.empty:
@@ -913,7 +1140,9 @@ class AKShareAdapter(BaseDataAdapter):
                         return []
                 else:
                     try:
-                        df = ak.stock_hk_hist(
+                        df = self.call_upstream(
+                            EASTMONEY_UPSTREAM,
+                            ak.stock_hk_hist,
                             symbol=symbol,
                             period=period,
                             start_date=start_date_str,
@@ -936,7 +1165,11 @@ class AKShareAdapter(BaseDataAdapter):
                         # For US indices, use Sina index API
                         sina_symbol = self._get_us_index_symbol_for_sina(ticker)
                         if sina_symbol:
-                            df = ak.index_us_stock_sina(symbol=sina_symbol)
+                            df = self.call_upstream(
+                                SINA_UPSTREAM,
+                                ak.index_us_stock_sina,
+                                symbol=sina_symbol,
+                            )
                             # Filter by date range
                             if df is not None and not df.empty:
                                 df["date"] = pd.to_datetime(df["date"])
@@ -951,7 +1184,9 @@ class AKShareAdapter(BaseDataAdapter):
                         return []
                 else:
                     try:
-                        df = ak.stock_us_hist(
+                        df = self.call_upstream(
+                            EASTMONEY_UPSTREAM,
+                            ak.stock_us_hist,
                             symbol=source_ticker,  # US stocks need exchange code prefix
                             period=period,
                             start_date=start_date_str,
@@ -1033,7 +1268,9 @@ class AKShareAdapter(BaseDataAdapter):
                 try:
                     # Note: 1-minute data only returns recent 5 trading days and cannot be adjusted
                     adjust = "" if period == "1" else "qfq"
-                    df = ak.stock_zh_a_hist_min_em(
+                    df = self.call_upstream(
+                        EASTMONEY_UPSTREAM,
+                        ak.stock_zh_a_hist_min_em,
                         symbol=symbol,
                         start_date=start_datetime_str,
                         end_date=end_datetime_str,
@@ -1050,7 +1287,9 @@ class AKShareAdapter(BaseDataAdapter):
             elif exchange == Exchange.HKEX:
                 try:
                     # Note: HK stock minute data doesn't support adjust parameter
-                    df = ak.stock_hk_hist_min_em(
+                    df = self.call_upstream(
+                        EASTMONEY_UPSTREAM,
+                        ak.stock_hk_hist_min_em,
                         symbol=symbol,
                         period=period,
                         adjust="",  # HK stocks don't support adjustment for minute data
@@ -1067,7 +1306,11 @@ class AKShareAdapter(BaseDataAdapter):
             elif exchange in [Exchange.NASDAQ, Exchange.NYSE, Exchange.AMEX]:
                 try:
                     # Note: US stock minute data API only returns latest data, doesn't support date range
-                    df = ak.stock_us_hist_min_em(symbol=source_ticker)
+                    df = self.call_upstream(
+                        EASTMONEY_UPSTREAM,
+                        ak.stock_us_hist_min_em,
+                        symbol=source_ticker,
+                    )
                 except Exception as e:
                     logger.error(
                         f"Error fetching US stock intraday data for {source_ticker}: {e}"
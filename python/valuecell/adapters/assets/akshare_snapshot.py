@@ -0,0 +1,292 @@
+"""Whole-market spot snapshots for the AKShare adapter.
+
+Eastmoney exposes "spot" tables that list the latest quote of every security
+in a market with a single request. This module fetches each market's table at
+most once per refresh interval, indexes the rows by code in memory and serves
+individual quote lookups from that index, so refreshing N tickers of the same
+market costs one upstream call instead of N.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Set
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotMarket(str, Enum):
+    """Markets that have a whole-market spot table."""
+
+    A_SHARES = "a_shares"
+    HK_STOCKS = "hk_stocks"
+    HK_INDICES = "hk_indices"
+    US_STOCKS = "us_stocks"
+
+
+# Standard field -> possible column names in the Eastmoney spot tables
+SPOT_FIELD_MAPPINGS: Dict[str, List[str]] = {
+    "code": ["代码", "symbol", "code"],
+    "name": ["名称", "name"],
+    "price": ["最新价", "price", "latest"],
+    "open": ["今开", "开盘价", "开盘", "open"],
+    "high": ["最高", "最高价", "high"],
+    "low": ["最低", "最低价", "low"],
+    "prev_close": ["昨收", "昨收价", "pre_close"],
+    "volume": ["成交量", "volume"],
+    "change": ["涨跌额", "change"],
+    "change_percent": ["涨跌幅", "change_percent"],
+    "market_cap": ["总市值", "market_cap"],
+}
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    """Convert a spot table cell to Decimal, treating NaN/blank as missing."""
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class SpotQuote:
+    """A single normalized row of a spot table."""
+
+    code: str
+    name: Optional[str] = None
+    price: Optional[Decimal] = None
+    open: Optional[Decimal] = None
+    high: Optional[Decimal] = None
+    low: Optional[Decimal] = None
+    prev_close: Optional[Decimal] = None
+    volume: Optional[Decimal] = None
+    change: Optional[Decimal] = None
+    change_percent: Optional[Decimal] = None
+    market_cap: Optional[Decimal] = None
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Immutable, code-indexed view of one market's spot table."""
+
+    market: SnapshotMarket
+    as_of: datetime
+    fetched_at: float
+    quotes: Dict[str, SpotQuote] = field(default_factory=dict)
+
+    def get(self, code: str) -> Optional[SpotQuote]:
+        """Look up a quote by security code (case-insensitive)."""
+        return self.quotes.get(code.strip().upper())
+
+    def __len__(self) -> int:
+        return len(self.quotes)
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        market: SnapshotMarket,
+        df: pd.DataFrame,
+        as_of: Optional[datetime] = None,
+        fetched_at: Optional[float] = None,
+    ) -> "MarketSnapshot":
+        """Build a snapshot from a raw spot DataFrame.
+
+        Args:
+            market: Market the table belongs to
+            df: Spot table as returned by AKShare
+            as_of: Wall-clock time the table was fetched
+            fetched_at: Monotonic time the table was fetched
+
+        Returns:
+            Snapshot indexed by upper-cased security code
+        """
+        columns: Dict[str, str] = {}
+        if df is not None:
+            for std_field, candidates in SPOT_FIELD_MAPPINGS.items():
+                for candidate in candidates:
+                    if candidate in df.columns:
+                        columns[std_field] = candidate
+                        break
+
+        quotes: Dict[str, SpotQuote] = {}
+        if df is not None and not df.empty and "code" in columns:
+            # to_dict is far cheaper than iterrows for tables with ~5k rows
+            for record in df.to_dict("records"):
+                raw_code = record.get(columns["code"])
+                if raw_code is None or (
+                    isinstance(raw_code, float) and pd.isna(raw_code)
+                ):
+                    continue
+                code = str(raw_code).strip().upper()
+                if not code:
+                    continue
+
+                values = {
+                    std_field: _to_decimal(record.get(column))
+                    for std_field, column in columns.items()
+                    if std_field not in ("code", "name")
+                }
+                name = record.get(columns["name"]) if "name" in columns else None
+                quotes[code] = SpotQuote(
+                    code=code,
+                    name=str(name) if name is not None else None,
+                    **values,
+                )
+
+        return cls(
+            market=market,
+            as_of=as_of or datetime.now(),
+            fetched_at=fetched_at if fetched_at is not None else time.monotonic(),
+            quotes=quotes,
+        )
+
+
+class SpotSnapshotCache:
+    """Refreshes and serves per-market spot snapshots.
+
+    Each market is fetched at most once per ``refresh_interval`` seconds.
+    Concurrent callers for the same market share a single in-flight fetch.
+    If a refresh fails, the previous snapshot keeps being served until
+    ``max_stale`` seconds have passed since it was fetched.
+
+    While a market is closed, a snapshot taken after the close stays fresh
+    until the market reopens, so no upstream calls are made in between.
+    """
+
+    def __init__(
+        self,
+        loaders: Dict[SnapshotMarket, Callable[[], pd.DataFrame]],
+        refresh_interval: float = 30.0,
+        max_stale: Optional[float] = 300.0,
+        is_open: Optional[Callable[[SnapshotMarket], bool]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize snapshot cache.
+
+        Args:
+            loaders: Market -> zero-argument callable returning its spot table
+            refresh_interval: Minimum seconds between upstream fetches per market
+            max_stale: Seconds a snapshot may still be served after failed
+                refreshes; None serves it indefinitely
+            is_open: Market -> whether it is trading now; None treats all
+                markets as always open
+            clock: Monotonic clock, injectable for tests
+        """
+        self.loaders = dict(loaders)
+        self.refresh_interval = refresh_interval
+        self.max_stale = max_stale
+        self.is_open = is_open
+        self._clock = clock
+        self._snapshots: Dict[SnapshotMarket, MarketSnapshot] = {}
+        # Time of the last attempt, successful or not, to avoid hammering
+        # upstream with retries while it is failing
+        self._last_attempt: Dict[SnapshotMarket, float] = {}
+        # Markets whose current snapshot was taken while they were closed
+        self._closed_snapshots: Set[SnapshotMarket] = set()
+        self._locks: Dict[SnapshotMarket, threading.Lock] = {
+            market: threading.Lock() for market in self.loaders
+        }
+
+    def supports(self, market: SnapshotMarket) -> bool:
+        """Check whether a loader is registered for the market."""
+        return market in self.loaders
+
+    def _market_closed(self, market: SnapshotMarket) -> bool:
+        if self.is_open is None:
+            return False
+        try:
+            return not self.is_open(market)
+        except Exception as e:
+            logger.debug(f"Market hours check failed for {market.value}: {e}")
+            return False
+
+    def _is_fresh(self, market: SnapshotMarket, now: float) -> bool:
+        if market in self._closed_snapshots:
+            if self._market_closed(market):
+                return True
+            # Reopened since the snapshot was taken
+            self._closed_snapshots.discard(market)
+            return False
+        last_attempt = self._last_attempt.get(market)
+        return last_attempt is not None and now - last_attempt < self.refresh_interval
+
+    def _usable(self, snapshot: Optional[MarketSnapshot], now: float) -> bool:
+        if snapshot is None:
+            return False
+        if self.max_stale is None or snapshot.market in self._closed_snapshots:
+            return True
+        return now - snapshot.fetched_at <= self.max_stale
+
+    def get_snapshot(self, market: SnapshotMarket) -> Optional[MarketSnapshot]:
+        """Get the current snapshot for a market, refreshing it if due.
+
+        Args:
+            market: Market to look up
+
+        Returns:
+            Snapshot or None if no usable snapshot could be obtained
+        """
+        if market not in self.loaders:
+            return None
+
+        now = self._clock()
+        if self._is_fresh(market, now):
+            snapshot = self._snapshots.get(market)
+            return snapshot if self._usable(snapshot, now) else None
+
+        with self._locks[market]:
+            # Another thread may have refreshed while we waited for the lock
+            now = self._clock()
+            if not self._is_fresh(market, now):
+                self._refresh(market, now)
+            snapshot = self._snapshots.get(market)
+            return snapshot if self._usable(snapshot, self._clock()) else None
+
+    def _refresh(self, market: SnapshotMarket, now: float) -> None:
+        self._last_attempt[market] = now
+        closed = self._market_closed(market)
+        try:
+            df = self.loaders[market]()
+        except Exception as e:
+            logger.warning(f"Failed to fetch {market.value} spot snapshot: {e}")
+            return
+
+        if df is None or df.empty:
+            logger.warning(f"Empty {market.value} spot snapshot, keeping previous")
+            return
+
+        snapshot = MarketSnapshot.from_dataframe(market, df, fetched_at=now)
+        self._snapshots[market] = snapshot
+        if closed:
+            self._closed_snapshots.add(market)
+        else:
+            self._closed_snapshots.discard(market)
+        logger.debug(f"Refreshed {market.value} spot snapshot: {len(snapshot)} rows")
+
+    def get_quote(self, market: SnapshotMarket, code: str) -> Optional[SpotQuote]:
+        """Look up a single quote, refreshing the market snapshot if due."""
+        snapshot = self.get_snapshot(market)
+        if snapshot is None:
+            return None
+        return snapshot.get(code)
+
+    def invalidate(self, market: Optional[SnapshotMarket] = None) -> None:
+        """Force the next lookup to refetch one market, or all markets."""
+        markets = [market] if market else list(self.loaders)
+        for m in markets:
+            self._last_attempt.pop(m, None)
+            self._snapshots.pop(m, None)
+            self._closed_snapshots.discard(m)
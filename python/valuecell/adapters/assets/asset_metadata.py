@@ -0,0 +1,407 @@
+"""Database-backed read-through cache for asset information.
+
+Asset info (names, exchange, sector, ...) rarely changes, yet fetching it
+takes a network round-trip through the data adapters. The cache keeps it in
+the ``assets`` table of the server database:
+
+- Fresh records are answered from the database.
+- Stale records are answered immediately while a background refresh runs
+  (stale-while-revalidate).
+- Only tickers without any record block on the adapters.
+
+Each record carries a ``refreshed_at`` timestamp; seeded records without one
+count as stale. The full adapter ``Asset`` is stored under the ``asset_info``
+key of the record's metadata, next to the flat fields other readers use.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .executor import get_adapter_executor
+from .rate_limit import Priority, request_priority
+from .types import Asset, AssetType, MarketInfo
+
+logger = logging.getLogger(__name__)
+
+# Age after which cached asset info is refreshed in the background
+DEFAULT_MAX_AGE = timedelta(days=1)
+
+# Minimum pause before retrying a ticker whose refresh failed
+DEFAULT_RETRY_INTERVAL = timedelta(minutes=5)
+
+# Failed tickers remembered for the retry pause, oldest forgotten first
+MAX_FAILED_TICKERS = 10_000
+
+# Shared executor key of background refreshes
+METADATA_REFRESH_KEY = "asset-metadata"
+
+ASSET_INFO_KEY = "asset_info"
+
+
+def _utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize a timestamp to aware UTC; naive values are UTC already."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def asset_from_record(record) -> Optional[Asset]:
+    """Build an adapter Asset from an ``assets`` table row.
+
+    Records written by the cache hold the complete asset. Seeded records are
+    converted from their flat fields as far as possible.
+
+    Args:
+        record: Database Asset record
+
+    Returns:
+        Asset, or None if the record cannot be converted
+    """
+    metadata = record.asset_metadata or {}
+    stored = metadata.get(ASSET_INFO_KEY)
+    if isinstance(stored, dict):
+        try:
+            return Asset.model_validate(stored)
+        except Exception as e:
+            logger.debug(f"Invalid cached asset info for {record.symbol}: {e}")
+
+    symbol = record.symbol or ""
+    if ":" not in symbol:
+        return None
+
+    try:
+        asset_type = AssetType(record.asset_type)
+    except ValueError:
+        asset_type = AssetType.STOCK
+
+    try:
+        asset = Asset(
+            ticker=symbol,
+            asset_type=asset_type,
+            market_info=MarketInfo(
+                exchange=metadata.get("exchange") or symbol.split(":", 1)[0],
+                country=metadata.get("country") or "",
+                currency=metadata.get("currency") or "",
+                timezone=metadata.get("timezone") or "",
+            ),
+            is_active=record.is_active,
+        )
+    except Exception as e:
+        logger.debug(f"Could not convert asset record {symbol}: {e}")
+        return None
+
+    names = metadata.get("names")
+    if isinstance(names, dict):
+        for language, name in names.items():
+            if name:
+                asset.set_localized_name(language, name)
+    if record.name and not asset.get_localized_name("en-US"):
+        asset.set_localized_name("en-US", record.name)
+    if record.description:
+        asset.descriptions.setdefault("en-US", record.description)
+    if record.sector:
+        asset.properties.setdefault("sector", record.sector)
+    return asset
+
+
+def asset_record_fields(asset: Asset) -> Dict[str, Any]:
+    """Database record fields for an adapter Asset.
+
+    Args:
+        asset: Asset returned by a data adapter
+
+    Returns:
+        Keyword arguments for ``AssetRepository.upsert_asset``, without
+        ``asset_metadata`` which callers merge with the existing record
+    """
+    names = asset.names.names
+    name = (
+        names.get("en-US")
+        or next((n for n in names.values() if n), None)
+        or asset.get_symbol()
+    )
+    return {
+        "symbol": asset.ticker,
+        "name": name,
+        "asset_type": asset.asset_type.value,
+        "description": asset.descriptions.get("en-US"),
+        "sector": asset.properties.get("sector"),
+        "is_active": asset.is_active,
+    }
+
+
+def asset_record_metadata(asset: Asset) -> Dict[str, Any]:
+    """Record metadata for an adapter Asset, including the full asset."""
+    return {
+        "exchange": asset.market_info.exchange,
+        "country": asset.market_info.country,
+        "currency": asset.market_info.currency,
+        "timezone": asset.market_info.timezone,
+        "names": dict(asset.names.names),
+        ASSET_INFO_KEY: asset.model_dump(mode="json"),
+    }
+
+
+class AssetMetadataCache:
+    """Read-through cache of asset info in the ``assets`` table."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Optional[Asset]],
+        repository=None,
+        max_age: timedelta = DEFAULT_MAX_AGE,
+        retry_interval: timedelta = DEFAULT_RETRY_INTERVAL,
+        max_workers: int = 4,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ):
+        """Initialize asset metadata cache.
+
+        Args:
+            fetch: Blocking fetcher of asset info, usually the adapter
+                manager's failover lookup
+            repository: Asset repository; defaults to the server's global one
+            max_age: Age after which records are refreshed in the background
+            retry_interval: Minimum pause before retrying a failed refresh
+            max_workers: Concurrent refreshes on the shared adapter executor
+            clock: Returns the current aware UTC time, injectable for tests
+        """
+        self.fetch = fetch
+        self._repository = repository
+        self.max_age = max_age
+        self.retry_interval = retry_interval
+        self.max_workers = max_workers
+        self._clock = clock
+        self._in_flight: Set[str] = set()
+        self._failed_at: Dict[str, datetime] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def repository(self):
+        """Lazy load asset repository to avoid circular imports."""
+        if self._repository is None:
+            from ...server.db.repositories.asset_repository import (
+                get_asset_repository,
+            )
+
+            self._repository = get_asset_repository()
+        return self._repository
+
+    def is_stale(self, record) -> bool:
+        """Check whether a record needs refreshing."""
+        refreshed_at = _utc(getattr(record, "refreshed_at", None))
+        return refreshed_at is None or self._clock() - refreshed_at >= self.max_age
+
+    def lookup(self, ticker: str) -> Optional[Asset]:
+        """Get cached asset info without blocking on the adapters.
+
+        Stale records are returned as they are and refreshed in the
+        background.
+
+        Args:
+            ticker: Asset ticker in internal format
+
+        Returns:
+            Cached asset, or None on a miss
+        """
+        try:
+            record = self.repository.get_asset_by_symbol(ticker)
+        except Exception as e:
+            logger.warning(f"Could not read cached asset info for {ticker}: {e}")
+            return None
+        if record is None:
+            return None
+
+        asset = asset_from_record(record)
+        if asset is not None and self.is_stale(record):
+            # Staleness is known already; skip the freshness query
+            self.refresh_in_background([ticker], force=True)
+        return asset
+
+    def store(self, asset: Asset) -> None:
+        """Write fetched asset info to the database."""
+        try:
+            existing = self.repository.get_asset_by_symbol(asset.ticker)
+            metadata = dict(existing.asset_metadata or {}) if existing else {}
+            metadata.update(asset_record_metadata(asset))
+            self.repository.upsert_asset(
+                **asset_record_fields(asset),
+                asset_metadata=metadata,
+                refreshed_at=self._clock(),
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache asset info for {asset.ticker}: {e}")
+
+    def get(self, ticker: str) -> Optional[Asset]:
+        """Get asset info, fetching it only if nothing is cached.
+
+        Args:
+            ticker: Asset ticker in internal format
+
+        Returns:
+            Asset information or None if not found
+        """
+        asset = self.lookup(ticker)
+        if asset is not None:
+            return asset
+        return self.refresh(ticker)
+
+    def refresh(self, ticker: str) -> Optional[Asset]:
+        """Fetch asset info from the adapters and cache it.
+
+        Returns:
+            Fetched asset, or None if the adapters found nothing
+        """
+        try:
+            asset = self.fetch(ticker)
+        except Exception as e:
+            logger.warning(f"Failed to fetch asset info for {ticker}: {e}")
+            asset = None
+
+        with self._lock:
+            self._failed_at.pop(ticker, None)
+            if asset is None:
+                self._remember_failure(ticker)
+
+        if asset is not None:
+            self.store(asset)
+        return asset
+
+    def _remember_failure(self, ticker: str) -> None:
+        """Record a failed refresh; the caller holds the lock."""
+        now = self._clock()
+        # Entries are in failure order: forget those past their retry pause
+        # and, beyond the bound, the oldest ones
+        for oldest, failed_at in list(self._failed_at.items()):
+            if (
+                now - failed_at < self.retry_interval
+                and len(self._failed_at) < MAX_FAILED_TICKERS
+            ):
+                break
+            del self._failed_at[oldest]
+        self._failed_at[ticker] = now
+
+    def _claim(self, tickers: Iterable[str]) -> List[str]:
+        """Mark tickers as being refreshed, skipping running and failed ones."""
+        now = self._clock()
+        claimed = []
+        with self._lock:
+            for ticker in dict.fromkeys(tickers):
+                if ticker in self._in_flight:
+                    continue
+                failed_at = self._failed_at.get(ticker)
+                if failed_at is not None and now - failed_at < self.retry_interval:
+                    continue
+                self._in_flight.add(ticker)
+                claimed.append(ticker)
+        return claimed
+
+    def _release(self, tickers: Iterable[str]) -> None:
+        with self._lock:
+            self._in_flight.difference_update(tickers)
+
+    def _select_stale(self, tickers: List[str]) -> List[str]:
+        """Filter tickers to those missing or stale, with a single query."""
+        try:
+            records = {
+                record.symbol: record
+                for record in self.repository.get_assets_by_symbols(tickers)
+            }
+        except Exception as e:
+            logger.warning(f"Could not read cached asset info: {e}")
+            records = {}
+        return [
+            ticker
+            for ticker in tickers
+            if ticker not in records or self.is_stale(records[ticker])
+        ]
+
+    def _submit_claimed(self, tickers: List[str]) -> List[Future]:
+        """Refresh claimed tickers on the shared executor at background priority."""
+        executor = get_adapter_executor()
+        executor.set_limit(METADATA_REFRESH_KEY, self.max_workers)
+        futures = []
+        # The executor carries the priority over to the refresh calls
+        with request_priority(Priority.BACKGROUND):
+            for ticker in tickers:
+                future = executor.submit(METADATA_REFRESH_KEY, self.refresh, ticker)
+                future.add_done_callback(
+                    lambda _, ticker=ticker: self._release([ticker])
+                )
+                futures.append(future)
+        return futures
+
+    def _refresh_stale_claimed(self, tickers: List[str]) -> None:
+        """Refresh the stale ones of claimed tickers without waiting for them."""
+        stale = self._select_stale(tickers)
+        self._release(set(tickers) - set(stale))
+        if stale:
+            self._submit_claimed(stale)
+
+    def refresh_many(self, tickers: Iterable[str], force: bool = False) -> int:
+        """Refresh missing and stale records of many tickers.
+
+        Records are loaded with a single query; only tickers that need it are
+        fetched, concurrently on the shared adapter executor and at
+        background priority.
+
+        Args:
+            tickers: Asset tickers in internal format
+            force: Refresh fresh records as well
+
+        Returns:
+            Number of tickers refreshed
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not force:
+            tickers = self._select_stale(tickers)
+
+        claimed = self._claim(tickers)
+        if not claimed:
+            return 0
+
+        refreshed = 0
+        for future in self._submit_claimed(claimed):
+            try:
+                if future.result() is not None:
+                    refreshed += 1
+            except Exception as e:
+                logger.debug(f"Asset info refresh failed: {e}")
+        logger.info(f"Refreshed asset info for {refreshed}/{len(claimed)} tickers")
+        return refreshed
+
+    def refresh_in_background(
+        self, tickers: Iterable[str], force: bool = False
+    ) -> None:
+        """Refresh tickers on the shared adapter executor without waiting.
+
+        Tickers already refreshing or recently failed are skipped before any
+        work is scheduled, so repeated calls for a hot ticker stay cheap.
+
+        Args:
+            tickers: Asset tickers in internal format
+            force: Refresh fresh records as well
+        """
+        claimed = self._claim(tickers)
+        if not claimed:
+            return
+        if force:
+            self._submit_claimed(claimed)
+            return
+
+        # Check freshness off the caller's thread; the refreshes it starts
+        # are submitted, not waited for
+        executor = get_adapter_executor()
+        executor.set_limit(METADATA_REFRESH_KEY, self.max_workers)
+        future = executor.submit(
+            METADATA_REFRESH_KEY, self._refresh_stale_claimed, claimed
+        )
+
+        def release_on_error(future: Future) -> None:
+            if future.cancelled() or future.exception() is not None:
+                logger.debug(f"Background asset info refresh failed: {future}")
+                self._release(claimed)
+
+        future.add_done_callback(release_on_error)
@@ -4,12 +4,16 @@ This module defines the abstract base classes that all data source adapters
 must implement to ensure consistent behavior across different providers.
 """
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
+from .executor import DEFAULT_ADAPTER_CONCURRENCY, get_adapter_executor
+from .rate_limit import get_rate_limiter
 from .types import (
     Asset,
     AssetPrice,
@@ -54,6 +58,10 @@ class BaseDataAdapter(ABC):
         self.api_key = api_key
         self.config = kwargs
         self.logger = logging.getLogger(f"{__name__}.{source.value}")
+        # Maximum concurrent blocking calls on the shared adapter executor
+        self.max_concurrency = kwargs.get(
+            "max_concurrency", DEFAULT_ADAPTER_CONCURRENCY
+        )
 
         # Initialize adapter-specific configuration
         self._initialize()
@@ -140,6 +148,17 @@ class BaseDataAdapter(ABC):
                 results[ticker] = None
         return results
 
+    def get_symbol_list(self) -> List[AssetSearchResult]:
+        """Get the full list of symbols this adapter can enumerate offline.
+
+        Used to populate the local search index. Adapters without a cheap
+        listing endpoint return an empty list.
+
+        Returns:
+            List of assets known to the data source
+        """
+        return []
+
     def validate_ticker(self, ticker: str) -> bool:
         """Validate if a ticker format is supported by this adapter.
 
@@ -222,3 +241,82 @@ class BaseDataAdapter(ABC):
         for cap in capabilities:
             exchanges.update(cap.exchanges)
         return exchanges
+
+    def submit_blocking(self, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Run a blocking call on the shared adapter executor.
+
+        Calls are limited to ``max_concurrency`` at a time for this data source.
+
+        Args:
+            fn: Blocking callable, usually one of this adapter's methods
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Future resolving to the call's result
+        """
+        executor = get_adapter_executor()
+        executor.set_limit(self.source.value, self.max_concurrency)
+        return executor.submit(self.source.value, fn, *args, **kwargs)
+
+    async def run_blocking(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Await a blocking call on the shared adapter executor."""
+        return await asyncio.wrap_future(self.submit_blocking(fn, *args, **kwargs))
+
+    def call_upstream(
+        self, upstream: str, fn: Callable, *args: Any, **kwargs: Any
+    ) -> Any:
+        """Call an upstream endpoint under its shared rate limit.
+
+        Waits for a token of the upstream's bucket at the priority of the
+        current context and reports 429-like errors and empty answers back to
+        the limiter, which then backs off. Calls that may legitimately come
+        back empty (searches, lookups of user-supplied tickers) pass
+        ``expect_data=False``.
+
+        Args:
+            upstream: Upstream host or endpoint name, e.g. "yahoo"
+            fn: Callable performing the network request
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Result of ``fn``
+        """
+        return get_rate_limiter().call(upstream, fn, *args, **kwargs)
+
+    # Async variants. Adapters backed by blocking libraries inherit these, which
+    # run the sync methods on the shared executor; native async adapters may
+    # override them.
+
+    async def search_assets_async(
+        self, query: AssetSearchQuery
+    ) -> List[AssetSearchResult]:
+        """Async variant of ``search_assets``."""
+        return await self.run_blocking(self.search_assets, query)
+
+    async def get_asset_info_async(self, ticker: str) -> Optional[Asset]:
+        """Async variant of ``get_asset_info``."""
+        return await self.run_blocking(self.get_asset_info, ticker)
+
+    async def get_real_time_price_async(self, ticker: str) -> Optional[AssetPrice]:
+        """Async variant of ``get_real_time_price``."""
+        return await self.run_blocking(self.get_real_time_price, ticker)
+
+    async def get_historical_prices_async(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> List[AssetPrice]:
+        """Async variant of ``get_historical_prices``."""
+        return await self.run_blocking(
+            self.get_historical_prices, ticker, start_date, end_date, interval
+        )
+
+    async def get_multiple_prices_async(
+        self, tickers: List[str]
+    ) -> Dict[str, Optional[AssetPrice]]:
+        """Async variant of ``get_multiple_prices``."""
+        return await self.run_blocking(self.get_multiple_prices, tickers)
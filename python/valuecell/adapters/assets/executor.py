@@ -0,0 +1,167 @@
+"""Shared executor for blocking data adapter calls.
+
+Data source libraries (yfinance, akshare, ...) are synchronous. Instead of
+creating thread pools per call, all blocking adapter work runs on one
+process-wide, bounded thread pool. Each adapter additionally has its own
+concurrency limit: calls beyond the limit wait in a per-adapter queue
+without occupying a worker thread, so a burst against one slow upstream
+cannot starve the others.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_ADAPTER_CONCURRENCY = 8
+
+
+class AdapterExecutor:
+    """Bounded thread pool with per-key concurrency limits."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        default_limit: int = DEFAULT_ADAPTER_CONCURRENCY,
+    ):
+        """Initialize executor.
+
+        Args:
+            max_workers: Total number of worker threads
+            default_limit: Concurrency limit for keys without an explicit limit
+        """
+        self.max_workers = max_workers
+        self.default_limit = default_limit
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="adapter-worker"
+        )
+        self._limits: Dict[str, int] = {}
+        self._active: Dict[str, int] = {}
+        self._queues: Dict[str, Deque[Tuple[Future, Callable, tuple, dict]]] = {}
+        self._lock = threading.Lock()
+
+    def set_limit(self, key: str, limit: int) -> None:
+        """Set the maximum number of concurrent calls for a key."""
+        with self._lock:
+            self._limits[key] = max(1, limit)
+
+    def get_limit(self, key: str) -> int:
+        """Get the concurrency limit for a key."""
+        return self._limits.get(key, self.default_limit)
+
+    def submit(self, key: str, fn: Callable, *args: Any, **kwargs: Any) -> Future:
+        """Schedule a blocking call under the key's concurrency limit.
+
+        Args:
+            key: Concurrency group, usually the data source name
+            fn: Blocking callable
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Future resolving to the call's result
+        """
+        future: Future = Future()
+        # Carry the caller's context variables (e.g. request priority) along
+        args = (fn, *args)
+        fn = contextvars.copy_context().run
+        with self._lock:
+            if self._active.get(key, 0) < self.get_limit(key):
+                self._active[key] = self._active.get(key, 0) + 1
+                start = True
+            else:
+                self._queues.setdefault(key, deque()).append((future, fn, args, kwargs))
+                start = False
+
+        if start:
+            self._dispatch(key, future, fn, args, kwargs)
+        return future
+
+    async def run(self, key: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking call without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit(key, fn, *args, **kwargs))
+
+    def _dispatch(
+        self, key: str, future: Future, fn: Callable, args: tuple, kwargs: dict
+    ) -> None:
+        # Skip calls cancelled while they were queued
+        if not future.set_running_or_notify_cancel():
+            self._release(key)
+            return
+
+        def call():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                self._release(key)
+
+        try:
+            self._pool.submit(call)
+        except RuntimeError as e:
+            # Pool was shut down
+            future.set_exception(e)
+            self._release(key)
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue:
+                future, fn, args, kwargs = queue.popleft()
+            else:
+                self._active[key] -= 1
+                return
+        # The slot passes straight to the next queued call
+        self._dispatch(key, future, fn, args, kwargs)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Active and queued call counts per key."""
+        with self._lock:
+            keys = set(self._active) | set(self._queues)
+            return {
+                key: {
+                    "active": self._active.get(key, 0),
+                    "queued": len(self._queues.get(key, ())),
+                    "limit": self.get_limit(key),
+                }
+                for key in keys
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool."""
+        self._pool.shutdown(wait=wait)
+
+
+# Global executor instance
+_adapter_executor: Optional[AdapterExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_adapter_executor() -> AdapterExecutor:
+    """Get the process-wide adapter executor."""
+    global _adapter_executor
+    if _adapter_executor is None:
+        with _executor_lock:
+            if _adapter_executor is None:
+                max_workers = int(
+                    os.getenv("VALUECELL_ADAPTER_WORKERS", DEFAULT_MAX_WORKERS)
+                )
+                _adapter_executor = AdapterExecutor(max_workers=max_workers)
+    return _adapter_executor
+
+
+def reset_adapter_executor() -> None:
+    """Shut down and drop the global adapter executor (mainly for testing)."""
+    global _adapter_executor
+    with _executor_lock:
+        if _adapter_executor is not None:
+            _adapter_executor.shutdown(wait=False)
+        _adapter_executor = None
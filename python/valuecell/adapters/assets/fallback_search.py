@@ -0,0 +1,348 @@
+"""LLM-based fallback asset search.
+
+When no adapter returns a result for a query, an LLM proposes candidate
+tickers which are then validated against the data adapters. Both steps are
+slow, so this module:
+
+- Reuses agent instances instead of building one per miss
+- Caches results per normalized query, with a shorter TTL for empty results
+- Collapses concurrent searches for the same query into one
+- Validates candidates concurrently under an overall deadline
+- Limits how many LLM searches can run at the same time
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .executor import get_adapter_executor
+from .types import Asset, AssetSearchQuery, AssetSearchResult
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = (
+    "You are a financial data expert that helps map search queries to "
+    "standardized ticker formats. Always respond with valid JSON arrays only."
+)
+
+USER_PROMPT_TEMPLATE = """Given the user search query: "{query}"
+
+Generate a list of possible internal ticker IDs that match this query. The internal ticker format is: EXCHANGE:SYMBOL
+
+Supported exchanges and their formats:
+- NASDAQ: NASDAQ:SYMBOL (e.g., NASDAQ:AAPL, NASDAQ:MSFT)
+- NYSE: NYSE:SYMBOL (e.g., NYSE:JPM, NYSE:BAC)
+- AMEX: AMEX:SYMBOL (e.g., AMEX:GORO, AMEX:GLD)
+- SSE: SSE:SYMBOL (Shanghai Stock Exchange, 6-digit code, e.g., SSE:601398, SSE:510050)
+- SZSE: SZSE:SYMBOL (Shenzhen Stock Exchange, 6-digit code, e.g., SZSE:000001, SZSE:002594, SZSE:300750)
+- BSE: BSE:SYMBOL (Beijing Stock Exchange, 6-digit code, e.g., BSE:835368, BSE:560800)
+- HKEX: HKEX:SYMBOL (Hong Kong Stock Exchange, 5-digit code with leading zeros, e.g., HKEX:00700, HKEX:03033)
+- CRYPTO: CRYPTO:SYMBOL (e.g., CRYPTO:BTC, CRYPTO:ETH)
+
+Consider:
+1. Common stock symbols and company names
+2. Chinese company names (if query contains Chinese characters)
+3. Cryptocurrency names
+4. Index names
+5. ETF names
+
+Return ONLY a JSON array of ticker strings, like:
+["NASDAQ:AAPL", "NYSE:AAPL", "HKEX:00700"]
+
+Generate up to at least 1 possible ticker candidate up to 10. Be creative but realistic."""
+
+MAX_CANDIDATES = 10
+
+# Shared executor key of candidate validations
+FALLBACK_VALIDATION_KEY = "fallback-validation"
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for caching: case-folded, single-spaced."""
+    return " ".join(query.casefold().split())
+
+
+def parse_ticker_candidates(response_text: str) -> List[str]:
+    """Parse the LLM response into a deduplicated list of candidate tickers.
+
+    Args:
+        response_text: Raw model output, optionally wrapped in a code fence
+
+    Returns:
+        Upper-cased EXCHANGE:SYMBOL candidates in the order proposed
+    """
+    text = response_text.strip()
+    # Handle cases where the LLM adds markdown formatting
+    if text.startswith("```json"):
+        text = text.split("```json")[1].split("```")[0].strip()
+    elif text.startswith("```"):
+        text = text.split("```")[1].split("```")[0].strip()
+
+    candidates = json.loads(text)
+    if not isinstance(candidates, list):
+        raise ValueError(f"LLM response is not a list: {candidates}")
+
+    tickers: List[str] = []
+    for candidate in candidates:
+        if not isinstance(candidate, str):
+            continue
+        ticker = candidate.strip().upper()
+        if ":" in ticker and ticker not in tickers:
+            tickers.append(ticker)
+    return tickers[:MAX_CANDIDATES]
+
+
+def create_fallback_agent():
+    """Create the agno agent used to propose ticker candidates."""
+    from agno.agent import Agent
+
+    from valuecell.utils.model import get_model
+
+    return Agent(
+        model=get_model("PRODUCT_MODEL_ID"),
+        instructions=[SYSTEM_PROMPT],
+        markdown=False,
+    )
+
+
+@dataclass
+class _InFlightSearch:
+    """A search being computed; other callers wait for its result."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    results: List[AssetSearchResult] = field(default_factory=list)
+
+
+class LLMFallbackSearcher:
+    """Cached, rate-limited LLM fallback search.
+
+    Agents are pooled: at most ``max_concurrent`` searches run at once and
+    each borrows its own agent, so no agent is ever used by two threads.
+    """
+
+    def __init__(
+        self,
+        validate: Callable[[str], Optional[Asset]],
+        agent_factory: Callable[[], Any] = create_fallback_agent,
+        cache_ttl: float = 3600.0,
+        negative_cache_ttl: float = 300.0,
+        max_cache_entries: int = 512,
+        max_concurrent: int = 2,
+        acquire_timeout: float = 10.0,
+        validation_workers: int = 8,
+        validation_deadline: float = 8.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize fallback searcher.
+
+        Args:
+            validate: Callable returning asset info for a ticker, or None
+            agent_factory: Zero-argument callable creating an agent with ``run``
+            cache_ttl: Seconds non-empty results are cached
+            negative_cache_ttl: Seconds empty or partial results are cached
+            max_cache_entries: Maximum number of cached queries (LRU)
+            max_concurrent: Maximum number of concurrent LLM searches
+            acquire_timeout: Seconds to wait for a free search slot
+            validation_workers: Concurrent candidate validations on the
+                shared adapter executor
+            validation_deadline: Overall seconds allowed for validation
+            clock: Monotonic clock for cache expiry, injectable for tests
+        """
+        self.validate = validate
+        self.agent_factory = agent_factory
+        self.cache_ttl = cache_ttl
+        self.negative_cache_ttl = negative_cache_ttl
+        self.max_cache_entries = max_cache_entries
+        self.acquire_timeout = acquire_timeout
+        self.validation_workers = validation_workers
+        self.validation_deadline = validation_deadline
+        self._clock = clock
+
+        # query -> (expires_at, results)
+        self._cache: "OrderedDict[str, Tuple[float, List[AssetSearchResult]]]" = (
+            OrderedDict()
+        )
+        self._in_flight: Dict[str, _InFlightSearch] = {}
+        self._lock = threading.Lock()
+
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._idle_agents: List[Any] = []
+
+    def search(self, query: AssetSearchQuery) -> List[AssetSearchResult]:
+        """Search for assets via the LLM, using cached results when possible.
+
+        Args:
+            query: Search query parameters
+
+        Returns:
+            List of validated search results
+        """
+        key = normalize_query(query.query)
+        if not key:
+            return []
+
+        with self._lock:
+            cached = self._get_cached(key)
+            if cached is not None:
+                logger.debug(f"Fallback search cache hit for '{key}'")
+                return cached[: query.limit]
+
+            in_flight = self._in_flight.get(key)
+            owner = in_flight is None
+            if owner:
+                in_flight = _InFlightSearch()
+                self._in_flight[key] = in_flight
+
+        if not owner:
+            # Another caller is already searching this query
+            in_flight.done.wait(self.acquire_timeout + self.validation_deadline)
+            return in_flight.results[: query.limit]
+
+        try:
+            results, complete = self._search_uncached(key, query.query.strip())
+            if complete is not None:
+                ttl = (
+                    self.cache_ttl if results and complete else self.negative_cache_ttl
+                )
+                self._put_cached(key, results, ttl)
+            in_flight.results = results
+            return results[: query.limit]
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            in_flight.done.set()
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+
+    def reset_agents(self) -> None:
+        """Drop pooled agents, e.g. after the model configuration changed."""
+        with self._lock:
+            self._idle_agents.clear()
+
+    def _get_cached(self, key: str) -> Optional[List[AssetSearchResult]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires_at, results = entry
+        if self._clock() >= expires_at:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return results
+
+    def _put_cached(
+        self, key: str, results: List[AssetSearchResult], ttl: float
+    ) -> None:
+        with self._lock:
+            self._cache[key] = (self._clock() + ttl, results)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_cache_entries:
+                self._cache.popitem(last=False)
+
+    def _search_uncached(
+        self, key: str, text: str
+    ) -> Tuple[List[AssetSearchResult], Optional[bool]]:
+        """Run the LLM and validate its candidates.
+
+        Returns:
+            Tuple of results and whether validation completed in time; the
+            flag is None if the search failed and must not be cached
+        """
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            logger.warning(f"Fallback search for '{key}' skipped: too many in flight")
+            return [], None
+
+        try:
+            candidates = self._propose_candidates(text)
+        except Exception as e:
+            logger.error(f"Fallback search failed: {e}", exc_info=True)
+            return [], None
+        finally:
+            self._slots.release()
+
+        results, complete = self._validate_candidates(candidates)
+        logger.info(
+            f"Fallback search returned {len(results)} results for query '{key}'"
+        )
+        return results, complete
+
+    def _propose_candidates(self, text: str) -> List[str]:
+        with self._lock:
+            agent = self._idle_agents.pop() if self._idle_agents else None
+        if agent is None:
+            agent = self.agent_factory()
+
+        response = agent.run(USER_PROMPT_TEMPLATE.format(query=text))
+        with self._lock:
+            self._idle_agents.append(agent)
+
+        response_text = response.content.strip()
+        logger.debug(f"LLM response for query '{text}': {response_text}")
+        return parse_ticker_candidates(response_text)
+
+    def _validate_candidates(
+        self, candidates: List[str]
+    ) -> Tuple[List[AssetSearchResult], bool]:
+        """Validate candidates concurrently, keeping the LLM's order."""
+        executor = get_adapter_executor()
+        executor.set_limit(FALLBACK_VALIDATION_KEY, self.validation_workers)
+        futures = {
+            executor.submit(FALLBACK_VALIDATION_KEY, self.validate, ticker): index
+            for index, ticker in enumerate(candidates)
+        }
+        found: Dict[int, Asset] = {}
+        deadline = time.monotonic() + self.validation_deadline
+
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(
+                pending, timeout=remaining, return_when=FIRST_COMPLETED
+            )
+            for future in done:
+                try:
+                    asset = future.result()
+                except Exception as e:
+                    logger.debug(
+                        f"Ticker {candidates[futures[future]]} validation failed: {e}"
+                    )
+                    continue
+                if asset:
+                    found[futures[future]] = asset
+
+        for future in pending:
+            future.cancel()
+        if pending:
+            logger.warning(
+                f"Fallback validation deadline hit, {len(pending)} candidates skipped"
+            )
+
+        results = []
+        seen = set()
+        for index in sorted(found):
+            asset = found[index]
+            if asset.ticker in seen:
+                continue
+            seen.add(asset.ticker)
+            results.append(
+                AssetSearchResult(
+                    ticker=asset.ticker,
+                    asset_type=asset.asset_type,
+                    names=asset.names.names,
+                    exchange=asset.market_info.exchange,
+                    country=asset.market_info.country,
+                )
+            )
+            logger.info(f"Fallback search found valid asset: {asset.ticker}")
+
+        return results, not pending
@@ -0,0 +1,201 @@
+"""Health tracking for data adapters.
+
+The adapter manager records the outcome and latency of every upstream call
+per (data source, exchange). The tracker keeps an exponentially weighted
+moving average (EWMA) of latency and error rate, puts adapters into a
+cooldown after rate-limit (HTTP 429 like) failures, and ranks adapters so
+that failover tries the healthiest one first.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .types import DataSource
+
+logger = logging.getLogger(__name__)
+
+# Substrings identifying rate-limit failures across upstream libraries
+RATE_LIMIT_MARKERS = ("429", "too many requests", "rate limit", "ratelimit")
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Check whether an exception looks like an upstream rate-limit failure."""
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in RATE_LIMIT_MARKERS)
+
+
+@dataclass
+class AdapterHealth:
+    """Health statistics of one adapter on one exchange."""
+
+    ewma_latency: float
+    error_rate: float = 0.0
+    samples: int = 0
+    consecutive_failures: int = 0
+    cooldown_until: float = 0.0
+    latencies: Deque[float] = field(default_factory=deque)
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """Latency at the given percentile (0-1) of the recent window."""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile * len(ordered)) - 1))
+        return ordered[index]
+
+
+class AdapterHealthTracker:
+    """Thread-safe per-(source, exchange) adapter health tracker."""
+
+    def __init__(
+        self,
+        alpha: float = 0.2,
+        prior_latency: float = 1.0,
+        error_penalty: float = 4.0,
+        cooldown_seconds: float = 60.0,
+        max_cooldown_seconds: float = 600.0,
+        latency_window: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize health tracker.
+
+        Args:
+            alpha: EWMA smoothing factor, higher reacts faster
+            prior_latency: Latency in seconds assumed for unmeasured adapters
+            error_penalty: Score penalty of a fully failing adapter, in
+                multiples of ``prior_latency``
+            cooldown_seconds: Cooldown after the first rate-limit failure;
+                doubles with each consecutive one
+            max_cooldown_seconds: Upper bound of the cooldown
+            latency_window: Number of recent latencies kept for percentiles
+            clock: Monotonic clock, injectable for tests
+        """
+        self.alpha = alpha
+        self.prior_latency = prior_latency
+        self.error_penalty = error_penalty
+        self.cooldown_seconds = cooldown_seconds
+        self.max_cooldown_seconds = max_cooldown_seconds
+        self.latency_window = latency_window
+        self._clock = clock
+        self._stats: Dict[Tuple[DataSource, str], AdapterHealth] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, source: DataSource, exchange: str) -> AdapterHealth:
+        key = (source, exchange)
+        health = self._stats.get(key)
+        if health is None:
+            health = AdapterHealth(
+                ewma_latency=self.prior_latency,
+                latencies=deque(maxlen=self.latency_window),
+            )
+            self._stats[key] = health
+        return health
+
+    def _update(self, health: AdapterHealth, latency: float, error: float) -> None:
+        if health.samples == 0:
+            health.ewma_latency = latency
+            health.error_rate = error
+        else:
+            health.ewma_latency += self.alpha * (latency - health.ewma_latency)
+            health.error_rate += self.alpha * (error - health.error_rate)
+        health.samples += 1
+        health.latencies.append(latency)
+
+    def record_success(self, source: DataSource, exchange: str, latency: float) -> None:
+        """Record a call that completed without raising."""
+        with self._lock:
+            health = self._get(source, exchange)
+            self._update(health, latency, 0.0)
+            health.consecutive_failures = 0
+
+    def record_failure(
+        self,
+        source: DataSource,
+        exchange: str,
+        latency: float,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Record a failed call, starting a cooldown on rate-limit errors."""
+        with self._lock:
+            health = self._get(source, exchange)
+            self._update(health, latency, 1.0)
+            health.consecutive_failures += 1
+
+            if error is not None and is_rate_limit_error(error):
+                cooldown = min(
+                    self.cooldown_seconds * 2 ** (health.consecutive_failures - 1),
+                    self.max_cooldown_seconds,
+                )
+                health.cooldown_until = self._clock() + cooldown
+                logger.warning(
+                    f"{source.value} rate limited on {exchange}, "
+                    f"cooling down for {cooldown:.0f}s"
+                )
+
+    def get_health(self, source: DataSource, exchange: str) -> Optional[AdapterHealth]:
+        """Get the health statistics for an adapter, if any were recorded."""
+        return self._stats.get((source, exchange))
+
+    def in_cooldown(self, source: DataSource, exchange: str) -> bool:
+        """Check whether an adapter is cooling down after rate limiting."""
+        health = self._stats.get((source, exchange))
+        return health is not None and self._clock() < health.cooldown_until
+
+    def score(self, source: DataSource, exchange: str) -> float:
+        """Expected cost of calling an adapter; lower is better."""
+        health = self._stats.get((source, exchange))
+        if health is None:
+            return self.prior_latency
+        # Errors cost error_penalty prior latencies, so even fast failures rank low
+        return health.ewma_latency + (
+            self.error_penalty * self.prior_latency * health.error_rate
+        )
+
+    def latency_percentile(
+        self, source: DataSource, exchange: str, percentile: float
+    ) -> Optional[float]:
+        """Recent latency percentile for an adapter, or None without samples."""
+        with self._lock:
+            health = self._stats.get((source, exchange))
+            return health.latency_percentile(percentile) if health else None
+
+    def rank(self, adapters: Sequence, exchange: str) -> List:
+        """Order adapters from healthiest to least healthy.
+
+        Adapters in cooldown go last. Ties keep the given order, so the
+        routing table's preference applies until measurements say otherwise.
+        """
+        with self._lock:
+            return sorted(
+                adapters,
+                key=lambda adapter: (
+                    self.in_cooldown(adapter.source, exchange),
+                    self.score(adapter.source, exchange),
+                ),
+            )
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Summarize tracked health, keyed by "source:exchange"."""
+        with self._lock:
+            now = self._clock()
+            return {
+                f"{source.value}:{exchange}": {
+                    "ewma_latency": round(health.ewma_latency, 4),
+                    "error_rate": round(health.error_rate, 4),
+                    "samples": health.samples,
+                    "cooldown_remaining": round(
+                        max(0.0, health.cooldown_until - now), 1
+                    ),
+                }
+                for (source, exchange), health in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Forget all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
@@ -5,30 +5,65 @@ localized asset names, descriptions, and other text content.
 """
 
 import logging
-from typing import Dict, List, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, wait
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from ...server.config.i18n import I18nConfig, get_i18n_config
 from ...server.services.i18n_service import get_i18n_service, t
+from .asset_metadata import asset_from_record
+from .executor import get_adapter_executor
 from .manager import AdapterManager
 from .types import Asset, AssetSearchResult, AssetType, MarketStatus
 
 logger = logging.getLogger(__name__)
 
+# Shared executor key of asset name lookups
+NAME_LOOKUP_KEY = "asset-names"
+
 
 class AssetI18nService:
     """Service for handling asset internationalization."""
 
-    def __init__(self, adapter_manager: AdapterManager):
+    def __init__(
+        self,
+        adapter_manager: AdapterManager,
+        repository=None,
+        max_cached_names: int = 4096,
+        lookup_workers: int = 8,
+        lookup_timeout: float = 10.0,
+        missing_name_ttl: float = 300.0,
+    ):
         """Initialize asset i18n service.
 
         Args:
             adapter_manager: Asset adapter manager instance
+            repository: Asset repository for persisted names; defaults to the
+                server's global one
+            max_cached_names: Maximum number of cached (ticker, language)
+                names (LRU)
+            lookup_workers: Concurrent lookups of names missing from the
+                database on the shared adapter executor
+            lookup_timeout: Overall seconds allowed for fetching missing names
+            missing_name_ttl: Seconds a ticker without a name (or whose
+                lookup timed out) falls back to the ticker before it is
+                looked up again
         """
         self.adapter_manager = adapter_manager
         self.i18n_service = get_i18n_service()
-
-        # Cache for translated asset names
-        self._name_cache: Dict[str, Dict[str, str]] = {}  # ticker -> language -> name
+        self._repository = repository
+        self.max_cached_names = max_cached_names
+        self.lookup_workers = lookup_workers
+        self.lookup_timeout = lookup_timeout
+        self.missing_name_ttl = missing_name_ttl
+
+        # Cache for translated asset names: (ticker, language) -> name
+        self._name_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        # Names not found: (ticker, language) -> monotonic expiry
+        self._missing_names: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._cache_lock = threading.Lock()
 
         # Known translations for common assets
         self._predefined_translations = self._load_predefined_translations()
@@ -151,52 +186,194 @@ class AssetI18nService:
             },
         }
 
-    def get_localized_asset_name(
-        self, ticker: str, language: Optional[str] = None
-    ) -> str:
-        """Get localized name for an asset.
+    @property
+    def repository(self):
+        """Lazy load asset repository to avoid circular imports."""
+        if self._repository is None:
+            from ...server.db.repositories.asset_repository import (
+                get_asset_repository,
+            )
+
+            self._repository = get_asset_repository()
+        return self._repository
+
+    def _get_cached_name(self, ticker: str, language: str) -> Optional[str]:
+        with self._cache_lock:
+            name = self._name_cache.get((ticker, language))
+            if name is not None:
+                self._name_cache.move_to_end((ticker, language))
+            return name
+
+    def _cache_name(self, ticker: str, language: str, name: str) -> None:
+        with self._cache_lock:
+            self._missing_names.pop((ticker, language), None)
+            self._name_cache[(ticker, language)] = name
+            self._name_cache.move_to_end((ticker, language))
+            while len(self._name_cache) > self.max_cached_names:
+                self._name_cache.popitem(last=False)
+
+    def _is_known_missing(self, ticker: str, language: str) -> bool:
+        with self._cache_lock:
+            expires_at = self._missing_names.get((ticker, language))
+            if expires_at is None:
+                return False
+            if time.monotonic() < expires_at:
+                return True
+            del self._missing_names[(ticker, language)]
+            return False
+
+    def _cache_missing(self, ticker: str, language: str) -> None:
+        with self._cache_lock:
+            key = (ticker, language)
+            self._missing_names.pop(key, None)
+            self._missing_names[key] = time.monotonic() + self.missing_name_ttl
+            while len(self._missing_names) > self.max_cached_names:
+                self._missing_names.popitem(last=False)
+
+    def _load_names_from_db(self, tickers: List[str], language: str) -> Dict[str, str]:
+        """Resolve names from the assets table with a single query."""
+        try:
+            records = self.repository.get_assets_by_symbols(tickers)
+        except Exception as e:
+            logger.debug(f"Could not load asset names from database: {e}")
+            return {}
+
+        names = {}
+        for record in records:
+            asset = asset_from_record(record)
+            name = asset.get_localized_name(language) if asset else None
+            if name:
+                names[record.symbol] = name
+        return names
+
+    def _name_from_future(
+        self, future: Future, ticker: str, language: str
+    ) -> Optional[str]:
+        try:
+            asset = future.result()
+        except Exception as e:
+            logger.warning(f"Could not fetch asset info for {ticker}: {e}")
+            return None
+        return asset.get_localized_name(language) if asset else None
+
+    def _fetch_names(self, tickers: List[str], language: str) -> Dict[str, str]:
+        """Fetch names from the adapters concurrently.
+
+        Lookups run on the shared adapter executor. With the adapter
+        manager's metadata cache enabled, fetched asset info is persisted, so
+        each ticker only ever reaches the network once. Lookups that miss the
+        timeout are cancelled if still queued; running ones cache their name
+        when they finish.
+        """
+        executor = get_adapter_executor()
+        executor.set_limit(NAME_LOOKUP_KEY, self.lookup_workers)
+        futures = {
+            executor.submit(
+                NAME_LOOKUP_KEY, self.adapter_manager.get_asset_info, ticker
+            ): ticker
+            for ticker in tickers
+        }
+        done, not_done = wait(futures, timeout=self.lookup_timeout)
+        if not_done:
+            logger.warning(
+                f"Asset name lookup timed out for {len(not_done)} of "
+                f"{len(tickers)} tickers"
+            )
+            for future in not_done:
+                if not future.cancel():
+                    future.add_done_callback(
+                        lambda f, ticker=futures[future]: self._cache_late_name(
+                            f, ticker, language
+                        )
+                    )
+
+        names = {}
+        for future in done:
+            ticker = futures[future]
+            name = self._name_from_future(future, ticker, language)
+            if name:
+                names[ticker] = name
+        return names
+
+    def _cache_late_name(self, future: Future, ticker: str, language: str) -> None:
+        name = self._name_from_future(future, ticker, language)
+        if name:
+            self._cache_name(ticker, language, name)
+
+    def get_localized_asset_names(
+        self, tickers: Iterable[str], language: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Get localized names for many assets at once.
+
+        Names are resolved from the LRU cache, predefined translations and
+        the assets table (one query for all tickers). The remaining tickers
+        are fetched from the adapters in a single concurrent batch; tickers
+        that resolve to no name are remembered for ``missing_name_ttl``.
 
         Args:
-            ticker: Asset ticker in internal format
+            tickers: Asset tickers in internal format
             language: Target language code (uses current i18n config if None)
 
         Returns:
-            Localized asset name or ticker if no translation available
+            Ticker -> localized name, or the ticker itself if no translation
+            is available
         """
         if language is None:
             config = get_i18n_config()
             language = config.language
 
-        # Check cache first
-        if ticker in self._name_cache and language in self._name_cache[ticker]:
-            return self._name_cache[ticker][language]
-
-        # Check predefined translations
-        if ticker in self._predefined_translations:
-            translations = self._predefined_translations[ticker]
-            if language in translations:
-                # Cache the result
-                if ticker not in self._name_cache:
-                    self._name_cache[ticker] = {}
-                self._name_cache[ticker][language] = translations[language]
-                return translations[language]
-
-        # Try to get from asset data
-        try:
-            asset = self.adapter_manager.get_asset_info(ticker)
-            if asset:
-                name = asset.get_localized_name(language)
+        names: Dict[str, str] = {}
+        misses: List[str] = []
+        for ticker in dict.fromkeys(tickers):
+            cached = self._get_cached_name(ticker, language)
+            if cached is not None:
+                names[ticker] = cached
+                continue
+
+            predefined = self._predefined_translations.get(ticker, {}).get(language)
+            if predefined:
+                self._cache_name(ticker, language, predefined)
+                names[ticker] = predefined
+                continue
+
+            if self._is_known_missing(ticker, language):
+                names[ticker] = ticker
+                continue
+
+            misses.append(ticker)
+
+        if misses:
+            resolved = self._load_names_from_db(misses, language)
+            remaining = [ticker for ticker in misses if ticker not in resolved]
+            if remaining:
+                resolved.update(self._fetch_names(remaining, language))
+
+            for ticker in misses:
+                name = resolved.get(ticker)
                 if name:
-                    # Cache the result
-                    if ticker not in self._name_cache:
-                        self._name_cache[ticker] = {}
-                    self._name_cache[ticker][language] = name
-                    return name
-        except Exception as e:
-            logger.warning(f"Could not fetch asset info for {ticker}: {e}")
+                    self._cache_name(ticker, language, name)
+                    names[ticker] = name
+                else:
+                    # Fallback to ticker, without looking it up again
+                    # until the TTL passes
+                    self._cache_missing(ticker, language)
+                    names[ticker] = ticker
 
-        # Fallback to ticker
-        return ticker
+        return names
+
+    def get_localized_asset_name(
+        self, ticker: str, language: Optional[str] = None
+    ) -> str:
+        """Get localized name for an asset.
+
+        Args:
+            ticker: Asset ticker in internal format
+            language: Target language code (uses current i18n config if None)
+
+        Returns:
+            Localized asset name or ticker if no translation available
+        """
+        return self.get_localized_asset_names([ticker], language)[ticker]
 
     def localize_asset(self, asset: Asset, language: Optional[str] = None) -> Asset:
         """Add localized names to an asset object.
@@ -236,8 +413,11 @@ class AssetI18nService:
             config = get_i18n_config()
             language = config.language
 
+        localized_names = self.get_localized_asset_names(
+            [result.ticker for result in results], language
+        )
         for result in results:
-            localized_name = self.get_localized_asset_name(result.ticker, language)
+            localized_name = localized_names[result.ticker]
             if localized_name != result.ticker:
                 result.names[language] = localized_name
 
@@ -418,15 +598,25 @@ class AssetI18nService:
         self._predefined_translations[ticker][language] = name
 
         # Update cache
-        if ticker not in self._name_cache:
-            self._name_cache[ticker] = {}
-        self._name_cache[ticker][language] = name
+        self._cache_name(ticker, language, name)
+
+        # Persist for other processes and restarts
+        try:
+            record = self.repository.get_asset_by_symbol(ticker)
+            if record is not None:
+                names = dict((record.asset_metadata or {}).get("names") or {})
+                names[language] = name
+                self.repository.update_asset_metadata(ticker, {"names": names})
+        except Exception as e:
+            logger.debug(f"Could not persist translation for {ticker}: {e}")
 
         logger.info(f"Added translation for {ticker} in {language}: {name}")
 
     def clear_cache(self) -> None:
         """Clear the translation cache."""
-        self._name_cache.clear()
+        with self._cache_lock:
+            self._name_cache.clear()
+            self._missing_names.clear()
         logger.info("Asset translation cache cleared")
 
     def get_available_languages_for_asset(self, ticker: str) -> List[str]:
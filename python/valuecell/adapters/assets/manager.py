@@ -4,17 +4,29 @@ This module provides a unified interface for managing multiple data source adapt
 and routing requests to the appropriate providers based on asset types and availability.
 """
 
-import json
+import asyncio
 import logging
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from collections import OrderedDict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    TimeoutError,
+    as_completed,
+    wait,
+)
 from datetime import datetime
-from typing import Dict, List, Optional
-
-from valuecell.utils.model import get_model
+from typing import Callable, Dict, List, Optional, Set, Tuple, TypeVar
 
-from .akshare_adapter import AKShareAdapter
+from .asset_metadata import AssetMetadataCache
 from .base import BaseDataAdapter
+from .executor import get_adapter_executor
+from .fallback_search import LLMFallbackSearcher
+from .health import AdapterHealthTracker
+from .market_calendar import get_calendar_for_ticker
+from .rate_limit import Priority, request_priority
+from .search_index import LocalAssetIndex, indexed_asset_from_record, normalize_text
 from .types import (
     Asset,
     AssetPrice,
@@ -25,10 +37,14 @@ from .types import (
     Exchange,
     Watchlist,
 )
-from .yfinance_adapter import YFinanceAdapter
 
 logger = logging.getLogger(__name__)
 
+# Executor key of background search index work
+SEARCH_BACKGROUND_KEY = "search-index"
+
+T = TypeVar("T")
+
 
 class AdapterManager:
     """Manager for coordinating multiple asset data adapters."""
@@ -47,6 +63,48 @@ class AdapterManager:
 
         self.lock = threading.RLock()
 
+        # Offline search index over the assets table and adapter symbol lists
+        self.search_index = LocalAssetIndex()
+        self.search_index_refresh_interval = 300  # seconds
+        self._search_index_refreshed_at: Optional[float] = None
+        self._search_index_lock = threading.Lock()
+        self._symbol_lists_loaded: Set[DataSource] = set()
+        self._symbol_lists_loading = False
+
+        # Background remote searches that enrich the index after local hits.
+        # A query waits out the debounce (a longer query typed meanwhile
+        # replaces it) and is not searched again within the TTL.
+        self.search_enrichment_debounce = 0.5  # seconds
+        self.search_enrichment_ttl = 600.0  # seconds
+        self.search_enrichment_max_pending = 32
+        # Normalized query -> (query, due time), in due order
+        self._enrichment_pending: "OrderedDict[str, Tuple[AssetSearchQuery, float]]" = (
+            OrderedDict()
+        )
+        # Normalized query -> time its enrichment started, oldest first
+        self._enriched_queries: "OrderedDict[str, float]" = OrderedDict()
+        self._enrichment_running = False
+
+        # Per-adapter, per-exchange health used to order failover
+        self.health = AdapterHealthTracker()
+        self.hedging_enabled = False
+        self.hedge_percentile = 0.95
+        self.hedge_min_delay = 0.25
+        self.hedge_max_delay = 2.0
+
+        # Real-time price cache. While a ticker's market is closed its last
+        # price stays cached until the market reopens (capped by closed_ttl)
+        self.price_cache_enabled = True
+        self.price_cache_open_ttl = 0.0
+        self.price_cache_closed_ttl = 3600.0
+        self._price_cache: Dict[str, Tuple[AssetPrice, float]] = {}
+
+        # Database-backed asset info cache, enabled by the server
+        self.metadata_cache: Optional[AssetMetadataCache] = None
+
+        # LLM-based search used when no adapter finds anything
+        self.fallback_searcher = LLMFallbackSearcher(validate=self.get_asset_info)
+
         logger.info("Asset adapter manager initialized")
 
     def _rebuild_routing_table(self) -> None:
@@ -100,6 +158,9 @@ class AdapterManager:
     def configure_yfinance(self, **kwargs) -> None:
         """Configure and register Yahoo Finance adapter."""
         try:
+            # Imported on use: yfinance and pandas are slow to import
+            from .yfinance_adapter import YFinanceAdapter
+
             adapter = YFinanceAdapter(**kwargs)
             self.register_adapter(adapter)
         except Exception as e:
@@ -112,6 +173,8 @@ class AdapterManager:
             **kwargs: Additional configuration
         """
         try:
+            from .akshare_adapter import AKShareAdapter
+
             adapter = AKShareAdapter(**kwargs)
             self.register_adapter(adapter)
         except Exception as e:
@@ -290,8 +353,118 @@ class AdapterManager:
 
         return unique_results
 
-    def search_assets(self, query: AssetSearchQuery) -> List[AssetSearchResult]:
-        """Search for assets across all available adapters.
+    def refresh_search_index(self) -> int:
+        """Incrementally load new or updated assets from the database.
+
+        Returns:
+            Number of assets (re)indexed
+        """
+        try:
+            from ...server.db.repositories.asset_repository import (
+                get_asset_repository,
+            )
+
+            records = get_asset_repository().get_assets_updated_since(
+                self.search_index.repository_watermark
+            )
+        except Exception as e:
+            logger.warning(f"Could not load assets for search index: {e}")
+            return 0
+
+        count = 0
+        for record in records:
+            indexed = indexed_asset_from_record(record)
+            if indexed:
+                self.search_index.upsert(indexed)
+                count += 1
+            if record.updated_at and (
+                self.search_index.repository_watermark is None
+                or record.updated_at > self.search_index.repository_watermark
+            ):
+                self.search_index.repository_watermark = record.updated_at
+
+        if count:
+            logger.debug(f"Indexed {count} assets from database")
+        return count
+
+    def load_adapter_symbol_lists(self) -> int:
+        """Index the symbol lists of all registered adapters not loaded yet.
+
+        Returns:
+            Number of assets indexed
+        """
+        with self.lock:
+            adapters = [
+                adapter
+                for adapter in self.adapters.values()
+                if adapter.source not in self._symbol_lists_loaded
+            ]
+
+        count = 0
+        for adapter in adapters:
+            try:
+                with request_priority(Priority.BACKGROUND):
+                    symbols = adapter.get_symbol_list()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load symbol list from {adapter.source.value}: {e}"
+                )
+                continue
+
+            if symbols:
+                count += self.search_index.upsert_search_results(symbols)
+                self._symbol_lists_loaded.add(adapter.source)
+                logger.info(
+                    f"Indexed {len(symbols)} symbols from {adapter.source.value}"
+                )
+
+        return count
+
+    def _ensure_search_index(self) -> None:
+        """Refresh the search index from the database if it is due.
+
+        Adapter symbol lists need network access, so they are loaded in the
+        background and never block a search.
+        """
+        now = time.monotonic()
+        if (
+            self._search_index_refreshed_at is not None
+            and now - self._search_index_refreshed_at
+            < self.search_index_refresh_interval
+        ):
+            return
+
+        # Only one caller refreshes; others search the current index
+        if not self._search_index_lock.acquire(blocking=False):
+            return
+        try:
+            self._search_index_refreshed_at = now
+            self.refresh_search_index()
+        finally:
+            self._search_index_lock.release()
+
+        with self.lock:
+            pending = not self._symbol_lists_loading and any(
+                source not in self._symbol_lists_loaded for source in self.adapters
+            )
+            if pending:
+                self._symbol_lists_loading = True
+        if pending:
+            get_adapter_executor().submit(
+                SEARCH_BACKGROUND_KEY, self._load_symbol_lists_in_background
+            )
+
+    def _load_symbol_lists_in_background(self) -> None:
+        try:
+            self.load_adapter_symbol_lists()
+        except Exception as e:
+            logger.warning(f"Background symbol list loading failed: {e}")
+        finally:
+            with self.lock:
+                self._symbol_lists_loading = False
+
+    def _search_remote(self, query: AssetSearchQuery) -> List[AssetSearchResult]:
+        """Search all adapters over the network and index what they return.
 
         Args:
             query: Search query parameters
@@ -301,35 +474,131 @@ class AdapterManager:
         """
         all_results = []
 
-        # Determine which adapters to use based on asset types
-        target_adapters = set()
-
         # Use all available adapters
         with self.lock:
-            target_adapters.update(self.adapters.values())
+            target_adapters = list(self.adapters.values())
 
-        # Search in parallel across adapters
         if not target_adapters:
             return []
 
-        with ThreadPoolExecutor(max_workers=len(target_adapters)) as executor:
-            future_to_adapter = {
-                executor.submit(adapter.search_assets, query): adapter
-                for adapter in target_adapters
-            }
+        # Search in parallel across adapters on the shared executor
+        future_to_adapter = {
+            adapter.submit_blocking(adapter.search_assets, query): adapter
+            for adapter in target_adapters
+        }
 
-            for future in as_completed(future_to_adapter):
+        try:
+            for future in as_completed(future_to_adapter, timeout=15):
                 adapter = future_to_adapter[future]
                 try:
-                    results = future.result(timeout=15)
-                    all_results.extend(results)
+                    all_results.extend(future.result())
                 except Exception as e:
                     logger.warning(
                         f"Search failed for adapter {adapter.source.value}: {e}"
                     )
+        except TimeoutError:
+            logger.warning(f"Search timed out for some adapters: {query.query}")
 
         # Smart deduplication of results
         unique_results = self._deduplicate_search_results(all_results)
+        self.search_index.upsert_search_results(unique_results)
+        return unique_results
+
+    def _enrich_search_in_background(self, query: AssetSearchQuery) -> None:
+        """Queue the remote search for a query to run in the background.
+
+        Results only feed the local index, so later searches benefit from them.
+        Queued queries run one at a time on a single enrichment thread after
+        the debounce; a longer query typed meanwhile replaces its prefixes,
+        and queries enriched within the TTL are skipped.
+        """
+        key = normalize_text(query.query)
+        if not key:
+            return
+
+        now = time.monotonic()
+        with self._cache_lock:
+            # Forget enrichments older than the TTL
+            while self._enriched_queries:
+                oldest, started = next(iter(self._enriched_queries.items()))
+                if now - started < self.search_enrichment_ttl:
+                    break
+                del self._enriched_queries[oldest]
+            if key in self._enriched_queries:
+                return
+
+            # "appl" supersedes "a", "ap" and "app" still waiting
+            for pending in [k for k in self._enrichment_pending if key.startswith(k)]:
+                del self._enrichment_pending[pending]
+            self._enrichment_pending[key] = (
+                query,
+                now + self.search_enrichment_debounce,
+            )
+            while len(self._enrichment_pending) > self.search_enrichment_max_pending:
+                self._enrichment_pending.popitem(last=False)
+
+            if self._enrichment_running:
+                return
+            self._enrichment_running = True
+
+        # Its own thread, not a worker of the shared adapter executor: it
+        # sleeps through the debounce and waits on the adapter searches,
+        # which run on that executor
+        try:
+            threading.Thread(
+                target=self._drain_search_enrichment,
+                name="search-enrichment",
+                daemon=True,
+            ).start()
+        except RuntimeError as e:
+            logger.debug(f"Could not start search enrichment: {e}")
+            with self._cache_lock:
+                self._enrichment_running = False
+
+    def _drain_search_enrichment(self) -> None:
+        """Run queued enrichments as they become due, until none is left."""
+        while True:
+            with self._cache_lock:
+                if not self._enrichment_pending:
+                    self._enrichment_running = False
+                    return
+                key, (query, due) = next(iter(self._enrichment_pending.items()))
+                wait = due - time.monotonic()
+                if wait <= 0:
+                    del self._enrichment_pending[key]
+                    self._enriched_queries[key] = time.monotonic()
+
+            if wait > 0:
+                time.sleep(wait)
+                continue
+
+            try:
+                with request_priority(Priority.BACKGROUND):
+                    self._search_remote(query)
+            except Exception as e:
+                logger.debug(f"Background search enrichment failed for {key}: {e}")
+
+    def search_assets(self, query: AssetSearchQuery) -> List[AssetSearchResult]:
+        """Search for assets, answering from the local index when possible.
+
+        Local hits are returned immediately and the remote adapter search only
+        runs in the background to enrich the index. Remote search runs inline
+        only when the local index has no match.
+
+        Args:
+            query: Search query parameters
+
+        Returns:
+            Combined and deduplicated search results
+        """
+        self._ensure_search_index()
+
+        local_results = self.search_index.search(query.query, limit=query.limit)
+        if local_results:
+            self._enrich_search_in_background(query)
+            return local_results
+
+        unique_results = self._search_remote(query)
 
         # Use fallback search if no results found
         if len(unique_results) == 0:
@@ -340,6 +609,7 @@ class AdapterManager:
             # Deduplicate fallback results with existing results
             combined_results = unique_results + fallback_results
             unique_results = self._deduplicate_search_results(combined_results)
+            self.search_index.upsert_search_results(unique_results)
 
         return unique_results[: query.limit]
 
@@ -348,9 +618,9 @@ class AdapterManager:
     ) -> List[AssetSearchResult]:
         """Fallback search assets if no results are found using LLM-based ticker generation.
 
-        This method uses the centralized configuration system to create model instances
-        for intelligently generating possible ticker formats based on the user's search query,
-        then validates each generated ticker.
+        The LLM proposes possible tickers for the query, which are then
+        validated concurrently through ``get_asset_info``. Results are cached
+        per normalized query, see ``LLMFallbackSearcher``.
 
         Args:
             query: Search query parameters
@@ -358,276 +628,362 @@ class AdapterManager:
         Returns:
             List of validated search results
         """
-        try:
-            # Use configuration system to create model
+        return self.fallback_searcher.search(query)
 
-            model = get_model("PRODUCT_MODEL_ID")
+    def _get_failover_adapters(self, ticker: str) -> List[BaseDataAdapter]:
+        """Get the adapters able to serve a ticker, healthiest first.
 
-            # Create prompt to generate possible ticker formats
-            system_prompt = (
-                "You are a financial data expert that helps map search queries to "
-                "standardized ticker formats. Always respond with valid JSON arrays only."
-            )
-
-            user_prompt = f"""Given the user search query: "{query.query}"
+        Adapters cooling down after rate limiting are left out unless no
+        other adapter is available.
 
-Generate a list of possible internal ticker IDs that match this query. The internal ticker format is: EXCHANGE:SYMBOL
-
-Supported exchanges and their formats:
-- NASDAQ: NASDAQ:SYMBOL (e.g., NASDAQ:AAPL, NASDAQ:MSFT)
-- NYSE: NYSE:SYMBOL (e.g., NYSE:JPM, NYSE:BAC)
-- AMEX: AMEX:SYMBOL (e.g., AMEX:GORO, AMEX:GLD)
-- SSE: SSE:SYMBOL (Shanghai Stock Exchange, 6-digit code, e.g., SSE:601398, SSE:510050)
-- SZSE: SZSE:SYMBOL (Shenzhen Stock Exchange, 6-digit code, e.g., SZSE:000001, SZSE:002594, SZSE:300750)
-- BSE: BSE:SYMBOL (Beijing Stock Exchange, 6-digit code, e.g., BSE:835368, BSE:560800)
-- HKEX: HKEX:SYMBOL (Hong Kong Stock Exchange, 5-digit code with leading zeros, e.g., HKEX:00700, HKEX:03033)
-- CRYPTO: CRYPTO:SYMBOL (e.g., CRYPTO:BTC, CRYPTO:ETH)
+        Args:
+            ticker: Asset ticker in internal format
 
-Consider:
-1. Common stock symbols and company names
-2. Chinese company names (if query contains Chinese characters)
-3. Cryptocurrency names
-4. Index names
-5. ETF names
+        Returns:
+            Ordered list of candidate adapters
+        """
+        primary = self.get_adapter_for_ticker(ticker)
+        if not primary:
+            return []
 
-Return ONLY a JSON array of ticker strings, like:
-["NASDAQ:AAPL", "NYSE:AAPL", "HKEX:00700"]
+        exchange = ticker.split(":", 1)[0]
+        candidates = [primary] + [
+            adapter
+            for adapter in self.get_adapters_for_exchange(exchange)
+            if adapter.source != primary.source and adapter.validate_ticker(ticker)
+        ]
+        ranked = self.health.rank(candidates, exchange)
+
+        available = [
+            adapter
+            for adapter in ranked
+            if not self.health.in_cooldown(adapter.source, exchange)
+        ]
+        return available or ranked
+
+    def configure_hedging(
+        self,
+        enabled: bool = True,
+        percentile: float = 0.95,
+        min_delay: float = 0.25,
+        max_delay: float = 2.0,
+    ) -> None:
+        """Configure hedged requests for single-ticker lookups.
 
-Generate up to at least 1 possible ticker candidate up to 10. Be creative but realistic."""
+        With hedging enabled, if the first adapter has not answered after its
+        recent latency percentile, the next adapter is called as well and the
+        first useful answer wins.
 
-            # Use agno Agent for structured communication
-            from agno.agent import Agent
+        Args:
+            enabled: Whether to hedge requests
+            percentile: Latency percentile (0-1) after which to hedge
+            min_delay: Lower bound of the hedge delay in seconds
+            max_delay: Upper bound of the hedge delay in seconds, also used
+                while there are no latency samples yet
+        """
+        self.hedging_enabled = enabled
+        self.hedge_percentile = percentile
+        self.hedge_min_delay = min_delay
+        self.hedge_max_delay = max_delay
+
+    def _hedge_delay(self, adapter: BaseDataAdapter, exchange: str) -> float:
+        latency = self.health.latency_percentile(
+            adapter.source, exchange, self.hedge_percentile
+        )
+        if latency is None:
+            return self.hedge_max_delay
+        return min(max(latency, self.hedge_min_delay), self.hedge_max_delay)
 
-            agent = Agent(
-                model=model,
-                instructions=[system_prompt],
-                markdown=False,
+    def _timed_call(
+        self,
+        adapter: BaseDataAdapter,
+        ticker: str,
+        operation: str,
+        call: Callable[[BaseDataAdapter], T],
+    ) -> Optional[T]:
+        """Call an adapter, recording latency and outcome in the health tracker."""
+        exchange = ticker.split(":", 1)[0]
+        start = time.monotonic()
+        try:
+            logger.debug(
+                f"Fetching {operation} for {ticker} from {adapter.source.value}"
+            )
+            result = call(adapter)
+        except Exception as e:
+            self.health.record_failure(
+                adapter.source, exchange, time.monotonic() - start, e
             )
+            logger.warning(
+                f"Adapter {adapter.source.value} failed for {operation} of {ticker}: {e}"
+            )
+            return None
 
-            # Call LLM API
-            response = agent.run(user_prompt)
+        self.health.record_success(adapter.source, exchange, time.monotonic() - start)
+        if not result:
+            logger.debug(
+                f"Adapter {adapter.source.value} returned no {operation} for {ticker}"
+            )
+        return result
 
-            # Parse response
-            response_text = response.content.strip()
-            logger.debug(f"LLM response for query '{query.query}': {response_text}")
+    def _call_sequential(
+        self,
+        adapters: List[BaseDataAdapter],
+        ticker: str,
+        operation: str,
+        call: Callable[[BaseDataAdapter], T],
+    ) -> Tuple[Optional[T], Optional[BaseDataAdapter]]:
+        for adapter in adapters:
+            result = self._timed_call(adapter, ticker, operation, call)
+            if result:
+                return result, adapter
+        return None, None
 
-            # Extract JSON array from response (handle cases where LLM adds markdown formatting)
-            if response_text.startswith("```json"):
-                response_text = (
-                    response_text.split("```json")[1].split("```")[0].strip()
+    def _call_hedged(
+        self,
+        adapters: List[BaseDataAdapter],
+        ticker: str,
+        operation: str,
+        call: Callable[[BaseDataAdapter], T],
+    ) -> Tuple[Optional[T], Optional[BaseDataAdapter]]:
+        exchange = ticker.split(":", 1)[0]
+        remaining = list(adapters)
+        running: Dict[Future, BaseDataAdapter] = {}
+        hedge_at = 0.0
+        launch_next = True
+
+        while True:
+            if launch_next and remaining:
+                adapter = remaining.pop(0)
+                future = adapter.submit_blocking(
+                    self._timed_call, adapter, ticker, operation, call
                 )
-            elif response_text.startswith("```"):
-                response_text = response_text.split("```")[1].split("```")[0].strip()
+                running[future] = adapter
+                hedge_at = time.monotonic() + self._hedge_delay(adapter, exchange)
+
+            if not running:
+                return None, None
+
+            timeout = max(0.0, hedge_at - time.monotonic()) if remaining else None
+            done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+            if not done:
+                # Slow answer: hedge with the next adapter, keep the first running
+                logger.debug(f"Hedging {operation} request for {ticker}")
+                launch_next = True
+                continue
 
-            possible_tickers = json.loads(response_text)
+            for future in done:
+                adapter = running.pop(future)
+                result = future.result()
+                if result:
+                    # Late answers still update health stats in the background
+                    return result, adapter
 
-            if not isinstance(possible_tickers, list):
-                logger.warning(f"LLM response is not a list: {possible_tickers}")
-                return []
+            launch_next = not running
 
-            # Validate each ticker and convert to search results
-            results = []
-            seen_tickers = set()
+    def _call_with_failover(
+        self, ticker: str, operation: str, call: Callable[[BaseDataAdapter], T]
+    ) -> Optional[T]:
+        """Run an adapter call for a ticker with health-ranked failover.
 
-            for ticker in possible_tickers:
-                if not isinstance(ticker, str):
-                    continue
+        Args:
+            ticker: Asset ticker in internal format
+            operation: Description used in logs
+            call: Function invoking the adapter method
 
-                ticker = ticker.strip().upper()
+        Returns:
+            First non-empty result, or None if all adapters failed
+        """
+        adapters = self._get_failover_adapters(ticker)
+        if not adapters:
+            logger.warning(f"No suitable adapter found for ticker: {ticker}")
+            return None
 
-                # Skip duplicates
-                if ticker in seen_tickers:
-                    continue
+        if self.hedging_enabled and len(adapters) > 1:
+            result, adapter = self._call_hedged(adapters, ticker, operation, call)
+        else:
+            result, adapter = self._call_sequential(adapters, ticker, operation, call)
 
-                # Validate ticker format
-                if ":" not in ticker:
-                    continue
+        return self._finish_failover(ticker, operation, result, adapter)
 
-                # Try to get asset info
-                try:
-                    asset_info = self.get_asset_info(ticker)
-
-                    if asset_info:
-                        seen_tickers.add(ticker)
-
-                        # Convert Asset to AssetSearchResult
-                        search_result = AssetSearchResult(
-                            ticker=asset_info.ticker,
-                            asset_type=asset_info.asset_type,
-                            names=asset_info.names.names,
-                            exchange=asset_info.market_info.exchange,
-                            country=asset_info.market_info.country,
-                        )
-                        results.append(search_result)
+    def _finish_failover(
+        self,
+        ticker: str,
+        operation: str,
+        result: Optional[T],
+        adapter: Optional[BaseDataAdapter],
+    ) -> Optional[T]:
+        if not result:
+            logger.error(f"All adapters failed for {operation} of {ticker}")
+            return None
 
-                        logger.info(f"Fallback search found valid asset: {ticker}")
+        logger.info(f"Fetched {operation} for {ticker} from {adapter.source.value}")
+        # Route later lookups to the adapter that answered
+        with self._cache_lock:
+            self._ticker_cache[ticker] = adapter
+        return result
 
-                        # Stop if we have enough results
-                        if len(results) >= query.limit:
-                            break
+    def enable_asset_metadata_cache(self, **kwargs) -> AssetMetadataCache:
+        """Serve asset info from the database, refreshing it in the background.
 
-                except Exception as e:
-                    logger.debug(f"Ticker {ticker} validation failed: {e}")
-                    continue
+        Args:
+            **kwargs: Options for ``AssetMetadataCache`` (repository, max_age,
+                retry_interval, max_workers, clock)
 
-            logger.info(
-                f"Fallback search returned {len(results)} results for query '{query.query}'"
-            )
-            return results
+        Returns:
+            The enabled cache
+        """
+        self.metadata_cache = AssetMetadataCache(fetch=self._fetch_asset_info, **kwargs)
+        return self.metadata_cache
 
-        except Exception as e:
-            logger.error(f"Fallback search failed: {e}", exc_info=True)
-            return []
+    def _fetch_asset_info(self, ticker: str) -> Optional[Asset]:
+        return self._call_with_failover(
+            ticker, "asset info", lambda adapter: adapter.get_asset_info(ticker)
+        )
 
     def get_asset_info(self, ticker: str) -> Optional[Asset]:
         """Get detailed asset information with automatic failover.
 
+        With the metadata cache enabled, cached info is returned without a
+        network round-trip; only unknown tickers wait for the adapters.
+
         Args:
             ticker: Asset ticker in internal format
 
         Returns:
             Asset information or None if not found
         """
-        # Get the primary adapter for this ticker
-        adapter = self.get_adapter_for_ticker(ticker)
+        if self.metadata_cache is not None:
+            return self.metadata_cache.get(ticker)
+        return self._fetch_asset_info(ticker)
 
-        if not adapter:
-            logger.warning(f"No suitable adapter found for ticker: {ticker}")
-            return None
+    def refresh_asset_info(self, tickers: List[str], force: bool = False) -> int:
+        """Refresh cached asset info of many tickers, e.g. a whole watchlist.
 
-        # Try the primary adapter
-        try:
-            logger.debug(
-                f"Fetching asset info for {ticker} from {adapter.source.value}"
-            )
-            asset_info = adapter.get_asset_info(ticker)
-            if asset_info:
-                logger.info(
-                    f"Successfully fetched asset info for {ticker} from {adapter.source.value}"
-                )
-                return asset_info
-            else:
-                logger.debug(
-                    f"Adapter {adapter.source.value} returned None for {ticker}"
-                )
-        except Exception as e:
-            logger.warning(
-                f"Primary adapter {adapter.source.value} failed for {ticker}: {e}"
-            )
+        Args:
+            tickers: Asset tickers in internal format
+            force: Also refresh info that is not stale yet
 
-        # Automatic failover: try other adapters for this exchange
-        exchange = ticker.split(":")[0] if ":" in ticker else ""
-        fallback_adapters = self.get_adapters_for_exchange(exchange)
+        Returns:
+            Number of tickers refreshed, 0 if the cache is disabled
+        """
+        if self.metadata_cache is None:
+            return 0
+        return self.metadata_cache.refresh_many(tickers, force=force)
 
-        for fallback_adapter in fallback_adapters:
-            # Skip the primary adapter we already tried
-            if fallback_adapter.source == adapter.source:
-                continue
+    def configure_price_cache(
+        self,
+        enabled: bool = True,
+        open_ttl: float = 0.0,
+        closed_ttl: float = 3600.0,
+    ) -> None:
+        """Configure caching of real-time prices.
 
-            if not fallback_adapter.validate_ticker(ticker):
-                continue
+        Args:
+            enabled: Whether prices are cached at all
+            open_ttl: Seconds a price is cached while its market is open
+            closed_ttl: Upper bound in seconds for caching a price while its
+                market is closed; entries otherwise live until it reopens
+        """
+        self.price_cache_enabled = enabled
+        self.price_cache_open_ttl = open_ttl
+        self.price_cache_closed_ttl = closed_ttl
+        with self._cache_lock:
+            self._price_cache.clear()
+
+    def _price_ttl(self, ticker: str) -> float:
+        """Seconds a fresh price of a ticker may be served from cache."""
+        calendar = get_calendar_for_ticker(ticker)
+        if calendar is None or calendar.is_open():
+            return self.price_cache_open_ttl
+        until_open = calendar.seconds_until_open()
+        if until_open is None:
+            return self.price_cache_closed_ttl
+        return min(until_open, self.price_cache_closed_ttl)
+
+    def _get_cached_price(self, ticker: str) -> Optional[AssetPrice]:
+        if not self.price_cache_enabled:
+            return None
+        with self._cache_lock:
+            entry = self._price_cache.get(ticker)
+            if entry is None:
+                return None
+            price, expires_at = entry
+            if time.monotonic() < expires_at:
+                return price
+            del self._price_cache[ticker]
+            return None
 
-            try:
-                logger.debug(
-                    f"Fallback: trying {fallback_adapter.source.value} for {ticker}"
-                )
-                asset_info = fallback_adapter.get_asset_info(ticker)
-                if asset_info:
-                    logger.info(
-                        f"Fallback success: fetched asset info for {ticker} from {fallback_adapter.source.value}"
-                    )
-                    # Update cache to use successful adapter
-                    with self._cache_lock:
-                        self._ticker_cache[ticker] = fallback_adapter
-                    return asset_info
-            except Exception as e:
-                logger.warning(
-                    f"Fallback adapter {fallback_adapter.source.value} failed for {ticker}: {e}"
-                )
-                continue
+    def _cache_price(self, ticker: str, price: Optional[AssetPrice]) -> None:
+        if not self.price_cache_enabled or price is None:
+            return
+        ttl = self._price_ttl(ticker)
+        if ttl <= 0:
+            return
+        with self._cache_lock:
+            self._price_cache[ticker] = (price, time.monotonic() + ttl)
 
-        logger.error(f"All adapters failed for {ticker}")
-        return None
+    def _split_cached_prices(
+        self, tickers: List[str]
+    ) -> Tuple[Dict[str, Optional[AssetPrice]], List[str]]:
+        """Split tickers into cached prices and tickers that need a fetch."""
+        cached: Dict[str, Optional[AssetPrice]] = {}
+        missing: List[str] = []
+        for ticker in tickers:
+            price = self._get_cached_price(ticker)
+            if price is not None:
+                cached[ticker] = price
+            else:
+                missing.append(ticker)
+        return cached, missing
 
     def get_real_time_price(self, ticker: str) -> Optional[AssetPrice]:
         """Get real-time price for an asset with automatic failover.
 
+        While the asset's market is closed, the last price is served from
+        cache without calling upstream.
+
         Args:
             ticker: Asset ticker in internal format
 
         Returns:
             Current price data or None if not available
         """
-        # Get the primary adapter for this ticker
-        adapter = self.get_adapter_for_ticker(ticker)
-
-        if not adapter:
-            logger.warning(f"No suitable adapter found for ticker: {ticker}")
-            return None
-
-        # Try the primary adapter
-        try:
-            logger.debug(f"Fetching price for {ticker} from {adapter.source.value}")
-            price = adapter.get_real_time_price(ticker)
-            if price:
-                logger.info(
-                    f"Successfully fetched price for {ticker} from {adapter.source.value}"
-                )
-                return price
-            else:
-                logger.debug(
-                    f"Adapter {adapter.source.value} returned None for {ticker}"
-                )
-        except Exception as e:
-            logger.warning(
-                f"Primary adapter {adapter.source.value} failed for {ticker}: {e}"
-            )
-
-        # Automatic failover: try other adapters for this exchange
-        exchange = ticker.split(":")[0] if ":" in ticker else ""
-        fallback_adapters = self.get_adapters_for_exchange(exchange)
-
-        for fallback_adapter in fallback_adapters:
-            # Skip the primary adapter we already tried
-            if fallback_adapter.source == adapter.source:
-                continue
-
-            if not fallback_adapter.validate_ticker(ticker):
-                continue
+        cached = self._get_cached_price(ticker)
+        if cached is not None:
+            return cached
 
-            try:
-                logger.debug(
-                    f"Fallback: trying {fallback_adapter.source.value} for {ticker}"
-                )
-                price = fallback_adapter.get_real_time_price(ticker)
-                if price:
-                    logger.info(
-                        f"Fallback success: fetched price for {ticker} from {fallback_adapter.source.value}"
-                    )
-                    # Update cache to use successful adapter
-                    with self._cache_lock:
-                        self._ticker_cache[ticker] = fallback_adapter
-                    return price
-            except Exception as e:
-                logger.warning(
-                    f"Fallback adapter {fallback_adapter.source.value} failed for {ticker}: {e}"
-                )
-                continue
-
-        logger.error(f"All adapters failed for {ticker}")
-        return None
+        price = self._call_with_failover(
+            ticker, "price", lambda adapter: adapter.get_real_time_price(ticker)
+        )
+        self._cache_price(ticker, price)
+        return price
 
     def get_multiple_prices(
         self, tickers: List[str]
     ) -> Dict[str, Optional[AssetPrice]]:
         """Get real-time prices for multiple assets efficiently with automatic failover.
 
+        Only tickers without a cached price are fetched.
+
         Args:
             tickers: List of asset tickers
 
         Returns:
             Dictionary mapping tickers to price data
         """
+        results, missing = self._split_cached_prices(tickers)
+        if missing:
+            fetched = self._fetch_multiple_prices(missing)
+            for ticker, price in fetched.items():
+                self._cache_price(ticker, price)
+            results.update(fetched)
+        return {ticker: results.get(ticker) for ticker in tickers}
+
+    def _fetch_multiple_prices(
+        self, tickers: List[str]
+    ) -> Dict[str, Optional[AssetPrice]]:
+        """Fetch prices batched per adapter, retrying failures with failover."""
         # Group tickers by adapter
         adapter_tickers: Dict[BaseDataAdapter, List[str]] = {}
 
@@ -646,28 +1002,27 @@ Generate up to at least 1 possible ticker candidate up to 10. Be creative but re
             # If no adapters found for any tickers, return None for all
             return {ticker: None for ticker in tickers}
 
-        with ThreadPoolExecutor(max_workers=len(adapter_tickers)) as executor:
-            future_to_adapter = {
-                executor.submit(adapter.get_multiple_prices, ticker_list): adapter
-                for adapter, ticker_list in adapter_tickers.items()
-            }
+        future_to_adapter = {
+            adapter.submit_blocking(adapter.get_multiple_prices, ticker_list): adapter
+            for adapter, ticker_list in adapter_tickers.items()
+        }
 
-            for future in as_completed(future_to_adapter):
-                adapter = future_to_adapter[future]
-                try:
-                    results = future.result(timeout=60)  # 60 second timeout
-                    # Separate successful and failed results
-                    for ticker, price in results.items():
-                        if price is not None:
-                            all_results[ticker] = price
-                        else:
-                            failed_tickers.append(ticker)
-                except Exception as e:
-                    logger.warning(
-                        f"Batch price fetch failed for adapter {adapter.source.value}: {e}"
-                    )
-                    # Mark all tickers from this adapter as failed
-                    failed_tickers.extend(adapter_tickers[adapter])
+        for future in as_completed(future_to_adapter):
+            adapter = future_to_adapter[future]
+            try:
+                results = future.result()
+                # Separate successful and failed results
+                for ticker, price in results.items():
+                    if price is not None:
+                        all_results[ticker] = price
+                    else:
+                        failed_tickers.append(ticker)
+            except Exception as e:
+                logger.warning(
+                    f"Batch price fetch failed for adapter {adapter.source.value}: {e}"
+                )
+                # Mark all tickers from this adapter as failed
+                failed_tickers.extend(adapter_tickers[adapter])
 
         # Retry failed tickers individually with fallback adapters
         if failed_tickers:
@@ -705,70 +1060,235 @@ Generate up to at least 1 possible ticker candidate up to 10. Be creative but re
         Returns:
             List of historical price data
         """
-        # Get the primary adapter for this ticker
-        adapter = self.get_adapter_for_ticker(ticker)
+        prices = self._call_with_failover(
+            ticker,
+            "historical data",
+            lambda adapter: adapter.get_historical_prices(
+                ticker, start_date, end_date, interval
+            ),
+        )
+        return prices or []
 
-        if not adapter:
-            logger.warning(f"No suitable adapter found for ticker: {ticker}")
-            return []
+    # Async API. Adapter I/O runs on the shared adapter executor, so these
+    # methods can be awaited from the event loop without blocking it.
 
-        # Try the primary adapter
-        try:
-            logger.debug(
-                f"Fetching historical data for {ticker} from {adapter.source.value}"
+    async def _call_hedged_async(
+        self,
+        adapters: List[BaseDataAdapter],
+        ticker: str,
+        operation: str,
+        call: Callable[[BaseDataAdapter], T],
+    ) -> Tuple[Optional[T], Optional[BaseDataAdapter]]:
+        loop = asyncio.get_running_loop()
+        exchange = ticker.split(":", 1)[0]
+        remaining = list(adapters)
+        running: Dict[asyncio.Future, BaseDataAdapter] = {}
+        hedge_at = 0.0
+        launch_next = True
+
+        while True:
+            if launch_next and remaining:
+                adapter = remaining.pop(0)
+                future = asyncio.wrap_future(
+                    adapter.submit_blocking(
+                        self._timed_call, adapter, ticker, operation, call
+                    )
+                )
+                running[future] = adapter
+                hedge_at = loop.time() + self._hedge_delay(adapter, exchange)
+
+            if not running:
+                return None, None
+
+            timeout = max(0.0, hedge_at - loop.time()) if remaining else None
+            done, _ = await asyncio.wait(
+                list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
             )
-            prices = adapter.get_historical_prices(
-                ticker, start_date, end_date, interval
+
+            if not done:
+                logger.debug(f"Hedging {operation} request for {ticker}")
+                launch_next = True
+                continue
+
+            for future in done:
+                adapter = running.pop(future)
+                result = future.result()
+                if result:
+                    return result, adapter
+
+            launch_next = not running
+
+    async def _call_with_failover_async(
+        self, ticker: str, operation: str, call: Callable[[BaseDataAdapter], T]
+    ) -> Optional[T]:
+        """Async variant of ``_call_with_failover``."""
+        adapters = self._get_failover_adapters(ticker)
+        if not adapters:
+            logger.warning(f"No suitable adapter found for ticker: {ticker}")
+            return None
+
+        result, adapter = None, None
+        if self.hedging_enabled and len(adapters) > 1:
+            result, adapter = await self._call_hedged_async(
+                adapters, ticker, operation, call
             )
-            if prices:
-                logger.info(
-                    f"Successfully fetched {len(prices)} historical prices for {ticker} from {adapter.source.value}"
+        else:
+            for candidate in adapters:
+                result = await candidate.run_blocking(
+                    self._timed_call, candidate, ticker, operation, call
                 )
-                return prices
-            else:
-                logger.debug(
-                    f"Adapter {adapter.source.value} returned empty historical data for {ticker}"
+                if result:
+                    adapter = candidate
+                    break
+
+        return self._finish_failover(ticker, operation, result, adapter)
+
+    async def get_asset_info_async(self, ticker: str) -> Optional[Asset]:
+        """Async variant of ``get_asset_info``."""
+        cache = self.metadata_cache
+        if cache is not None:
+            cached = await asyncio.to_thread(cache.lookup, ticker)
+            if cached is not None:
+                return cached
+
+        asset = await self._call_with_failover_async(
+            ticker, "asset info", lambda adapter: adapter.get_asset_info(ticker)
+        )
+        if asset is not None and cache is not None:
+            await asyncio.to_thread(cache.store, asset)
+        return asset
+
+    async def get_real_time_price_async(self, ticker: str) -> Optional[AssetPrice]:
+        """Async variant of ``get_real_time_price``."""
+        cached = self._get_cached_price(ticker)
+        if cached is not None:
+            return cached
+
+        price = await self._call_with_failover_async(
+            ticker, "price", lambda adapter: adapter.get_real_time_price(ticker)
+        )
+        self._cache_price(ticker, price)
+        return price
+
+    async def get_historical_prices_async(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+    ) -> List[AssetPrice]:
+        """Async variant of ``get_historical_prices``."""
+        prices = await self._call_with_failover_async(
+            ticker,
+            "historical data",
+            lambda adapter: adapter.get_historical_prices(
+                ticker, start_date, end_date, interval
+            ),
+        )
+        return prices or []
+
+    async def get_multiple_prices_async(
+        self, tickers: List[str]
+    ) -> Dict[str, Optional[AssetPrice]]:
+        """Async variant of ``get_multiple_prices``."""
+        results, missing = self._split_cached_prices(tickers)
+        if missing:
+            fetched = await self._fetch_multiple_prices_async(missing)
+            for ticker, price in fetched.items():
+                self._cache_price(ticker, price)
+            results.update(fetched)
+        return {ticker: results.get(ticker) for ticker in tickers}
+
+    async def _fetch_multiple_prices_async(
+        self, tickers: List[str]
+    ) -> Dict[str, Optional[AssetPrice]]:
+        """Async variant of ``_fetch_multiple_prices``."""
+        adapter_tickers: Dict[BaseDataAdapter, List[str]] = {}
+        for ticker in tickers:
+            adapter = self.get_adapter_for_ticker(ticker)
+            if adapter:
+                adapter_tickers.setdefault(adapter, []).append(ticker)
+
+        all_results: Dict[str, Optional[AssetPrice]] = {}
+        failed_tickers: List[str] = []
+
+        adapters = list(adapter_tickers)
+        batches = await asyncio.gather(
+            *(
+                adapter.get_multiple_prices_async(adapter_tickers[adapter])
+                for adapter in adapters
+            ),
+            return_exceptions=True,
+        )
+        for adapter, results in zip(adapters, batches):
+            if isinstance(results, BaseException):
+                logger.warning(
+                    f"Batch price fetch failed for adapter {adapter.source.value}: {results}"
                 )
-        except Exception as e:
-            logger.warning(
-                f"Primary adapter {adapter.source.value} failed for historical data of {ticker}: {e}"
+                failed_tickers.extend(adapter_tickers[adapter])
+                continue
+            for ticker, price in results.items():
+                if price is not None:
+                    all_results[ticker] = price
+                else:
+                    failed_tickers.append(ticker)
+
+        # Retry failed tickers concurrently with failover
+        if failed_tickers:
+            logger.info(
+                f"Retrying {len(failed_tickers)} failed tickers with fallback adapters"
+            )
+            retried = await asyncio.gather(
+                *(self.get_real_time_price_async(t) for t in failed_tickers)
             )
+            all_results.update(zip(failed_tickers, retried))
 
-        # Automatic failover: try other adapters for this exchange
-        exchange = ticker.split(":")[0] if ":" in ticker else ""
-        fallback_adapters = self.get_adapters_for_exchange(exchange)
+        return {ticker: all_results.get(ticker) for ticker in tickers}
 
-        for fallback_adapter in fallback_adapters:
-            # Skip the primary adapter we already tried
-            if fallback_adapter.source == adapter.source:
-                continue
+    async def search_assets_async(
+        self, query: AssetSearchQuery
+    ) -> List[AssetSearchResult]:
+        """Async variant of ``search_assets``."""
+        # Database refresh of the index is blocking but not adapter I/O
+        await asyncio.to_thread(self._ensure_search_index)
 
-            if not fallback_adapter.validate_ticker(ticker):
-                continue
+        local_results = self.search_index.search(query.query, limit=query.limit)
+        if local_results:
+            self._enrich_search_in_background(query)
+            return local_results
 
-            try:
-                logger.debug(
-                    f"Fallback: trying {fallback_adapter.source.value} for historical data of {ticker}"
-                )
-                prices = fallback_adapter.get_historical_prices(
-                    ticker, start_date, end_date, interval
-                )
-                if prices:
-                    logger.info(
-                        f"Fallback success: fetched {len(prices)} historical prices for {ticker} from {fallback_adapter.source.value}"
-                    )
-                    # Update cache to use successful adapter
-                    with self._cache_lock:
-                        self._ticker_cache[ticker] = fallback_adapter
-                    return prices
-            except Exception as e:
+        with self.lock:
+            target_adapters = list(self.adapters.values())
+
+        all_results: List[AssetSearchResult] = []
+        batches = await asyncio.gather(
+            *(
+                asyncio.wait_for(adapter.search_assets_async(query), timeout=15)
+                for adapter in target_adapters
+            ),
+            return_exceptions=True,
+        )
+        for adapter, results in zip(target_adapters, batches):
+            if isinstance(results, BaseException):
                 logger.warning(
-                    f"Fallback adapter {fallback_adapter.source.value} failed for historical data of {ticker}: {e}"
+                    f"Search failed for adapter {adapter.source.value}: {results}"
                 )
                 continue
+            all_results.extend(results)
 
-        logger.error(f"All adapters failed for historical data of {ticker}")
-        return []
+        unique_results = self._deduplicate_search_results(all_results)
+        if not unique_results:
+            logger.info(
+                f"No results from adapters, trying fallback search for query: {query.query}"
+            )
+            # The LLM fallback validates on the adapter executor itself, so it
+            # must not occupy one of its workers
+            unique_results = await asyncio.to_thread(
+                self._fallback_search_assets, query
+            )
+        self.search_index.upsert_search_results(unique_results)
+
+        return unique_results[: query.limit]
 
 
 class WatchlistManager:
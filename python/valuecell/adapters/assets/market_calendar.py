@@ -0,0 +1,290 @@
+"""Market calendars for exchange trading sessions.
+
+Knows the regular session hours, lunch breaks, holidays and early closes of
+each exchange so that callers can skip upstream fetches while a market is
+closed. Calendars are loaded from the JSON files in the ``calendars``
+directory next to this module, one file per market:
+
+    {
+      "name": "China A-shares",
+      "exchanges": ["SSE", "SZSE", "BSE"],
+      "timezone": "Asia/Shanghai",
+      "sessions": [["09:30", "11:30"], ["13:00", "15:00"]],
+      "holidays": ["2025-01-01", ...],
+      "early_closes": {"2025-12-24": "13:00"}
+    }
+
+Markets trading around the clock set ``"always_open": true`` instead.
+Holiday lists have to be extended every year.
+"""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from .types import Exchange, MarketStatus
+
+logger = logging.getLogger(__name__)
+
+CALENDAR_DIR = Path(__file__).parent / "calendars"
+
+# How far ahead to look for the next session, covers the longest holidays
+MAX_LOOKAHEAD_DAYS = 30
+
+
+def _parse_time(value: str) -> time:
+    hour, minute = value.split(":")
+    return time(int(hour), int(minute))
+
+
+@dataclass(frozen=True)
+class TradingSession:
+    """A continuous trading session within a day, in exchange local time."""
+
+    start: time
+    end: time
+
+
+@dataclass
+class MarketCalendar:
+    """Trading calendar of one market."""
+
+    name: str
+    exchanges: Tuple[str, ...]
+    timezone: ZoneInfo
+    sessions: List[TradingSession] = field(default_factory=list)
+    holidays: Set[date] = field(default_factory=set)
+    early_closes: Dict[date, time] = field(default_factory=dict)
+    always_open: bool = False
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MarketCalendar":
+        """Create a calendar from its JSON representation."""
+        return cls(
+            name=data["name"],
+            exchanges=tuple(data.get("exchanges", [])),
+            timezone=ZoneInfo(data.get("timezone", "UTC")),
+            sessions=[
+                TradingSession(_parse_time(start), _parse_time(end))
+                for start, end in data.get("sessions", [])
+            ],
+            holidays={date.fromisoformat(d) for d in data.get("holidays", [])},
+            early_closes={
+                date.fromisoformat(d): _parse_time(t)
+                for d, t in data.get("early_closes", {}).items()
+            },
+            always_open=data.get("always_open", False),
+        )
+
+    def _local(self, at: Optional[datetime]) -> datetime:
+        """Convert a time to exchange local time; naive times are UTC."""
+        if at is None:
+            at = datetime.now(timezone.utc)
+        elif at.tzinfo is None:
+            at = at.replace(tzinfo=timezone.utc)
+        return at.astimezone(self.timezone)
+
+    def is_trading_day(self, day: date) -> bool:
+        """Check whether the market trades on a (local) calendar day."""
+        if self.always_open:
+            return True
+        return day.weekday() < 5 and day not in self.holidays
+
+    def sessions_on(self, day: date) -> List[Tuple[datetime, datetime]]:
+        """Session start and end times on a day, shortened by early closes.
+
+        Args:
+            day: Local calendar day
+
+        Returns:
+            Timezone-aware (start, end) pairs, empty on non-trading days
+        """
+        if not self.is_trading_day(day):
+            return []
+
+        early_close = self.early_closes.get(day)
+        result = []
+        for session in self.sessions:
+            end = session.end
+            if early_close is not None:
+                if session.start >= early_close:
+                    continue
+                end = min(end, early_close)
+            result.append(
+                (
+                    datetime.combine(day, session.start, self.timezone),
+                    datetime.combine(day, end, self.timezone),
+                )
+            )
+        return result
+
+    def is_open(self, at: Optional[datetime] = None) -> bool:
+        """Check whether the market is in a trading session.
+
+        Args:
+            at: Time to check, defaults to now; naive times are UTC
+
+        Returns:
+            True during a session, False on holidays, weekends, lunch
+            breaks and outside trading hours
+        """
+        if self.always_open:
+            return True
+        local = self._local(at)
+        return any(
+            start <= local < end for start, end in self.sessions_on(local.date())
+        )
+
+    def status(self, at: Optional[datetime] = None) -> MarketStatus:
+        """Market status at a time.
+
+        Before the first session of a trading day the market is pre-market,
+        after the last one after-hours; lunch breaks count as closed.
+        """
+        if self.always_open:
+            return MarketStatus.OPEN
+        local = self._local(at)
+        sessions = self.sessions_on(local.date())
+        if not sessions:
+            return MarketStatus.CLOSED
+        if local < sessions[0][0]:
+            return MarketStatus.PRE_MARKET
+        if local >= sessions[-1][1]:
+            return MarketStatus.AFTER_HOURS
+        if any(start <= local < end for start, end in sessions):
+            return MarketStatus.OPEN
+        return MarketStatus.CLOSED
+
+    def next_open(self, at: Optional[datetime] = None) -> Optional[datetime]:
+        """Start of the next session at or after a time.
+
+        Returns ``at`` itself while the market is open, or None if no session
+        is known within ``MAX_LOOKAHEAD_DAYS`` (e.g. holiday data ran out).
+        """
+        local = self._local(at)
+        if self.is_open(local):
+            return local
+        for offset in range(MAX_LOOKAHEAD_DAYS + 1):
+            day = local.date() + timedelta(days=offset)
+            for start, _ in self.sessions_on(day):
+                if start > local:
+                    return start
+        return None
+
+    def next_close(self, at: Optional[datetime] = None) -> Optional[datetime]:
+        """End of the current session, or None if closed or always open."""
+        if self.always_open:
+            return None
+        local = self._local(at)
+        for start, end in self.sessions_on(local.date()):
+            if start <= local < end:
+                return end
+        return None
+
+    def seconds_until_open(self, at: Optional[datetime] = None) -> Optional[float]:
+        """Seconds until the market opens; 0 while open, None if unknown."""
+        local = self._local(at)
+        next_open = self.next_open(local)
+        if next_open is None:
+            return None
+        return max(0.0, (next_open - local).total_seconds())
+
+
+def load_calendar(path: Union[str, Path]) -> MarketCalendar:
+    """Load a market calendar from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        return MarketCalendar.from_dict(json.load(f))
+
+
+def load_calendars(
+    directory: Union[str, Path] = CALENDAR_DIR,
+) -> Dict[str, MarketCalendar]:
+    """Load all calendars of a directory, keyed by exchange.
+
+    Args:
+        directory: Directory containing calendar JSON files
+
+    Returns:
+        Exchange value -> calendar
+    """
+    calendars: Dict[str, MarketCalendar] = {}
+    for path in sorted(Path(directory).glob("*.json")):
+        try:
+            calendar = load_calendar(path)
+        except Exception as e:
+            logger.error(f"Failed to load market calendar {path.name}: {e}")
+            continue
+        for exchange in calendar.exchanges:
+            calendars[exchange] = calendar
+    return calendars
+
+
+# Global calendars keyed by exchange
+_calendars: Optional[Dict[str, MarketCalendar]] = None
+_calendars_lock = threading.Lock()
+
+
+def _get_calendars() -> Dict[str, MarketCalendar]:
+    global _calendars
+    if _calendars is None:
+        with _calendars_lock:
+            if _calendars is None:
+                _calendars = load_calendars()
+    return _calendars
+
+
+def get_market_calendar(
+    exchange: Union[str, Exchange],
+) -> Optional[MarketCalendar]:
+    """Get the calendar of an exchange, or None if none is known."""
+    key = exchange.value if isinstance(exchange, Exchange) else exchange.upper()
+    return _get_calendars().get(key)
+
+
+def get_calendar_for_ticker(ticker: str) -> Optional[MarketCalendar]:
+    """Get the calendar of an internal ticker's (EXCHANGE:SYMBOL) exchange."""
+    if ":" not in ticker:
+        return None
+    return get_market_calendar(ticker.split(":", 1)[0])
+
+
+def is_market_open(ticker: str, at: Optional[datetime] = None) -> bool:
+    """Check whether a ticker's market is open.
+
+    Tickers without a known calendar are treated as open, so callers never
+    skip fetches they cannot reason about.
+
+    Args:
+        ticker: Internal ticker (EXCHANGE:SYMBOL)
+        at: Time to check, defaults to now; naive times are UTC
+
+    Returns:
+        True if the market is open or unknown
+    """
+    calendar = get_calendar_for_ticker(ticker)
+    return calendar is None or calendar.is_open(at)
+
+
+def seconds_until_market_open(
+    ticker: str, at: Optional[datetime] = None
+) -> Optional[float]:
+    """Seconds until a ticker's market opens; 0 while open or unknown.
+
+    Returns None if the calendar has no session within its lookahead.
+    """
+    calendar = get_calendar_for_ticker(ticker)
+    if calendar is None:
+        return 0.0
+    return calendar.seconds_until_open(at)
+
+
+def reset_market_calendars() -> None:
+    """Drop loaded calendars so they are re-read from disk (mainly for testing)."""
+    global _calendars
+    with _calendars_lock:
+        _calendars = None
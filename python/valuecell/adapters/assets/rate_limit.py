@@ -0,0 +1,450 @@
+"""Per-upstream rate limiting for data adapters.
+
+Upstream data providers (Yahoo Finance, East Money, Xueqiu, Sina, ...)
+enforce undocumented request quotas and answer bursts with HTTP 429 or,
+worse, silently empty payloads. All adapters share one ``RateLimiter``
+holding a token bucket per upstream host or endpoint, so concurrent users,
+background refreshes and the trading loop draw from the same budget.
+
+Callers waiting for a token are served by priority: interactive requests
+(user-facing API calls) go before background work (index enrichment,
+symbol list loading, trading loops). The priority of a call is taken from a
+context variable, see ``request_priority``.
+
+When an upstream signals throttling, its bucket backs off adaptively: the
+refill rate is halved and new requests pause for an exponentially growing
+backoff. Successful calls restore the rate additively (AIMD).
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .health import is_rate_limit_error
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Request priority classes; lower values are served first."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_request_priority: ContextVar[Priority] = ContextVar(
+    "adapter_request_priority", default=Priority.INTERACTIVE
+)
+
+
+def get_request_priority() -> Priority:
+    """Get the priority of upstream calls made in the current context."""
+    return _request_priority.get()
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Run upstream calls in the block with the given priority.
+
+    Args:
+        priority: Priority class for rate-limited upstream calls
+    """
+    token = _request_priority.set(priority)
+    try:
+        yield
+    finally:
+        _request_priority.reset(token)
+
+
+def is_empty_response(result: Any) -> bool:
+    """Check whether an upstream answer carries no data.
+
+    Throttled upstreams often answer with an empty payload instead of an
+    error, so a streak of empty answers is treated as a throttling signal.
+    """
+    if result is None:
+        return True
+    empty = getattr(result, "empty", None)
+    if isinstance(empty, bool):
+        return empty
+    if isinstance(result, (list, tuple, dict, set, str)):
+        return len(result) == 0
+    return False
+
+
+class RateLimitTimeout(TimeoutError):
+    """Raised when no upstream token became available within the timeout."""
+
+
+# Default quotas per upstream: sustained requests per second and burst size
+DEFAULT_UPSTREAM_LIMITS: Dict[str, Dict[str, float]] = {
+    "yahoo": {"rate": 2.0, "burst": 5},
+    "eastmoney": {"rate": 4.0, "burst": 8},
+    "xueqiu": {"rate": 1.0, "burst": 3},
+    "sina": {"rate": 1.0, "burst": 3},
+}
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 5
+
+
+class UpstreamLimiter:
+    """Token bucket for one upstream with priority queueing and AIMD backoff."""
+
+    def __init__(
+        self,
+        name: str,
+        rate: float = DEFAULT_RATE,
+        burst: float = DEFAULT_BURST,
+        background_reserve: float = 0.2,
+        min_rate: Optional[float] = None,
+        backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 60.0,
+        recovery_step: float = 0.1,
+        empty_threshold: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ):
+        """Initialize upstream limiter.
+
+        Args:
+            name: Upstream host or endpoint name
+            rate: Sustained tokens per second
+            burst: Bucket capacity
+            background_reserve: Fraction of the bucket background requests
+                leave untouched for interactive ones
+            min_rate: Lower bound for the backed-off rate, defaults to a
+                tenth of ``rate``
+            backoff_seconds: Pause after the first throttling signal;
+                doubles with each consecutive one
+            max_backoff_seconds: Upper bound of the pause
+            recovery_step: Fraction of ``rate`` restored per successful call
+            empty_threshold: Consecutive empty answers treated as throttling
+            clock: Monotonic clock, injectable for tests
+            sleep: Sleep function used while waiting for a token. Defaults to
+                waiting on a condition; tests pass one advancing a fake clock.
+        """
+        self.name = name
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = burst
+        self.background_reserve = background_reserve
+        self.min_rate = min_rate if min_rate is not None else rate / 10
+        self.backoff_seconds = backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.recovery_step = recovery_step
+        self.empty_threshold = empty_threshold
+        self._clock = clock
+        self._sleep = sleep
+
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._backoff_until = 0.0
+        self._consecutive_throttles = 0
+        self._empty_streak = 0
+
+        self._waiters: List[Tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._cond = threading.Condition()
+
+        # Metrics
+        self._queued: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._acquired: Dict[Priority, int] = {p: 0 for p in Priority}
+        self._total_wait: Dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._max_wait: Dict[Priority, float] = {p: 0.0 for p in Priority}
+        self._timeouts = 0
+        self._throttles = 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def _required_tokens(self, priority: Priority) -> float:
+        if priority == Priority.BACKGROUND:
+            # Never demand more than a full bucket, or background would starve
+            reserve = self.background_reserve * self.capacity
+            return max(1.0, min(self.capacity, 1.0 + reserve))
+        return 1.0
+
+    def _wait_needed(self, priority: Priority, now: float) -> float:
+        """Seconds until the head waiter can take a token."""
+        backoff = max(0.0, self._backoff_until - now)
+        missing = self._required_tokens(priority) - self._tokens
+        refill = missing / self.rate if missing > 0 else 0.0
+        return max(backoff, refill)
+
+    def _block(self, seconds: Optional[float]) -> None:
+        if self._sleep is None or seconds is None:
+            self._cond.wait(seconds)
+            return
+        self._cond.release()
+        try:
+            self._sleep(seconds)
+        finally:
+            self._cond.acquire()
+
+    def acquire(
+        self, priority: Optional[Priority] = None, timeout: Optional[float] = None
+    ) -> bool:
+        """Take one token, waiting behind higher priority callers.
+
+        Args:
+            priority: Priority class, defaults to the context's priority
+            timeout: Maximum seconds to wait, None waits indefinitely
+
+        Returns:
+            True if a token was taken, False if it would take longer than
+            ``timeout``
+        """
+        if priority is None:
+            priority = get_request_priority()
+
+        with self._cond:
+            start = self._clock()
+            deadline = start + timeout if timeout is not None else None
+            ticket = (int(priority), next(self._sequence))
+            heapq.heappush(self._waiters, ticket)
+            self._queued[priority] += 1
+            try:
+                while True:
+                    now = self._clock()
+                    self._refill(now)
+                    remaining = deadline - now if deadline is not None else None
+
+                    if self._waiters[0] == ticket:
+                        wait = self._wait_needed(priority, now)
+                        if wait <= 0:
+                            self._tokens -= 1.0
+                            self._record_wait(priority, now - start)
+                            return True
+                        if remaining is not None and wait > remaining:
+                            # Fail fast instead of sleeping into the deadline
+                            self._timeouts += 1
+                            return False
+                        self._block(wait)
+                    else:
+                        if remaining is not None and remaining <= 0:
+                            self._timeouts += 1
+                            return False
+                        self._block(remaining)
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._queued[priority] -= 1
+                self._cond.notify_all()
+
+    def _record_wait(self, priority: Priority, waited: float) -> None:
+        self._acquired[priority] += 1
+        self._total_wait[priority] += waited
+        self._max_wait[priority] = max(self._max_wait[priority], waited)
+
+    def _throttle(self, reason: str) -> None:
+        now = self._clock()
+        self._refill(now)
+        self._consecutive_throttles += 1
+        self._throttles += 1
+        self._empty_streak = 0
+        backoff = min(
+            self.backoff_seconds * 2 ** (self._consecutive_throttles - 1),
+            self.max_backoff_seconds,
+        )
+        self._backoff_until = max(self._backoff_until, now + backoff)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = 0.0
+        logger.warning(
+            f"Upstream {self.name} throttled ({reason}), backing off {backoff:.1f}s "
+            f"at {self.rate:.2f} req/s"
+        )
+
+    def report_throttled(self, reason: str = "rate limited") -> None:
+        """Back off after an explicit throttling signal such as HTTP 429."""
+        with self._cond:
+            self._throttle(reason)
+            self._cond.notify_all()
+
+    def report_empty(self) -> None:
+        """Record an empty answer; a streak of them counts as throttling."""
+        with self._cond:
+            self._empty_streak += 1
+            if self._empty_streak >= self.empty_threshold:
+                self._throttle(f"{self._empty_streak} empty responses")
+                self._cond.notify_all()
+
+    def report_success(self) -> None:
+        """Record a successful answer and restore the rate additively."""
+        with self._cond:
+            self._consecutive_throttles = 0
+            self._empty_streak = 0
+            if self.rate < self.base_rate:
+                self._refill(self._clock())
+                self.rate = min(
+                    self.base_rate, self.rate + self.base_rate * self.recovery_step
+                )
+
+    def call(
+        self,
+        fn: Callable,
+        *args: Any,
+        priority: Optional[Priority] = None,
+        timeout: Optional[float] = None,
+        expect_data: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """Call ``fn`` once a token is available and feed back its outcome.
+
+        Args:
+            fn: Callable hitting the upstream
+            *args: Positional arguments for ``fn``
+            priority: Priority class, defaults to the context's priority
+            timeout: Maximum seconds to wait for a token
+            expect_data: Whether a healthy upstream always answers with data.
+                Pass False for lookups that are legitimately empty (searches,
+                unknown tickers) so their empty answers are not counted as
+                throttling
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            Result of ``fn``
+
+        Raises:
+            RateLimitTimeout: If no token became available in time
+        """
+        if not self.acquire(priority=priority, timeout=timeout):
+            raise RateLimitTimeout(f"No {self.name} request slot within {timeout}s")
+
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self.report_throttled(type(e).__name__)
+            raise
+
+        if not is_empty_response(result):
+            self.report_success()
+        elif expect_data:
+            self.report_empty()
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Queue depth, wait time and backoff state of this upstream."""
+        with self._cond:
+            now = self._clock()
+            self._refill(now)
+            return {
+                "rate": round(self.rate, 4),
+                "base_rate": self.base_rate,
+                "tokens": round(self._tokens, 4),
+                "backoff_remaining": round(max(0.0, self._backoff_until - now), 4),
+                "throttles": self._throttles,
+                "timeouts": self._timeouts,
+                "queue_depth": {p.name.lower(): self._queued[p] for p in Priority},
+                "acquired": {p.name.lower(): self._acquired[p] for p in Priority},
+                "avg_wait": {
+                    p.name.lower(): round(self._total_wait[p] / self._acquired[p], 4)
+                    if self._acquired[p]
+                    else 0.0
+                    for p in Priority
+                },
+                "max_wait": {
+                    p.name.lower(): round(self._max_wait[p], 4) for p in Priority
+                },
+            }
+
+
+class RateLimiter:
+    """Registry of per-upstream limiters shared by all adapters."""
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Dict[str, float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            limits: Limiter settings per upstream name, keyword arguments of
+                ``UpstreamLimiter``. Unknown upstreams use the defaults.
+            clock: Monotonic clock, injectable for tests
+            sleep: Sleep function used while waiting, injectable for tests
+        """
+        self.limits = dict(DEFAULT_UPSTREAM_LIMITS if limits is None else limits)
+        self._clock = clock
+        self._sleep = sleep
+        self._limiters: Dict[str, UpstreamLimiter] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, upstream: str, **settings: Any) -> UpstreamLimiter:
+        """Replace the limiter of an upstream with new settings.
+
+        Args:
+            upstream: Upstream host or endpoint name
+            **settings: Keyword arguments of ``UpstreamLimiter``
+
+        Returns:
+            The new limiter
+        """
+        with self._lock:
+            self.limits[upstream] = settings
+            limiter = UpstreamLimiter(
+                upstream, clock=self._clock, sleep=self._sleep, **settings
+            )
+            self._limiters[upstream] = limiter
+            return limiter
+
+    def get(self, upstream: str) -> UpstreamLimiter:
+        """Get the limiter of an upstream, creating it on first use."""
+        limiter = self._limiters.get(upstream)
+        if limiter is None:
+            with self._lock:
+                limiter = self._limiters.get(upstream)
+                if limiter is None:
+                    limiter = UpstreamLimiter(
+                        upstream,
+                        clock=self._clock,
+                        sleep=self._sleep,
+                        **self.limits.get(upstream, {}),
+                    )
+                    self._limiters[upstream] = limiter
+        return limiter
+
+    def call(self, upstream: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Call ``fn`` under the upstream's rate limit.
+
+        See ``UpstreamLimiter.call`` for the accepted keyword arguments.
+        """
+        return self.get(upstream).call(fn, *args, **kwargs)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Metrics of all upstreams used so far."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return {limiter.name: limiter.metrics() for limiter in limiters}
+
+
+# Global rate limiter instance
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the process-wide upstream rate limiter."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Drop the global rate limiter (mainly for testing)."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = None
@@ -0,0 +1,445 @@
+"""Offline asset search index.
+
+This module keeps an in-memory index over known assets (the ``assets`` table and
+the adapters' symbol lists) so that interactive asset search can be answered
+locally without any network round-trip. Matching covers:
+
+- Prefix matches on symbols, tickers, localized names, name words and aliases
+- Pinyin initials and full pinyin for Chinese names (requires ``pypinyin``)
+- Substring and trigram-based fuzzy matches for typos
+"""
+
+import bisect
+import logging
+import re
+import threading
+import unicodedata
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .types import AssetSearchResult, AssetType, Exchange
+
+try:
+    from pypinyin import Style, lazy_pinyin
+except ImportError:
+    lazy_pinyin = None
+    Style = None
+
+logger = logging.getLogger(__name__)
+
+# Relative weight of each key kind; the final score is weight * match quality
+SYMBOL_WEIGHT = 1.0
+NAME_WEIGHT = 0.85
+ALIAS_WEIGHT = 0.85
+PINYIN_INITIALS_WEIGHT = 0.8
+NAME_WORD_WEIGHT = 0.75
+PINYIN_FULL_WEIGHT = 0.75
+
+# Minimum trigram similarity for a fuzzy match
+FUZZY_THRESHOLD = 0.3
+# Upper bound of fuzzy candidates scored per query
+MAX_FUZZY_CANDIDATES = 200
+# Bulk upserts prepared outside the lock before building under it
+BULK_UPSERT_ATTEMPTS = 3
+
+EXCHANGE_COUNTRIES = {
+    Exchange.NASDAQ.value: "US",
+    Exchange.NYSE.value: "US",
+    Exchange.AMEX.value: "US",
+    Exchange.SSE.value: "CN",
+    Exchange.SZSE.value: "CN",
+    Exchange.BSE.value: "CN",
+    Exchange.HKEX.value: "HK",
+    Exchange.CRYPTO.value: "US",
+}
+
+_CJK_RE = re.compile(r"[一-鿿]")
+_SEPARATOR_RE = re.compile(r"[\s\-_.,&()/'·]+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for matching: NFKC, lower case, no separators."""
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return _SEPARATOR_RE.sub("", text)
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"^{text}$"
+    if len(padded) < 3:
+        return {padded}
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _pinyin_keys(name: str) -> List[Tuple[str, float]]:
+    """Build pinyin initials and full pinyin keys for a Chinese name."""
+    if lazy_pinyin is None or not _CJK_RE.search(name):
+        return []
+    try:
+        initials = "".join(lazy_pinyin(name, style=Style.FIRST_LETTER))
+        full = "".join(lazy_pinyin(name))
+    except Exception as e:
+        logger.debug(f"Failed to build pinyin for {name}: {e}")
+        return []
+    return [
+        (normalize_text(initials), PINYIN_INITIALS_WEIGHT),
+        (normalize_text(full), PINYIN_FULL_WEIGHT),
+    ]
+
+
+@dataclass
+class IndexedAsset:
+    """Searchable description of an asset."""
+
+    ticker: str
+    asset_type: AssetType
+    names: Dict[str, str] = field(default_factory=dict)
+    aliases: List[str] = field(default_factory=list)
+    currency: Optional[str] = None
+
+    @property
+    def exchange(self) -> str:
+        return self.ticker.split(":", 1)[0]
+
+    @property
+    def symbol(self) -> str:
+        return self.ticker.split(":", 1)[1]
+
+    def build_keys(self) -> List[Tuple[str, float]]:
+        """Build the normalized (key, weight) pairs this asset is found by."""
+        keys: Dict[str, float] = {}
+
+        def add(key: str, weight: float) -> None:
+            if key and weight > keys.get(key, 0.0):
+                keys[key] = weight
+
+        symbol = normalize_text(self.symbol)
+        add(symbol, SYMBOL_WEIGHT)
+        add(normalize_text(self.ticker), SYMBOL_WEIGHT)
+        # HK codes are often typed without leading zeros ("700" for 00700)
+        if symbol.isdigit():
+            add(symbol.lstrip("0"), SYMBOL_WEIGHT)
+
+        for name in set(self.names.values()):
+            if not name:
+                continue
+            add(normalize_text(name), NAME_WEIGHT)
+            words = [w for w in re.split(r"\s+", name.strip()) if w]
+            for i in range(1, len(words)):
+                add(normalize_text(" ".join(words[i:])), NAME_WORD_WEIGHT)
+            for key, weight in _pinyin_keys(name):
+                add(key, weight)
+
+        for alias in self.aliases:
+            add(normalize_text(alias), ALIAS_WEIGHT)
+
+        return list(keys.items())
+
+    def to_search_result(self, relevance_score: float) -> AssetSearchResult:
+        return AssetSearchResult(
+            ticker=self.ticker,
+            asset_type=self.asset_type,
+            names=dict(self.names),
+            exchange=self.exchange,
+            country=EXCHANGE_COUNTRIES.get(self.exchange, "US"),
+            currency=self.currency,
+            relevance_score=round(min(relevance_score, 1.0), 4),
+        )
+
+
+def _merge_assets(existing: IndexedAsset, asset: IndexedAsset) -> IndexedAsset:
+    """Merge a new description of an asset into an existing one."""
+    names = {
+        **existing.names,
+        **{k: v for k, v in asset.names.items() if v},
+    }
+    aliases = list(dict.fromkeys(existing.aliases + asset.aliases))
+    return IndexedAsset(
+        ticker=asset.ticker,
+        asset_type=asset.asset_type,
+        names=names,
+        aliases=aliases,
+        currency=asset.currency or existing.currency,
+    )
+
+
+@dataclass
+class _IndexUpdate:
+    """A bulk upsert prepared outside the index lock.
+
+    Holds the merged batch entries and complete new copies of the sorted key
+    list and trigram map; trigram sets the batch touches are copied before
+    they are changed, so the live index is never modified until the swap.
+    """
+
+    version: int
+    entries: Dict[str, IndexedAsset]
+    keys: Dict[str, List[Tuple[str, float]]]
+    sorted_keys: List[Tuple[str, str]]
+    trigrams: Dict[str, Set[str]]
+
+    @classmethod
+    def build(
+        cls, batch: Dict[str, IndexedAsset], index: "LocalAssetIndex"
+    ) -> "_IndexUpdate":
+        """Prepare a batch; only the snapshot of the index needs its lock."""
+        with index._lock:
+            version = index._version
+            existing = {t: index._entries[t] for t in batch if t in index._entries}
+            old_keys = {t: index._keys[t] for t in batch if t in index._keys}
+            sorted_keys = list(index._sorted_keys)
+            trigrams = dict(index._trigrams)
+
+        touched: Dict[str, Set[str]] = {}
+
+        def gram_set(gram: str) -> Set[str]:
+            tickers = touched.get(gram)
+            if tickers is None:
+                tickers = touched[gram] = set(trigrams.get(gram, ()))
+            return tickers
+
+        dropped = set()
+        for ticker, keys in old_keys.items():
+            for key, _ in keys:
+                dropped.add((key, ticker))
+                for gram in _trigrams(key):
+                    gram_set(gram).discard(ticker)
+        if dropped:
+            sorted_keys = [k for k in sorted_keys if k not in dropped]
+
+        entries: Dict[str, IndexedAsset] = {}
+        new_keys: Dict[str, List[Tuple[str, float]]] = {}
+        for ticker, asset in batch.items():
+            if ticker in existing:
+                asset = _merge_assets(existing[ticker], asset)
+            keys = asset.build_keys()
+            entries[ticker] = asset
+            new_keys[ticker] = keys
+            for key, _ in keys:
+                sorted_keys.append((key, ticker))
+                for gram in _trigrams(key):
+                    gram_set(gram).add(ticker)
+        sorted_keys.sort()
+
+        for gram, tickers in touched.items():
+            if tickers:
+                trigrams[gram] = tickers
+            else:
+                trigrams.pop(gram, None)
+        return cls(version, entries, new_keys, sorted_keys, trigrams)
+
+
+class LocalAssetIndex:
+    """Thread-safe in-memory asset search index.
+
+    Keys are kept in a sorted list for prefix lookups and in a trigram
+    inverted index for fuzzy lookups. Both are updated incrementally as
+    assets are added, updated or removed.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._entries: Dict[str, IndexedAsset] = {}
+        self._keys: Dict[str, List[Tuple[str, float]]] = {}
+        self._sorted_keys: List[Tuple[str, str]] = []  # (key, ticker)
+        self._trigrams: Dict[str, Set[str]] = {}  # trigram -> tickers
+        self._lock = threading.RLock()
+        # Bumped on every write, so bulk loads can detect concurrent writes
+        self._version = 0
+        # Highest ``updated_at`` seen from the assets table, for incremental loads
+        self.repository_watermark: Optional[datetime] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, ticker: str) -> bool:
+        return ticker in self._entries
+
+    def get(self, ticker: str) -> Optional[IndexedAsset]:
+        """Get an indexed asset by ticker."""
+        return self._entries.get(ticker)
+
+    def upsert(self, asset: IndexedAsset) -> None:
+        """Add or replace an asset, merging names and aliases with existing ones."""
+        with self._lock:
+            existing = self._entries.get(asset.ticker)
+            if existing:
+                asset = _merge_assets(existing, asset)
+                self._remove_keys(asset.ticker)
+
+            keys = asset.build_keys()
+            self._entries[asset.ticker] = asset
+            self._keys[asset.ticker] = keys
+            for key, _ in keys:
+                bisect.insort(self._sorted_keys, (key, asset.ticker))
+                for gram in _trigrams(key):
+                    self._trigrams.setdefault(gram, set()).add(asset.ticker)
+            self._version += 1
+
+    def upsert_many(self, assets: Iterable[IndexedAsset]) -> int:
+        """Add or replace several assets. Returns the number processed.
+
+        The batch is built outside the lock on a copy of the key list and
+        trigram map (one sort instead of an insert per key) and swapped in,
+        so a bulk load only blocks searches while the index is copied.
+        """
+        batch: Dict[str, IndexedAsset] = {}
+        count = 0
+        for asset in assets:
+            count += 1
+            previous = batch.get(asset.ticker)
+            batch[asset.ticker] = _merge_assets(previous, asset) if previous else asset
+        if not batch:
+            return 0
+
+        # Concurrent writes invalidate a prepared batch; retry, then give up
+        # on building it outside the lock
+        for _ in range(BULK_UPSERT_ATTEMPTS):
+            update = _IndexUpdate.build(batch, self)
+            with self._lock:
+                if update.version == self._version:
+                    self._swap(update)
+                    return count
+        with self._lock:
+            self._swap(_IndexUpdate.build(batch, self))
+        return count
+
+    def upsert_search_results(self, results: Iterable[AssetSearchResult]) -> int:
+        """Index assets discovered through remote search."""
+        return self.upsert_many(
+            IndexedAsset(
+                ticker=result.ticker,
+                asset_type=result.asset_type,
+                names=dict(result.names),
+                currency=result.currency,
+            )
+            for result in results
+        )
+
+    def remove(self, ticker: str) -> bool:
+        """Remove an asset from the index."""
+        with self._lock:
+            if ticker not in self._entries:
+                return False
+            self._remove_keys(ticker)
+            del self._entries[ticker]
+            self._version += 1
+            return True
+
+    def _swap(self, update: _IndexUpdate) -> None:
+        """Install a prepared batch; the caller holds the lock."""
+        self._entries.update(update.entries)
+        self._keys.update(update.keys)
+        self._sorted_keys = update.sorted_keys
+        self._trigrams = update.trigrams
+        self._version += 1
+
+    def _remove_keys(self, ticker: str) -> None:
+        for key, _ in self._keys.pop(ticker, []):
+            pos = bisect.bisect_left(self._sorted_keys, (key, ticker))
+            if pos < len(self._sorted_keys) and self._sorted_keys[pos] == (
+                key,
+                ticker,
+            ):
+                del self._sorted_keys[pos]
+            for gram in _trigrams(key):
+                tickers = self._trigrams.get(gram)
+                if tickers:
+                    tickers.discard(ticker)
+                    if not tickers:
+                        del self._trigrams[gram]
+
+    def search(self, query: str, limit: int = 10) -> List[AssetSearchResult]:
+        """Search the index.
+
+        Args:
+            query: Free-text query (ticker, symbol, name, pinyin initials, ...)
+            limit: Maximum number of results
+
+        Returns:
+            Results ordered by descending relevance score
+        """
+        q = normalize_text(query)
+        if not q:
+            return []
+
+        scores: Dict[str, float] = {}
+
+        def score(ticker: str, value: float) -> None:
+            if value > scores.get(ticker, 0.0):
+                scores[ticker] = value
+
+        with self._lock:
+            # Prefix matches (exact matches included) via the sorted key list
+            pos = bisect.bisect_left(self._sorted_keys, (q, ""))
+            while pos < len(self._sorted_keys):
+                key, ticker = self._sorted_keys[pos]
+                if not key.startswith(q):
+                    break
+                weight = self._key_weight(ticker, key)
+                if key == q:
+                    score(ticker, weight)
+                else:
+                    score(ticker, weight * (0.8 + 0.1 * len(q) / len(key)))
+                pos += 1
+
+            # Substring and fuzzy matches via the trigram index
+            if len(scores) < limit and len(q) >= 2:
+                query_grams = _trigrams(q)
+                shared: Dict[str, int] = {}
+                for gram in query_grams:
+                    for ticker in self._trigrams.get(gram, ()):
+                        shared[ticker] = shared.get(ticker, 0) + 1
+
+                candidates = sorted(shared, key=shared.get, reverse=True)
+                for ticker in candidates[:MAX_FUZZY_CANDIDATES]:
+                    for key, weight in self._keys.get(ticker, []):
+                        if q in key:
+                            score(ticker, weight * 0.6)
+                            continue
+                        key_grams = _trigrams(key)
+                        similarity = len(query_grams & key_grams) / len(
+                            query_grams | key_grams
+                        )
+                        if similarity >= FUZZY_THRESHOLD:
+                            score(ticker, weight * 0.5 * similarity)
+
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return [
+                self._entries[ticker].to_search_result(value)
+                for ticker, value in ranked[:limit]
+            ]
+
+    def _key_weight(self, ticker: str, key: str) -> float:
+        for k, weight in self._keys.get(ticker, []):
+            if k == key:
+                return weight
+        return 0.0
+
+
+def indexed_asset_from_record(record) -> Optional[IndexedAsset]:
+    """Build an IndexedAsset from an ``assets`` table row."""
+    symbol = getattr(record, "symbol", None)
+    if not symbol or ":" not in symbol:
+        return None
+
+    try:
+        asset_type = AssetType(record.asset_type)
+    except ValueError:
+        asset_type = AssetType.STOCK
+
+    metadata = record.asset_metadata or {}
+    names: Dict[str, str] = {}
+    if isinstance(metadata.get("names"), dict):
+        names.update({k: v for k, v in metadata["names"].items() if v})
+    if record.name:
+        names.setdefault("en-US", record.name)
+
+    aliases = metadata.get("aliases") or []
+    return IndexedAsset(
+        ticker=symbol,
+        asset_type=asset_type,
+        names=names,
+        aliases=[a for a in aliases if isinstance(a, str)],
+        currency=metadata.get("currency"),
+    )
@@ -0,0 +1,200 @@
+"""Tests for the shared adapter executor and async adapter API."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from valuecell.adapters.assets.base import AdapterCapability, BaseDataAdapter
+from valuecell.adapters.assets.executor import AdapterExecutor, reset_adapter_executor
+from valuecell.adapters.assets.manager import AdapterManager
+from valuecell.adapters.assets.types import (
+    AssetPrice,
+    AssetType,
+    DataSource,
+    Exchange,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    reset_adapter_executor()
+    yield
+    reset_adapter_executor()
+
+
+class ConcurrencyProbe:
+    """Blocking callable recording the peak number of concurrent calls."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, value=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return value
+
+
+class TestAdapterExecutor:
+    def test_per_key_limit(self):
+        executor = AdapterExecutor(max_workers=8)
+        executor.set_limit("slow", 2)
+        probe = ConcurrencyProbe()
+
+        futures = [executor.submit("slow", probe, i) for i in range(6)]
+
+        assert [f.result(timeout=5) for f in futures] == list(range(6))
+        assert probe.peak == 2
+        executor.shutdown()
+
+    def test_queued_calls_do_not_occupy_workers(self):
+        executor = AdapterExecutor(max_workers=2)
+        executor.set_limit("slow", 1)
+        release = threading.Event()
+
+        for _ in range(5):
+            executor.submit("slow", release.wait, 5)
+
+        # Only one worker is busy with "slow"; the other key still runs
+        assert executor.submit("fast", lambda: "ok").result(timeout=1) == "ok"
+        assert executor.stats()["slow"] == {"active": 1, "queued": 4, "limit": 1}
+
+        release.set()
+        executor.shutdown()
+
+    def test_exceptions_propagate_and_release_slot(self):
+        executor = AdapterExecutor(max_workers=2)
+        executor.set_limit("key", 1)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            executor.submit("key", fail).result(timeout=1)
+        assert executor.submit("key", lambda: 1).result(timeout=1) == 1
+        executor.shutdown()
+
+    def test_cancelled_queued_call_is_skipped(self):
+        executor = AdapterExecutor(max_workers=2)
+        executor.set_limit("key", 1)
+        release = threading.Event()
+        calls = []
+
+        first = executor.submit("key", release.wait, 5)
+        queued = executor.submit("key", calls.append, "queued")
+        assert queued.cancel()
+        release.set()
+
+        first.result(timeout=1)
+        assert executor.submit("key", lambda: "next").result(timeout=1) == "next"
+        assert calls == []
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_does_not_block_event_loop(self):
+        executor = AdapterExecutor(max_workers=4)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(executor.run("key", time.sleep, 0.1), ticker())
+
+        assert len(ticks) == 5
+        executor.shutdown()
+
+
+class PriceAdapter(BaseDataAdapter):
+    """Fake NASDAQ adapter with a blocking price lookup."""
+
+    def __init__(self, source, price="100", **kwargs):
+        self.price = price
+        self.probe = ConcurrencyProbe(delay=0.05)
+        super().__init__(source, **kwargs)
+
+    def _initialize(self):
+        pass
+
+    def get_real_time_price(self, ticker):
+        self.probe()
+        if self.price is None:
+            return None
+        return AssetPrice(
+            ticker=ticker,
+            price=Decimal(self.price),
+            currency="USD",
+            timestamp=datetime.now(),
+            source=self.source,
+        )
+
+    def search_assets(self, query):
+        return []
+
+    def get_asset_info(self, ticker):
+        return None
+
+    def get_historical_prices(self, ticker, start_date, end_date, interval="1d"):
+        return []
+
+    def get_capabilities(self):
+        return [AdapterCapability(AssetType.STOCK, {Exchange.NASDAQ})]
+
+    def convert_to_source_ticker(self, internal_ticker):
+        return internal_ticker
+
+    def convert_to_internal_ticker(self, source_ticker, default_exchange=None):
+        return source_ticker
+
+
+class TestAsyncAdapterApi:
+    @pytest.mark.asyncio
+    async def test_adapter_async_variant_respects_max_concurrency(self):
+        adapter = PriceAdapter(DataSource.YFINANCE, max_concurrency=2)
+
+        prices = await asyncio.gather(
+            *(adapter.get_real_time_price_async(f"NASDAQ:T{i}") for i in range(6))
+        )
+
+        assert all(p.price == Decimal("100") for p in prices)
+        assert adapter.probe.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_manager_multiple_prices_async_with_failover(self):
+        primary = PriceAdapter(DataSource.YFINANCE, price=None)
+        secondary = PriceAdapter(DataSource.AKSHARE, price="101")
+        manager = AdapterManager()
+        manager.register_adapter(primary)
+        manager.register_adapter(secondary)
+
+        prices = await manager.get_multiple_prices_async(["NASDAQ:AAPL", "NASDAQ:MSFT"])
+
+        assert prices["NASDAQ:AAPL"].price == Decimal("101")
+        assert prices["NASDAQ:MSFT"].source == DataSource.AKSHARE
+
+    @pytest.mark.asyncio
+    async def test_manager_real_time_price_async_hedged(self):
+        slow = PriceAdapter(DataSource.YFINANCE, price="100")
+        slow.probe.delay = 1.0
+        fast = PriceAdapter(DataSource.AKSHARE, price="101")
+        manager = AdapterManager()
+        manager.register_adapter(slow)
+        manager.register_adapter(fast)
+        manager.configure_hedging(min_delay=0.05, max_delay=0.1)
+
+        start = time.monotonic()
+        price = await manager.get_real_time_price_async("NASDAQ:AAPL")
+
+        assert price.price == Decimal("101")
+        assert time.monotonic() - start < 0.8
@@ -0,0 +1,234 @@
+"""Tests for adapter health scoring and hedged failover."""
+
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from valuecell.adapters.assets.base import AdapterCapability, BaseDataAdapter
+from valuecell.adapters.assets.health import AdapterHealthTracker, is_rate_limit_error
+from valuecell.adapters.assets.manager import AdapterManager
+from valuecell.adapters.assets.types import (
+    AssetPrice,
+    AssetType,
+    DataSource,
+    Exchange,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DelayedAdapter(BaseDataAdapter):
+    """Fake adapter answering NASDAQ prices after a configurable delay."""
+
+    def __init__(self, source, delay=0.0, error=None, price="100"):
+        self.delay = delay
+        self.error = error
+        self.price = price
+        self.calls = 0
+        self.release = threading.Event()
+        super().__init__(source)
+
+    def _initialize(self):
+        pass
+
+    def get_real_time_price(self, ticker):
+        self.calls += 1
+        if self.delay:
+            self.release.wait(self.delay)
+        if self.error:
+            raise self.error
+        if self.price is None:
+            return None
+        return AssetPrice(
+            ticker=ticker,
+            price=Decimal(self.price),
+            currency="USD",
+            timestamp=datetime.now(),
+            source=self.source,
+        )
+
+    def search_assets(self, query):
+        return []
+
+    def get_asset_info(self, ticker):
+        return None
+
+    def get_historical_prices(self, ticker, start_date, end_date, interval="1d"):
+        return []
+
+    def get_capabilities(self):
+        return [AdapterCapability(AssetType.STOCK, {Exchange.NASDAQ})]
+
+    def convert_to_source_ticker(self, internal_ticker):
+        return internal_ticker
+
+    def convert_to_internal_ticker(self, source_ticker, default_exchange=None):
+        return source_ticker
+
+
+def make_manager(*adapters):
+    manager = AdapterManager()
+    # Tests count upstream calls; do not depend on today's market hours
+    manager.configure_price_cache(enabled=False)
+    for adapter in adapters:
+        manager.register_adapter(adapter)
+    return manager
+
+
+class TestAdapterHealthTracker:
+    def test_ewma_latency_and_error_rate(self):
+        tracker = AdapterHealthTracker(alpha=0.5)
+
+        tracker.record_success(DataSource.YFINANCE, "NASDAQ", 1.0)
+        tracker.record_success(DataSource.YFINANCE, "NASDAQ", 3.0)
+        tracker.record_failure(DataSource.YFINANCE, "NASDAQ", 2.0)
+
+        health = tracker.get_health(DataSource.YFINANCE, "NASDAQ")
+        assert health.ewma_latency == pytest.approx(2.0)
+        assert health.error_rate == pytest.approx(0.5)
+        assert health.samples == 3
+        # Stats are per exchange
+        assert tracker.get_health(DataSource.YFINANCE, "SSE") is None
+
+    def test_rate_limit_starts_growing_cooldown(self):
+        clock = FakeClock()
+        tracker = AdapterHealthTracker(cooldown_seconds=10, clock=clock)
+
+        tracker.record_failure(
+            DataSource.YFINANCE, "NASDAQ", 0.1, RuntimeError("HTTP 429")
+        )
+        assert tracker.in_cooldown(DataSource.YFINANCE, "NASDAQ")
+        clock.now = 10
+        assert not tracker.in_cooldown(DataSource.YFINANCE, "NASDAQ")
+
+        tracker.record_failure(
+            DataSource.YFINANCE, "NASDAQ", 0.1, RuntimeError("Too Many Requests")
+        )
+        clock.now = 25
+        assert tracker.in_cooldown(DataSource.YFINANCE, "NASDAQ")
+
+    def test_plain_errors_do_not_cool_down(self):
+        tracker = AdapterHealthTracker()
+        tracker.record_failure(
+            DataSource.YFINANCE, "NASDAQ", 0.1, ValueError("bad symbol")
+        )
+        assert not tracker.in_cooldown(DataSource.YFINANCE, "NASDAQ")
+
+    def test_is_rate_limit_error(self):
+        class YFRateLimitError(Exception):
+            pass
+
+        assert is_rate_limit_error(YFRateLimitError("slow down"))
+        assert not is_rate_limit_error(ValueError("not found"))
+
+    def test_rank_prefers_faster_and_keeps_order_on_ties(self):
+        tracker = AdapterHealthTracker()
+        slow = DelayedAdapter(DataSource.YFINANCE)
+        fast = DelayedAdapter(DataSource.AKSHARE)
+
+        assert tracker.rank([slow, fast], "NASDAQ") == [slow, fast]
+
+        tracker.record_success(DataSource.YFINANCE, "NASDAQ", 3.0)
+        tracker.record_success(DataSource.AKSHARE, "NASDAQ", 0.2)
+        assert tracker.rank([slow, fast], "NASDAQ") == [fast, slow]
+
+    def test_latency_percentile(self):
+        tracker = AdapterHealthTracker()
+        for latency in range(1, 11):
+            tracker.record_success(DataSource.YFINANCE, "NASDAQ", float(latency))
+
+        assert tracker.latency_percentile(DataSource.YFINANCE, "NASDAQ", 0.9) == 9.0
+        assert tracker.latency_percentile(DataSource.AKSHARE, "NASDAQ", 0.9) is None
+
+
+class TestHealthRankedFailover:
+    def test_failover_on_error_and_reroute(self):
+        primary = DelayedAdapter(DataSource.YFINANCE, error=RuntimeError("boom"))
+        secondary = DelayedAdapter(DataSource.AKSHARE, price="101")
+        manager = make_manager(primary, secondary)
+
+        price = manager.get_real_time_price("NASDAQ:AAPL")
+        assert price.price == Decimal("101")
+
+        # The failing adapter is now scored worse and tried second
+        manager.get_real_time_price("NASDAQ:AAPL")
+        assert primary.calls == 1
+        assert secondary.calls == 2
+
+    def test_rate_limited_adapter_is_skipped(self):
+        primary = DelayedAdapter(
+            DataSource.YFINANCE, error=RuntimeError("429 Too Many Requests")
+        )
+        secondary = DelayedAdapter(DataSource.AKSHARE)
+        manager = make_manager(primary, secondary)
+
+        manager.get_real_time_price("NASDAQ:AAPL")
+        primary.error = None
+        manager.get_real_time_price("NASDAQ:AAPL")
+
+        assert primary.calls == 1
+
+    def test_all_adapters_failing_returns_none(self):
+        manager = make_manager(
+            DelayedAdapter(DataSource.YFINANCE, price=None),
+            DelayedAdapter(DataSource.AKSHARE, error=RuntimeError("down")),
+        )
+        assert manager.get_real_time_price("NASDAQ:AAPL") is None
+        assert (
+            manager.get_historical_prices(
+                "NASDAQ:AAPL", datetime(2025, 1, 1), datetime(2025, 1, 2)
+            )
+            == []
+        )
+
+
+class TestHedgedRequests:
+    def test_slow_primary_is_hedged(self):
+        slow = DelayedAdapter(DataSource.YFINANCE, delay=5, price="100")
+        fast = DelayedAdapter(DataSource.AKSHARE, price="101")
+        manager = make_manager(slow, fast)
+        manager.configure_hedging(min_delay=0.05, max_delay=0.1)
+
+        try:
+            start = time.monotonic()
+            price = manager.get_real_time_price("NASDAQ:AAPL")
+            elapsed = time.monotonic() - start
+        finally:
+            slow.release.set()
+
+        assert price.price == Decimal("101")
+        assert elapsed < 1
+        assert slow.calls == 1 and fast.calls == 1
+
+    def test_fast_primary_is_not_hedged(self):
+        primary = DelayedAdapter(DataSource.YFINANCE, price="100")
+        secondary = DelayedAdapter(DataSource.AKSHARE, price="101")
+        manager = make_manager(primary, secondary)
+        manager.configure_hedging(min_delay=0.5, max_delay=1.0)
+
+        price = manager.get_real_time_price("NASDAQ:AAPL")
+
+        assert price.price == Decimal("100")
+        assert secondary.calls == 0
+
+    def test_empty_primary_answer_falls_through(self):
+        primary = DelayedAdapter(DataSource.YFINANCE, price=None)
+        secondary = DelayedAdapter(DataSource.AKSHARE, price="101")
+        manager = make_manager(primary, secondary)
+        manager.configure_hedging(min_delay=1.0, max_delay=2.0)
+
+        start = time.monotonic()
+        price = manager.get_real_time_price("NASDAQ:AAPL")
+
+        assert price.price == Decimal("101")
+        # Did not wait for the hedge delay after an empty answer
+        assert time.monotonic() - start < 0.5
@@ -0,0 +1,287 @@
+"""Tests for AKShare whole-market spot snapshots using recorded DataFrames."""
+
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from valuecell.adapters.assets import akshare_adapter
+from valuecell.adapters.assets.akshare_adapter import AKShareAdapter
+from valuecell.adapters.assets.akshare_snapshot import (
+    MarketSnapshot,
+    SnapshotMarket,
+    SpotSnapshotCache,
+)
+
+# Trimmed recordings of the Eastmoney spot tables (same column layout)
+A_SHARE_SPOT = pd.DataFrame(
+    {
+        "序号": [1, 2, 3],
+        "代码": ["600519", "000001", "688001"],
+        "名称": ["贵州茅台", "平安银行", "华兴源创"],
+        "最新价": [1500.5, 11.2, float("nan")],
+        "涨跌幅": [1.2, -0.5, float("nan")],
+        "涨跌额": [17.8, -0.06, float("nan")],
+        "成交量": [32000.0, 900000.0, float("nan")],
+        "最高": [1510.0, 11.4, float("nan")],
+        "最低": [1480.0, 11.1, float("nan")],
+        "今开": [1482.0, 11.3, 0.0],
+        "昨收": [1482.7, 11.26, 20.0],
+        "总市值": [1.88e12, 2.17e11, float("nan")],
+    }
+)
+
+HK_INDEX_SPOT = pd.DataFrame(
+    {
+        "序号": [1, 2],
+        "内部编号": [124, 124],
+        "代码": ["HSI", "HSTECH"],
+        "名称": ["恒生指数", "恒生科技指数"],
+        "最新价": [25000.1, 5600.2],
+        "涨跌额": [120.0, -30.0],
+        "涨跌幅": [0.48, -0.53],
+        "今开": [24900.0, 5620.0],
+        "最高": [25100.0, 5650.0],
+        "最低": [24850.0, 5580.0],
+        "昨收": [24880.1, 5630.2],
+        "成交量": [1.0e9, 5.0e8],
+    }
+)
+
+US_SPOT = pd.DataFrame(
+    {
+        "序号": [1, 2],
+        "名称": ["苹果", "英伟达"],
+        "最新价": [230.1, 120.5],
+        "涨跌额": [1.1, -2.0],
+        "涨跌幅": [0.48, -1.63],
+        "开盘价": [229.0, 122.0],
+        "最高价": [231.0, 123.0],
+        "最低价": [228.5, 119.9],
+        "昨收价": [229.0, 122.5],
+        "总市值": [3.5e12, 2.9e12],
+        "代码": ["105.AAPL", "105.NVDA"],
+    }
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class CountingLoader:
+    def __init__(self, df):
+        self.df = df
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("upstream unavailable")
+        return self.df
+
+
+class TestMarketSnapshot:
+    def test_indexes_rows_by_code(self):
+        snapshot = MarketSnapshot.from_dataframe(SnapshotMarket.A_SHARES, A_SHARE_SPOT)
+
+        assert len(snapshot) == 3
+        quote = snapshot.get("600519")
+        assert quote.name == "贵州茅台"
+        assert quote.price == Decimal("1500.5")
+        assert quote.prev_close == Decimal("1482.7")
+        assert quote.market_cap == Decimal("1880000000000.0")
+
+    def test_missing_values_become_none(self):
+        snapshot = MarketSnapshot.from_dataframe(SnapshotMarket.A_SHARES, A_SHARE_SPOT)
+
+        quote = snapshot.get("688001")
+        assert quote.price is None
+        assert quote.volume is None
+
+    def test_maps_alternate_column_names(self):
+        snapshot = MarketSnapshot.from_dataframe(SnapshotMarket.US_STOCKS, US_SPOT)
+
+        quote = snapshot.get("105.aapl")
+        assert quote.open == Decimal("229.0")
+        assert quote.high == Decimal("231.0")
+        assert quote.prev_close == Decimal("229.0")
+
+
+class TestSpotSnapshotCache:
+    def test_fetches_once_per_interval(self):
+        clock = FakeClock()
+        loader = CountingLoader(A_SHARE_SPOT)
+        cache = SpotSnapshotCache(
+            {SnapshotMarket.A_SHARES: loader}, refresh_interval=30, clock=clock
+        )
+
+        for code in ["600519", "000001", "600519"]:
+            assert cache.get_quote(SnapshotMarket.A_SHARES, code) is not None
+        assert loader.calls == 1
+
+        clock.advance(31)
+        cache.get_quote(SnapshotMarket.A_SHARES, "600519")
+        assert loader.calls == 2
+
+    def test_serves_previous_snapshot_when_refresh_fails(self):
+        clock = FakeClock()
+        loader = CountingLoader(A_SHARE_SPOT)
+        cache = SpotSnapshotCache(
+            {SnapshotMarket.A_SHARES: loader},
+            refresh_interval=30,
+            max_stale=100,
+            clock=clock,
+        )
+        cache.get_snapshot(SnapshotMarket.A_SHARES)
+
+        loader.fail = True
+        clock.advance(31)
+        assert cache.get_quote(SnapshotMarket.A_SHARES, "600519") is not None
+
+        clock.advance(100)
+        assert cache.get_snapshot(SnapshotMarket.A_SHARES) is None
+
+    def test_failed_refresh_is_not_retried_within_interval(self):
+        clock = FakeClock()
+        loader = CountingLoader(A_SHARE_SPOT)
+        loader.fail = True
+        cache = SpotSnapshotCache(
+            {SnapshotMarket.A_SHARES: loader}, refresh_interval=30, clock=clock
+        )
+
+        assert cache.get_snapshot(SnapshotMarket.A_SHARES) is None
+        assert cache.get_snapshot(SnapshotMarket.A_SHARES) is None
+        assert loader.calls == 1
+
+    def test_closed_market_is_not_refetched_until_reopen(self):
+        clock = FakeClock()
+        loader = CountingLoader(A_SHARE_SPOT)
+        market_open = {"value": False}
+        cache = SpotSnapshotCache(
+            {SnapshotMarket.A_SHARES: loader},
+            refresh_interval=30,
+            max_stale=100,
+            is_open=lambda market: market_open["value"],
+            clock=clock,
+        )
+
+        cache.get_snapshot(SnapshotMarket.A_SHARES)
+        clock.advance(3600)
+        # Still served: nothing changes while the market is closed
+        assert cache.get_quote(SnapshotMarket.A_SHARES, "600519") is not None
+        assert loader.calls == 1
+
+        market_open["value"] = True
+        cache.get_snapshot(SnapshotMarket.A_SHARES)
+        assert loader.calls == 2
+
+    def test_unknown_market_returns_none(self):
+        cache = SpotSnapshotCache({})
+        assert cache.get_snapshot(SnapshotMarket.HK_STOCKS) is None
+
+    def test_invalidate_forces_refetch(self):
+        loader = CountingLoader(HK_INDEX_SPOT)
+        cache = SpotSnapshotCache({SnapshotMarket.HK_INDICES: loader})
+
+        cache.get_snapshot(SnapshotMarket.HK_INDICES)
+        cache.invalidate(SnapshotMarket.HK_INDICES)
+        cache.get_snapshot(SnapshotMarket.HK_INDICES)
+        assert loader.calls == 2
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    adapter = AKShareAdapter()
+    loaders = {
+        SnapshotMarket.A_SHARES: CountingLoader(A_SHARE_SPOT),
+        SnapshotMarket.HK_INDICES: CountingLoader(HK_INDEX_SPOT),
+        SnapshotMarket.US_STOCKS: CountingLoader(US_SPOT),
+    }
+    adapter.snapshot_cache = SpotSnapshotCache(loaders, refresh_interval=30)
+    adapter.loaders = loaders
+
+    # Avoid database lookups for asset types
+    monkeypatch.setattr(adapter, "_is_hk_index", lambda t: t == "HKEX:HSI")
+    monkeypatch.setattr(adapter, "_is_us_index", lambda t: False)
+    monkeypatch.setattr(
+        adapter,
+        "convert_to_source_ticker",
+        lambda t: "105." + t.split(":")[1] if t.startswith("NASDAQ") else t,
+    )
+    return adapter
+
+
+class TestAKShareAdapterSnapshotMode:
+    def test_multiple_prices_use_one_call_per_market(self, adapter, monkeypatch):
+        def fail_minute_history(**kwargs):
+            raise AssertionError("per-ticker history should not be fetched")
+
+        monkeypatch.setattr(
+            akshare_adapter.ak, "stock_zh_a_hist_min_em", fail_minute_history
+        )
+
+        prices = adapter.get_multiple_prices(
+            ["SSE:600519", "SZSE:000001", "HKEX:HSI", "NASDAQ:AAPL", "NASDAQ:NVDA"]
+        )
+
+        assert prices["SSE:600519"].price == Decimal("1500.5")
+        assert prices["SZSE:000001"].change == Decimal("-0.06")
+        assert prices["HKEX:HSI"].currency == "HKD"
+        assert prices["NASDAQ:NVDA"].price == Decimal("120.5")
+        assert all(loader.calls == 1 for loader in adapter.loaders.values())
+
+    def test_code_from_other_exchange_is_not_matched(self, adapter, monkeypatch):
+        monkeypatch.setattr(
+            akshare_adapter.ak,
+            "stock_zh_a_hist_min_em",
+            lambda **kwargs: pd.DataFrame(),
+        )
+
+        # SSE:000001 is the Shanghai Composite, not Ping An Bank (SZSE:000001)
+        assert adapter.get_real_time_price("SSE:000001") is None
+
+    def test_suspended_stock_falls_back_to_minute_history(self, adapter, monkeypatch):
+        calls = []
+
+        def minute_history(**kwargs):
+            calls.append(kwargs["symbol"])
+            return pd.DataFrame(
+                {
+                    "时间": ["2025-01-02 09:31:00"],
+                    "开盘": [20.0],
+                    "收盘": [20.1],
+                    "最高": [20.2],
+                    "最低": [19.9],
+                    "成交量": [100],
+                }
+            )
+
+        monkeypatch.setattr(
+            akshare_adapter.ak, "stock_zh_a_hist_min_em", minute_history
+        )
+
+        price = adapter.get_real_time_price("SSE:688001")
+        assert calls == ["688001"]
+        assert price.price == Decimal("20.1")
+
+    def test_snapshot_mode_can_be_disabled(self, adapter, monkeypatch):
+        adapter.snapshot_enabled = False
+        monkeypatch.setattr(
+            akshare_adapter.ak,
+            "stock_zh_a_hist_min_em",
+            lambda **kwargs: pd.DataFrame(),
+        )
+
+        assert adapter.get_real_time_price("SSE:600519") is None
+        assert adapter.loaders[SnapshotMarket.A_SHARES].calls == 0
+        # HK indices are only served by the spot table
+        assert adapter.get_real_time_price("HKEX:HSI").price == Decimal("25000.1")
@@ -0,0 +1,183 @@
+"""Tests for batched localized asset name resolution."""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from valuecell.adapters.assets.i18n_integration import AssetI18nService
+from valuecell.adapters.assets.types import Asset, AssetType, MarketInfo
+from valuecell.server.db.models.base import Base
+from valuecell.server.db.repositories.asset_repository import AssetRepository
+
+
+class SessionRepository(AssetRepository):
+    """Asset repository counting queries on a test database."""
+
+    def __init__(self, session_factory):
+        super().__init__()
+        self.session_factory = session_factory
+        self.batch_queries = 0
+
+    def _get_session(self):
+        return self.session_factory()
+
+    def get_assets_by_symbols(self, symbols):
+        self.batch_queries += 1
+        return super().get_assets_by_symbols(symbols)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'names.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield SessionRepository(sessionmaker(bind=engine))
+    engine.dispose()
+
+
+class SlowManager:
+    """Adapter manager stand-in whose asset info lookups take a while."""
+
+    def __init__(self, delay=0.1, known=None):
+        self.delay = delay
+        self.known = known
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def get_asset_info(self, ticker):
+        with self.lock:
+            self.calls.append(ticker)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self.lock:
+                self.active -= 1
+        if self.known is not None and ticker not in self.known:
+            return None
+        asset = Asset(
+            ticker=ticker,
+            asset_type=AssetType.STOCK,
+            market_info=MarketInfo(
+                exchange="NASDAQ", country="US", currency="USD", timezone=""
+            ),
+        )
+        asset.set_localized_name("en-US", f"{ticker.split(':')[1]} Corp")
+        return asset
+
+
+def make_service(manager, repository, **kwargs):
+    return AssetI18nService(manager, repository=repository, **kwargs)
+
+
+def test_misses_are_fetched_in_one_concurrent_batch(repository):
+    manager = SlowManager(delay=0.2)
+    service = make_service(manager, repository, lookup_workers=8)
+    tickers = [f"NASDAQ:T{i}" for i in range(8)]
+
+    start = time.monotonic()
+    names = service.get_localized_asset_names(tickers, "en-US")
+    elapsed = time.monotonic() - start
+
+    assert names == {ticker: f"{ticker.split(':')[1]} Corp" for ticker in tickers}
+    assert manager.max_active > 1
+    assert elapsed < 0.2 * len(tickers) / 2
+    assert repository.batch_queries == 1
+
+    # Second call is answered from the cache
+    service.get_localized_asset_names(tickers, "en-US")
+    assert len(manager.calls) == len(tickers)
+    assert repository.batch_queries == 1
+
+
+def test_database_and_predefined_names_skip_the_network(repository):
+    repository.create_asset(
+        symbol="SSE:600519",
+        name="Kweichow Moutai",
+        asset_type="stock",
+        asset_metadata={"names": {"zh-Hans": "贵州茅台"}},
+    )
+    manager = SlowManager(delay=0)
+    service = make_service(manager, repository)
+
+    names = service.get_localized_asset_names(
+        ["SSE:600519", "NASDAQ:AAPL", "SSE:600519"], "zh-Hans"
+    )
+
+    assert names == {"SSE:600519": "贵州茅台", "NASDAQ:AAPL": "苹果公司"}
+    assert manager.calls == []
+
+
+def test_unknown_tickers_fall_back_to_ticker(repository):
+    manager = SlowManager(delay=0, known=set())
+    service = make_service(manager, repository)
+
+    assert service.get_localized_asset_name("NASDAQ:ZZZZ", "en-US") == "NASDAQ:ZZZZ"
+
+
+def test_unknown_tickers_are_not_looked_up_again_within_ttl(repository):
+    manager = SlowManager(delay=0, known=set())
+    service = make_service(manager, repository)
+
+    for _ in range(3):
+        service.get_localized_asset_names(["NASDAQ:ZZZZ"], "en-US")
+    assert manager.calls == ["NASDAQ:ZZZZ"]
+
+    service.missing_name_ttl = 0.0
+    service.get_localized_asset_names(["NASDAQ:YYYY"], "en-US")
+    service.get_localized_asset_names(["NASDAQ:YYYY"], "en-US")
+    assert manager.calls.count("NASDAQ:YYYY") == 2
+
+
+def test_slow_lookups_are_bounded_by_timeout(repository):
+    manager = SlowManager(delay=0.5)
+    service = make_service(manager, repository, lookup_timeout=0.1)
+
+    start = time.monotonic()
+    names = service.get_localized_asset_names(["NASDAQ:SLOW"], "en-US")
+
+    assert names == {"NASDAQ:SLOW": "NASDAQ:SLOW"}
+    assert time.monotonic() - start < 0.4
+
+    # The lookup that missed the timeout still caches its name
+    deadline = time.monotonic() + 2
+    while service._get_cached_name("NASDAQ:SLOW", "en-US") is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.02)
+    assert service.get_localized_asset_name("NASDAQ:SLOW", "en-US") == "SLOW Corp"
+    assert manager.calls == ["NASDAQ:SLOW"]
+
+
+def test_name_cache_is_bounded(repository):
+    manager = SlowManager(delay=0)
+    service = make_service(manager, repository, max_cached_names=3)
+
+    service.get_localized_asset_names([f"NASDAQ:T{i}" for i in range(5)], "en-US")
+    assert len(service._name_cache) == 3
+
+    # Least recently used entries were evicted
+    service.get_localized_asset_name("NASDAQ:T0", "en-US")
+    assert manager.calls.count("NASDAQ:T0") == 2
+
+
+def test_added_translation_is_persisted(repository):
+    repository.create_asset(
+        symbol="NASDAQ:NVDA",
+        name="NVIDIA",
+        asset_type="stock",
+        asset_metadata={"names": {"en-US": "NVIDIA"}},
+    )
+    service = make_service(SlowManager(delay=0), repository)
+    service.add_asset_translation("NASDAQ:NVDA", "zh-Hans", "英伟达")
+
+    names = repository.get_asset_by_symbol("NASDAQ:NVDA").asset_metadata["names"]
+    assert names == {"en-US": "NVIDIA", "zh-Hans": "英伟达"}
+
+    # A fresh service (e.g. after a restart) reads it from the database
+    fresh = make_service(SlowManager(delay=0), repository)
+    assert fresh.get_localized_asset_name("NASDAQ:NVDA", "zh-Hans") == "英伟达"
@@ -0,0 +1,313 @@
+"""Tests for the database-backed asset info cache."""
+
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from valuecell.adapters.assets import asset_metadata
+from valuecell.adapters.assets.asset_metadata import (
+    AssetMetadataCache,
+    asset_from_record,
+)
+from valuecell.adapters.assets.manager import AdapterManager
+from valuecell.adapters.assets.rate_limit import Priority, get_request_priority
+from valuecell.adapters.assets.types import Asset, AssetType, MarketInfo
+from valuecell.server.db.models.base import Base
+from valuecell.server.db.repositories.asset_repository import AssetRepository
+
+
+class SessionRepository(AssetRepository):
+    """Asset repository opening sessions on a test database."""
+
+    def __init__(self, session_factory):
+        super().__init__()
+        self.session_factory = session_factory
+
+    def _get_session(self):
+        return self.session_factory()
+
+
+@pytest.fixture
+def repository(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'assets.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield SessionRepository(sessionmaker(bind=engine))
+    engine.dispose()
+
+
+class Clock:
+    def __init__(self):
+        self.now = datetime(2025, 3, 5, 12, 0, tzinfo=timezone.utc)
+
+    def __call__(self):
+        return self.now
+
+
+class Fetcher:
+    """Fake asset info fetcher counting calls per ticker."""
+
+    def __init__(self, name="Apple Inc."):
+        self.name = name
+        self.calls = []
+        self.priorities = []
+        self.lock = threading.Lock()
+
+    def __call__(self, ticker):
+        with self.lock:
+            self.calls.append(ticker)
+            self.priorities.append(get_request_priority())
+        if ticker.endswith("MISSING"):
+            return None
+        asset = Asset(
+            ticker=ticker,
+            asset_type=AssetType.STOCK,
+            market_info=MarketInfo(
+                exchange=ticker.split(":")[0],
+                country="US",
+                currency="USD",
+                timezone="America/New_York",
+            ),
+            properties={"sector": "Technology"},
+        )
+        asset.set_localized_name("en-US", self.name)
+        asset.set_localized_name("zh-Hans", "苹果")
+        return asset
+
+
+def make_cache(repository, fetcher=None, clock=None, **kwargs):
+    return AssetMetadataCache(
+        fetch=fetcher or Fetcher(),
+        repository=repository,
+        clock=clock or Clock(),
+        **kwargs,
+    )
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+class TestAssetMetadataCache:
+    def test_miss_fetches_and_persists(self, repository):
+        clock = Clock()
+        fetcher = Fetcher()
+        cache = make_cache(repository, fetcher, clock)
+
+        asset = cache.get("NASDAQ:AAPL")
+        assert asset.get_localized_name("zh-Hans") == "苹果"
+
+        record = repository.get_asset_by_symbol("NASDAQ:AAPL")
+        assert record.name == "Apple Inc."
+        assert record.sector == "Technology"
+        assert record.refreshed_at.replace(tzinfo=timezone.utc) == clock.now
+
+        # Fresh records are answered from the database
+        again = cache.get("NASDAQ:AAPL")
+        assert again.market_info.timezone == "America/New_York"
+        assert fetcher.calls == ["NASDAQ:AAPL"]
+
+    def test_stale_record_is_served_while_revalidating(self, repository):
+        clock = Clock()
+        fetcher = Fetcher()
+        cache = make_cache(repository, fetcher, clock, max_age=timedelta(hours=1))
+        cache.get("NASDAQ:AAPL")
+
+        clock.now += timedelta(hours=2)
+        fetcher.name = "Apple Inc. (renamed)"
+
+        stale = cache.lookup("NASDAQ:AAPL")
+        assert stale.get_localized_name("en-US") == "Apple Inc."
+
+        wait_for(lambda: len(fetcher.calls) == 2 and not cache._in_flight)
+        assert fetcher.priorities[-1] == Priority.BACKGROUND
+        assert repository.get_asset_by_symbol("NASDAQ:AAPL").name == (
+            "Apple Inc. (renamed)"
+        )
+
+    def test_seeded_record_without_refresh_is_stale(self, repository):
+        repository.create_asset(
+            symbol="NASDAQ:MSFT",
+            name="Microsoft",
+            asset_type="stock",
+            asset_metadata={"currency": "USD", "aliases": ["msft"]},
+        )
+        fetcher = Fetcher()
+        cache = make_cache(repository, fetcher, Clock())
+
+        asset = cache.lookup("NASDAQ:MSFT")
+        assert asset.get_localized_name("en-US") == "Microsoft"
+        assert asset.market_info.currency == "USD"
+
+        wait_for(lambda: fetcher.calls and not cache._in_flight)
+        metadata = repository.get_asset_by_symbol("NASDAQ:MSFT").asset_metadata
+        # Fields written by other jobs survive a refresh
+        assert metadata["aliases"] == ["msft"]
+        assert metadata["asset_info"]["ticker"] == "NASDAQ:MSFT"
+
+    def test_refresh_many_only_fetches_missing_and_stale(self, repository):
+        clock = Clock()
+        fetcher = Fetcher()
+        cache = make_cache(repository, fetcher, clock, max_age=timedelta(hours=1))
+        cache.get("NASDAQ:AAPL")
+        clock.now += timedelta(minutes=30)
+        cache.get("NASDAQ:MSFT")
+        clock.now += timedelta(minutes=45)
+        fetcher.calls.clear()
+
+        refreshed = cache.refresh_many(
+            ["NASDAQ:AAPL", "NASDAQ:MSFT", "NASDAQ:NVDA", "NASDAQ:NVDA"]
+        )
+
+        assert refreshed == 2
+        assert sorted(fetcher.calls) == ["NASDAQ:AAPL", "NASDAQ:NVDA"]
+        assert set(fetcher.priorities[-2:]) == {Priority.BACKGROUND}
+
+        fetcher.calls.clear()
+        assert cache.refresh_many(["NASDAQ:AAPL", "NASDAQ:MSFT"], force=True) == 2
+        assert sorted(fetcher.calls) == ["NASDAQ:AAPL", "NASDAQ:MSFT"]
+
+    def test_failed_refresh_is_not_retried_immediately(self, repository):
+        clock = Clock()
+        fetcher = Fetcher()
+        cache = make_cache(
+            repository, fetcher, clock, retry_interval=timedelta(minutes=5)
+        )
+
+        assert cache.refresh_many(["NASDAQ:MISSING"]) == 0
+        assert cache.refresh_many(["NASDAQ:MISSING"]) == 0
+        assert fetcher.calls == ["NASDAQ:MISSING"]
+
+        clock.now += timedelta(minutes=6)
+        cache.refresh_many(["NASDAQ:MISSING"])
+        assert len(fetcher.calls) == 2
+
+    def test_hot_stale_ticker_schedules_one_refresh(self, repository, monkeypatch):
+        clock = Clock()
+        fetcher = Fetcher()
+        cache = make_cache(repository, fetcher, clock, max_age=timedelta(hours=1))
+        cache.get("NASDAQ:AAPL")
+        clock.now += timedelta(hours=2)
+
+        release = threading.Event()
+        fetch = cache.fetch
+        cache.fetch = lambda ticker: release.wait(2) and fetch(ticker)
+        submitted = []
+        real_submit = cache._submit_claimed
+        monkeypatch.setattr(
+            cache,
+            "_submit_claimed",
+            lambda tickers: submitted.append(tickers) or real_submit(tickers),
+        )
+
+        for _ in range(20):
+            assert cache.lookup("NASDAQ:AAPL") is not None
+        release.set()
+        wait_for(lambda: not cache._in_flight)
+
+        assert submitted == [["NASDAQ:AAPL"]]
+        assert fetcher.calls == ["NASDAQ:AAPL", "NASDAQ:AAPL"]
+
+    def test_failed_tickers_are_bounded(self, repository, monkeypatch):
+        monkeypatch.setattr(asset_metadata, "MAX_FAILED_TICKERS", 3)
+        clock = Clock()
+        cache = make_cache(
+            repository, Fetcher(), clock, retry_interval=timedelta(minutes=5)
+        )
+
+        cache.refresh_many([f"NASDAQ:{i}MISSING" for i in range(5)])
+        assert len(cache._failed_at) == 3
+
+        # Failures past their retry pause are forgotten
+        clock.now += timedelta(minutes=6)
+        cache.refresh_many(["NYSE:MISSING"])
+        assert list(cache._failed_at) == ["NYSE:MISSING"]
+
+    def test_database_errors_fall_back_to_fetching(self):
+        class BrokenRepository:
+            def get_asset_by_symbol(self, symbol):
+                raise RuntimeError("database is locked")
+
+            def upsert_asset(self, **kwargs):
+                raise RuntimeError("database is locked")
+
+        fetcher = Fetcher()
+        cache = make_cache(BrokenRepository(), fetcher, Clock())
+
+        assert cache.get("NASDAQ:AAPL").ticker == "NASDAQ:AAPL"
+        assert fetcher.calls == ["NASDAQ:AAPL"]
+
+    def test_asset_from_record_round_trip(self, repository):
+        cache = make_cache(repository, Fetcher(), Clock())
+        original = cache.get("NASDAQ:AAPL")
+
+        restored = asset_from_record(repository.get_asset_by_symbol("NASDAQ:AAPL"))
+        assert restored.names.names == original.names.names
+        assert restored.properties == original.properties
+
+
+class TestManagerIntegration:
+    def test_manager_reads_through_cache(self, repository):
+        manager = AdapterManager()
+        fetcher = Fetcher()
+        manager._fetch_asset_info = fetcher
+        manager.enable_asset_metadata_cache(repository=repository, clock=Clock())
+
+        manager.get_asset_info("NASDAQ:AAPL")
+        manager.get_asset_info("NASDAQ:AAPL")
+        assert fetcher.calls == ["NASDAQ:AAPL"]
+        assert manager.refresh_asset_info(["NASDAQ:AAPL"], force=True) == 1
+
+    def test_refresh_without_cache_is_noop(self):
+        assert AdapterManager().refresh_asset_info(["NASDAQ:AAPL"]) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_lookup_uses_cache(self, repository, monkeypatch):
+        manager = AdapterManager()
+        manager.enable_asset_metadata_cache(repository=repository, clock=Clock())
+        fetcher = Fetcher()
+        calls = []
+
+        async def failover(ticker, operation, call):
+            calls.append(ticker)
+            return fetcher(ticker)
+
+        monkeypatch.setattr(manager, "_call_with_failover_async", failover)
+
+        first = await manager.get_asset_info_async("NASDAQ:AAPL")
+        second = await manager.get_asset_info_async("NASDAQ:AAPL")
+
+        assert first.ticker == second.ticker == "NASDAQ:AAPL"
+        assert calls == ["NASDAQ:AAPL"]
+
+
+def test_missing_columns_are_added(tmp_path):
+    from valuecell.server.db.init_db import DatabaseInitializer
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.connect() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE assets (id INTEGER PRIMARY KEY, symbol VARCHAR(50), "
+                "name VARCHAR(200), asset_type VARCHAR(50))"
+            )
+        )
+        conn.commit()
+
+    class FakeManager:
+        def get_engine(self):
+            return engine
+
+    initializer = DatabaseInitializer(db_manager=FakeManager())
+    assert initializer.add_missing_columns()
+
+    columns = {column["name"] for column in inspect(engine).get_columns("assets")}
+    assert "refreshed_at" in columns
+    engine.dispose()
@@ -0,0 +1,233 @@
+"""Tests for the cached LLM fallback search."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from valuecell.adapters.assets.executor import get_adapter_executor
+from valuecell.adapters.assets.fallback_search import (
+    FALLBACK_VALIDATION_KEY,
+    LLMFallbackSearcher,
+    normalize_query,
+    parse_ticker_candidates,
+)
+from valuecell.adapters.assets.types import (
+    Asset,
+    AssetSearchQuery,
+    AssetType,
+    LocalizedName,
+    MarketInfo,
+)
+
+
+def make_asset(ticker):
+    exchange = ticker.split(":")[0]
+    return Asset(
+        ticker=ticker,
+        asset_type=AssetType.STOCK,
+        names=LocalizedName(names={"en-US": ticker}),
+        market_info=MarketInfo(
+            exchange=exchange,
+            country="US",
+            currency="USD",
+            timezone="America/New_York",
+        ),
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeAgent:
+    def __init__(self, response, calls):
+        self.response = response
+        self.calls = calls
+
+    def run(self, prompt):
+        self.calls.append(prompt)
+        return SimpleNamespace(content=self.response)
+
+
+class AgentFactory:
+    def __init__(self, response):
+        self.response = response
+        self.created = 0
+        self.prompts = []
+
+    def __call__(self):
+        self.created += 1
+        return FakeAgent(self.response, self.prompts)
+
+
+def make_searcher(response, validate, **kwargs):
+    factory = AgentFactory(response)
+    clock = FakeClock()
+    searcher = LLMFallbackSearcher(
+        validate=validate, agent_factory=factory, clock=clock, **kwargs
+    )
+    return searcher, factory, clock
+
+
+def test_normalize_query():
+    assert normalize_query("  Apple   INC ") == "apple inc"
+
+
+def test_parse_ticker_candidates():
+    text = '```json\n["nasdaq:aapl", "NASDAQ:AAPL", "AAPL", 3, "HKEX:00700"]\n```'
+    assert parse_ticker_candidates(text) == ["NASDAQ:AAPL", "HKEX:00700"]
+
+    with pytest.raises(ValueError):
+        parse_ticker_candidates('{"ticker": "NASDAQ:AAPL"}')
+
+
+class TestLLMFallbackSearcher:
+    def test_results_are_cached_per_normalized_query(self):
+        searcher, factory, _ = make_searcher(
+            '["NASDAQ:AAPL", "NYSE:AAPL"]',
+            lambda t: make_asset(t) if t == "NASDAQ:AAPL" else None,
+        )
+
+        first = searcher.search(AssetSearchQuery(query="Apple"))
+        second = searcher.search(AssetSearchQuery(query="  apple "))
+
+        assert [r.ticker for r in first] == ["NASDAQ:AAPL"]
+        assert [r.ticker for r in second] == ["NASDAQ:AAPL"]
+        assert len(factory.prompts) == 1
+
+    def test_agent_is_reused(self):
+        searcher, factory, _ = make_searcher('["NASDAQ:AAPL"]', make_asset)
+
+        searcher.search(AssetSearchQuery(query="apple"))
+        searcher.search(AssetSearchQuery(query="microsoft"))
+
+        assert len(factory.prompts) == 2
+        assert factory.created == 1
+
+    def test_negative_results_use_shorter_ttl(self):
+        searcher, factory, clock = make_searcher(
+            '["NASDAQ:XXXX"]',
+            lambda t: None,
+            cache_ttl=3600,
+            negative_cache_ttl=60,
+        )
+
+        assert searcher.search(AssetSearchQuery(query="xxxx")) == []
+        clock.now = 30
+        searcher.search(AssetSearchQuery(query="xxxx"))
+        assert len(factory.prompts) == 1
+
+        clock.now = 61
+        searcher.search(AssetSearchQuery(query="xxxx"))
+        assert len(factory.prompts) == 2
+
+    def test_llm_errors_are_not_cached(self):
+        searcher, factory, _ = make_searcher("not json", make_asset)
+
+        assert searcher.search(AssetSearchQuery(query="apple")) == []
+        assert searcher.search(AssetSearchQuery(query="apple")) == []
+        assert len(factory.prompts) == 2
+
+    def test_candidates_are_validated_concurrently_in_order(self):
+        def validate(ticker):
+            time.sleep(0.2)
+            return make_asset(ticker)
+
+        searcher, _, _ = make_searcher(
+            '["NASDAQ:A", "NASDAQ:B", "NASDAQ:C", "NASDAQ:D"]', validate
+        )
+
+        start = time.monotonic()
+        results = searcher.search(AssetSearchQuery(query="letters"))
+
+        assert time.monotonic() - start < 0.6
+        assert [r.ticker for r in results] == [
+            "NASDAQ:A",
+            "NASDAQ:B",
+            "NASDAQ:C",
+            "NASDAQ:D",
+        ]
+
+    def test_validation_runs_on_shared_executor_key(self):
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def validate(ticker):
+            with lock:
+                running.append(ticker)
+                peak.append(len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(ticker)
+            return make_asset(ticker)
+
+        searcher, _, _ = make_searcher(
+            '["NASDAQ:A", "NASDAQ:B", "NASDAQ:C", "NASDAQ:D"]',
+            validate,
+            validation_workers=2,
+        )
+
+        results = searcher.search(AssetSearchQuery(query="limited"))
+
+        assert len(results) == 4
+        assert max(peak) <= 2
+        assert get_adapter_executor().get_limit(FALLBACK_VALIDATION_KEY) == 2
+
+    def test_validation_deadline(self):
+        release = threading.Event()
+
+        def validate(ticker):
+            if ticker == "NASDAQ:SLOW":
+                release.wait(5)
+            return make_asset(ticker)
+
+        searcher, _, _ = make_searcher(
+            '["NASDAQ:SLOW", "NASDAQ:FAST"]', validate, validation_deadline=0.2
+        )
+
+        try:
+            start = time.monotonic()
+            results = searcher.search(AssetSearchQuery(query="deadline"))
+            assert time.monotonic() - start < 1
+            assert [r.ticker for r in results] == ["NASDAQ:FAST"]
+        finally:
+            release.set()
+
+    def test_limit_applies_to_cached_results(self):
+        searcher, _, _ = make_searcher(
+            '["NASDAQ:A", "NASDAQ:B", "NASDAQ:C"]', make_asset
+        )
+
+        searcher.search(AssetSearchQuery(query="abc"))
+        assert len(searcher.search(AssetSearchQuery(query="abc", limit=2))) == 2
+
+    def test_concurrent_identical_queries_share_one_search(self):
+        gate = threading.Event()
+
+        def validate(ticker):
+            gate.wait(2)
+            return make_asset(ticker)
+
+        searcher, factory, _ = make_searcher('["NASDAQ:AAPL"]', validate)
+        results = []
+
+        def run():
+            results.append(searcher.search(AssetSearchQuery(query="apple")))
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        gate.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(factory.prompts) == 1
+        assert all([r.ticker for r in result] == ["NASDAQ:AAPL"] for result in results)
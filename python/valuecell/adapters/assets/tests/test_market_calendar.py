@@ -0,0 +1,244 @@
+"""Tests for market calendars and calendar-aware price caching."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from valuecell.adapters.assets import manager as manager_module
+from valuecell.adapters.assets.base import AdapterCapability, BaseDataAdapter
+from valuecell.adapters.assets.manager import AdapterManager
+from valuecell.adapters.assets.market_calendar import (
+    MarketCalendar,
+    get_calendar_for_ticker,
+    get_market_calendar,
+    is_market_open,
+    load_calendars,
+)
+from valuecell.adapters.assets.types import (
+    AssetPrice,
+    AssetType,
+    DataSource,
+    Exchange,
+    MarketStatus,
+)
+
+NEW_YORK = ZoneInfo("America/New_York")
+SHANGHAI = ZoneInfo("Asia/Shanghai")
+HONG_KONG = ZoneInfo("Asia/Hong_Kong")
+
+
+def local(tz, *args):
+    return datetime(*args, tzinfo=tz)
+
+
+class TestMarketCalendar:
+    def test_bundled_calendars_cover_all_exchanges(self):
+        calendars = load_calendars()
+        for exchange in Exchange:
+            assert exchange.value in calendars
+
+    def test_us_regular_session(self):
+        us = get_market_calendar(Exchange.NASDAQ)
+
+        assert us.is_open(local(NEW_YORK, 2025, 3, 5, 9, 30))
+        assert us.is_open(local(NEW_YORK, 2025, 3, 5, 15, 59))
+        assert not us.is_open(local(NEW_YORK, 2025, 3, 5, 16, 0))
+        assert not us.is_open(local(NEW_YORK, 2025, 3, 5, 9, 29))
+        # Weekend
+        assert not us.is_open(local(NEW_YORK, 2025, 3, 8, 12, 0))
+
+    def test_naive_times_are_utc(self):
+        us = get_market_calendar("nyse")
+        # 15:00 UTC is 10:00 in New York (EST)
+        assert us.is_open(datetime(2025, 3, 5, 15, 0))
+
+    def test_holidays_and_early_closes(self):
+        us = get_market_calendar(Exchange.NYSE)
+
+        assert not us.is_open(local(NEW_YORK, 2025, 12, 25, 12, 0))
+        assert us.is_open(local(NEW_YORK, 2025, 12, 24, 12, 59))
+        assert not us.is_open(local(NEW_YORK, 2025, 12, 24, 13, 0))
+
+    def test_lunch_breaks(self):
+        cn = get_market_calendar(Exchange.SSE)
+        hk = get_market_calendar(Exchange.HKEX)
+
+        assert cn.is_open(local(SHANGHAI, 2025, 3, 5, 11, 0))
+        assert not cn.is_open(local(SHANGHAI, 2025, 3, 5, 12, 0))
+        assert cn.status(local(SHANGHAI, 2025, 3, 5, 12, 0)) == MarketStatus.CLOSED
+        assert cn.is_open(local(SHANGHAI, 2025, 3, 5, 13, 0))
+
+        assert hk.is_open(local(HONG_KONG, 2025, 3, 5, 11, 45))
+        assert not hk.is_open(local(HONG_KONG, 2025, 3, 5, 12, 30))
+
+    def test_half_day_drops_afternoon_session(self):
+        hk = get_market_calendar(Exchange.HKEX)
+        day = local(HONG_KONG, 2025, 12, 24, 0, 0).date()
+
+        sessions = hk.sessions_on(day)
+        assert len(sessions) == 1
+        assert sessions[0][1].hour == 12
+
+    def test_status(self):
+        us = get_market_calendar(Exchange.NASDAQ)
+
+        assert us.status(local(NEW_YORK, 2025, 3, 5, 8, 0)) == MarketStatus.PRE_MARKET
+        assert us.status(local(NEW_YORK, 2025, 3, 5, 10, 0)) == MarketStatus.OPEN
+        assert us.status(local(NEW_YORK, 2025, 3, 5, 17, 0)) == MarketStatus.AFTER_HOURS
+        assert us.status(local(NEW_YORK, 2025, 3, 8, 10, 0)) == MarketStatus.CLOSED
+
+    def test_next_open_skips_weekends_and_holidays(self):
+        cn = get_market_calendar(Exchange.SZSE)
+
+        # Friday before the 2025 National Day holiday (Oct 1-8)
+        friday = local(SHANGHAI, 2025, 9, 30, 16, 0)
+        assert cn.next_open(friday) == local(SHANGHAI, 2025, 10, 9, 9, 30)
+
+        # During lunch the afternoon session is next
+        lunch = local(SHANGHAI, 2025, 3, 5, 12, 0)
+        assert cn.next_open(lunch) == local(SHANGHAI, 2025, 3, 5, 13, 0)
+        assert cn.seconds_until_open(lunch) == 3600
+
+        assert cn.seconds_until_open(local(SHANGHAI, 2025, 3, 5, 10, 0)) == 0
+
+    def test_next_close(self):
+        us = get_market_calendar(Exchange.NASDAQ)
+        assert us.next_close(local(NEW_YORK, 2025, 3, 5, 10, 0)) == local(
+            NEW_YORK, 2025, 3, 5, 16, 0
+        )
+        assert us.next_close(local(NEW_YORK, 2025, 3, 8, 10, 0)) is None
+
+    def test_crypto_is_always_open(self):
+        saturday = datetime(2025, 3, 8, 3, 0, tzinfo=timezone.utc)
+        assert is_market_open("CRYPTO:BTC", saturday)
+        assert get_market_calendar(Exchange.CRYPTO).next_close(saturday) is None
+
+    def test_unknown_tickers_are_treated_as_open(self):
+        assert get_calendar_for_ticker("AAPL") is None
+        assert is_market_open("LSE:VOD", datetime(2025, 3, 8, 12, 0))
+
+    def test_exhausted_holiday_data_returns_none(self):
+        calendar = MarketCalendar.from_dict(
+            {
+                "name": "Closed",
+                "timezone": "UTC",
+                "sessions": [["09:00", "17:00"]],
+                "holidays": [f"2025-03-{day:02d}" for day in range(1, 32)]
+                + [f"2025-04-{day:02d}" for day in range(1, 31)],
+            }
+        )
+        assert calendar.next_open(datetime(2025, 3, 1, tzinfo=timezone.utc)) is None
+
+
+class PriceAdapter(BaseDataAdapter):
+    """Fake adapter counting price requests."""
+
+    def __init__(self):
+        self.calls = 0
+        super().__init__(DataSource.YFINANCE)
+
+    def _initialize(self):
+        pass
+
+    def get_real_time_price(self, ticker):
+        self.calls += 1
+        return AssetPrice(
+            ticker=ticker,
+            price=Decimal("100"),
+            currency="USD",
+            timestamp=datetime.now(),
+            source=self.source,
+        )
+
+    def search_assets(self, query):
+        return []
+
+    def get_asset_info(self, ticker):
+        return None
+
+    def get_historical_prices(self, ticker, start_date, end_date, interval="1d"):
+        return []
+
+    def get_capabilities(self):
+        return [
+            AdapterCapability(AssetType.STOCK, {Exchange.NASDAQ}),
+            AdapterCapability(AssetType.CRYPTO, {Exchange.CRYPTO}),
+        ]
+
+    def convert_to_source_ticker(self, internal_ticker):
+        return internal_ticker
+
+    def convert_to_internal_ticker(self, source_ticker, default_exchange=None):
+        return source_ticker
+
+
+@pytest.fixture
+def closed_calendar():
+    """Calendar of a market that never opens."""
+    return MarketCalendar.from_dict({"name": "Closed", "timezone": "UTC"})
+
+
+class TestCalendarAwarePriceCache:
+    def test_open_market_is_not_cached_by_default(self):
+        adapter = PriceAdapter()
+        manager = AdapterManager()
+        manager.register_adapter(adapter)
+
+        manager.get_real_time_price("CRYPTO:BTC")
+        manager.get_real_time_price("CRYPTO:BTC")
+        assert adapter.calls == 2
+
+    def test_open_market_ttl(self):
+        adapter = PriceAdapter()
+        manager = AdapterManager()
+        manager.register_adapter(adapter)
+        manager.configure_price_cache(open_ttl=60)
+
+        manager.get_real_time_price("CRYPTO:BTC")
+        manager.get_multiple_prices(["CRYPTO:BTC"])
+        assert adapter.calls == 1
+
+    def test_closed_market_serves_cached_price(self, monkeypatch, closed_calendar):
+        monkeypatch.setattr(
+            manager_module, "get_calendar_for_ticker", lambda ticker: closed_calendar
+        )
+        adapter = PriceAdapter()
+        manager = AdapterManager()
+        manager.register_adapter(adapter)
+
+        first = manager.get_real_time_price("NASDAQ:AAPL")
+        prices = manager.get_multiple_prices(["NASDAQ:AAPL", "NASDAQ:MSFT"])
+
+        assert prices["NASDAQ:AAPL"] is first
+        # Only the uncached ticker was fetched
+        assert adapter.calls == 2
+
+    def test_closed_ttl_caps_cache_lifetime(self, monkeypatch, closed_calendar):
+        monkeypatch.setattr(
+            manager_module, "get_calendar_for_ticker", lambda ticker: closed_calendar
+        )
+        manager = AdapterManager()
+        manager.configure_price_cache(closed_ttl=120)
+        assert manager._price_ttl("NASDAQ:AAPL") == 120
+
+        manager.configure_price_cache(enabled=False)
+        adapter = PriceAdapter()
+        manager.register_adapter(adapter)
+        manager.get_real_time_price("NASDAQ:AAPL")
+        manager.get_real_time_price("NASDAQ:AAPL")
+        assert adapter.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_async_prices_use_cache(self, monkeypatch, closed_calendar):
+        monkeypatch.setattr(
+            manager_module, "get_calendar_for_ticker", lambda ticker: closed_calendar
+        )
+        adapter = PriceAdapter()
+        manager = AdapterManager()
+        manager.register_adapter(adapter)
+
+        await manager.get_real_time_price_async("NASDAQ:AAPL")
+        await manager.get_multiple_prices_async(["NASDAQ:AAPL"])
+        assert adapter.calls == 1
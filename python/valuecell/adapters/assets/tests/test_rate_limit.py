@@ -0,0 +1,275 @@
+"""Tests for the per-upstream rate limiter."""
+
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from valuecell.adapters.assets.executor import AdapterExecutor
+from valuecell.adapters.assets.rate_limit import (
+    Priority,
+    RateLimiter,
+    RateLimitTimeout,
+    UpstreamLimiter,
+    get_request_priority,
+    is_empty_response,
+    request_priority,
+)
+
+
+class FakeClock:
+    """Clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(**kwargs):
+    clock = FakeClock()
+    kwargs.setdefault("background_reserve", 0.0)
+    limiter = UpstreamLimiter("test", clock=clock, sleep=clock.sleep, **kwargs)
+    return limiter, clock
+
+
+def test_is_empty_response():
+    assert is_empty_response(None)
+    assert is_empty_response([])
+    assert is_empty_response({})
+    assert is_empty_response(pd.DataFrame())
+    assert not is_empty_response(pd.DataFrame({"close": [1.0]}))
+    assert not is_empty_response({"symbol": "AAPL"})
+    assert not is_empty_response(0)
+
+
+def test_request_priority_context():
+    assert get_request_priority() == Priority.INTERACTIVE
+    with request_priority(Priority.BACKGROUND):
+        assert get_request_priority() == Priority.BACKGROUND
+    assert get_request_priority() == Priority.INTERACTIVE
+
+
+class TestTokenBucket:
+    def test_burst_then_sustained_rate(self):
+        limiter, clock = make_limiter(rate=2.0, burst=2)
+
+        assert limiter.acquire()
+        assert limiter.acquire()
+        assert clock.now == 0
+
+        assert limiter.acquire()
+        assert clock.now == pytest.approx(0.5)
+
+    def test_tokens_refill_up_to_capacity(self):
+        limiter, clock = make_limiter(rate=1.0, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+
+        clock.now = 100
+        for _ in range(3):
+            limiter.acquire()
+        assert clock.now == 100
+        limiter.acquire()
+        assert clock.now == pytest.approx(101)
+
+    def test_timeout_fails_fast(self):
+        limiter, clock = make_limiter(rate=1.0, burst=1)
+        limiter.acquire()
+
+        assert not limiter.acquire(timeout=0.5)
+        # Did not sleep into a deadline it could not meet
+        assert clock.now == 0
+        assert limiter.metrics()["timeouts"] == 1
+
+        with pytest.raises(RateLimitTimeout):
+            limiter.call(lambda: "data", timeout=0.5)
+
+    def test_background_leaves_reserve_for_interactive(self):
+        limiter, clock = make_limiter(rate=1.0, burst=4, background_reserve=0.5)
+
+        # Background may only drain the bucket down to the reserve
+        limiter.acquire(Priority.BACKGROUND)
+        limiter.acquire(Priority.BACKGROUND)
+        assert clock.now == 0
+        assert not limiter.acquire(Priority.BACKGROUND, timeout=0.5)
+
+        # Interactive callers can still use the reserve
+        limiter.acquire(Priority.INTERACTIVE)
+        limiter.acquire(Priority.INTERACTIVE)
+        assert clock.now == 0
+
+    def test_context_priority_is_used_by_default(self):
+        limiter, _ = make_limiter(rate=1.0, burst=4)
+
+        with request_priority(Priority.BACKGROUND):
+            limiter.acquire()
+        limiter.acquire()
+
+        acquired = limiter.metrics()["acquired"]
+        assert acquired == {"interactive": 1, "background": 1}
+
+
+class TestAdaptiveBackoff:
+    def test_rate_limit_error_halves_rate_and_pauses(self):
+        limiter, clock = make_limiter(rate=4.0, burst=4, backoff_seconds=2.0)
+
+        def throttled():
+            raise RuntimeError("HTTP Error 429: Too Many Requests")
+
+        with pytest.raises(RuntimeError):
+            limiter.call(throttled)
+
+        metrics = limiter.metrics()
+        assert metrics["rate"] == 2.0
+        assert metrics["throttles"] == 1
+        assert metrics["backoff_remaining"] == 2.0
+
+        limiter.acquire()
+        assert clock.now == pytest.approx(2.0)
+
+    def test_backoff_grows_with_consecutive_throttles(self):
+        limiter, clock = make_limiter(
+            rate=8.0, burst=1, backoff_seconds=1.0, max_backoff_seconds=3.0
+        )
+
+        limiter.report_throttled()
+        limiter.report_throttled()
+        assert limiter.metrics()["backoff_remaining"] == 2.0
+        limiter.report_throttled()
+        assert limiter.metrics()["backoff_remaining"] == 3.0
+        assert limiter.rate == 1.0
+
+    def test_rate_never_drops_below_minimum(self):
+        limiter, _ = make_limiter(rate=1.0, burst=1, min_rate=0.4)
+        for _ in range(5):
+            limiter.report_throttled()
+        assert limiter.rate == 0.4
+
+    def test_empty_response_streak_counts_as_throttling(self):
+        limiter, _ = make_limiter(rate=4.0, burst=10, empty_threshold=3)
+
+        limiter.call(lambda: pd.DataFrame())
+        limiter.call(lambda: pd.DataFrame())
+        # A real answer breaks the streak
+        limiter.call(lambda: pd.DataFrame({"close": [1.0]}))
+        limiter.call(lambda: None)
+        limiter.call(lambda: None)
+        assert limiter.metrics()["throttles"] == 0
+
+        limiter.call(lambda: None)
+        assert limiter.metrics()["throttles"] == 1
+        assert limiter.rate == 2.0
+
+    def test_empty_searches_do_not_throttle(self):
+        limiter, _ = make_limiter(rate=4.0, burst=10, empty_threshold=3)
+
+        # Searches for tickers that do not exist legitimately come back empty
+        for _ in range(5):
+            limiter.call(lambda: [], expect_data=False)
+        assert limiter.metrics()["throttles"] == 0
+
+        # ... and neither start nor break a streak of empty price answers
+        limiter.call(lambda: None)
+        limiter.call(lambda: None)
+        limiter.call(lambda: [], expect_data=False)
+        limiter.call(lambda: None)
+        assert limiter.metrics()["throttles"] == 1
+
+    def test_success_restores_rate_additively(self):
+        limiter, clock = make_limiter(rate=10.0, burst=10, recovery_step=0.25)
+        limiter.report_throttled()
+        assert limiter.rate == 5.0
+
+        clock.now = 100
+        limiter.call(lambda: "ok")
+        assert limiter.rate == 7.5
+        for _ in range(5):
+            limiter.call(lambda: "ok")
+        assert limiter.rate == 10.0
+
+    def test_plain_errors_do_not_back_off(self):
+        limiter, _ = make_limiter(rate=1.0, burst=1)
+        with pytest.raises(ValueError):
+            limiter.call(lambda: (_ for _ in ()).throw(ValueError("bad symbol")))
+        assert limiter.metrics()["throttles"] == 0
+
+
+class TestMetrics:
+    def test_wait_time_metrics(self):
+        limiter, _ = make_limiter(rate=1.0, burst=1)
+
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+        metrics = limiter.metrics()
+        assert metrics["acquired"]["interactive"] == 3
+        assert metrics["max_wait"]["interactive"] == 1.0
+        assert metrics["avg_wait"]["interactive"] == pytest.approx(2 / 3, abs=1e-3)
+        assert metrics["queue_depth"] == {"interactive": 0, "background": 0}
+
+    def test_queue_depth_and_priority_order(self):
+        limiter = UpstreamLimiter("test", rate=5.0, burst=1, background_reserve=0.0)
+        limiter.acquire()
+        order = []
+
+        def take(priority):
+            limiter.acquire(priority)
+            order.append(priority)
+
+        background = threading.Thread(target=take, args=(Priority.BACKGROUND,))
+        background.start()
+        time.sleep(0.02)
+        interactive = threading.Thread(target=take, args=(Priority.INTERACTIVE,))
+        interactive.start()
+        time.sleep(0.02)
+
+        assert limiter.metrics()["queue_depth"] == {"interactive": 1, "background": 1}
+
+        background.join(2)
+        interactive.join(2)
+        # The later interactive caller was served first
+        assert order == [Priority.INTERACTIVE, Priority.BACKGROUND]
+
+
+class TestRateLimiter:
+    def test_upstreams_have_separate_buckets(self):
+        clock = FakeClock()
+        limiter = RateLimiter(
+            limits={"yahoo": {"rate": 1.0, "burst": 1}},
+            clock=clock,
+            sleep=clock.sleep,
+        )
+
+        limiter.call("yahoo", lambda: "ok")
+        limiter.call("eastmoney", lambda: "ok")
+        assert clock.now == 0
+
+        limiter.call("yahoo", lambda: "ok")
+        assert clock.now == pytest.approx(1.0)
+        assert set(limiter.metrics()) == {"yahoo", "eastmoney"}
+
+    def test_configure_replaces_limiter(self):
+        limiter = RateLimiter()
+        upstream = limiter.configure("yahoo", rate=10.0, burst=20)
+        assert limiter.get("yahoo") is upstream
+        assert upstream.capacity == 20
+
+    def test_executor_carries_request_priority(self):
+        executor = AdapterExecutor(max_workers=2, default_limit=1)
+        try:
+            with request_priority(Priority.BACKGROUND):
+                futures = [
+                    executor.submit("test", get_request_priority) for _ in range(3)
+                ]
+            assert [f.result(2) for f in futures] == [Priority.BACKGROUND] * 3
+        finally:
+            executor.shutdown()
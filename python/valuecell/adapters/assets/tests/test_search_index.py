@@ -0,0 +1,293 @@
+"""Tests for the offline asset search index."""
+
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from valuecell.adapters.assets import search_index
+from valuecell.adapters.assets.base import BaseDataAdapter
+from valuecell.adapters.assets.manager import AdapterManager
+from valuecell.adapters.assets.search_index import (
+    IndexedAsset,
+    LocalAssetIndex,
+    indexed_asset_from_record,
+)
+from valuecell.adapters.assets.types import (
+    AssetSearchQuery,
+    AssetSearchResult,
+    AssetType,
+    DataSource,
+)
+
+
+@pytest.fixture
+def index():
+    index = LocalAssetIndex()
+    index.upsert_many(
+        [
+            IndexedAsset(
+                ticker="NASDAQ:AAPL",
+                asset_type=AssetType.STOCK,
+                names={"en-US": "Apple Inc.", "zh-Hans": "苹果"},
+            ),
+            IndexedAsset(
+                ticker="NASDAQ:NVDA",
+                asset_type=AssetType.STOCK,
+                names={"en-US": "NVIDIA Corporation", "zh-Hans": "英伟达"},
+            ),
+            IndexedAsset(
+                ticker="HKEX:00700",
+                asset_type=AssetType.STOCK,
+                names={"en-US": "Tencent Holdings", "zh-Hant": "騰訊控股"},
+                aliases=["TCEHY"],
+            ),
+            IndexedAsset(
+                ticker="SSE:600519",
+                asset_type=AssetType.STOCK,
+                names={"zh-Hans": "贵州茅台", "en-US": "Kweichow Moutai"},
+            ),
+        ]
+    )
+    return index
+
+
+class TestLocalAssetIndex:
+    def test_exact_symbol_ranks_first(self, index):
+        results = index.search("AAPL")
+
+        assert results[0].ticker == "NASDAQ:AAPL"
+        assert results[0].relevance_score == 1.0
+        assert results[0].country == "US"
+
+    def test_prefix_on_name(self, index):
+        results = index.search("nvi")
+        assert [r.ticker for r in results][:1] == ["NASDAQ:NVDA"]
+
+    def test_prefix_on_later_name_word(self, index):
+        results = index.search("Moutai")
+        assert results[0].ticker == "SSE:600519"
+
+    def test_chinese_name(self, index):
+        assert index.search("茅台")[0].ticker == "SSE:600519"
+        assert index.search("贵州")[0].ticker == "SSE:600519"
+
+    def test_hk_code_without_leading_zeros(self, index):
+        results = index.search("700")
+        assert results[0].ticker == "HKEX:00700"
+        assert results[0].country == "HK"
+
+    def test_alias(self, index):
+        assert index.search("tcehy")[0].ticker == "HKEX:00700"
+
+    def test_fuzzy_match_on_typo(self, index):
+        results = index.search("Tencnet Holdings")
+        assert results and results[0].ticker == "HKEX:00700"
+
+    def test_no_match(self, index):
+        assert index.search("zzzzqqq") == []
+        assert index.search("  ") == []
+
+    def test_limit(self, index):
+        assert len(index.search("a", limit=2)) <= 2
+
+    def test_upsert_merges_names(self, index):
+        index.upsert(
+            IndexedAsset(
+                ticker="NASDAQ:AAPL",
+                asset_type=AssetType.STOCK,
+                names={"ja-JP": "アップル"},
+            )
+        )
+
+        asset = index.get("NASDAQ:AAPL")
+        assert asset.names["en-US"] == "Apple Inc."
+        assert index.search("アップル")[0].ticker == "NASDAQ:AAPL"
+
+    def test_remove(self, index):
+        assert index.remove("NASDAQ:AAPL")
+        assert "NASDAQ:AAPL" not in index
+        assert all(r.ticker != "NASDAQ:AAPL" for r in index.search("apple"))
+        assert not index.remove("NASDAQ:AAPL")
+
+    def test_bulk_upsert_matches_incremental_upserts(self, index):
+        assets = [
+            IndexedAsset(
+                ticker=f"NYSE:T{i}",
+                asset_type=AssetType.STOCK,
+                names={"en-US": f"Test Company {i}"},
+            )
+            for i in range(50)
+        ]
+        # Re-indexing an existing asset replaces its keys
+        assets.append(
+            IndexedAsset(
+                ticker="NASDAQ:AAPL",
+                asset_type=AssetType.STOCK,
+                names={"ja-JP": "アップル"},
+                aliases=["apple computer"],
+            )
+        )
+        incremental = LocalAssetIndex()
+        for asset in index._entries.values():
+            incremental.upsert(asset)
+        for asset in assets:
+            incremental.upsert(asset)
+
+        assert index.upsert_many(assets) == len(assets)
+
+        assert index._sorted_keys == incremental._sorted_keys
+        assert index._trigrams == incremental._trigrams
+        assert index.search("apple computer")[0].ticker == "NASDAQ:AAPL"
+        assert index.search("Test Company 7")[0].ticker == "NYSE:T7"
+
+    def test_pinyin_initials(self, index):
+        if search_index.lazy_pinyin is None:
+            pytest.skip("pypinyin is not installed")
+
+        assert index.search("gzmt")[0].ticker == "SSE:600519"
+
+
+def test_indexed_asset_from_record():
+    record = SimpleNamespace(
+        symbol="SZSE:000001",
+        name="Ping An Bank",
+        asset_type="stock",
+        asset_metadata={
+            "names": {"zh-Hans": "平安银行"},
+            "aliases": ["PAB"],
+            "currency": "CNY",
+        },
+        updated_at=datetime(2025, 1, 1),
+    )
+
+    asset = indexed_asset_from_record(record)
+    assert asset.names == {"zh-Hans": "平安银行", "en-US": "Ping An Bank"}
+    assert asset.aliases == ["PAB"]
+    assert asset.currency == "CNY"
+    assert indexed_asset_from_record(SimpleNamespace(symbol="AAPL")) is None
+
+
+class FakeSearchAdapter(BaseDataAdapter):
+    """Adapter that only records remote search calls."""
+
+    def __init__(self, results=None):
+        self.results = results or []
+        self.search_calls = 0
+        super().__init__(DataSource.YFINANCE)
+
+    def _initialize(self):
+        pass
+
+    def search_assets(self, query):
+        self.search_calls += 1
+        return self.results
+
+    def get_asset_info(self, ticker):
+        return None
+
+    def get_real_time_price(self, ticker):
+        return None
+
+    def get_historical_prices(self, ticker, start_date, end_date, interval="1d"):
+        return []
+
+    def get_capabilities(self):
+        return []
+
+    def convert_to_source_ticker(self, internal_ticker):
+        return internal_ticker
+
+    def convert_to_internal_ticker(self, source_ticker, default_exchange=None):
+        return source_ticker
+
+
+class TestAdapterManagerLocalSearch:
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        manager = AdapterManager()
+        # Keep tests away from the database and background threads
+        monkeypatch.setattr(manager, "_ensure_search_index", lambda: None)
+        monkeypatch.setattr(manager, "_enrich_search_in_background", lambda query: None)
+        return manager
+
+    def test_local_hit_skips_remote_search(self, manager, index):
+        adapter = FakeSearchAdapter()
+        manager.register_adapter(adapter)
+        manager.search_index = index
+
+        results = manager.search_assets(AssetSearchQuery(query="Tencent"))
+
+        assert results[0].ticker == "HKEX:00700"
+        assert adapter.search_calls == 0
+
+    def test_miss_searches_remotely_and_indexes_results(self, manager):
+        adapter = FakeSearchAdapter(
+            [
+                AssetSearchResult(
+                    ticker="NYSE:JPM",
+                    asset_type=AssetType.STOCK,
+                    names={"en-US": "JPMorgan Chase & Co."},
+                    exchange="NYSE",
+                    country="US",
+                    currency="USD",
+                    relevance_score=1.0,
+                )
+            ]
+        )
+        manager.register_adapter(adapter)
+
+        results = manager.search_assets(AssetSearchQuery(query="JPM"))
+        assert [r.ticker for r in results] == ["NYSE:JPM"]
+        assert adapter.search_calls == 1
+
+        # Second search is served from the index
+        results = manager.search_assets(AssetSearchQuery(query="jpmorgan"))
+        assert results[0].ticker == "NYSE:JPM"
+        assert adapter.search_calls == 1
+
+
+class TestSearchEnrichment:
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        manager = AdapterManager()
+        monkeypatch.setattr(manager, "_ensure_search_index", lambda: None)
+        manager.search_enrichment_debounce = 0.05
+        return manager
+
+    @staticmethod
+    def wait_for_drain(manager, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while manager._enrichment_running and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not manager._enrichment_running
+
+    def test_typing_enriches_only_the_final_query(self, manager, index):
+        adapter = FakeSearchAdapter()
+        manager.register_adapter(adapter)
+        manager.search_index = index
+
+        for prefix in ["a", "ap", "app", "appl"]:
+            assert manager.search_assets(AssetSearchQuery(query=prefix))
+        self.wait_for_drain(manager)
+
+        assert adapter.search_calls == 1
+        assert list(manager._enriched_queries) == ["appl"]
+
+    def test_recently_enriched_query_is_not_searched_again(self, manager, index):
+        adapter = FakeSearchAdapter()
+        manager.register_adapter(adapter)
+        manager.search_index = index
+
+        manager.search_assets(AssetSearchQuery(query="Tencent"))
+        self.wait_for_drain(manager)
+        manager.search_assets(AssetSearchQuery(query="tencent "))
+        self.wait_for_drain(manager)
+        assert adapter.search_calls == 1
+
+        # Expired entries are enriched again
+        manager.search_enrichment_ttl = 0.0
+        manager.search_assets(AssetSearchQuery(query="Tencent"))
+        self.wait_for_drain(manager)
+        assert adapter.search_calls == 2
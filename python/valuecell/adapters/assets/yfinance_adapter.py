@@ -28,6 +28,9 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Rate limit bucket shared by all Yahoo Finance requests
+YAHOO_UPSTREAM = "yahoo"
+
 
 class YFinanceAdapter(BaseDataAdapter):
     """Yahoo Finance data adapter implementation."""
@@ -90,7 +93,9 @@ class YFinanceAdapter(BaseDataAdapter):
 
         try:
             # Use yfinance Search API for comprehensive search
-            search_obj = yf.Search(search_term)
+            search_obj = self.call_upstream(
+                YAHOO_UPSTREAM, yf.Search, search_term, expect_data=False
+            )
 
             # Get search results from different categories
             search_quotes = getattr(search_obj, "quotes", [])
@@ -224,7 +229,9 @@ class YFinanceAdapter(BaseDataAdapter):
         try:
             source_ticker = self.convert_to_source_ticker(ticker)
             ticker_obj = yf.Ticker(source_ticker)
-            info = ticker_obj.info
+            info = self.call_upstream(
+                YAHOO_UPSTREAM, lambda: ticker_obj.info, expect_data=False
+            )
 
             if not info or "symbol" not in info:
                 return None
@@ -316,13 +323,15 @@ class YFinanceAdapter(BaseDataAdapter):
             ticker_obj = yf.Ticker(source_ticker)
 
             # Get current data
-            data = ticker_obj.history(period="1d", interval="1m")
+            data = self.call_upstream(
+                YAHOO_UPSTREAM, ticker_obj.history, period="1d", interval="1m"
+            )
             if data.empty:
                 return None
 
             # Get the most recent data point
             latest = data.iloc[-1]
-            info = ticker_obj.info
+            info = self.call_upstream(YAHOO_UPSTREAM, lambda: ticker_obj.info)
 
             # Calculate change
             current_price = Decimal(str(latest["Close"]))
@@ -385,7 +394,9 @@ class YFinanceAdapter(BaseDataAdapter):
             yf_interval = interval_mapping.get(interval, "1d")
 
             # Fetch historical data
-            data = ticker_obj.history(
+            data = self.call_upstream(
+                YAHOO_UPSTREAM,
+                ticker_obj.history,
                 start=start_date.strftime("%Y-%m-%d"),
                 end=end_date.strftime("%Y-%m-%d"),
                 interval=yf_interval,
@@ -395,7 +406,7 @@ class YFinanceAdapter(BaseDataAdapter):
                 return []
 
             # Get currency from ticker info
-            info = ticker_obj.info
+            info = self.call_upstream(YAHOO_UPSTREAM, lambda: ticker_obj.info)
             currency = info.get("currency", "USD")
 
             prices = []
@@ -445,7 +456,9 @@ class YFinanceAdapter(BaseDataAdapter):
             data = None
             for interval, period in [("1m", "1d"), ("1d", "5d")]:
                 try:
-                    data = yf.download(
+                    data = self.call_upstream(
+                        YAHOO_UPSTREAM,
+                        yf.download,
                         source_tickers,
                         period=period,
                         interval=interval,
@@ -498,7 +511,7 @@ class YFinanceAdapter(BaseDataAdapter):
 
                     # Get additional info for currency and market cap
                     ticker_obj = yf.Ticker(source_ticker)
-                    info = ticker_obj.info
+                    info = self.call_upstream(YAHOO_UPSTREAM, lambda: ticker_obj.info)
 
                     # Safe Decimal conversion with NaN check
                     def safe_decimal(value, default=None):
@@ -8,6 +8,7 @@ Main Components:
 - ModelFactory: Factory class for creating model instances
 - ModelProvider: Abstract base class for provider implementations
 - Provider implementations: OpenRouterProvider, GoogleProvider, AzureProvider, etc.
+- ModelCache: Reuses model instances (and their HTTP clients) across calls
 
 Usage:
     >>> from valuecell.adapters.models import create_model, create_model_for_agent
@@ -22,6 +23,7 @@ Usage:
 from valuecell.adapters.models.factory import (
     AzureProvider,
     GoogleProvider,
+    ModelCache,
     ModelFactory,
     ModelProvider,
     OpenRouterProvider,
@@ -29,13 +31,16 @@ from valuecell.adapters.models.factory import (
     create_model,
     create_model_for_agent,
     get_model_factory,
+    reset_model_factory,
 )
 
 __all__ = [
     # Factory and base classes
     "ModelFactory",
     "ModelProvider",
+    "ModelCache",
     "get_model_factory",
+    "reset_model_factory",
     # Provider implementations
     "OpenRouterProvider",
     "GoogleProvider",
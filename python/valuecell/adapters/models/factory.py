@@ -6,13 +6,18 @@ This factory:
 2. Validates provider credentials
 3. Creates appropriate model instances with correct parameters
 4. Supports fallback providers for reliability
+5. Caches model instances so their HTTP clients are reused across requests
 """
 
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 
 from valuecell.config.manager import ConfigManager, ProviderConfig, get_config_manager
+from valuecell.config.watcher import ConfigChangeEvent
 
 logger = logging.getLogger(__name__)
 
@@ -252,6 +257,120 @@ class SiliconFlowProvider(ModelProvider):
         )
 
 
+def _freeze(value: Any) -> Hashable:
+    """Convert a parameter value into a hashable, order-independent form"""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def credentials_fingerprint(config: ProviderConfig) -> str:
+    """
+    Fingerprint the credentials and endpoint of a provider
+
+    The raw API key never ends up in a cache key; a rotated key or a changed
+    endpoint yields a different fingerprint.
+
+    Args:
+        config: Provider configuration
+
+    Returns:
+        Hex digest of the credentials
+    """
+    material = repr(
+        (config.api_key, config.base_url, _freeze(config.extra_config))
+    ).encode()
+    return hashlib.sha256(material).hexdigest()[:16]
+
+
+class ModelCache:
+    """
+    Thread-safe LRU cache of model and embedder instances
+
+    Each key is created at most once even when several threads ask for it at
+    the same time: callers of the same key wait on a per-key lock while other
+    keys are created in parallel.
+    """
+
+    def __init__(self, max_size: int = 64):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of cached instances
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_create(self, key: Hashable, create: Callable[[], Any]) -> Any:
+        """
+        Get the instance for a key, creating it on a miss
+
+        Args:
+            key: Cache key
+            create: Builds the instance; exceptions propagate uncached
+
+        Returns:
+            Cached or newly created instance
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                # Created by another thread while we waited
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key]
+                self.misses += 1
+                generation = self._generation
+
+            try:
+                instance = create()
+            except BaseException:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+                raise
+
+            with self._lock:
+                # Do not store instances built from configuration that was
+                # reloaded while they were being created
+                if generation == self._generation:
+                    self._entries[key] = instance
+                    while len(self._entries) > self.max_size:
+                        self._entries.popitem(last=False)
+                # Dropped together with storing the entry so that a caller
+                # arriving in between cannot miss both and create again
+                self._key_locks.pop(key, None)
+            return instance
+
+    def clear(self) -> None:
+        """Drop all cached instances"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
 class ModelFactory:
     """
     Factory for creating model instances with provider abstraction
@@ -261,6 +380,7 @@ class ModelFactory:
     - Provider validation
     - Fallback provider support
     - Parameter merging
+    - Instance caching keyed by provider, model, parameters and credentials
     """
 
     # Registry of provider classes
@@ -279,6 +399,9 @@ class ModelFactory:
             config_manager: ConfigManager instance (auto-created if None)
         """
         self.config_manager = config_manager or get_config_manager()
+        self._cache = ModelCache()
+        # Reloaded configuration may change defaults and parameters
+        self.config_manager.add_reload_listener(self._on_config_reload)
 
     def register_provider(self, name: str, provider_class: type[ModelProvider]):
         """
@@ -289,8 +412,56 @@ class ModelFactory:
             provider_class: Provider class
         """
         self._providers[name] = provider_class
+        self._cache.clear()
         logger.info(f"Registered custom provider: {name}")
 
+    def clear_cache(self):
+        """Drop all cached model and embedder instances"""
+        self._cache.clear()
+
+    def _on_config_reload(self, event: ConfigChangeEvent):
+        """Drop cached instances built from the previous configuration"""
+        logger.info(
+            f"Configuration reloaded (generation {event.generation}), "
+            "clearing model cache"
+        )
+        self._cache.clear()
+
+    def _cache_key(
+        self,
+        kind: str,
+        provider: str,
+        model_id: Optional[str],
+        provider_config: ProviderConfig,
+        kwargs: Dict[str, Any],
+    ) -> Tuple[Hashable, ...]:
+        """
+        Build the cache key of a model or embedder
+
+        Args:
+            kind: "model" or "embedder"
+            provider: Provider name
+            model_id: Requested model ID (None for the provider default)
+            provider_config: Resolved provider configuration
+            kwargs: Creation parameters
+
+        Returns:
+            Hashable cache key
+        """
+        if kind == "embedder":
+            model_id = model_id or provider_config.default_embedding_model
+            defaults = provider_config.embedding_parameters
+        else:
+            model_id = model_id or provider_config.default_model
+            defaults = provider_config.parameters
+        return (
+            kind,
+            provider,
+            model_id,
+            _freeze({**defaults, **kwargs}),
+            credentials_fingerprint(provider_config),
+        )
+
     def create_model(
         self,
         model_id: Optional[str] = None,
@@ -385,10 +556,13 @@ class ModelFactory:
 
         # Create provider instance
         provider_class = self._providers[provider]
-        provider_instance = provider_class(provider_config)
+        key = self._cache_key("model", provider, model_id, provider_config, kwargs)
 
-        # Create model
-        return provider_instance.create_model(model_id, **kwargs)
+        # Create model once per key and reuse it
+        return self._cache.get_or_create(
+            key,
+            lambda: provider_class(provider_config).create_model(model_id, **kwargs),
+        )
 
     def create_model_for_agent(
         self, agent_name: str, use_fallback: bool = True, **kwargs
@@ -634,10 +808,13 @@ class ModelFactory:
 
         # Create provider instance
         provider_class = self._providers[provider]
-        provider_instance = provider_class(provider_config)
+        key = self._cache_key("embedder", provider, model_id, provider_config, kwargs)
 
-        # Create embedder
-        return provider_instance.create_embedder(model_id, **kwargs)
+        # Create embedder once per key and reuse it
+        return self._cache.get_or_create(
+            key,
+            lambda: provider_class(provider_config).create_embedder(model_id, **kwargs),
+        )
 
 
 # ============================================
@@ -660,6 +837,15 @@ def get_model_factory() -> ModelFactory:
     return _factory
 
 
+def reset_model_factory() -> None:
+    """Drop the singleton model factory together with its cached instances"""
+    global _factory
+    if _factory is not None:
+        _factory.config_manager.remove_reload_listener(_factory._on_config_reload)
+        _factory.clear_cache()
+    _factory = None
+
+
 def create_model(
     model_id: Optional[str] = None, provider: Optional[str] = None, **kwargs
 ):
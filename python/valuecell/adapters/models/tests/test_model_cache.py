@@ -0,0 +1,184 @@
+"""Tests for the model instance cache of ModelFactory."""
+
+import threading
+import time
+
+import pytest
+
+from valuecell.adapters.models import factory as factory_module
+from valuecell.adapters.models.factory import ModelCache, ModelFactory, ModelProvider
+from valuecell.config.manager import ConfigManager, ProviderConfig
+
+
+class FakeLoader:
+    def __init__(self):
+        self.loads = 0
+
+    def load_config(self):
+        self.loads += 1
+        return {"models": {"primary_provider": "fake"}}
+
+    def clear_cache(self):
+        pass
+
+
+class FakeConfigManager(ConfigManager):
+    def __init__(self):
+        super().__init__(loader=FakeLoader())
+        self.api_key = "key-1"
+
+    def get_provider_config(self, provider_name=None):
+        return ProviderConfig(
+            name="fake",
+            enabled=True,
+            api_key=self.api_key,
+            base_url="https://fake.example/v1",
+            default_model="fake-default",
+            models=[],
+            parameters={"temperature": 0.5},
+            default_embedding_model="fake-embed",
+        )
+
+    def validate_provider(self, provider_name):
+        return True, None
+
+
+class FakeProvider(ModelProvider):
+    created = []
+
+    def create_model(self, model_id=None, **kwargs):
+        # Widen the window for concurrent creation
+        time.sleep(0.01)
+        model = {
+            "id": model_id or self.config.default_model,
+            "api_key": self.config.api_key,
+            **kwargs,
+        }
+        FakeProvider.created.append(model)
+        return model
+
+    def create_embedder(self, model_id=None, **kwargs):
+        return {"embedder": model_id or self.config.default_embedding_model, **kwargs}
+
+
+@pytest.fixture
+def factory():
+    FakeProvider.created = []
+    factory = ModelFactory(config_manager=FakeConfigManager())
+    factory.register_provider("fake", FakeProvider)
+    yield factory
+    ModelFactory._providers.pop("fake", None)
+
+
+def test_same_key_returns_same_instance(factory):
+    first = factory.create_model(provider="fake", use_fallback=False)
+    second = factory.create_model(
+        model_id="fake-default", provider="fake", use_fallback=False
+    )
+
+    assert first is second
+    assert len(FakeProvider.created) == 1
+
+
+def test_parameters_and_credentials_change_the_key(factory):
+    base = factory.create_model(provider="fake", use_fallback=False)
+    warmer = factory.create_model(provider="fake", use_fallback=False, temperature=0.9)
+    # Explicitly passing the provider default hits the same entry
+    same = factory.create_model(provider="fake", use_fallback=False, temperature=0.5)
+
+    factory.config_manager.api_key = "key-2"
+    rotated = factory.create_model(provider="fake", use_fallback=False)
+
+    assert warmer is not base
+    assert same is base
+    assert rotated is not base
+    assert rotated["api_key"] == "key-2"
+
+
+def test_models_and_embedders_are_cached_separately(factory):
+    model = factory.create_model(provider="fake", use_fallback=False)
+    embedder = factory.create_embedder(provider="fake", use_fallback=False)
+
+    assert embedder is not model
+    assert factory.create_embedder(provider="fake", use_fallback=False) is embedder
+
+
+def test_config_reload_invalidates_cache(factory):
+    first = factory.create_model(provider="fake", use_fallback=False)
+
+    factory.config_manager.reload()
+
+    assert factory.config_manager.loader.loads == 2
+    assert factory.create_model(provider="fake", use_fallback=False) is not first
+
+
+def test_concurrent_callers_create_one_instance(factory):
+    results = []
+
+    def worker():
+        results.append(factory.create_model(provider="fake", use_fallback=False))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeProvider.created) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ModelCache(max_size=2)
+    cache.get_or_create("a", lambda: "A")
+    cache.get_or_create("b", lambda: "B")
+    cache.get_or_create("a", lambda: "A2")
+    cache.get_or_create("c", lambda: "C")
+
+    assert len(cache) == 2
+    assert cache.get_or_create("a", lambda: "A3") == "A"
+    assert cache.get_or_create("b", lambda: "B2") == "B2"
+
+
+def test_failed_creation_is_not_cached():
+    cache = ModelCache()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get_or_create("a", fail)
+    assert cache.get_or_create("a", lambda: "A") == "A"
+
+
+def test_callers_racing_a_finished_creation_reuse_it():
+    for round_ in range(50):
+        cache = ModelCache()
+        created = []
+        start = threading.Barrier(8)
+
+        def worker():
+            start.wait()
+            cache.get_or_create("a", lambda: created.append(round_) or object())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert cache._key_locks == {}
+
+
+def test_reset_unregisters_reload_listener(monkeypatch):
+    manager = FakeConfigManager()
+    monkeypatch.setattr(
+        factory_module, "_factory", ModelFactory(config_manager=manager)
+    )
+    old = factory_module._factory
+
+    factory_module.reset_model_factory()
+
+    assert factory_module._factory is None
+    assert old._on_config_reload not in manager._reload_listeners
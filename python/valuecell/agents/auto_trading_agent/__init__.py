@@ -5,8 +5,11 @@ Modules:
 - models: Data models and enumerations
 - position_manager: Position and cash management
 - market_data: Technical analysis and indicator retrieval
+- panel: Vectorized indicators for many symbols at once
+- backtest: Offline replay of stored bars through the decision loop
 - trade_recorder: Trade history and statistics
 - trading_executor: High-level trade execution facade
+- state_store: Durable instance state (SQLite journal and snapshots)
 - technical_analysis: Backward-compatible technical analysis interface
 - portfolio_decision_manager: Portfolio-level decision making
 - formatters: Message formatting utilities
@@ -6,6 +6,13 @@ from valuecell.core.agent.decorator import create_wrapped_agent
 
 from .agent import AutoTradingAgent
 
-if __name__ == "__main__":
+
+async def main():
     agent = create_wrapped_agent(AutoTradingAgent)
-    asyncio.run(agent.serve())
+    # Resume the paper portfolios that were running before the restart
+    await agent.restore_instances()
+    await agent.serve()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -4,9 +4,8 @@ import asyncio
 import json
 import logging
 import os
-from collections import deque
 from datetime import datetime, timezone
-from typing import Any, AsyncGenerator, Deque, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 from agno.agent import Agent
 
@@ -15,25 +14,36 @@ from valuecell.core.types import (
     BaseAgent,
     ComponentType,
     FilteredCardPushNotificationComponentData,
+    FilteredCardPushNotificationDeltaComponentData,
     FilteredLineChartComponentData,
+    FilteredLineChartDeltaComponentData,
     StreamResponse,
 )
+from valuecell.utils import resolve_db_path
 
+from .chart import PortfolioChartSeries
 from .constants import (
+    CHART_MAX_POINTS,
     DEFAULT_AGENT_MODEL,
     DEFAULT_CHECK_INTERVAL,
     ENV_PARSER_MODEL_ID,
     ENV_SIGNAL_MODEL_ID,
+    SYMBOL_STAGE_TIMEOUT,
 )
 from .formatters import MessageFormatter
+from .market_data import is_symbol_market_open
+from .market_hub import MarketSnapshot, get_market_data_hub
 from .models import (
     AutoTradingConfig,
+    PortfolioValueSnapshot,
     TradingRequest,
 )
+from .notifications import MAX_NOTIFICATION_CACHE_SIZE, NotificationLog
 from .portfolio_decision_manager import (
     AssetAnalysis,
     PortfolioDecisionManager,
 )
+from .state_store import InstanceJournal, SQLiteTradingStateStore
 from .technical_analysis import AISignalGenerator, TechnicalAnalyzer
 from .trading_executor import TradingExecutor
 
@@ -41,9 +51,6 @@ from .trading_executor import TradingExecutor
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Maximum cached notifications per session
-MAX_NOTIFICATION_CACHE_SIZE = 5000
-
 
 class AutoTradingAgent(BaseAgent):
     """
@@ -58,12 +65,25 @@ class AutoTradingAgent(BaseAgent):
         # Structure: {session_id: {instance_id: TradingInstanceData}}
         self.trading_instances: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
-        # Notification cache for batch sending
-        # Structure: {session_id: deque[FilteredCardPushNotificationComponentData]}
-        # Using deque with maxlen for automatic FIFO eviction
-        self.notification_cache: Dict[
-            str, Deque[FilteredCardPushNotificationComponentData]
-        ] = {}
+        # Market data shared by all instances: one download per symbol per tick
+        self.market_data = get_market_data_hub()
+
+        # Portfolio value chart of each session, sent as deltas
+        self.portfolio_charts: Dict[str, PortfolioChartSeries] = {}
+
+        # Notification log of each session: streams send the notifications
+        # after their cursor, the bounded history serves replays
+        self.notification_cache: Dict[str, NotificationLog] = {}
+
+        # Durable instance state, so portfolios survive a restart
+        self.state_store = SQLiteTradingStateStore(resolve_db_path())
+
+        # Trading loops and other work that outlives the stream that
+        # started it; referenced here so the tasks are not collected
+        self.background_tasks: Set[asyncio.Task] = set()
+
+        # Wakes the streams of a session after each trading cycle
+        self.session_updates: Dict[str, asyncio.Event] = {}
 
         try:
             # Parser agent for natural language query parsing
@@ -90,6 +110,7 @@ class AutoTradingAgent(BaseAgent):
         instance_id: str,
         semaphore: asyncio.Semaphore,
         unified_timestamp: Optional[datetime] = None,
+        snapshots: Optional[Dict[str, MarketSnapshot]] = None,
     ) -> None:
         """
         Process a single trading instance with semaphore control for concurrency limiting.
@@ -99,7 +120,10 @@ class AutoTradingAgent(BaseAgent):
             instance_id: Trading instance identifier
             semaphore: Asyncio semaphore to limit concurrent processing
             unified_timestamp: Optional unified timestamp for snapshot alignment across instances
+            snapshots: Market snapshots refreshed for this cycle; symbols
+                without one are skipped
         """
+        snapshots = snapshots or {}
         async with semaphore:
             try:
                 # Check if instance still exists and is active
@@ -120,6 +144,12 @@ class AutoTradingAgent(BaseAgent):
                 instance["last_check"] = datetime.now()
                 check_count = instance["check_count"]
 
+                # Mark every position to market once: valuation, P&L and
+                # chart points of this cycle all use these prices
+                executor.mark_to_market(
+                    unified_timestamp, config.crypto_symbols, fetch_missing=False
+                )
+
                 logger.info(
                     f"Trading check #{check_count} for instance {instance_id} (model: {config.agent_model})"
                 )
@@ -142,52 +172,19 @@ class AutoTradingAgent(BaseAgent):
 
                 portfolio_manager = PortfolioDecisionManager(config, llm_client)
 
-                for symbol in config.crypto_symbols:
-                    # Calculate indicators
-                    indicators = TechnicalAnalyzer.calculate_indicators(symbol)
-
-                    if indicators is None:
-                        logger.warning(f"Skipping {symbol} - insufficient data")
-                        continue
-
-                    # Generate technical signal
-                    technical_action, technical_trade_type = (
-                        TechnicalAnalyzer.generate_signal(indicators)
-                    )
-
-                    # Generate AI signal if enabled
-                    ai_action, ai_trade_type, ai_reasoning, ai_confidence = (
-                        None,
-                        None,
-                        None,
-                        None,
+                # Analyze symbols concurrently, each within its own deadline
+                analyses = await asyncio.gather(
+                    *(
+                        self._analyze_symbol(
+                            symbol, snapshots.get(symbol), ai_signal_generator
+                        )
+                        for symbol in config.crypto_symbols
                     )
+                )
 
-                    if ai_signal_generator:
-                        ai_signal = await ai_signal_generator.get_signal(indicators)
-                        if ai_signal:
-                            (
-                                ai_action,
-                                ai_trade_type,
-                                ai_reasoning,
-                                ai_confidence,
-                            ) = ai_signal
-                            logger.info(
-                                f"AI signal for {symbol}: {ai_action.value} {ai_trade_type.value} "
-                                f"(confidence: {ai_confidence}%)"
-                            )
-
-                    # Create asset analysis
-                    asset_analysis = AssetAnalysis(
-                        symbol=symbol,
-                        indicators=indicators,
-                        technical_action=technical_action,
-                        technical_trade_type=technical_trade_type,
-                        ai_action=ai_action,
-                        ai_trade_type=ai_trade_type,
-                        ai_reasoning=ai_reasoning,
-                        ai_confidence=ai_confidence,
-                    )
+                for asset_analysis in analyses:
+                    if asset_analysis is None:
+                        continue
 
                     # Add to portfolio manager
                     portfolio_manager.add_asset_analysis(asset_analysis)
@@ -195,12 +192,12 @@ class AutoTradingAgent(BaseAgent):
                     # Display individual asset analysis
                     logger.info(
                         MessageFormatter.format_market_analysis_notification(
-                            symbol,
-                            indicators,
+                            asset_analysis.symbol,
+                            asset_analysis.indicators,
                             asset_analysis.recommended_action,
                             asset_analysis.recommended_trade_type,
                             executor.positions,
-                            ai_reasoning,
+                            asset_analysis.ai_reasoning,
                         )
                     )
 
@@ -293,7 +290,16 @@ class AutoTradingAgent(BaseAgent):
                 # Take snapshots with unified timestamp if provided
                 timestamp = unified_timestamp if unified_timestamp else datetime.now()
                 executor.snapshot_positions(timestamp)
-                executor.snapshot_portfolio(timestamp)
+                self._record_chart_point(
+                    session_id, config, executor.snapshot_portfolio(timestamp)
+                )
+
+                # Journal the cycle's trades and snapshots
+                journal: Optional[InstanceJournal] = instance.get("journal")
+                if journal is not None:
+                    await journal.record_cycle(
+                        executor, check_count, instance["last_check"]
+                    )
 
                 # Send portfolio update
                 portfolio_value = executor.get_portfolio_value()
@@ -312,26 +318,18 @@ class AutoTradingAgent(BaseAgent):
                 if executor.positions:
                     portfolio_msg += "\n**Open Positions:**\n"
                     for symbol, pos in executor.positions.items():
-                        try:
-                            import yfinance as yf
-
-                            ticker = yf.Ticker(symbol)
-                            current_price = ticker.history(period="1d", interval="1m")[
-                                "Close"
-                            ].iloc[-1]
-                            if pos.trade_type.value == "long":
-                                current_pnl = (current_price - pos.entry_price) * abs(
-                                    pos.quantity
-                                )
-                            else:
-                                current_pnl = (pos.entry_price - current_price) * abs(
-                                    pos.quantity
-                                )
-                            pnl_emoji = "🟢" if current_pnl >= 0 else "🔴"
-                            portfolio_msg += f"- {symbol}: {pos.trade_type.value.upper()} @ ${pos.entry_price:,.2f} {pnl_emoji} P&L: ${current_pnl:,.2f}\n"
-                        except Exception as e:
-                            logger.warning(f"Failed to calculate P&L for {symbol}: {e}")
+                        valuation = executor.value_position(symbol)
+                        if valuation is None:
+                            logger.warning(f"Failed to calculate P&L for {symbol}")
                             portfolio_msg += f"- {symbol}: {pos.trade_type.value.upper()} @ ${pos.entry_price:,.2f}\n"
+                            continue
+                        _, current_pnl, _ = valuation
+                        pnl_emoji = "🟢" if current_pnl >= 0 else "🔴"
+                        portfolio_msg += f"- {symbol}: {pos.trade_type.value.upper()} @ ${pos.entry_price:,.2f} {pnl_emoji} P&L: ${current_pnl:,.2f}\n"
+
+                stale_symbols = executor.get_stale_symbols()
+                if stale_symbols:
+                    portfolio_msg += f"\n⚠️ Stale prices: {', '.join(stale_symbols)}\n"
 
                 logger.info(portfolio_msg + "\n")
 
@@ -346,6 +344,115 @@ class AutoTradingAgent(BaseAgent):
                 logger.error(f"Error processing trading instance {instance_id}: {e}")
                 # Don't raise - let other instances continue
 
+    async def _analyze_symbol(
+        self,
+        symbol: str,
+        snapshot: Optional[MarketSnapshot],
+        ai_signal_generator: Optional[AISignalGenerator],
+    ) -> Optional[AssetAnalysis]:
+        """
+        Build the technical and optional AI analysis of one symbol
+
+        Args:
+            symbol: Trading symbol
+            snapshot: Market snapshot of this cycle (None if it failed or
+                missed its deadline)
+            ai_signal_generator: AI signal generator if AI signals are enabled
+
+        Returns:
+            Asset analysis or None if the symbol is skipped this cycle
+        """
+        # Nothing can change while the symbol's market is closed
+        if not is_symbol_market_open(symbol):
+            logger.info(f"Skipping {symbol} - market closed")
+            return None
+
+        if snapshot is None:
+            logger.warning(f"Skipping {symbol} - no market data this cycle")
+            return None
+
+        indicators = snapshot.indicators
+        if indicators is None:
+            logger.warning(f"Skipping {symbol} - insufficient data")
+            return None
+
+        # Generate technical signal
+        technical_action, technical_trade_type = TechnicalAnalyzer.generate_signal(
+            indicators
+        )
+
+        # Generate AI signal if enabled
+        ai_action, ai_trade_type, ai_reasoning, ai_confidence = (
+            None,
+            None,
+            None,
+            None,
+        )
+
+        if ai_signal_generator:
+            try:
+                ai_signal = await asyncio.wait_for(
+                    ai_signal_generator.get_signal(indicators),
+                    timeout=SYMBOL_STAGE_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"AI signal for {symbol} missed its {SYMBOL_STAGE_TIMEOUT}s "
+                    "deadline, using the technical signal"
+                )
+                ai_signal = None
+            if ai_signal:
+                ai_action, ai_trade_type, ai_reasoning, ai_confidence = ai_signal
+                logger.info(
+                    f"AI signal for {symbol}: {ai_action.value} {ai_trade_type.value} "
+                    f"(confidence: {ai_confidence}%)"
+                )
+
+        return AssetAnalysis(
+            symbol=symbol,
+            indicators=indicators,
+            technical_action=technical_action,
+            technical_trade_type=technical_trade_type,
+            ai_action=ai_action,
+            ai_trade_type=ai_trade_type,
+            ai_reasoning=ai_reasoning,
+            ai_confidence=ai_confidence,
+        )
+
+    def _deactivate_instance(self, session_id: str, instance_id: str) -> bool:
+        """
+        Stop an instance and release its market data subscriptions
+
+        Args:
+            session_id: Session identifier
+            instance_id: Trading instance identifier
+
+        Returns:
+            True if the instance was active
+        """
+        instance = self.trading_instances.get(session_id, {}).get(instance_id)
+        if not instance or not instance["active"]:
+            return False
+        instance["active"] = False
+        self.market_data.unsubscribe(instance["config"].crypto_symbols)
+        return True
+
+    async def _persist_inactive(self, session_id: str, instance_id: str) -> None:
+        """
+        Record in the state store that an instance was stopped, so it is not
+        resumed after a restart
+
+        Args:
+            session_id: Session identifier
+            instance_id: Trading instance identifier
+        """
+        instance = self.trading_instances.get(session_id, {}).get(instance_id)
+        journal: Optional[InstanceJournal] = (
+            instance.get("journal") if instance else None
+        )
+        if journal is not None:
+            await journal.set_active(False)
+
     def _generate_instance_id(self, task_id: str, model_id: str) -> str:
         """
         Generate unique instance ID for a specific model
@@ -372,8 +479,8 @@ class AutoTradingAgent(BaseAgent):
     def _init_notification_cache(self, session_id: str) -> None:
         """Initialize notification cache for a session if not exists"""
         if session_id not in self.notification_cache:
-            self.notification_cache[session_id] = deque(
-                maxlen=MAX_NOTIFICATION_CACHE_SIZE
+            self.notification_cache[session_id] = NotificationLog(
+                MAX_NOTIFICATION_CACHE_SIZE
             )
             logger.info(f"Initialized notification cache for session {session_id}")
 
@@ -381,7 +488,7 @@ class AutoTradingAgent(BaseAgent):
         self, session_id: str, notification: FilteredCardPushNotificationComponentData
     ) -> None:
         """
-        Cache a notification for later batch sending.
+        Cache a notification for later batch sending and assign its id.
         Automatically evicts oldest notifications when cache exceeds MAX_NOTIFICATION_CACHE_SIZE.
 
         Args:
@@ -409,7 +516,55 @@ class AutoTradingAgent(BaseAgent):
         """
         if session_id not in self.notification_cache:
             return []
-        return list(self.notification_cache[session_id])
+        return self.notification_cache[session_id].replay()
+
+    def _get_notifications_since(
+        self, session_id: str, cursor: Optional[int]
+    ) -> Optional[List[FilteredCardPushNotificationComponentData]]:
+        """
+        Get the notifications cached after a cursor.
+
+        Args:
+            session_id: Session ID
+            cursor: Last notification id the stream sent, None if it sent none
+
+        Returns:
+            New notifications (oldest to newest), or None if the stream needs
+            a full replay
+        """
+        if cursor is None or session_id not in self.notification_cache:
+            return None
+        return self.notification_cache[session_id].since(cursor)
+
+    def _get_notification_cursor(self, session_id: str) -> int:
+        """Id of the newest notification of a session (0 if none)"""
+        log = self.notification_cache.get(session_id)
+        return log.last_id if log is not None else 0
+
+    def _replay_notifications(self, session_id: str) -> Optional[StreamResponse]:
+        """
+        Build the component with every cached notification of a session,
+        sent when a stream starts or a client asks for a replay.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Component response, or None if nothing is cached
+        """
+        cached_notifications = self._get_cached_notifications(session_id)
+        if not cached_notifications:
+            return None
+        logger.info(
+            f"Replaying {len(cached_notifications)} cached notifications for session {session_id}"
+        )
+        # Convert all cached notifications to a list of dicts for batch sending
+        batch_data = [notif.model_dump() for notif in cached_notifications]
+        return streaming.component_generator(
+            json.dumps(batch_data),
+            ComponentType.FILTERED_CARD_PUSH_NOTIFICATION,
+            component_id=f"trading_status_{session_id}",
+        )
 
     def _clear_notification_cache(self, session_id: str) -> None:
         """
@@ -582,46 +737,33 @@ class AutoTradingAgent(BaseAgent):
                 "|--------|------|----------|-----------|---------------|----------------|----------------|"
             )
 
+            stale_symbols = set(portfolio_summary["positions"]["stale_symbols"])
             for symbol, pos in executor.positions.items():
-                try:
-                    import yfinance as yf
-
-                    ticker = yf.Ticker(symbol)
-                    current_price = ticker.history(period="1d", interval="1m")[
-                        "Close"
-                    ].iloc[-1]
-
-                    # Calculate unrealized P&L
-                    if pos.trade_type.value == "long":
-                        unrealized_pnl = (current_price - pos.entry_price) * abs(
-                            pos.quantity
-                        )
-                        position_value = abs(pos.quantity) * current_price
-                    else:
-                        unrealized_pnl = (pos.entry_price - current_price) * abs(
-                            pos.quantity
-                        )
-                        position_value = pos.notional + unrealized_pnl
-
-                    # Format row
-                    pnl_emoji = "🟢" if unrealized_pnl >= 0 else "🔴"
-                    pnl_sign = "+" if unrealized_pnl >= 0 else ""
-
-                    output.append(
-                        f"| **{symbol}** | {pos.trade_type.value.upper()} | "
-                        f"{abs(pos.quantity):.4f} | ${pos.entry_price:,.2f} | "
-                        f"${current_price:,.2f} | ${position_value:,.2f} | "
-                        f"{pnl_emoji} {pnl_sign}${unrealized_pnl:,.2f} |"
-                    )
-
-                except Exception as e:
-                    logger.warning(f"Failed to get price for {symbol}: {e}")
+                # Valued at the marks of the current cycle
+                valuation = executor.value_position(symbol)
+                if valuation is None:
+                    logger.warning(f"Failed to get price for {symbol}")
                     # Fallback display with entry price only
                     output.append(
                         f"| **{symbol}** | {pos.trade_type.value.upper()} | "
                         f"{abs(pos.quantity):.4f} | ${pos.entry_price:,.2f} | "
                         f"N/A | ${pos.notional:,.2f} | N/A |"
                     )
+                    continue
+
+                current_price, unrealized_pnl, position_value = valuation
+                stale_flag = " ⚠️" if symbol in stale_symbols else ""
+
+                # Format row
+                pnl_emoji = "🟢" if unrealized_pnl >= 0 else "🔴"
+                pnl_sign = "+" if unrealized_pnl >= 0 else ""
+
+                output.append(
+                    f"| **{symbol}** | {pos.trade_type.value.upper()} | "
+                    f"{abs(pos.quantity):.4f} | ${pos.entry_price:,.2f} | "
+                    f"${current_price:,.2f}{stale_flag} | ${position_value:,.2f} | "
+                    f"{pnl_emoji} {pnl_sign}${unrealized_pnl:,.2f} |"
+                )
         else:
             output.append("\n*No open positions*")
 
@@ -634,7 +776,33 @@ class AutoTradingAgent(BaseAgent):
         )
         return component_data
 
-    def _get_session_portfolio_chart_data(self, session_id: str) -> str:
+    def _get_chart_series(self, session_id: str) -> PortfolioChartSeries:
+        """Get the portfolio chart series of a session, creating it if needed"""
+        if session_id not in self.portfolio_charts:
+            self.portfolio_charts[session_id] = PortfolioChartSeries()
+        return self.portfolio_charts[session_id]
+
+    def _record_chart_point(
+        self,
+        session_id: str,
+        config: AutoTradingConfig,
+        snapshot: PortfolioValueSnapshot,
+    ) -> None:
+        """
+        Append a portfolio snapshot to the session chart
+
+        Args:
+            session_id: Session identifier
+            config: Configuration of the instance the snapshot belongs to
+            snapshot: Portfolio snapshot just recorded by the executor
+        """
+        series = self._get_chart_series(session_id)
+        series.add_series(config.agent_model, config.initial_capital)
+        series.record(snapshot.timestamp, config.agent_model, snapshot.total_value)
+
+    def _get_session_portfolio_chart_data(
+        self, session_id: str, max_points: int = CHART_MAX_POINTS
+    ) -> str:
         """
         Generate FilteredLineChartComponentData for all instances in a session
         Uses forward-fill strategy to handle missing timestamps
@@ -647,88 +815,36 @@ class AutoTradingAgent(BaseAgent):
             ...
         ]
 
+        Long sessions are downsampled to about max_points points per model.
+
         Returns:
             JSON string of FilteredLineChartComponentData
         """
-        if session_id not in self.trading_instances:
-            return ""
-
-        # Collect portfolio value history from all instances
-        # Store as {model_id: {'initial_capital': float, 'history': [(timestamp, value)]}}
-        model_data = {}
-
-        for instance_id, instance in self.trading_instances[session_id].items():
-            executor: TradingExecutor = instance["executor"]
-            config: AutoTradingConfig = instance["config"]
-            model_id = config.agent_model
-
-            if model_id not in model_data:
-                model_data[model_id] = {
-                    "initial_capital": config.initial_capital,
-                    "history": [],
-                }
-
-            portfolio_history = executor.get_portfolio_history()
-
-            for snapshot in portfolio_history:
-                model_data[model_id]["history"].append(
-                    (snapshot.timestamp, snapshot.total_value)
-                )
-
-        if not model_data:
+        series = self.portfolio_charts.get(session_id)
+        if series is None or not len(series):
             return ""
 
-        # Sort each model's history by timestamp
-        for model_id in model_data:
-            model_data[model_id]["history"].sort(key=lambda x: x[0])
-
-        # Collect all unique timestamps across all models
-        all_timestamps = set()
-        for model_id, data in model_data.items():
-            for timestamp, _ in data["history"]:
-                all_timestamps.add(timestamp)
+        component_data = FilteredLineChartComponentData(
+            title=f"Portfolio Value History - Session {session_id[:8]}",
+            data=json.dumps(series.snapshot(max_points)),
+            create_time=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        )
 
-        if not all_timestamps:
-            return ""
+        return component_data.model_dump_json()
 
-        sorted_timestamps = sorted(all_timestamps)
-        model_ids = list(model_data.keys())
-
-        # Build data array with forward-fill strategy
-        # First row: ['Time', 'model1', 'model2', ...]
-        data_array = [["Time"] + model_ids]
-
-        # Track last known value for each model (for forward-fill)
-        last_known_values = {
-            model_id: data["initial_capital"] for model_id, data in model_data.items()
-        }
-
-        # Data rows: ['timestamp', value1, value2, ...]
-        for timestamp in sorted_timestamps:
-            timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            row = [timestamp_str]
-
-            for model_id in model_ids:
-                # Find value at this timestamp for this model
-                value_at_timestamp = None
-                for ts, val in model_data[model_id]["history"]:
-                    if ts == timestamp:
-                        value_at_timestamp = val
-                        break
-
-                # Update logic: use new value if found, otherwise forward-fill
-                if value_at_timestamp is not None:
-                    last_known_values[model_id] = value_at_timestamp
-                    row.append(value_at_timestamp)
-                else:
-                    # Use last known value (forward-fill)
-                    row.append(last_known_values[model_id])
-
-            data_array.append(row)
+    def _get_session_portfolio_chart_delta(
+        self, session_id: str, rows: List[list]
+    ) -> str:
+        """
+        Generate FilteredLineChartDeltaComponentData with the rows appended to
+        the session chart since it was last sent
 
-        component_data = FilteredLineChartComponentData(
-            title=f"Portfolio Value History - Session {session_id[:8]}",
-            data=json.dumps(data_array),
+        Returns:
+            JSON string of FilteredLineChartDeltaComponentData
+        """
+        component_data = FilteredLineChartDeltaComponentData(
+            chart_id=f"portfolio_chart_{session_id}",
+            data=json.dumps(rows),
             create_time=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
         )
 
@@ -757,7 +873,9 @@ class AutoTradingAgent(BaseAgent):
         if instance_id:
             # Stop specific instance
             if instance_id in self.trading_instances[session_id]:
-                self.trading_instances[session_id][instance_id]["active"] = False
+                self._deactivate_instance(session_id, instance_id)
+                await self._persist_inactive(session_id, instance_id)
+                self._notify_session(session_id)
                 executor = self.trading_instances[session_id][instance_id]["executor"]
                 portfolio_value = executor.get_portfolio_value()
 
@@ -774,19 +892,42 @@ class AutoTradingAgent(BaseAgent):
         else:
             # Stop all instances in this session
             count = 0
-            for inst_id in self.trading_instances[session_id]:
-                self.trading_instances[session_id][inst_id]["active"] = False
+            for inst_id in list(self.trading_instances[session_id]):
+                self._deactivate_instance(session_id, inst_id)
+                await self._persist_inactive(session_id, inst_id)
                 count += 1
+            self._notify_session(session_id)
 
             yield streaming.message_chunk(
                 f"🛑 **All Trading Instances Stopped**\n\n"
                 f"Stopped {count} instance(s) in session: {session_id[:8]}\n\n"
             )
 
+    async def _handle_replay_command(
+        self, session_id: str
+    ) -> AsyncGenerator[StreamResponse, None]:
+        """Handle replay command: resend all notifications and the full chart"""
+        replay = self._replay_notifications(session_id)
+        chart_data = self._get_session_portfolio_chart_data(session_id)
+        if replay is None and not chart_data:
+            yield streaming.message_chunk(
+                "⚠️ No trading history found in this session.\n"
+            )
+            return
+
+        if replay is not None:
+            yield replay
+        if chart_data:
+            yield streaming.component_generator(
+                content=chart_data,
+                component_type=ComponentType.FILTERED_LINE_CHART,
+                component_id=f"portfolio_chart_{session_id}",
+            )
+
     async def _handle_status_command(
         self, session_id: str
     ) -> AsyncGenerator[StreamResponse, None]:
-        """Handle status query command"""
+        """Send a status report of every instance in the session"""
         if (
             session_id not in self.trading_instances
             or not self.trading_instances[session_id]
@@ -821,6 +962,285 @@ class AutoTradingAgent(BaseAgent):
             )
 
         logger.info(f"Status message: {status_message}")
+        yield streaming.message_chunk(status_message)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run work that outlives the stream that started it"""
+        task = asyncio.create_task(coro)
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return task
+
+    def _notify_session(self, session_id: str) -> None:
+        """Wake the streams following a session"""
+        event = self.session_updates.pop(session_id, None)
+        if event is not None:
+            event.set()
+
+    async def _wait_for_session(self, session_id: str, timeout: float) -> None:
+        """Wait until the session changes or the timeout passes"""
+        event = self.session_updates.setdefault(session_id, asyncio.Event())
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def _any_active(self, session_id: str, instance_ids: List[str]) -> bool:
+        """Check whether any of the given instances is still running"""
+        instances = self.trading_instances.get(session_id, {})
+        return any(
+            instances[inst_id]["active"]
+            for inst_id in instance_ids
+            if inst_id in instances
+        )
+
+    def _start_trading_loop(
+        self, session_id: str, instance_ids: List[str]
+    ) -> asyncio.Task:
+        """
+        Start the trading loop of instances as a server-side task.
+
+        The loop does not depend on any client stream: it runs until its
+        instances are stopped, so the persisted active flag keeps matching
+        what is running.
+
+        Args:
+            session_id: Session identifier
+            instance_ids: Instances the loop drives
+
+        Returns:
+            The loop task
+        """
+        return self._spawn(self._run_trading_loop(session_id, instance_ids))
+
+    async def _run_trading_loop(self, session_id: str, instance_ids: List[str]) -> None:
+        """
+        Run trading cycles for instances of a session until all are stopped
+
+        Args:
+            session_id: Session identifier
+            instance_ids: Instances this loop drives
+        """
+        # Set check interval
+        check_interval = DEFAULT_CHECK_INTERVAL
+
+        # Create semaphore to limit concurrent instance processing (max 10)
+        semaphore = asyncio.Semaphore(10)
+
+        # Check if any instance is still active
+        while self._any_active(session_id, instance_ids):
+            try:
+                # Create unified timestamp for this iteration to align snapshots
+                unified_timestamp = datetime.now()
+
+                # Download each subscribed symbol once for all instances on
+                # worker threads; symbols another session refreshed this
+                # tick are reused and slow ones are skipped for the cycle
+                snapshots = await self.market_data.refresh_async()
+
+                # Process all active instances concurrently using task pool
+                tasks = []
+                for instance_id in instance_ids:
+                    # Skip if instance was removed or is inactive
+                    if instance_id not in self.trading_instances[session_id]:
+                        continue
+
+                    instance = self.trading_instances[session_id][instance_id]
+                    if not instance["active"]:
+                        continue
+
+                    # Create task for this instance with semaphore control and unified timestamp
+                    task = asyncio.create_task(
+                        self._process_trading_instance(
+                            session_id,
+                            instance_id,
+                            semaphore,
+                            unified_timestamp,
+                            snapshots,
+                        )
+                    )
+                    tasks.append(task)
+
+                # Wait for all instance tasks to complete (process concurrently)
+                if tasks:
+                    # Gather all tasks and handle any exceptions
+                    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+                    # Log any exceptions that occurred
+                    for i, result in enumerate(results):
+                        if isinstance(result, Exception):
+                            logger.error(f"Task {i} failed with exception: {result}")
+
+                # Let the streams send this cycle's notifications and chart
+                self._notify_session(session_id)
+
+                # Wait for next check interval - only sleep once after processing all instances
+                logger.info(f"Waiting {check_interval}s until next check...")
+                await asyncio.sleep(check_interval)
+
+            except Exception as e:
+                logger.error(f"Error during trading cycle: {e}")
+                await asyncio.sleep(check_interval)
+
+        logger.info(f"Trading loop of session {session_id} finished")
+        self._notify_session(session_id)
+
+    async def _stream_session_updates(
+        self, session_id: str, instance_ids: List[str]
+    ) -> AsyncGenerator[StreamResponse, None]:
+        """
+        Follow the trading loop of instances until all are stopped
+
+        Args:
+            session_id: Session identifier
+            instance_ids: Instances whose loop this stream follows
+
+        Yields:
+            StreamResponse: Notification and chart updates after each cycle
+        """
+        # Chart revision and last notification id this stream has sent,
+        # None until the full chart / notification replay went out
+        chart_revision: Optional[int] = None
+        notification_cursor: Optional[int] = None
+
+        while True:
+            # Send the notifications this stream has not sent yet; the
+            # first update (or a cursor whose notifications were evicted)
+            # replays all
+            new_notifications = self._get_notifications_since(
+                session_id, notification_cursor
+            )
+            if new_notifications is None:
+                replay = self._replay_notifications(session_id)
+                if replay:
+                    yield replay
+            elif new_notifications:
+                logger.info(
+                    f"Sending {len(new_notifications)} new notifications for session {session_id}"
+                )
+                delta = FilteredCardPushNotificationDeltaComponentData(
+                    card_id=f"trading_status_{session_id}",
+                    notifications=new_notifications,
+                )
+                # Deltas get their own item ids, like chart deltas
+                yield streaming.component_generator(
+                    delta.model_dump_json(),
+                    ComponentType.FILTERED_CARD_PUSH_NOTIFICATION_DELTA,
+                )
+            notification_cursor = self._get_notification_cursor(session_id)
+
+            # Send chart data (not cached, sent separately): the full
+            # chart once per stream, then only the new rows
+            series = self._get_chart_series(session_id)
+            rows = (
+                series.rows_since(chart_revision)
+                if chart_revision is not None
+                else None
+            )
+            if rows is None:
+                chart_data = self._get_session_portfolio_chart_data(session_id)
+                if chart_data:
+                    yield streaming.component_generator(
+                        content=chart_data,
+                        component_type=ComponentType.FILTERED_LINE_CHART,
+                        component_id=f"portfolio_chart_{session_id}",
+                    )
+                    chart_revision = series.revision
+            elif rows:
+                # Deltas get their own item ids so stored history
+                # replays every one of them onto the full chart
+                yield streaming.component_generator(
+                    content=self._get_session_portfolio_chart_delta(session_id, rows),
+                    component_type=ComponentType.FILTERED_LINE_CHART_DELTA,
+                )
+                chart_revision = series.revision
+
+            if not self._any_active(session_id, instance_ids):
+                return
+            # Woken after every cycle and on stop; the timeout only guards
+            # against a loop that died
+            await self._wait_for_session(session_id, DEFAULT_CHECK_INTERVAL)
+
+    async def restore_instances(self) -> int:
+        """
+        Restore the instances that were running when the agent last stopped
+        and resume their trading loops on the server.
+
+        Their notifications and chart are kept per session as for any
+        loop: the replay command sends them and the status command reports
+        each instance. Older trades are read back in the background.
+
+        Returns:
+            Number of instances restored
+        """
+        try:
+            stored_instances = await self.state_store.load_instances()
+        except Exception as e:
+            logger.error(f"Failed to load persisted trading instances: {e}")
+            return 0
+
+        restored: Dict[str, List[str]] = {}
+        for stored in stored_instances:
+            session_instances = self.trading_instances.setdefault(stored.session_id, {})
+            if stored.instance_id in session_instances:
+                continue
+
+            try:
+                state = stored.rebuild()
+            except Exception as e:
+                logger.error(f"Failed to restore instance {stored.instance_id}: {e}")
+                continue
+
+            executor = TradingExecutor(stored.config)
+            executor.restore_state(state)
+            session_instances[stored.instance_id] = {
+                "instance_id": stored.instance_id,
+                "config": stored.config,
+                "executor": executor,
+                "ai_signal_generator": self._initialize_ai_signal_generator(
+                    stored.config
+                ),
+                "active": True,
+                "created_at": stored.created_at,
+                "check_count": state.check_count,
+                "last_check": state.last_check_time,
+                "journal": InstanceJournal.resume(self.state_store, stored, state),
+            }
+            self.market_data.subscribe(stored.config.crypto_symbols)
+            restored.setdefault(stored.session_id, []).append(stored.instance_id)
+            logger.info(
+                f"Restored instance {stored.instance_id}: "
+                f"{len(state.current_positions)} open positions, "
+                f"{state.total_trades} trades"
+            )
+
+        for session_id, instance_ids in restored.items():
+            self._init_notification_cache(session_id)
+            self._restore_chart(session_id, instance_ids)
+            self._start_trading_loop(session_id, instance_ids)
+            self._spawn(self._backfill_trades(session_id, instance_ids))
+
+        return sum(len(instance_ids) for instance_ids in restored.values())
+
+    def _restore_chart(self, session_id: str, instance_ids: List[str]) -> None:
+        """Rebuild the session chart from the restored portfolio histories"""
+        points = []
+        for instance_id in instance_ids:
+            instance = self.trading_instances[session_id][instance_id]
+            for snapshot in instance["executor"].get_portfolio_history():
+                points.append((snapshot.timestamp, instance["config"], snapshot))
+
+        points.sort(key=lambda point: point[0])
+        for _, config, snapshot in points:
+            self._record_chart_point(session_id, config, snapshot)
+
+    async def _backfill_trades(self, session_id: str, instance_ids: List[str]) -> None:
+        """Load the older trades that restored snapshots left out"""
+        for instance_id in instance_ids:
+            instance = self.trading_instances[session_id][instance_id]
+            added = await instance["journal"].backfill_trades(instance["executor"])
+            if added:
+                logger.info(f"Backfilled {added} older trades of {instance_id}")
 
     async def stream(
         self,
@@ -843,6 +1263,8 @@ class AutoTradingAgent(BaseAgent):
         """
         # Track created instances for cleanup
         created_instances = []
+        # Once started, the trading loop runs on without this stream
+        loop_started = False
 
         try:
             logger.info(
@@ -860,6 +1282,12 @@ class AutoTradingAgent(BaseAgent):
                     yield response
                 return
 
+            # Handle replay commands, e.g. after a client reconnects
+            if any(cmd in query_lower.split() for cmd in ["replay", "回放"]):
+                async for response in self._handle_replay_command(session_id):
+                    yield response
+                return
+
             # Handle status query commands
             if any(
                 cmd in query_lower.split()
@@ -916,6 +1344,13 @@ class AutoTradingAgent(BaseAgent):
                 # Initialize AI signal generator if enabled
                 ai_signal_generator = self._initialize_ai_signal_generator(config)
 
+                # Persist the instance so it is resumed after a restart
+                created_at = datetime.now()
+                journal = InstanceJournal(
+                    self.state_store, session_id, instance_id, config, created_at
+                )
+                await journal.start()
+
                 # Store instance
                 self.trading_instances[session_id][instance_id] = {
                     "instance_id": instance_id,
@@ -923,10 +1358,12 @@ class AutoTradingAgent(BaseAgent):
                     "executor": executor,
                     "ai_signal_generator": ai_signal_generator,
                     "active": True,
-                    "created_at": datetime.now(),
+                    "created_at": created_at,
                     "check_count": 0,
                     "last_check": None,
+                    "journal": journal,
                 }
+                self.market_data.subscribe(config.crypto_symbols)
 
                 created_instances.append(instance_id)
 
@@ -965,7 +1402,11 @@ class AutoTradingAgent(BaseAgent):
 
                 # Send initial portfolio snapshot - cache it
                 portfolio_value = executor.get_portfolio_value()
-                executor.snapshot_portfolio(unified_initial_timestamp)
+                self._record_chart_point(
+                    session_id,
+                    config,
+                    executor.snapshot_portfolio(unified_initial_timestamp),
+                )
 
                 initial_portfolio_msg = FilteredCardPushNotificationComponentData(
                     title=f"{config.agent_model} Portfolio",
@@ -979,105 +1420,30 @@ class AutoTradingAgent(BaseAgent):
                 # Cache the initial notification
                 self._cache_notification(session_id, initial_portfolio_msg)
 
-            # Set check interval
-            check_interval = DEFAULT_CHECK_INTERVAL
-
-            # Create semaphore to limit concurrent instance processing (max 10)
-            semaphore = asyncio.Semaphore(10)
-
             # Main trading loop - monitor all instances in parallel
             yield streaming.message_chunk(
                 "📈 **Starting monitoring loop for all instances...**\n\n"
             )
 
-            # Check if any instance is still active
-            while any(
-                self.trading_instances[session_id][inst_id]["active"]
-                for inst_id in created_instances
-                if inst_id in self.trading_instances[session_id]
-            ):
-                try:
-                    # Create unified timestamp for this iteration to align snapshots
-                    unified_timestamp = datetime.now()
-
-                    # Process all active instances concurrently using task pool
-                    tasks = []
-                    for instance_id in created_instances:
-                        # Skip if instance was removed or is inactive
-                        if instance_id not in self.trading_instances[session_id]:
-                            continue
+            self._start_trading_loop(session_id, created_instances)
+            loop_started = True
 
-                        instance = self.trading_instances[session_id][instance_id]
-                        if not instance["active"]:
-                            continue
-
-                        # Create task for this instance with semaphore control and unified timestamp
-                        task = asyncio.create_task(
-                            self._process_trading_instance(
-                                session_id, instance_id, semaphore, unified_timestamp
-                            )
-                        )
-                        tasks.append(task)
-
-                    # Wait for all instance tasks to complete (process concurrently)
-                    if tasks:
-                        # Gather all tasks and handle any exceptions
-                        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                        # Log any exceptions that occurred
-                        for i, result in enumerate(results):
-                            if isinstance(result, Exception):
-                                logger.error(
-                                    f"Task {i} failed with exception: {result}"
-                                )
-
-                    # After processing all instances, send batched notifications
-                    cached_notifications = self._get_cached_notifications(session_id)
-                    if cached_notifications:
-                        logger.info(
-                            f"Sending {len(cached_notifications)} cached notifications for session {session_id}"
-                        )
-                        # Convert all cached notifications to a list of dicts for batch sending
-                        batch_data = [
-                            notif.model_dump() for notif in cached_notifications
-                        ]
-                        # Send as a single batch component - frontend will receive all historical data
-                        yield streaming.component_generator(
-                            json.dumps(batch_data),
-                            ComponentType.FILTERED_CARD_PUSH_NOTIFICATION,
-                            component_id=f"trading_status_{session_id}",
-                        )
-
-                    # Send chart data (not cached, sent separately)
-                    chart_data = self._get_session_portfolio_chart_data(session_id)
-                    if chart_data:
-                        yield streaming.component_generator(
-                            content=chart_data,
-                            component_type=ComponentType.FILTERED_LINE_CHART,
-                            component_id=f"portfolio_chart_{session_id}",
-                        )
-
-                    # Wait for next check interval - only sleep once after processing all instances
-                    logger.info(f"Waiting {check_interval}s until next check...")
-                    await asyncio.sleep(check_interval)
-
-                except Exception as e:
-                    logger.error(f"Error during trading cycle: {e}")
-                    yield streaming.message_chunk(
-                        f"⚠️ **Error during trading cycle**: {str(e)}\n"
-                        f"Continuing with next check...\n\n"
-                    )
-                    await asyncio.sleep(check_interval)
+            # A client disconnecting only ends this stream: the loop keeps
+            # trading until a stop command, and is resumed after a restart
+            async for response in self._stream_session_updates(
+                session_id, created_instances
+            ):
+                yield response
 
         except Exception as e:
             logger.error(f"Critical error in stream method: {e}")
             yield streaming.failed(f"Critical error: {str(e)}")
         finally:
-            # Mark all created instances as inactive but keep data for history
-            if session_id in self.trading_instances:
+            # Instances whose loop never started would otherwise stay
+            # active without trading; keep their data for history
+            if not loop_started and session_id in self.trading_instances:
                 for instance_id in created_instances:
-                    if instance_id in self.trading_instances[session_id]:
-                        self.trading_instances[session_id][instance_id]["active"] = (
-                            False
-                        )
+                    if self._deactivate_instance(session_id, instance_id):
                         logger.info(f"Stopped instance: {instance_id}")
+                        # A cancelled or closed stream cannot await here
+                        self._spawn(self._persist_inactive(session_id, instance_id))
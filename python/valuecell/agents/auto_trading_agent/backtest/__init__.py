@@ -0,0 +1,45 @@
+"""Offline backtesting of the auto-trading decision loop
+
+Modules:
+- engine: Event-driven replay of stored bars through the decision path
+- replay: Simulated clock, CSV bar loading and the replay data provider
+- signals: Rule and recorded stand-ins for AISignalGenerator
+- costs: Fee and slippage models
+- exchange: PaperTrading with fees, slippage and simulated time
+- metrics: Backtest results and summary metrics
+
+Run on the bundled fixtures with
+``python -m valuecell.agents.auto_trading_agent.backtest``.
+"""
+
+from .costs import FeeModel, SlippageModel
+from .engine import BacktestEngine
+from .exchange import SimulatedExchange
+from .metrics import BacktestMetrics, BacktestResult, BacktestTrade, compute_metrics
+from .replay import (
+    ReplayDataProvider,
+    SimulatedClock,
+    available_fixtures,
+    load_bars,
+    load_fixtures,
+)
+from .signals import RecordedSignalProvider, RuleSignalProvider, SignalRecorder
+
+__all__ = [
+    "BacktestEngine",
+    "BacktestMetrics",
+    "BacktestResult",
+    "BacktestTrade",
+    "FeeModel",
+    "RecordedSignalProvider",
+    "ReplayDataProvider",
+    "RuleSignalProvider",
+    "SignalRecorder",
+    "SimulatedClock",
+    "SimulatedExchange",
+    "SlippageModel",
+    "available_fixtures",
+    "compute_metrics",
+    "load_bars",
+    "load_fixtures",
+]
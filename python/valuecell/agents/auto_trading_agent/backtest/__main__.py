@@ -0,0 +1,56 @@
+"""Run a backtest on stored bars and print its summary metrics"""
+
+import argparse
+import asyncio
+import logging
+from typing import Optional, Sequence
+
+from ..models import AutoTradingConfig
+from .costs import FeeModel, SlippageModel
+from .engine import BacktestEngine
+from .replay import FIXTURES_DIR, available_fixtures, load_fixtures
+from .signals import RecordedSignalProvider
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", nargs="+")
+    parser.add_argument("--data-dir", default=str(FIXTURES_DIR))
+    parser.add_argument("--capital", type=float, default=100000.0)
+    parser.add_argument("--check-interval", type=int, default=60)
+    parser.add_argument("--fee-bps", type=float, default=10.0)
+    parser.add_argument("--slippage-bps", type=float, default=5.0)
+    parser.add_argument("--signals", help="JSON file saved by SignalRecorder")
+    parser.add_argument("--verbose", action="store_true", help="Log every cycle")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        logging.getLogger("valuecell").setLevel(logging.WARNING)
+
+    symbols = args.symbols or available_fixtures(args.data_dir)
+    config = AutoTradingConfig(
+        initial_capital=args.capital,
+        crypto_symbols=symbols,
+        check_interval=args.check_interval,
+    )
+    engine = BacktestEngine(
+        config,
+        load_fixtures(config.crypto_symbols, args.data_dir),
+        signal_provider=(
+            RecordedSignalProvider.from_file(args.signals) if args.signals else None
+        ),
+        fee_model=FeeModel(args.fee_bps),
+        slippage_model=SlippageModel(args.slippage_bps),
+    )
+    result = asyncio.run(engine.run())
+
+    print(f"Symbols: {', '.join(config.crypto_symbols)} ({result.steps} cycles)")
+    summary = {**result.metrics.to_dict(), "skipped_orders": result.skipped_orders}
+    for name, value in summary.items():
+        text = f"{value:,.4f}" if isinstance(value, float) else str(value)
+        print(f"{name:>16}: {text}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
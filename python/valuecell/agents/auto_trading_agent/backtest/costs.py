@@ -0,0 +1,58 @@
+"""Trading cost models for simulated fills"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class FeeModel:
+    """
+    Proportional taker fee with an optional minimum per fill.
+
+    Attributes:
+        rate_bps: Fee in basis points of the fill notional
+        minimum: Minimum fee charged per fill
+    """
+
+    rate_bps: float = 10.0
+    minimum: float = 0.0
+
+    def fee(self, notional: float) -> float:
+        """
+        Fee charged for a fill.
+
+        Args:
+            notional: Absolute fill value
+
+        Returns:
+            Fee in quote currency
+        """
+        if notional <= 0:
+            return 0.0
+        return max(abs(notional) * self.rate_bps / 10_000, self.minimum)
+
+
+@dataclass(frozen=True)
+class SlippageModel:
+    """
+    Fixed slippage against the order side.
+
+    Attributes:
+        bps: Price impact in basis points; buys fill above the reference
+            price and sells below it
+    """
+
+    bps: float = 5.0
+
+    def fill_price(self, price: float, side: str) -> float:
+        """
+        Price a market order fills at.
+
+        Args:
+            price: Reference price (close of the current bar)
+            side: "buy" or "sell"
+
+        Returns:
+            Fill price after slippage
+        """
+        impact = price * self.bps / 10_000
+        return price + impact if side == "buy" else price - impact
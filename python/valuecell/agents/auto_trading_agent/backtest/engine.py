@@ -0,0 +1,296 @@
+"""Event-driven backtest of the auto-trading decision loop
+
+Each bar of the replayed history is one event. The simulated clock moves to
+the bar, the market data hub "downloads" the bars visible at that time and
+updates the incremental indicators, and - once per check interval - the
+cycle of the live agent runs: technical signal plus optional provider
+signal per symbol, a rule-based PortfolioDecisionManager decision, and
+market orders on a PaperTrading exchange that charges fees and slippage.
+"""
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from ..exchanges.base_exchange import Order, OrderStatus
+from ..market_hub import MarketDataHub, MarketSnapshot
+from ..models import AutoTradingConfig, Position, TradeAction, TradeType
+from ..portfolio_decision_manager import AssetAnalysis, PortfolioDecisionManager
+from ..technical_analysis import TechnicalAnalyzer
+from .costs import FeeModel, SlippageModel
+from .exchange import SimulatedExchange
+from .metrics import BacktestResult, BacktestTrade, compute_metrics
+from .replay import (
+    DEFAULT_REPLAY_WINDOW,
+    ReplayDataProvider,
+    SimulatedClock,
+    as_utc,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BacktestEngine:
+    """
+    Replays stored bars through the trading decision path.
+
+    The paper exchange is spot only: short entries the decision asks for
+    are counted in ``skipped_orders`` instead of being filled.
+    """
+
+    def __init__(
+        self,
+        config: AutoTradingConfig,
+        bars_by_symbol: Dict[str, pd.DataFrame],
+        signal_provider=None,
+        fee_model: Optional[FeeModel] = None,
+        slippage_model: Optional[SlippageModel] = None,
+        window: int = DEFAULT_REPLAY_WINDOW,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            config: Trading configuration; check_interval sets how often the
+                decision cycle runs in simulated time
+            bars_by_symbol: OHLCV bars by symbol, indexed by time
+            signal_provider: Stand-in for AISignalGenerator (any object with
+                an async get_signal(indicators)); None for technical only
+            fee_model: Fee charged per fill
+            slippage_model: Fill price model
+            window: Bars visible to the indicators at each step
+        """
+        missing = [s for s in config.crypto_symbols if s not in bars_by_symbol]
+        if missing:
+            raise ValueError(f"No bars for {', '.join(missing)}")
+
+        self.config = config
+        self.bars_by_symbol = bars_by_symbol
+        self.signal_provider = signal_provider
+        self.clock = SimulatedClock()
+        self.market_data = MarketDataHub(
+            ReplayDataProvider(bars_by_symbol, self.clock, window),
+            # Every step sees new bars; replayed markets never close
+            max_age_seconds=0,
+            market_open=lambda symbol: True,
+        )
+        self.exchange = SimulatedExchange(
+            config.initial_capital,
+            self.market_data,
+            self.clock,
+            fee_model,
+            slippage_model,
+        )
+        self.trades: List[BacktestTrade] = []
+        self.skipped_orders = 0
+
+    def timeline(self) -> pd.DatetimeIndex:
+        """Union of the bar times of the configured symbols"""
+        index = pd.DatetimeIndex([], tz="UTC")
+        for symbol in self.config.crypto_symbols:
+            index = index.union(self.bars_by_symbol[symbol].index)
+        return index
+
+    async def run(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> BacktestResult:
+        """
+        Replay the bars and return the results.
+
+        Args:
+            start: First bar time to trade (earlier bars only warm up the
+                indicators)
+            end: Last bar time to replay
+
+        Returns:
+            BacktestResult with metrics, equity curve and fills
+        """
+        symbols = self.config.crypto_symbols
+        interval = pd.Timedelta(seconds=self.config.check_interval)
+        start = as_utc(start) if start is not None else None
+        end = as_utc(end) if end is not None else None
+        last_check = None
+        equity_curve = []
+        steps = 0
+
+        for timestamp in self.timeline():
+            if end is not None and timestamp > end:
+                break
+            self.clock.advance_to(timestamp)
+            snapshots = self.market_data.refresh(symbols)
+            if start is not None and timestamp < start:
+                continue
+
+            if last_check is None or timestamp - last_check >= interval:
+                last_check = timestamp
+                steps += 1
+                await self.step(timestamp, snapshots)
+            equity_curve.append((timestamp.to_pydatetime(), self.portfolio_value()))
+
+        metrics = compute_metrics(
+            equity_curve,
+            self.trades,
+            self.config.initial_capital,
+            self.exchange.slippage_cost,
+        )
+        logger.info(
+            f"Backtest finished: {steps} cycles, {metrics.trade_count} fills, "
+            f"return {metrics.total_return:.2%}"
+        )
+        return BacktestResult(
+            metrics=metrics,
+            equity_curve=equity_curve,
+            trades=list(self.trades),
+            skipped_orders=self.skipped_orders,
+            steps=steps,
+        )
+
+    async def step(
+        self, timestamp: pd.Timestamp, snapshots: Dict[str, MarketSnapshot]
+    ) -> None:
+        """
+        Run one decision cycle at the current simulated time.
+
+        Args:
+            timestamp: Simulated time of the cycle
+            snapshots: Market snapshots of this step by symbol
+        """
+        manager = PortfolioDecisionManager(self.config)
+        for symbol in self.config.crypto_symbols:
+            # A symbol without a bar at this time has no new data this cycle
+            if timestamp not in self.bars_by_symbol[symbol].index:
+                continue
+            analysis = await self._analyze_symbol(
+                symbol, snapshots.get(symbol), timestamp
+            )
+            if analysis is not None:
+                manager.add_asset_analysis(analysis)
+
+        decision = await manager.make_portfolio_decision(
+            current_positions=self.positions,
+            available_cash=self.exchange.balance,
+            total_portfolio_value=self.portfolio_value(),
+        )
+
+        for symbol, action, trade_type in decision.trades_to_execute:
+            if action == TradeAction.BUY:
+                await self._open_position(symbol, trade_type)
+            elif action == TradeAction.SELL:
+                await self._close_position(symbol, trade_type)
+
+    async def _analyze_symbol(
+        self,
+        symbol: str,
+        snapshot: Optional[MarketSnapshot],
+        timestamp: pd.Timestamp,
+    ) -> Optional[AssetAnalysis]:
+        """Technical and provider signal of one symbol, as in the live loop"""
+        if snapshot is None or snapshot.indicators is None:
+            return None
+
+        # Stamp the indicators with the bar time recorded signals are keyed by
+        indicators = snapshot.indicators.model_copy(
+            update={"timestamp": timestamp.to_pydatetime()}
+        )
+        technical_action, technical_trade_type = TechnicalAnalyzer.generate_signal(
+            indicators
+        )
+
+        ai_signal = None
+        if self.signal_provider is not None:
+            ai_signal = await self.signal_provider.get_signal(indicators)
+        ai_action, ai_trade_type, ai_reasoning, ai_confidence = ai_signal or (
+            None,
+            None,
+            None,
+            None,
+        )
+
+        return AssetAnalysis(
+            symbol=symbol,
+            indicators=indicators,
+            technical_action=technical_action,
+            technical_trade_type=technical_trade_type,
+            ai_action=ai_action,
+            ai_trade_type=ai_trade_type,
+            ai_reasoning=ai_reasoning,
+            ai_confidence=ai_confidence,
+        )
+
+    async def _open_position(self, symbol: str, trade_type: TradeType) -> None:
+        if trade_type != TradeType.LONG:
+            self.skipped_orders += 1
+            logger.debug(f"Skipping {symbol} short entry: spot paper exchange")
+            return
+
+        price = self.market_data.last_price(symbol)
+        if not price:
+            self.skipped_orders += 1
+            return
+
+        # Same sizing as TradingExecutor
+        quantity = self.exchange.balance * self.config.risk_per_trade / price
+        order = await self.exchange.execute_buy(
+            self.exchange.normalize_symbol(symbol), quantity
+        )
+        self._record_fill(symbol, order)
+
+    async def _close_position(self, symbol: str, trade_type: TradeType) -> None:
+        exchange_symbol = self.exchange.normalize_symbol(symbol)
+        position = self.exchange.positions.get(exchange_symbol)
+        if position is None or trade_type != TradeType.LONG:
+            return
+
+        entry_price = position["entry_price"]
+        entry_fee = self.exchange.entry_fees.get(exchange_symbol, 0.0)
+        order = await self.exchange.execute_sell(exchange_symbol, position["quantity"])
+        pnl = None
+        if order is not None and order.status == OrderStatus.FILLED:
+            pnl = (order.price - entry_price) * order.quantity - order.fee - entry_fee
+        self._record_fill(symbol, order, pnl)
+
+    def _record_fill(
+        self, symbol: str, order: Optional[Order], pnl: Optional[float] = None
+    ) -> None:
+        if order is None or order.status != OrderStatus.FILLED:
+            self.skipped_orders += 1
+            return
+        self.trades.append(
+            BacktestTrade(
+                timestamp=order.created_at,
+                symbol=symbol,
+                side=order.side,
+                quantity=order.quantity,
+                price=order.price,
+                fee=order.fee,
+                pnl=pnl,
+            )
+        )
+
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Open exchange positions in the form the decision manager takes"""
+        positions = {}
+        for exchange_symbol, data in self.exchange.positions.items():
+            symbol = self.exchange._denormalize_symbol(exchange_symbol)
+            positions[symbol] = Position(
+                symbol=symbol,
+                entry_price=data["entry_price"],
+                quantity=data["quantity"],
+                entry_time=data["entry_time"],
+                trade_type=TradeType.LONG,
+                notional=data["entry_price"] * data["quantity"],
+            )
+        return positions
+
+    def portfolio_value(self) -> float:
+        """Cash plus open positions at the current replayed prices"""
+        value = self.exchange.balance
+        for exchange_symbol, data in self.exchange.positions.items():
+            price = self.market_data.last_price(
+                self.exchange._denormalize_symbol(exchange_symbol)
+            )
+            value += data["quantity"] * (price or data["entry_price"])
+        return value
@@ -0,0 +1,112 @@
+"""Paper exchange with fees, slippage and simulated time"""
+
+import logging
+from typing import Dict, Optional
+
+import pandas as pd
+
+from ..exchanges.base_exchange import Order, OrderStatus
+from ..exchanges.paper_trading import PaperTrading
+from ..market_hub import MarketDataHub
+from .costs import FeeModel, SlippageModel
+from .replay import SimulatedClock
+
+logger = logging.getLogger(__name__)
+
+
+class SimulatedExchange(PaperTrading):
+    """
+    PaperTrading that fills market orders at the close of the current
+    replayed bar, moved by the slippage model, and charges the fee model.
+    Orders are stamped with the simulated time.
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        market_data: MarketDataHub,
+        clock: SimulatedClock,
+        fee_model: Optional[FeeModel] = None,
+        slippage_model: Optional[SlippageModel] = None,
+    ):
+        """
+        Initialize the exchange.
+
+        Args:
+            initial_balance: Starting capital
+            market_data: Hub serving the replayed bars
+            clock: Simulated clock
+            fee_model: Fee charged per fill (defaults to FeeModel())
+            slippage_model: Fill price model (defaults to SlippageModel())
+        """
+        super().__init__(initial_balance, market_data)
+        self.clock = clock
+        self.fee_model = fee_model or FeeModel()
+        self.slippage_model = slippage_model or SlippageModel()
+        self.fees_paid = 0.0
+        self.slippage_cost = 0.0
+        # Fees paid to open each position, charged to its P&L on close
+        self.entry_fees: Dict[str, float] = {}
+
+    async def get_current_price(self, symbol: str) -> float:
+        """
+        Get the close of the current replayed bar.
+
+        Args:
+            symbol: Trading symbol in exchange format
+
+        Returns:
+            Current price (0.0 if the symbol has no bars yet)
+        """
+        price = self.market_data.last_price(self._denormalize_symbol(symbol))
+        if price is None:
+            logger.warning(f"No replayed price for {symbol}")
+            return 0.0
+        return price
+
+    async def _fill_order(self, order: Order) -> bool:
+        """
+        Fill an order after slippage and charge its fee.
+
+        Args:
+            order: Order to fill
+
+        Returns:
+            True if filled, False if the balance cannot pay for it
+        """
+        reference = order.price
+        order.price = self.slippage_model.fill_price(reference, order.side)
+        notional = order.quantity * order.price
+        fee = self.fee_model.fee(notional)
+
+        if order.side == "buy" and notional + fee > self.balance:
+            logger.warning(
+                f"Rejected {order.symbol} buy: need ${notional + fee:.2f}, "
+                f"have ${self.balance:.2f}"
+            )
+            order.status = OrderStatus.REJECTED
+            return False
+
+        now = self.clock.now()
+        if now is not None:
+            order.created_at = order.updated_at = pd.Timestamp(now).to_pydatetime()
+
+        if not await super()._fill_order(order):
+            return False
+
+        self.balance -= fee
+        self.fees_paid += fee
+        self.slippage_cost += abs(order.price - reference) * order.quantity
+        order.fee = fee
+        if order.side == "buy":
+            self.entry_fees[order.symbol] = self.entry_fees.get(order.symbol, 0.0) + fee
+        elif order.symbol not in self.positions:
+            self.entry_fees.pop(order.symbol, None)
+        return True
+
+    async def reset(self, initial_balance: float):
+        """Reset balances, positions and cost totals"""
+        await super().reset(initial_balance)
+        self.fees_paid = 0.0
+        self.slippage_cost = 0.0
+        self.entry_fees.clear()
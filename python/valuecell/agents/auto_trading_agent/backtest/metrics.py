@@ -0,0 +1,150 @@
+"""Backtest results and summary metrics"""
+
+import math
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from statistics import median
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# Crypto trades around the clock
+SECONDS_PER_YEAR = 365 * 24 * 3600
+
+
+@dataclass(frozen=True)
+class BacktestTrade:
+    """One simulated fill"""
+
+    timestamp: datetime
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    fee: float
+    # Realized P&L net of entry and exit fees; None for entries
+    pnl: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class BacktestMetrics:
+    """Summary statistics of a backtest run"""
+
+    initial_capital: float
+    final_value: float
+    total_return: float
+    max_drawdown: float
+    sharpe_ratio: float
+    trade_count: int
+    closed_trades: int
+    win_rate: float
+    total_fees: float
+    total_slippage: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert metrics to a dictionary"""
+        return asdict(self)
+
+
+@dataclass
+class BacktestResult:
+    """Metrics plus the equity curve and fills of a run"""
+
+    metrics: BacktestMetrics
+    equity_curve: List[Tuple[datetime, float]] = field(default_factory=list)
+    trades: List[BacktestTrade] = field(default_factory=list)
+    # Orders the decision asked for but the engine could not place
+    skipped_orders: int = 0
+    steps: int = 0
+
+
+def max_drawdown(values: Sequence[float]) -> float:
+    """
+    Largest peak-to-trough loss of an equity curve.
+
+    Args:
+        values: Portfolio values in time order
+
+    Returns:
+        Drawdown as a fraction of the peak (0.0 for a curve that never falls)
+    """
+    peak = -math.inf
+    worst = 0.0
+    for value in values:
+        peak = max(peak, value)
+        if peak > 0:
+            worst = max(worst, (peak - value) / peak)
+    return worst
+
+
+def periods_per_year(timestamps: Sequence[datetime]) -> float:
+    """Annualization factor from the median spacing of the timestamps"""
+    gaps = [
+        (later - earlier).total_seconds()
+        for earlier, later in zip(timestamps, timestamps[1:])
+    ]
+    gaps = [gap for gap in gaps if gap > 0]
+    if not gaps:
+        return 0.0
+    return SECONDS_PER_YEAR / median(gaps)
+
+
+def sharpe_ratio(values: Sequence[float], periods: float) -> float:
+    """
+    Annualized Sharpe ratio of the per-step returns (zero risk-free rate).
+
+    Args:
+        values: Portfolio values in time order
+        periods: Steps per year
+
+    Returns:
+        Sharpe ratio, 0.0 if the returns have no variance
+    """
+    returns = [
+        later / earlier - 1.0
+        for earlier, later in zip(values, values[1:])
+        if earlier > 0
+    ]
+    if len(returns) < 2 or periods <= 0:
+        return 0.0
+    mean = sum(returns) / len(returns)
+    variance = sum((r - mean) ** 2 for r in returns) / (len(returns) - 1)
+    if variance <= 0:
+        return 0.0
+    return mean / math.sqrt(variance) * math.sqrt(periods)
+
+
+def compute_metrics(
+    equity_curve: Sequence[Tuple[datetime, float]],
+    trades: Sequence[BacktestTrade],
+    initial_capital: float,
+    total_slippage: float = 0.0,
+) -> BacktestMetrics:
+    """
+    Summarize a backtest run.
+
+    Args:
+        equity_curve: (time, portfolio value) per step
+        trades: Fills of the run
+        initial_capital: Starting capital
+        total_slippage: Cost of slippage over all fills
+
+    Returns:
+        BacktestMetrics of the run
+    """
+    timestamps = [ts for ts, _ in equity_curve]
+    values = [value for _, value in equity_curve]
+    final_value = values[-1] if values else initial_capital
+    closed = [trade for trade in trades if trade.pnl is not None]
+    wins = sum(1 for trade in closed if trade.pnl > 0)
+
+    return BacktestMetrics(
+        initial_capital=initial_capital,
+        final_value=final_value,
+        total_return=final_value / initial_capital - 1.0,
+        max_drawdown=max_drawdown([initial_capital, *values]),
+        sharpe_ratio=sharpe_ratio(values, periods_per_year(timestamps)),
+        trade_count=len(trades),
+        closed_trades=len(closed),
+        win_rate=wins / len(closed) if closed else 0.0,
+        total_fees=sum(trade.fee for trade in trades),
+        total_slippage=total_slippage,
+    )
@@ -0,0 +1,157 @@
+"""Simulated clock and stored-bar replay for backtests"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+from ..market_data import MarketDataProvider
+
+logger = logging.getLogger(__name__)
+
+# CSV bars bundled with the package, one file per symbol
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Bars returned per fetch, about the 5d/1m window the live hub downloads
+DEFAULT_REPLAY_WINDOW = 500
+
+
+def as_utc(timestamp: Union[str, datetime]) -> pd.Timestamp:
+    """Timestamp in UTC; naive times are taken to be UTC"""
+    ts = pd.Timestamp(timestamp)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+class SimulatedClock:
+    """Backtest time; only moves forward"""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self._now = start
+
+    def now(self) -> Optional[datetime]:
+        """Current simulated time (None before the first bar)"""
+        return self._now
+
+    def advance_to(self, timestamp: datetime) -> None:
+        """
+        Move the clock to a later time.
+
+        Args:
+            timestamp: New simulated time
+
+        Raises:
+            ValueError: If the time is before the current one
+        """
+        if self._now is not None and timestamp < self._now:
+            raise ValueError(f"Clock cannot go back from {self._now} to {timestamp}")
+        self._now = timestamp
+
+
+def load_bars(path: Union[str, Path]) -> pd.DataFrame:
+    """
+    Load OHLCV bars from a CSV file in yfinance column layout.
+
+    The first column is the bar time; naive times are read as UTC.
+
+    Args:
+        path: CSV file path
+
+    Returns:
+        Bars indexed by time in ascending order
+    """
+    bars = pd.read_csv(path, index_col=0)
+    bars.index = pd.to_datetime(bars.index, utc=True)
+    bars.index.name = "Datetime"
+    bars = bars[~bars.index.duplicated(keep="last")].sort_index()
+    return bars[["Open", "High", "Low", "Close", "Volume"]].astype(float)
+
+
+def available_fixtures(directory: Union[str, Path] = FIXTURES_DIR) -> List[str]:
+    """Symbols with a CSV file in a directory"""
+    return sorted(path.stem for path in Path(directory).glob("*.csv"))
+
+
+def load_fixtures(
+    symbols: Iterable[str], directory: Union[str, Path] = FIXTURES_DIR
+) -> Dict[str, pd.DataFrame]:
+    """
+    Load the bars of several symbols from ``<directory>/<symbol>.csv``.
+
+    Args:
+        symbols: Symbols to load
+        directory: Directory of the CSV files (defaults to the bundled ones)
+
+    Returns:
+        Bars by symbol
+
+    Raises:
+        FileNotFoundError: If a symbol has no CSV file
+    """
+    directory = Path(directory)
+    bars = {}
+    for symbol in symbols:
+        path = directory / f"{symbol}.csv"
+        if not path.exists():
+            raise FileNotFoundError(f"No bars for {symbol} in {directory}")
+        bars[symbol] = load_bars(path)
+    return bars
+
+
+class ReplayDataProvider(MarketDataProvider):
+    """
+    Market data provider that serves stored bars up to the simulated time.
+
+    Plugged into a MarketDataHub it stands in for the yfinance download, so
+    a backtest computes its indicators exactly like the live loop does.
+    """
+
+    def __init__(
+        self,
+        bars_by_symbol: Dict[str, pd.DataFrame],
+        clock: SimulatedClock,
+        window: int = DEFAULT_REPLAY_WINDOW,
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            bars_by_symbol: Bars by symbol, indexed by time
+            clock: Simulated clock deciding which bars are visible
+            window: Maximum bars returned per fetch
+        """
+        super().__init__()
+        self.bars_by_symbol = bars_by_symbol
+        self.clock = clock
+        self.window = window
+
+    def fetch_bars(
+        self, symbol: str, period: str = "5d", interval: str = "1m"
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get the bars of a symbol that closed at or before the simulated time.
+
+        Args:
+            symbol: Trading symbol
+            period: Ignored, the window size is fixed
+            interval: Ignored, bars are replayed as stored
+
+        Returns:
+            Up to ``window`` bars, or None if the symbol has none yet
+        """
+        bars = self.bars_by_symbol.get(symbol)
+        now = self.clock.now()
+        if bars is None or now is None:
+            return None
+        end = int(bars.index.searchsorted(now, side="right"))
+        if end == 0:
+            return None
+        return bars.iloc[max(0, end - self.window) : end]
+
+    def get_current_price(self, symbol: str) -> Optional[float]:
+        """Close of the last visible bar of a symbol"""
+        bars = self.fetch_bars(symbol)
+        if bars is None:
+            return None
+        return float(bars["Close"].iloc[-1])
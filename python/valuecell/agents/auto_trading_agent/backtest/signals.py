@@ -0,0 +1,177 @@
+"""Signal providers that stand in for AISignalGenerator in backtests
+
+A provider has the same ``get_signal(indicators)`` coroutine as
+AISignalGenerator, so the engine treats a live generator, a rule and a
+recording alike. During a backtest the indicators carry the simulated bar
+time in ``timestamp``, which is what recordings are keyed by.
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..market_data import SignalGenerator
+from ..models import TechnicalIndicators, TradeAction, TradeType
+from .replay import as_utc
+
+logger = logging.getLogger(__name__)
+
+Signal = Tuple[TradeAction, TradeType, str, float]
+
+
+def _signal_key(
+    symbol: str, timestamp: Union[str, datetime]
+) -> Tuple[str, pd.Timestamp]:
+    return symbol.upper(), as_utc(timestamp)
+
+
+class RuleSignalProvider:
+    """Deterministic signals from a rule over the indicators"""
+
+    def __init__(
+        self,
+        rule: Callable[
+            [TechnicalIndicators], Tuple[TradeAction, TradeType]
+        ] = SignalGenerator.generate_signal,
+        confidence: float = 100.0,
+        name: str = "rule",
+    ):
+        """
+        Initialize the provider.
+
+        Args:
+            rule: Maps indicators to (TradeAction, TradeType); defaults to
+                the technical signal of the live loop
+            confidence: Confidence reported with every signal
+            name: Label used in the reasoning text
+        """
+        self.rule = rule
+        self.confidence = confidence
+        self.name = name
+
+    async def get_signal(self, indicators: TechnicalIndicators) -> Optional[Signal]:
+        """
+        Apply the rule to the indicators.
+
+        Args:
+            indicators: Technical indicators for analysis
+
+        Returns:
+            Tuple of (TradeAction, TradeType, reasoning, confidence)
+        """
+        action, trade_type = self.rule(indicators)
+        reasoning = f"{self.name}: {action.value} {trade_type.value}"
+        return action, trade_type, reasoning, self.confidence
+
+
+class RecordedSignalProvider:
+    """
+    Replays signals recorded from an earlier run, keyed by symbol and bar
+    time. Bars without a recorded signal get None, like an AI call that
+    failed, so the technical signal is used for them.
+    """
+
+    def __init__(self, records: Optional[List[Dict]] = None):
+        """
+        Initialize the provider.
+
+        Args:
+            records: Dicts with symbol, timestamp, action, trade_type and
+                optional reasoning and confidence
+        """
+        self._signals: Dict[Tuple[str, pd.Timestamp], Signal] = {}
+        for record in records or []:
+            self.add(record)
+
+    def __len__(self) -> int:
+        return len(self._signals)
+
+    def add(self, record: Dict) -> None:
+        """
+        Add one recorded signal.
+
+        Args:
+            record: Dict with symbol, timestamp, action and trade_type
+        """
+        key = _signal_key(record["symbol"], record["timestamp"])
+        self._signals[key] = (
+            TradeAction(record["action"]),
+            TradeType(record["trade_type"]),
+            record.get("reasoning") or "recorded signal",
+            float(record.get("confidence") or 0.0),
+        )
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> "RecordedSignalProvider":
+        """
+        Load signals saved by SignalRecorder.save().
+
+        Args:
+            path: JSON file with a list of records
+
+        Returns:
+            Provider replaying the file
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    async def get_signal(self, indicators: TechnicalIndicators) -> Optional[Signal]:
+        """
+        Look up the signal recorded for the bar of the indicators.
+
+        Args:
+            indicators: Technical indicators stamped with the bar time
+
+        Returns:
+            Recorded (TradeAction, TradeType, reasoning, confidence) or None
+        """
+        return self._signals.get(_signal_key(indicators.symbol, indicators.timestamp))
+
+
+class SignalRecorder:
+    """
+    Wraps a signal generator (an AISignalGenerator, typically) and records
+    every signal it returns, so a run can be repeated without the model.
+    """
+
+    def __init__(self, generator):
+        """
+        Initialize the recorder.
+
+        Args:
+            generator: Object with an async get_signal(indicators)
+        """
+        self.generator = generator
+        self.records: List[Dict] = []
+
+    async def get_signal(self, indicators: TechnicalIndicators) -> Optional[Signal]:
+        """Get a signal from the wrapped generator and record it"""
+        signal = await self.generator.get_signal(indicators)
+        if signal:
+            action, trade_type, reasoning, confidence = signal
+            self.records.append(
+                {
+                    "symbol": indicators.symbol,
+                    "timestamp": as_utc(indicators.timestamp).isoformat(),
+                    "action": action.value,
+                    "trade_type": trade_type.value,
+                    "reasoning": reasoning,
+                    "confidence": confidence,
+                }
+            )
+        return signal
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Write the recorded signals for RecordedSignalProvider.from_file().
+
+        Args:
+            path: Output JSON file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.records, f, indent=2)
+        logger.info(f"Saved {len(self.records)} recorded signals to {path}")
@@ -0,0 +1,199 @@
+"""Append-only portfolio value series for the session chart
+
+The chart shows one line per model over the unified cycle timestamps. It
+used to be rebuilt from every instance's full history each cycle and sent
+whole; ``PortfolioChartSeries`` instead keeps the table as it grows, so a
+cycle only sends the rows that changed since a reader's cursor and the full
+table (downsampled with LTTB) only goes out when a stream starts.
+"""
+
+import bisect
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def lttb(points: Sequence[Tuple[float, float]], threshold: int) -> List[int]:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point and, from each bucket in between, the
+    point forming the largest triangle with its neighbours, which preserves
+    the visual shape of a line with far fewer points.
+
+    Args:
+        points: (x, y) pairs sorted by x
+        threshold: Number of points to keep
+
+    Returns:
+        Indices of the kept points in ascending order
+    """
+    count = len(points)
+    if threshold >= count or threshold < 3:
+        return list(range(count))
+
+    selected = [0]
+    bucket_size = (count - 2) / (threshold - 2)
+    a = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+
+        # Average of the next bucket (the last point for the last bucket)
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            avg_x, avg_y = points[-1]
+        else:
+            span = points[next_start:next_end]
+            avg_x = sum(p[0] for p in span) / len(span)
+            avg_y = sum(p[1] for p in span) / len(span)
+
+        ax, ay = points[a]
+        best, best_area = start, -1.0
+        for i in range(start, end):
+            x, y = points[i]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = i, area
+        selected.append(best)
+        a = best
+
+    selected.append(count - 1)
+    return selected
+
+
+class PortfolioChartSeries:
+    """
+    Portfolio value table of one session: a time column plus one column per
+    model, forward-filled like the original chart.
+
+    Every change bumps ``revision``. Readers keep the revision they last saw
+    and call ``rows_since()`` for the rows that changed after it; changes
+    that invalidate earlier rows (a new column, a timestamp arriving out of
+    order) raise ``layout_revision`` so those readers take a full snapshot.
+    """
+
+    def __init__(self):
+        self.columns: List[str] = []
+        self.revision = 0
+        self.layout_revision = 0
+        self._initial: Dict[str, float] = {}
+        self._timestamps: List[datetime] = []
+        # Recorded values (None where a model has no point) and the
+        # forward-filled rows that are sent
+        self._raw: List[List[Optional[float]]] = []
+        self._rows: List[List[float]] = []
+        # Revision at which each row last changed
+        self._row_revisions: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add_series(self, name: str, initial_value: float) -> None:
+        """
+        Add a column for a model; rows before its first point show the
+        initial value.
+
+        Args:
+            name: Column name (the model id)
+            initial_value: Value before the first recorded point
+        """
+        if name in self._initial:
+            return
+        self.columns.append(name)
+        self._initial[name] = initial_value
+        for raw, row in zip(self._raw, self._rows):
+            raw.append(None)
+            row.append(initial_value)
+        self.revision += 1
+        self.layout_revision = self.revision
+
+    def record(self, timestamp: datetime, name: str, value: float) -> None:
+        """
+        Record the value of a model at a cycle timestamp.
+
+        Args:
+            timestamp: Unified cycle timestamp
+            name: Column name, added with add_series()
+            value: Portfolio value
+        """
+        if name not in self._initial:
+            raise KeyError(f"Unknown chart series: {name}")
+        column = self.columns.index(name)
+        self.revision += 1
+
+        if self._timestamps and timestamp < self._timestamps[-1]:
+            # Rare: insert the row and forward-fill the table again
+            index = bisect.bisect_left(self._timestamps, timestamp)
+            if self._timestamps[index] != timestamp:
+                self._timestamps.insert(index, timestamp)
+                self._raw.insert(index, [None] * len(self.columns))
+                self._rows.insert(index, [])
+                self._row_revisions.insert(index, self.revision)
+            self._raw[index][column] = value
+            self._refill()
+            self.layout_revision = self.revision
+            return
+
+        if not self._timestamps or timestamp > self._timestamps[-1]:
+            # New row, forward-filled from the previous one
+            previous = self._rows[-1] if self._rows else self._initial.values()
+            self._timestamps.append(timestamp)
+            self._raw.append([None] * len(self.columns))
+            self._rows.append(list(previous))
+            self._row_revisions.append(self.revision)
+
+        self._raw[-1][column] = value
+        self._rows[-1][column] = value
+        self._row_revisions[-1] = self.revision
+
+    def _refill(self) -> None:
+        last = list(self._initial.values())
+        for index, raw in enumerate(self._raw):
+            last = [v if v is not None else prev for v, prev in zip(raw, last)]
+            self._rows[index] = last
+
+    def _format(self, index: int) -> list:
+        return [self._timestamps[index].strftime(TIME_FORMAT), *self._rows[index]]
+
+    def rows_since(self, revision: int) -> Optional[List[list]]:
+        """
+        Get the rows that changed after a revision.
+
+        Args:
+            revision: Revision the reader last saw
+
+        Returns:
+            Changed rows in time order (empty if none), or None if the reader
+            needs a full snapshot
+        """
+        if revision < self.layout_revision:
+            return None
+        # Changes after the layout revision only touch the tail
+        start = len(self._rows)
+        while start > 0 and self._row_revisions[start - 1] > revision:
+            start -= 1
+        return [self._format(i) for i in range(start, len(self._rows))]
+
+    def snapshot(self, max_points: Optional[int] = None) -> List[list]:
+        """
+        Get the full table with its header row.
+
+        Args:
+            max_points: Downsample each column to this many points with LTTB;
+                rows kept for any column are sent
+
+        Returns:
+            [['Time', model, ...], [time, value, ...], ...]
+        """
+        indices = range(len(self._rows))
+        if max_points and len(self._rows) > max_points:
+            xs = [ts.timestamp() for ts in self._timestamps]
+            kept = set()
+            for column in range(len(self.columns)):
+                points = [(x, row[column]) for x, row in zip(xs, self._rows)]
+                kept.update(lttb(points, max_points))
+            indices = sorted(kept)
+        return [["Time", *self.columns], *(self._format(i) for i in indices)]
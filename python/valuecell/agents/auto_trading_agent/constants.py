@@ -3,6 +3,11 @@
 # Limits
 MAX_SYMBOLS = 10
 DEFAULT_CHECK_INTERVAL = 60  # 1 minute in seconds
+SYMBOL_STAGE_TIMEOUT = 20  # seconds one symbol's fetch or AI signal may take
+MAX_CONCURRENT_FETCHES = 8  # market data downloads running in parallel
+CHART_MAX_POINTS = 500  # points per line in a full portfolio chart snapshot
+STATE_SNAPSHOT_INTERVAL = 100  # journal entries per instance between state snapshots
+STATE_HISTORY_TAIL = 500  # newest trades and portfolio points kept in a snapshot
 
 # Default configuration values
 DEFAULT_INITIAL_CAPITAL = 100000
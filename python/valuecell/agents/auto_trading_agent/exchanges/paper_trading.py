@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional
 
 import yfinance as yf
 
+from ..market_hub import MarketDataHub, get_market_data_hub
 from .base_exchange import ExchangeBase, ExchangeType, Order, OrderStatus
 
 logger = logging.getLogger(__name__)
@@ -18,14 +19,20 @@ class PaperTrading(ExchangeBase):
     Used for backtesting and strategy development without risking real capital.
     """
 
-    def __init__(self, initial_balance: float = 100000.0):
+    def __init__(
+        self,
+        initial_balance: float = 100000.0,
+        market_data: Optional[MarketDataHub] = None,
+    ):
         """
         Initialize paper trading exchange.
 
         Args:
             initial_balance: Starting capital for simulated trading
+            market_data: Source of simulated prices (defaults to the shared hub)
         """
         super().__init__(ExchangeType.PAPER)
+        self.market_data = market_data or get_market_data_hub()
         self.initial_balance = initial_balance
         self.balance = initial_balance
         self.positions: Dict[str, Dict[str, Any]] = {}  # {symbol: position_data}
@@ -89,7 +96,7 @@ class PaperTrading(ExchangeBase):
 
     async def get_current_price(self, symbol: str) -> float:
         """
-        Get current simulated price from yfinance.
+        Get current simulated price from the shared market data hub.
 
         Args:
             symbol: Trading symbol in exchange format
@@ -100,12 +107,11 @@ class PaperTrading(ExchangeBase):
         try:
             # Convert exchange format back to ticker format
             ticker_symbol = self._denormalize_symbol(symbol)
-            ticker = yf.Ticker(ticker_symbol)
-            data = ticker.history(period="1d", interval="1m")
-            if data.empty:
+            snapshot = await self.market_data.aget(ticker_symbol)
+            if snapshot is None:
                 logger.warning(f"No price data for {symbol}")
                 return 0.0
-            return float(data["Close"].iloc[-1])
+            return snapshot.price
         except Exception as e:
             logger.error(f"Failed to get price for {symbol}: {e}")
             return 0.0
@@ -0,0 +1,368 @@
+"""Incremental technical indicators - O(1) work per new bar
+
+The pandas implementation in ``MarketDataProvider`` recomputes every
+indicator over the full 5-day window each cycle although only a bar or two
+arrived since the last one. The classes here keep running state instead:
+they are seeded once from history and then updated bar by bar.
+
+Every indicator has two operations:
+- ``update(...)`` commits a closed bar and returns the new value
+- ``peek(...)`` returns the value a bar would produce without committing it,
+  used for the still-forming last bar of a download
+
+Each indicator matches its pandas counterpart (``ewm(adjust=False)``,
+``rolling``) on the same series; see the tests for the reference formulas.
+"""
+
+import math
+from collections import deque
+from datetime import datetime, timezone
+from typing import Deque, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .models import TechnicalIndicators
+
+# Bars required before indicators are reported, as in MarketDataProvider
+MIN_BARS = 50
+
+
+class EMA:
+    """Exponential moving average, ``Series.ewm(adjust=False).mean()``"""
+
+    def __init__(self, span: Optional[float] = None, alpha: Optional[float] = None):
+        """
+        Initialize the average.
+
+        Args:
+            span: Span in bars (alpha = 2 / (span + 1))
+            alpha: Smoothing factor, e.g. 1 / period for Wilder smoothing
+        """
+        if alpha is None:
+            if span is None:
+                raise ValueError("Either span or alpha is required")
+            alpha = 2.0 / (span + 1.0)
+        self.alpha = alpha
+        self.value: Optional[float] = None
+
+    def peek(self, x: float) -> float:
+        if self.value is None:
+            return x
+        return self.value + self.alpha * (x - self.value)
+
+    def update(self, x: float) -> float:
+        self.value = self.peek(x)
+        return self.value
+
+
+class MACD:
+    """MACD line, signal line and histogram"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self.fast = EMA(span=fast)
+        self.slow = EMA(span=slow)
+        self.signal = EMA(span=signal)
+
+    def peek(self, x: float) -> Tuple[float, float, float]:
+        macd = self.fast.peek(x) - self.slow.peek(x)
+        signal = self.signal.peek(macd)
+        return macd, signal, macd - signal
+
+    def update(self, x: float) -> Tuple[float, float, float]:
+        macd = self.fast.update(x) - self.slow.update(x)
+        signal = self.signal.update(macd)
+        return macd, signal, macd - signal
+
+
+class RollingStats:
+    """
+    Rolling mean and sample variance over a fixed window.
+
+    Uses Welford's add/remove updates, which stay accurate for prices far
+    from zero where running sums of squares lose precision. Like pandas, a
+    window of identical values yields exactly that value and zero variance,
+    so an all-zero window of losses never turns into rounding residue.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        # Length of the run of identical values at the end of the window
+        self._run_value: Optional[float] = None
+        self._run_length = 0
+
+    @staticmethod
+    def _add(n: int, mean: float, m2: float, x: float) -> Tuple[int, float, float]:
+        n += 1
+        delta = x - mean
+        mean += delta / n
+        m2 += delta * (x - mean)
+        return n, mean, m2
+
+    @staticmethod
+    def _remove(n: int, mean: float, m2: float, x: float) -> Tuple[int, float, float]:
+        if n == 1:
+            return 0, 0.0, 0.0
+        n -= 1
+        delta = x - mean
+        mean -= delta / n
+        m2 -= delta * (x - mean)
+        return n, mean, m2
+
+    def _next(self, x: float) -> Tuple[int, float, float, int]:
+        n, mean, m2 = len(self._values), self._mean, self._m2
+        if n == self.window:
+            n, mean, m2 = self._remove(n, mean, m2, self._values[0])
+        n, mean, m2 = self._add(n, mean, m2, x)
+        run_length = self._run_length + 1 if x == self._run_value else 1
+        if run_length >= n:
+            # Every value in the window is x
+            mean, m2 = x, 0.0
+        return n, mean, m2, run_length
+
+    def _stats(
+        self, n: int, mean: float, m2: float
+    ) -> Tuple[Optional[float], Optional[float]]:
+        if n < self.window:
+            return None, None
+        variance = max(m2, 0.0) / (n - 1) if n > 1 else 0.0
+        return mean, variance
+
+    def peek(self, x: float) -> Tuple[Optional[float], Optional[float]]:
+        """Mean and variance if x were added (None until the window is full)"""
+        n, mean, m2, _ = self._next(x)
+        return self._stats(n, mean, m2)
+
+    def update(self, x: float) -> Tuple[Optional[float], Optional[float]]:
+        n, self._mean, self._m2, self._run_length = self._next(x)
+        self._run_value = x
+        if len(self._values) == self.window:
+            self._values.popleft()
+        self._values.append(x)
+        return self._stats(n, self._mean, self._m2)
+
+
+class RollingRSI:
+    """
+    RSI from simple rolling averages of gains and losses.
+
+    Same definition as ``MarketDataProvider._calculate_rsi``, including its
+    handling of a window without losses.
+    """
+
+    def __init__(self, period: int = 14):
+        self.gains = RollingStats(period)
+        self.losses = RollingStats(period)
+        self.prev: Optional[float] = None
+
+    def _split(self, x: float) -> Tuple[float, float]:
+        # The first bar has no change; pandas fills it with zero gain and loss
+        delta = 0.0 if self.prev is None else x - self.prev
+        return max(delta, 0.0), max(-delta, 0.0)
+
+    @staticmethod
+    def _rsi(gain: Optional[float], loss: Optional[float]) -> Optional[float]:
+        if gain is None or loss is None:
+            return None
+        rs = gain / loss if loss != 0 else 0.0
+        return 100 - 100 / (1 + rs)
+
+    def peek(self, x: float) -> Optional[float]:
+        gain, loss = self._split(x)
+        return self._rsi(self.gains.peek(gain)[0], self.losses.peek(loss)[0])
+
+    def update(self, x: float) -> Optional[float]:
+        gain, loss = self._split(x)
+        self.prev = x
+        return self._rsi(self.gains.update(gain)[0], self.losses.update(loss)[0])
+
+
+class WilderRSI:
+    """RSI with Wilder smoothing of gains and losses (alpha = 1 / period)"""
+
+    def __init__(self, period: int = 14):
+        self.gains = EMA(alpha=1.0 / period)
+        self.losses = EMA(alpha=1.0 / period)
+        self.prev: Optional[float] = None
+
+    def _split(self, x: float) -> Tuple[float, float]:
+        delta = 0.0 if self.prev is None else x - self.prev
+        return max(delta, 0.0), max(-delta, 0.0)
+
+    @staticmethod
+    def _rsi(gain: float, loss: float) -> float:
+        if loss == 0:
+            return 100.0 if gain > 0 else 50.0
+        return 100 - 100 / (1 + gain / loss)
+
+    def peek(self, x: float) -> float:
+        gain, loss = self._split(x)
+        return self._rsi(self.gains.peek(gain), self.losses.peek(loss))
+
+    def update(self, x: float) -> float:
+        gain, loss = self._split(x)
+        self.prev = x
+        return self._rsi(self.gains.update(gain), self.losses.update(loss))
+
+
+class ATR:
+    """Average true range with Wilder smoothing"""
+
+    def __init__(self, period: int = 14):
+        self.average = EMA(alpha=1.0 / period)
+        self.prev_close: Optional[float] = None
+
+    def _true_range(self, high: float, low: float) -> float:
+        if self.prev_close is None:
+            return high - low
+        return max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+
+    def peek(self, high: float, low: float, close: float) -> float:
+        return self.average.peek(self._true_range(high, low))
+
+    def update(self, high: float, low: float, close: float) -> float:
+        value = self.average.update(self._true_range(high, low))
+        self.prev_close = close
+        return value
+
+
+class BollingerBands:
+    """Rolling mean plus/minus a multiple of the rolling standard deviation"""
+
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        self.stats = RollingStats(period)
+        self.std_dev = std_dev
+
+    def _bands(
+        self, mean: Optional[float], variance: Optional[float]
+    ) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+        if mean is None or variance is None:
+            return None, None, None
+        width = math.sqrt(variance) * self.std_dev
+        return mean + width, mean, mean - width
+
+    def peek(self, x: float) -> Tuple[Optional[float], ...]:
+        return self._bands(*self.stats.peek(x))
+
+    def update(self, x: float) -> Tuple[Optional[float], ...]:
+        return self._bands(*self.stats.update(x))
+
+
+class IndicatorEngine:
+    """
+    Incremental indicator state of one symbol.
+
+    ``sync()`` takes each new download of bars, commits the closed bars it
+    has not seen yet and evaluates the last, still-forming bar with
+    ``peek``, so repeated downloads of an overlapping window cost O(new
+    bars) instead of a full recomputation.
+    """
+
+    def __init__(self, symbol: str, min_bars: int = MIN_BARS):
+        self.symbol = symbol
+        self.min_bars = min_bars
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all state; the next sync seeds from scratch"""
+        self.ema_12 = EMA(span=12)
+        self.ema_26 = EMA(span=26)
+        self.ema_50 = EMA(span=50)
+        self.macd = MACD()
+        self.rsi = RollingRSI()
+        self.wilder_rsi = WilderRSI()
+        self.atr = ATR()
+        self.bollinger = BollingerBands()
+        self.last_timestamp: Optional[pd.Timestamp] = None
+        self.bar_count = 0
+        self.values: Dict[str, Optional[float]] = {}
+
+    def _commit(self, high: float, low: float, close: float) -> None:
+        self.ema_12.update(close)
+        self.ema_26.update(close)
+        self.ema_50.update(close)
+        self.macd.update(close)
+        self.rsi.update(close)
+        self.wilder_rsi.update(close)
+        self.atr.update(high, low, close)
+        self.bollinger.update(close)
+        self.bar_count += 1
+
+    def _evaluate(self, high: float, low: float, close: float) -> Dict[str, float]:
+        macd, macd_signal, macd_histogram = self.macd.peek(close)
+        bb_upper, bb_middle, bb_lower = self.bollinger.peek(close)
+        return {
+            "close_price": close,
+            "ema_12": self.ema_12.peek(close),
+            "ema_26": self.ema_26.peek(close),
+            "ema_50": self.ema_50.peek(close),
+            "macd": macd,
+            "macd_signal": macd_signal,
+            "macd_histogram": macd_histogram,
+            "rsi": self.rsi.peek(close),
+            "rsi_wilder": self.wilder_rsi.peek(close),
+            "atr": self.atr.peek(high, low, close),
+            "bb_upper": bb_upper,
+            "bb_middle": bb_middle,
+            "bb_lower": bb_lower,
+        }
+
+    def sync(self, bars: pd.DataFrame) -> Optional[TechnicalIndicators]:
+        """
+        Advance the state with a new download of bars.
+
+        Args:
+            bars: OHLCV bars in time order; the last one may still be forming.
+                Bars without a finite high, low and close are skipped
+
+        Returns:
+            Indicators as of the last bar, or None with too little history
+        """
+        # A bar with a missing or infinite price would poison every running
+        # state for good; drop it, as if the bar had never been downloaded
+        prices = bars[["High", "Low", "Close"]].to_numpy(dtype=float)
+        finite = np.isfinite(prices).all(axis=1)
+        if not finite.all():
+            bars = bars[finite]
+        if bars.empty:
+            return None
+
+        index = bars.index
+        if (
+            self.last_timestamp is None
+            or index[0] > self.last_timestamp
+            or index[-1] <= self.last_timestamp
+        ):
+            # No overlap with what was committed: seed again from this window
+            self.reset()
+            start = 0
+        else:
+            start = int(index.searchsorted(self.last_timestamp, side="right"))
+
+        highs = bars["High"].to_numpy(dtype=float)
+        lows = bars["Low"].to_numpy(dtype=float)
+        closes = bars["Close"].to_numpy(dtype=float)
+
+        last = len(bars) - 1
+        for i in range(start, last):
+            self._commit(highs[i], lows[i], closes[i])
+        if last > start:
+            self.last_timestamp = index[last - 1]
+
+        self.values = self._evaluate(highs[last], lows[last], closes[last])
+        if len(bars) < self.min_bars:
+            return None
+
+        return TechnicalIndicators(
+            symbol=self.symbol,
+            timestamp=datetime.now(timezone.utc),
+            volume=float(bars["Volume"].iloc[-1]),
+            **{
+                key: value
+                for key, value in self.values.items()
+                if key not in ("rsi_wilder", "atr")
+            },
+        )
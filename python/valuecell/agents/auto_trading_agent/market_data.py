@@ -1,16 +1,52 @@
 """Market data and technical indicator retrieval - from a trader's perspective"""
 
 import logging
+import re
 from datetime import datetime, timezone
 from typing import Dict, Optional
 
 import pandas as pd
 import yfinance as yf
 
+from valuecell.adapters.assets.market_calendar import is_market_open
+from valuecell.adapters.assets.rate_limit import Priority, get_rate_limiter
+
 from .models import TechnicalIndicators
 
 logger = logging.getLogger(__name__)
 
+# Yahoo Finance symbol suffix -> exchange whose trading calendar applies
+YAHOO_SUFFIX_EXCHANGES = {".SS": "SSE", ".SZ": "SZSE", ".HK": "HKEX"}
+# Crypto pairs such as BTC-USD trade around the clock
+CRYPTO_PAIR_PATTERN = re.compile(r"-[A-Z]{3,4}$")
+
+
+def is_symbol_market_open(symbol: str, at: Optional[datetime] = None) -> bool:
+    """
+    Check whether the market of a Yahoo Finance symbol is trading.
+
+    Args:
+        symbol: Trading symbol (e.g., BTC-USD, AAPL, 0700.HK)
+        at: Time to check, defaults to now
+
+    Returns:
+        True if the symbol's market is open; symbols without a suffix are
+        treated as US listings
+    """
+    upper = symbol.upper()
+    if CRYPTO_PAIR_PATTERN.search(upper):
+        exchange = "CRYPTO"
+    else:
+        exchange = next(
+            (
+                ex
+                for suffix, ex in YAHOO_SUFFIX_EXCHANGES.items()
+                if upper.endswith(suffix)
+            ),
+            "NASDAQ",
+        )
+    return is_market_open(f"{exchange}:{upper}", at)
+
 
 class MarketDataProvider:
     """
@@ -44,7 +80,13 @@ class MarketDataProvider:
         """
         try:
             ticker = yf.Ticker(symbol)
-            data = ticker.history(period="1d", interval="1m")
+            data = get_rate_limiter().call(
+                "yahoo",
+                ticker.history,
+                period="1d",
+                interval="1m",
+                priority=Priority.BACKGROUND,
+            )
             if data.empty:
                 logger.warning(f"No data available for {symbol}")
                 return None
@@ -68,27 +110,70 @@ class MarketDataProvider:
             TechnicalIndicators object or None if calculation fails
         """
         try:
-            # Fetch data from yfinance
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(period=period, interval=interval)
-
-            if df.empty or len(df) < 50:
-                logger.warning(f"Insufficient data for {symbol}: {len(df)} bars")
+            df = self.fetch_bars(symbol, period, interval)
+            if df is None:
                 return None
+            return self.indicators_from_bars(df, symbol)
 
-            # Calculate all indicators
-            self._calculate_moving_averages(df)
-            self._calculate_macd(df)
-            self._calculate_rsi(df)
-            self._calculate_bollinger_bands(df)
+        except Exception as e:
+            logger.error(f"Failed to calculate indicators for {symbol}: {e}")
+            return None
 
-            # Get latest values
-            return self._extract_latest_indicators(df, symbol)
+    def fetch_bars(
+        self, symbol: str, period: str = "5d", interval: str = "1m"
+    ) -> Optional[pd.DataFrame]:
+        """
+        Download OHLCV bars for a symbol.
+
+        Args:
+            symbol: Trading symbol
+            period: Data period
+            interval: Data interval
 
+        Returns:
+            Bars indexed by time, or None if the download failed
+        """
+        try:
+            ticker = yf.Ticker(symbol)
+            return get_rate_limiter().call(
+                "yahoo",
+                ticker.history,
+                period=period,
+                interval=interval,
+                priority=Priority.BACKGROUND,
+            )
         except Exception as e:
-            logger.error(f"Failed to calculate indicators for {symbol}: {e}")
+            logger.error(f"Failed to fetch bars for {symbol}: {e}")
+            return None
+
+    def indicators_from_bars(
+        self, bars: pd.DataFrame, symbol: str
+    ) -> Optional[TechnicalIndicators]:
+        """
+        Calculate technical indicators from downloaded bars.
+
+        Args:
+            bars: OHLCV bars; left unmodified
+            symbol: Trading symbol
+
+        Returns:
+            TechnicalIndicators object or None if there are too few bars
+        """
+        if bars.empty or len(bars) < 50:
+            logger.warning(f"Insufficient data for {symbol}: {len(bars)} bars")
             return None
 
+        df = bars.copy()
+
+        # Calculate all indicators
+        self._calculate_moving_averages(df)
+        self._calculate_macd(df)
+        self._calculate_rsi(df)
+        self._calculate_bollinger_bands(df)
+
+        # Get latest values
+        return self._extract_latest_indicators(df, symbol)
+
     @staticmethod
     def _calculate_moving_averages(df: pd.DataFrame):
         """Calculate exponential moving averages"""
@@ -0,0 +1,439 @@
+"""Shared market data hub - one download per symbol per trading tick
+
+Every trading instance, its position manager and the paper exchange read
+prices and indicators from the same per-process hub instead of downloading
+their own copy of the same bars. Instances subscribe to their symbols when
+they start and unsubscribe when they stop; the hub keeps the latest snapshot
+of every subscribed symbol.
+
+Downloads and indicator calculations block (HTTP plus pandas), so the async
+API runs them on worker threads with a deadline per symbol: a slow ticker
+is skipped for the cycle instead of stalling the event loop. Indicators are
+kept incrementally per symbol, so a tick only processes the bars that are
+new since the previous download.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional
+
+from .constants import (
+    DEFAULT_CHECK_INTERVAL,
+    MAX_CONCURRENT_FETCHES,
+    SYMBOL_STAGE_TIMEOUT,
+)
+from .indicators import IndicatorEngine
+from .market_data import MarketDataProvider, is_symbol_market_open
+from .models import TechnicalIndicators
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MarketSnapshot:
+    """Immutable market state of one symbol at one tick"""
+
+    symbol: str
+    price: float
+    volume: float
+    bar_count: int
+    fetched_at: datetime
+    # Monotonic time of the download, used for freshness checks
+    fetched_monotonic: float
+    # None when there are too few bars for the indicators
+    indicators: Optional[TechnicalIndicators] = None
+
+    def age_seconds(self, now: Optional[float] = None) -> float:
+        """Seconds since the snapshot was downloaded"""
+        return (time.monotonic() if now is None else now) - self.fetched_monotonic
+
+
+@dataclass(frozen=True)
+class PriceSnapshot:
+    """
+    Mark-to-market prices of a set of symbols taken at one moment.
+
+    A trading cycle values every position, P&L figure and chart point from
+    one of these, so the numbers of a cycle agree with each other.
+    """
+
+    timestamp: datetime
+    prices: Mapping[str, float]
+    # Symbols without a price or whose price is older than the freshness limit
+    stale: FrozenSet[str] = frozenset()
+
+    def price(self, symbol: str) -> Optional[float]:
+        """Marked price of a symbol, None if it has none"""
+        return self.prices.get(symbol)
+
+    def is_stale(self, symbol: str) -> bool:
+        """Whether the price of a symbol is missing or out of date"""
+        return symbol in self.stale or symbol not in self.prices
+
+
+class MarketDataHub:
+    """
+    Per-process cache of market snapshots shared by all trading instances.
+
+    A symbol is downloaded at most once per ``max_age_seconds``: concurrent
+    readers of a stale symbol wait for the single download in flight instead
+    of starting their own. Snapshots are replaced, never modified, so readers
+    can keep a reference without locking.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[MarketDataProvider] = None,
+        max_age_seconds: float = DEFAULT_CHECK_INTERVAL / 2,
+        period: str = "5d",
+        interval: str = "1m",
+        market_open: Callable[[str], bool] = is_symbol_market_open,
+    ):
+        """
+        Initialize the hub.
+
+        Args:
+            provider: Downloads bars and calculates indicators
+            max_age_seconds: Snapshots younger than this are not refreshed;
+                half the check interval so every tick sees a new download
+            period: Bar history period used for the indicators
+            interval: Bar interval
+            market_open: Returns False for symbols whose market is closed;
+                their last snapshot stays valid until the market opens
+        """
+        self.provider = provider or MarketDataProvider()
+        self.max_age_seconds = max_age_seconds
+        self.period = period
+        self.interval = interval
+        self.market_open = market_open
+
+        self._snapshots: Dict[str, MarketSnapshot] = {}
+        self._subscribers: Dict[str, int] = {}
+        self._symbol_locks: Dict[str, threading.Lock] = {}
+        self._engines: Dict[str, IndicatorEngine] = {}
+        self._lock = threading.Lock()
+        # Downloads started by the async API, shared by concurrent awaiters
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.fetch_count = 0
+
+    # ============ Subscriptions ============
+
+    def subscribe(self, symbols: Iterable[str]) -> None:
+        """
+        Add a reference to each symbol.
+
+        Args:
+            symbols: Symbols a trading instance watches
+        """
+        with self._lock:
+            for symbol in symbols:
+                self._subscribers[symbol] = self._subscribers.get(symbol, 0) + 1
+
+    def unsubscribe(self, symbols: Iterable[str]) -> None:
+        """
+        Drop a reference to each symbol; unreferenced symbols are forgotten.
+
+        Args:
+            symbols: Symbols passed to subscribe()
+        """
+        with self._lock:
+            for symbol in symbols:
+                count = self._subscribers.get(symbol, 0) - 1
+                if count > 0:
+                    self._subscribers[symbol] = count
+                    continue
+                self._subscribers.pop(symbol, None)
+                self._snapshots.pop(symbol, None)
+                self._symbol_locks.pop(symbol, None)
+                self._engines.pop(symbol, None)
+
+    def subscriber_count(self, symbol: str) -> int:
+        """Number of active subscriptions of a symbol"""
+        with self._lock:
+            return self._subscribers.get(symbol, 0)
+
+    def subscribed_symbols(self) -> List[str]:
+        """Symbols with at least one subscription"""
+        with self._lock:
+            return sorted(self._subscribers)
+
+    # ============ Snapshots ============
+
+    def latest(self, symbol: str) -> Optional[MarketSnapshot]:
+        """
+        Get the last published snapshot without downloading.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Snapshot or None if the symbol was never fetched
+        """
+        return self._snapshots.get(symbol)
+
+    def _is_fresh(self, snapshot: Optional[MarketSnapshot]) -> bool:
+        if snapshot is None:
+            return False
+        if snapshot.age_seconds() < self.max_age_seconds:
+            return True
+        # Prices do not move while the market is closed
+        return not self.market_open(snapshot.symbol)
+
+    def get(self, symbol: str) -> Optional[MarketSnapshot]:
+        """
+        Get a fresh snapshot, downloading it if needed.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Fresh snapshot, the previous one if the download failed, or None
+        """
+        snapshot = self._snapshots.get(symbol)
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        with self._lock:
+            symbol_lock = self._symbol_locks.setdefault(symbol, threading.Lock())
+
+        with symbol_lock:
+            # Another reader may have downloaded it while we waited
+            snapshot = self._snapshots.get(symbol)
+            if self._is_fresh(snapshot):
+                return snapshot
+            return self._fetch(symbol) or snapshot
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """
+        Get the current price of a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Last close or None if no price is available
+        """
+        snapshot = self.get(symbol)
+        return snapshot.price if snapshot else None
+
+    def last_price(self, symbol: str) -> Optional[float]:
+        """
+        Get the most recently published price without waiting for a refresh.
+
+        Used for valuation on the event loop: it only downloads when the
+        symbol was never fetched.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Last close or None if no price is available
+        """
+        snapshot = self._snapshots.get(symbol)
+        if snapshot is not None:
+            return snapshot.price
+        return self.get_price(symbol)
+
+    def get_indicators(self, symbol: str) -> Optional[TechnicalIndicators]:
+        """
+        Get the technical indicators of a symbol.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Indicators or None if there is not enough data
+        """
+        snapshot = self.get(symbol)
+        return snapshot.indicators if snapshot else None
+
+    def refresh(
+        self, symbols: Optional[Iterable[str]] = None
+    ) -> Dict[str, MarketSnapshot]:
+        """
+        Bring the snapshots of a tick up to date.
+
+        Symbols that were already refreshed during this tick (by another
+        session's loop, for example) are not downloaded again.
+
+        Args:
+            symbols: Symbols to refresh (defaults to all subscribed symbols)
+
+        Returns:
+            Available snapshots by symbol
+        """
+        targets = list(symbols) if symbols is not None else self.subscribed_symbols()
+        snapshots = {}
+        for symbol in targets:
+            snapshot = self.get(symbol)
+            if snapshot is not None:
+                snapshots[symbol] = snapshot
+        return snapshots
+
+    def price_snapshot(
+        self,
+        symbols: Iterable[str],
+        timestamp: Optional[datetime] = None,
+        fetch_missing: bool = True,
+    ) -> PriceSnapshot:
+        """
+        Mark a set of symbols to market from the published snapshots.
+
+        Symbols are read as they are, without refreshing: the trading loop
+        refreshes them once at the start of the cycle.
+
+        Args:
+            symbols: Symbols to price
+            timestamp: Time of the marks (defaults to now)
+            fetch_missing: Download symbols that were never fetched; the
+                trading loop passes False to stay off the network
+
+        Returns:
+            Prices by symbol; missing and out-of-date prices are flagged stale
+        """
+        prices: Dict[str, float] = {}
+        stale = set()
+        for symbol in dict.fromkeys(symbols):
+            snapshot = self._snapshots.get(symbol)
+            if snapshot is None and fetch_missing:
+                snapshot = self.get(symbol)
+            if snapshot is None:
+                stale.add(symbol)
+                continue
+            prices[symbol] = snapshot.price
+            if not self._is_fresh(snapshot):
+                stale.add(symbol)
+
+        return PriceSnapshot(
+            timestamp=timestamp or datetime.now(timezone.utc),
+            prices=prices,
+            stale=frozenset(stale),
+        )
+
+    async def aget(
+        self, symbol: str, timeout: Optional[float] = SYMBOL_STAGE_TIMEOUT
+    ) -> Optional[MarketSnapshot]:
+        """
+        Get a fresh snapshot without blocking the event loop.
+
+        The download and the indicator calculation run on a worker thread.
+        When the deadline passes the caller gets None while the download
+        keeps running and publishes its snapshot for the next reader.
+
+        Args:
+            symbol: Trading symbol
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            Fresh snapshot, or None on timeout or failure
+        """
+        snapshot = self._snapshots.get(symbol)
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        future = self._inflight.get(symbol)
+        if future is None:
+            future = asyncio.ensure_future(asyncio.to_thread(self.get, symbol))
+            self._inflight[symbol] = future
+            future.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+
+        try:
+            snapshot = await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Market data for {symbol} missed its {timeout}s deadline")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to refresh market data for {symbol}: {e}")
+            return None
+        return snapshot if self._is_fresh(snapshot) else None
+
+    async def refresh_async(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = SYMBOL_STAGE_TIMEOUT,
+        max_concurrency: int = MAX_CONCURRENT_FETCHES,
+    ) -> Dict[str, MarketSnapshot]:
+        """
+        Refresh the snapshots of a tick concurrently.
+
+        Args:
+            symbols: Symbols to refresh (defaults to all subscribed symbols)
+            timeout: Deadline per symbol in seconds
+            max_concurrency: Downloads running at the same time
+
+        Returns:
+            Fresh snapshots by symbol; symbols that failed or missed their
+            deadline are left out
+        """
+        targets = list(symbols) if symbols is not None else self.subscribed_symbols()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def refresh_one(symbol: str) -> Optional[MarketSnapshot]:
+            async with semaphore:
+                return await self.aget(symbol, timeout)
+
+        results = await asyncio.gather(*(refresh_one(symbol) for symbol in targets))
+        return {
+            symbol: snapshot
+            for symbol, snapshot in zip(targets, results)
+            if snapshot is not None
+        }
+
+    def _fetch(self, symbol: str) -> Optional[MarketSnapshot]:
+        """Download bars for a symbol and publish a new snapshot"""
+        self.fetch_count += 1
+        bars = self.provider.fetch_bars(symbol, self.period, self.interval)
+        if bars is None or bars.empty:
+            logger.warning(f"No market data available for {symbol}")
+            return None
+
+        try:
+            # Only called under the symbol lock, so the engine is not shared
+            engine = self._engines.get(symbol)
+            if engine is None:
+                engine = self._engines.setdefault(symbol, IndicatorEngine(symbol))
+            latest = bars.iloc[-1]
+            snapshot = MarketSnapshot(
+                symbol=symbol,
+                price=float(latest["Close"]),
+                volume=float(latest["Volume"]),
+                bar_count=len(bars),
+                fetched_at=datetime.now(timezone.utc),
+                fetched_monotonic=time.monotonic(),
+                indicators=engine.sync(bars),
+            )
+        except Exception as e:
+            logger.error(f"Failed to build market snapshot for {symbol}: {e}")
+            return None
+
+        self._snapshots[symbol] = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        """Forget all snapshots and subscriptions"""
+        with self._lock:
+            self._snapshots.clear()
+            self._subscribers.clear()
+            self._symbol_locks.clear()
+            self._engines.clear()
+
+
+_hub: Optional[MarketDataHub] = None
+
+
+def get_market_data_hub() -> MarketDataHub:
+    """Get the process-wide market data hub"""
+    global _hub
+    if _hub is None:
+        _hub = MarketDataHub()
+    return _hub
+
+
+def reset_market_data_hub() -> None:
+    """Drop the process-wide market data hub (for tests)"""
+    global _hub
+    _hub = None
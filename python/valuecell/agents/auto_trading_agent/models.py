@@ -190,6 +190,9 @@ class PositionHistorySnapshot(BaseModel):
     trade_type: str = Field(..., description="Trade type: long or short")
     unrealized_pnl: float = Field(..., description="Unrealized P&L")
     notional: float = Field(..., description="Position notional value")
+    price_stale: bool = Field(
+        default=False, description="Current price is missing or out of date"
+    )
 
 
 class PortfolioValueSnapshot(BaseModel):
@@ -204,6 +207,10 @@ class PortfolioValueSnapshot(BaseModel):
     positions_value: float = Field(..., description="Value of open positions")
     positions_count: int = Field(..., description="Number of open positions")
     total_pnl: float = Field(..., description="Total unrealized P&L")
+    stale_symbols: List[str] = Field(
+        default_factory=list,
+        description="Positions valued without a current price",
+    )
 
 
 class TradingInstanceData(BaseModel):
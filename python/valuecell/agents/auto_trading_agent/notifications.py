@@ -0,0 +1,77 @@
+"""Per-session notification log with monotonically increasing ids
+
+Every notification the trading loop produces gets the next id of its
+session. A stream remembers the last id it sent and each cycle emits only
+the notifications after it; the bounded history is kept for replaying the
+whole log to a client that reconnects.
+"""
+
+from collections import deque
+from typing import Deque, List, Optional
+
+from valuecell.core.types import FilteredCardPushNotificationComponentData
+
+# Maximum notifications kept per session for replay
+MAX_NOTIFICATION_CACHE_SIZE = 5000
+
+
+class NotificationLog:
+    """Bounded, append-only notification history of one session"""
+
+    def __init__(self, maxlen: int = MAX_NOTIFICATION_CACHE_SIZE):
+        self._entries: Deque[FilteredCardPushNotificationComponentData] = deque(
+            maxlen=maxlen
+        )
+        self.last_id = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def append(self, notification: FilteredCardPushNotificationComponentData) -> int:
+        """
+        Assign the next id to a notification and store it.
+
+        Args:
+            notification: Notification to log; its notification_id is set
+
+        Returns:
+            The assigned id
+        """
+        self.last_id += 1
+        notification.notification_id = self.last_id
+        self._entries.append(notification)
+        return self.last_id
+
+    def since(
+        self, cursor: int
+    ) -> Optional[List[FilteredCardPushNotificationComponentData]]:
+        """
+        Get the notifications logged after a cursor.
+
+        Args:
+            cursor: Last id the reader has seen
+
+        Returns:
+            New notifications oldest first (empty if none), or None if some
+            of them were already evicted and the reader needs a replay
+        """
+        if cursor >= self.last_id:
+            return []
+        new = []
+        # New entries are at the end: walk back to the cursor
+        for notification in reversed(self._entries):
+            if notification.notification_id <= cursor:
+                break
+            new.append(notification)
+        if len(new) < self.last_id - cursor:
+            return None
+        new.reverse()
+        return new
+
+    def replay(self) -> List[FilteredCardPushNotificationComponentData]:
+        """All retained notifications, oldest first"""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop the history; ids keep increasing"""
+        self._entries.clear()
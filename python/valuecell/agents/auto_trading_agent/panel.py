@@ -0,0 +1,379 @@
+"""Vectorized indicators for many symbols at once
+
+``MarketDataProvider.indicators_from_bars`` works on one symbol's DataFrame.
+An instance trading a long symbol list pays the pandas overhead once per
+symbol; the functions here take a wide ``(time x symbol)`` panel of closes
+and compute every indicator for every symbol in one pass over the rows.
+
+Each column is treated as its own series of valid observations: missing
+bars (NaN) are skipped, so a symbol with a shorter or gappy history gets
+the same values as ``indicators_from_bars`` on its own bars. The EMA pass
+is compiled with numba when it is installed and runs as numpy row updates
+otherwise.
+
+This is a library function for callers holding a full panel, e.g. scans
+or research over many symbols. The live loop and the backtest engine do
+not use it: they step the incremental per-symbol ``IndicatorEngine`` of
+the market hub, which needs rolling state that the latest values computed
+here cannot seed.
+
+Usage:
+    python -m valuecell.agents.auto_trading_agent.panel
+    python -m valuecell.agents.auto_trading_agent.panel --symbols 1 50 200
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .indicators import MIN_BARS
+from .models import TechnicalIndicators
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+ArrayLike = Union[pd.DataFrame, np.ndarray]
+
+EMA_SPANS = (12, 26, 50)
+MACD_SIGNAL_SPAN = 9
+RSI_PERIOD = 14
+BB_PERIOD = 20
+BB_STD_DEV = 2.0
+
+
+def _alpha(span: int) -> float:
+    return 2.0 / (span + 1.0)
+
+
+def _ema_pass_numpy(values: np.ndarray) -> np.ndarray:
+    """
+    Final EMA-12/26/50 and MACD signal of every column.
+
+    Args:
+        values: Right-aligned closes, leading NaN before a column starts
+
+    Returns:
+        Array of shape (4, symbols): ema_12, ema_26, ema_50, macd_signal
+    """
+    a12, a26, a50, a_sig = (_alpha(s) for s in EMA_SPANS + (MACD_SIGNAL_SPAN,))
+    columns = values.shape[1]
+    ema12 = np.full(columns, np.nan)
+    ema26 = np.full(columns, np.nan)
+    ema50 = np.full(columns, np.nan)
+    signal = np.full(columns, np.nan)
+
+    for row in values:
+        started = np.isnan(ema12)
+        ema12 = np.where(started, row, ema12 + a12 * (row - ema12))
+        ema26 = np.where(started, row, ema26 + a26 * (row - ema26))
+        ema50 = np.where(started, row, ema50 + a50 * (row - ema50))
+        macd = ema12 - ema26
+        signal = np.where(np.isnan(signal), macd, signal + a_sig * (macd - signal))
+
+    return np.vstack([ema12, ema26, ema50, signal])
+
+
+def _ema_pass_scalar(values: np.ndarray) -> np.ndarray:
+    """Same as _ema_pass_numpy with scalar loops, for numba"""
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a50 = 2.0 / 51.0
+    a_sig = 2.0 / 10.0
+    rows, columns = values.shape
+    out = np.full((4, columns), np.nan)
+    for col in range(columns):
+        ema12 = ema26 = ema50 = signal = np.nan
+        for row in range(rows):
+            x = values[row, col]
+            if np.isnan(x):
+                continue
+            if np.isnan(ema12):
+                ema12 = ema26 = ema50 = x
+                signal = 0.0
+                continue
+            ema12 += a12 * (x - ema12)
+            ema26 += a26 * (x - ema26)
+            ema50 += a50 * (x - ema50)
+            signal += a_sig * ((ema12 - ema26) - signal)
+        out[0, col] = ema12
+        out[1, col] = ema26
+        out[2, col] = ema50
+        out[3, col] = signal
+    return out
+
+
+_ema_pass_compiled = njit(cache=True)(_ema_pass_scalar) if njit else None
+
+
+def _ema_pass(values: np.ndarray, use_numba: Optional[bool]) -> np.ndarray:
+    if use_numba is None:
+        use_numba = _ema_pass_compiled is not None
+    if use_numba:
+        if _ema_pass_compiled is None:
+            raise RuntimeError("numba is not installed")
+        return _ema_pass_compiled(np.ascontiguousarray(values))
+    return _ema_pass_numpy(values)
+
+
+def right_align(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Move the valid observations of every column to the bottom.
+
+    Args:
+        values: Array of shape (time, symbols) with NaN for missing bars
+
+    Returns:
+        (aligned values, row order used per column, valid count per column)
+    """
+    valid = ~np.isnan(values)
+    # A stable sort of the mask puts missing rows first and keeps the
+    # valid ones in time order
+    order = np.argsort(valid, axis=0, kind="stable")
+    return np.take_along_axis(values, order, axis=0), order, valid.sum(axis=0)
+
+
+def panel_indicator_values(
+    closes: np.ndarray, use_numba: Optional[bool] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Latest indicator values of every column of a close panel.
+
+    Args:
+        closes: Array of shape (time, symbols)
+        use_numba: Force the numba or numpy EMA pass (default: numba if
+            installed)
+
+    Returns:
+        Indicator name to array of shape (symbols,); NaN where a column has
+        too little history for the indicator
+    """
+    closes = np.asarray(closes, dtype=float)
+    aligned, _, counts = right_align(closes)
+
+    ema12, ema26, ema50, macd_signal = _ema_pass(aligned, use_numba)
+    macd = ema12 - ema26
+
+    # The rolling indicators only need the tail of each column
+    window = aligned[-BB_PERIOD:]
+    bb_middle = window.mean(axis=0)
+    bb_std = window.std(axis=0, ddof=1) * BB_STD_DEV
+    short = counts < BB_PERIOD
+    bb_middle[short] = np.nan
+
+    deltas = np.diff(aligned[-(RSI_PERIOD + 1) :], axis=0)
+    gain = np.where(deltas > 0, deltas, 0.0).mean(axis=0)
+    loss = np.where(deltas < 0, -deltas, 0.0).mean(axis=0)
+    # As in MarketDataProvider._calculate_rsi, a window without losses has rs 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = np.where(loss != 0, gain / loss, 0.0)
+    rsi = 100 - 100 / (1 + rs)
+    rsi[counts < RSI_PERIOD + 1] = np.nan
+
+    return {
+        "close_price": aligned[-1],
+        "ema_12": ema12,
+        "ema_26": ema26,
+        "ema_50": ema50,
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_histogram": macd - macd_signal,
+        "rsi": rsi,
+        "bb_upper": bb_middle + bb_std,
+        "bb_middle": bb_middle,
+        "bb_lower": bb_middle - bb_std,
+    }
+
+
+def compute_panel_indicators(
+    closes: ArrayLike,
+    volumes: Optional[ArrayLike] = None,
+    symbols: Optional[Sequence[str]] = None,
+    min_bars: int = MIN_BARS,
+    use_numba: Optional[bool] = None,
+) -> Dict[str, Optional[TechnicalIndicators]]:
+    """
+    Calculate the technical indicators of many symbols in one pass.
+
+    Args:
+        closes: Wide panel of closes, one column per symbol
+        volumes: Panel of volumes with the same shape (optional)
+        symbols: Column names; required when closes is an ndarray
+        min_bars: Bars a symbol needs before its indicators are reported
+        use_numba: Force the numba or numpy EMA pass
+
+    Returns:
+        TechnicalIndicators by symbol, None for symbols with too few bars
+    """
+    if isinstance(closes, pd.DataFrame):
+        symbols = list(closes.columns) if symbols is None else list(symbols)
+        closes = closes.to_numpy(dtype=float)
+    if isinstance(volumes, pd.DataFrame):
+        volumes = volumes.to_numpy(dtype=float)
+    if symbols is None:
+        raise ValueError("symbols are required for an array panel")
+    closes = np.asarray(closes, dtype=float)
+    if closes.ndim != 2 or closes.shape[1] != len(symbols):
+        raise ValueError(
+            f"Expected a (time, {len(symbols)}) panel, got shape {closes.shape}"
+        )
+
+    _, order, counts = right_align(closes)
+    values = panel_indicator_values(closes, use_numba)
+    if volumes is None:
+        last_volume = np.zeros(len(symbols))
+    else:
+        # Volume of the same bar as the last valid close
+        last_volume = np.take_along_axis(
+            np.asarray(volumes, dtype=float), order[-1:], axis=0
+        )[0]
+
+    now = datetime.now(timezone.utc)
+    results: Dict[str, Optional[TechnicalIndicators]] = {}
+    for col, symbol in enumerate(symbols):
+        if counts[col] < min_bars:
+            results[symbol] = None
+            continue
+        fields = {
+            name: (None if np.isnan(column[col]) else float(column[col]))
+            for name, column in values.items()
+        }
+        volume = last_volume[col]
+        results[symbol] = TechnicalIndicators(
+            symbol=symbol,
+            timestamp=now,
+            volume=0.0 if np.isnan(volume) else float(volume),
+            **fields,
+        )
+    return results
+
+
+def build_panel(
+    bars_by_symbol: Mapping[str, pd.DataFrame], column: str = "Close"
+) -> pd.DataFrame:
+    """
+    Align per-symbol bars into a wide panel.
+
+    Args:
+        bars_by_symbol: OHLCV bars by symbol
+        column: Bar column to take
+
+    Returns:
+        DataFrame indexed by the union of timestamps, one column per symbol
+    """
+    return pd.DataFrame(
+        {symbol: bars[column] for symbol, bars in bars_by_symbol.items()}
+    ).sort_index()
+
+
+# ============ Benchmark ============
+
+
+@dataclass
+class PanelBenchmark:
+    """Timings of one panel size"""
+
+    symbols: int
+    bars: int
+    panel_ms: float
+    per_symbol_ms: float
+
+    @property
+    def speedup(self) -> float:
+        return self.per_symbol_ms / self.panel_ms if self.panel_ms else 0.0
+
+
+def _synthetic_bars(symbols: int, bars: int, seed: int = 0) -> Dict[str, pd.DataFrame]:
+    rng = np.random.default_rng(seed)
+    index = pd.date_range("2025-01-06", periods=bars, freq="1min", tz="UTC")
+    closes = 100.0 + np.cumsum(rng.normal(0, 0.5, (bars, symbols)), axis=0)
+    volumes = rng.integers(100, 1000, (bars, symbols)).astype(float)
+    return {
+        f"SYM{i}": pd.DataFrame(
+            {"Close": closes[:, i], "Volume": volumes[:, i]}, index=index
+        )
+        for i in range(symbols)
+    }
+
+
+def _best_ms(func, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def benchmark(
+    symbol_counts: Sequence[int] = (1, 200),
+    bars: int = 1950,
+    repeats: int = 3,
+    use_numba: Optional[bool] = None,
+) -> List[PanelBenchmark]:
+    """
+    Compare the panel path against one indicators_from_bars call per symbol.
+
+    Args:
+        symbol_counts: Panel widths to time
+        bars: Bars per symbol (1950 is five sessions of 1m bars)
+        repeats: Runs per measurement; the fastest one is reported
+        use_numba: Force the numba or numpy EMA pass
+
+    Returns:
+        One result per panel width
+    """
+    from .market_data import MarketDataProvider
+
+    provider = MarketDataProvider()
+    results = []
+    for count in symbol_counts:
+        bars_by_symbol = _synthetic_bars(count, bars)
+        closes = build_panel(bars_by_symbol)
+        volumes = build_panel(bars_by_symbol, "Volume")
+        # Warm up (and compile, with numba) outside the timings
+        compute_panel_indicators(closes, volumes, use_numba=use_numba)
+
+        panel_ms = _best_ms(
+            lambda: compute_panel_indicators(closes, volumes, use_numba=use_numba),
+            repeats,
+        )
+        per_symbol_ms = _best_ms(
+            lambda: [
+                provider.indicators_from_bars(frame, symbol)
+                for symbol, frame in bars_by_symbol.items()
+            ],
+            repeats,
+        )
+        results.append(PanelBenchmark(count, bars, panel_ms, per_symbol_ms))
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--symbols", type=int, nargs="+", default=[1, 200])
+    parser.add_argument("--bars", type=int, default=1950)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--no-numba", action="store_true")
+    args = parser.parse_args(argv)
+
+    use_numba = False if args.no_numba else None
+    backend = "numba" if (_ema_pass_compiled and use_numba is None) else "numpy"
+    print(f"{args.bars} bars per symbol, EMA pass: {backend}")
+    print(f"{'symbols':>8} {'panel ms':>10} {'per-symbol ms':>14} {'speedup':>8}")
+    for result in benchmark(args.symbols, args.bars, args.repeats, use_numba):
+        print(
+            f"{result.symbols:>8} {result.panel_ms:>10.1f} "
+            f"{result.per_symbol_ms:>14.1f} {result.speedup:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,10 +2,9 @@
 
 import logging
 from datetime import datetime
-from typing import Dict, Optional, Tuple
-
-import yfinance as yf
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from .market_hub import MarketDataHub, PriceSnapshot, get_market_data_hub
 from .models import (
     CashManagement,
     PortfolioValueSnapshot,
@@ -28,14 +27,18 @@ class PositionManager:
     4. "How much total capital is deployed?"
     """
 
-    def __init__(self, initial_capital: float):
+    def __init__(
+        self, initial_capital: float, market_data: Optional[MarketDataHub] = None
+    ):
         """
         Initialize position manager with initial capital.
 
         Args:
             initial_capital: Total capital available for trading
+            market_data: Source of current prices (defaults to the shared hub)
         """
         self.initial_capital = initial_capital
+        self._market_data = market_data or get_market_data_hub()
 
         # Current state
         self._positions: Dict[str, Position] = {}  # symbol -> Position
@@ -50,6 +53,9 @@ class PositionManager:
         self._position_history: list[PositionHistorySnapshot] = []
         self._portfolio_history: list[PortfolioValueSnapshot] = []
 
+        # Prices of the current trading cycle, see mark_to_market()
+        self._marks: Optional[PriceSnapshot] = None
+
     # ============ Cash Management Section ============
 
     def get_cash_status(self) -> CashManagement:
@@ -156,6 +162,58 @@ class PositionManager:
 
     # ============ Portfolio Valuation Section ============
 
+    def mark_to_market(
+        self,
+        timestamp: Optional[datetime] = None,
+        symbols: Iterable[str] = (),
+        fetch_missing: bool = True,
+    ) -> PriceSnapshot:
+        """
+        Take the price snapshot positions are valued with until the next mark.
+
+        Call once per trading cycle: valuation, P&L and history snapshots of
+        the cycle then all use the same prices.
+
+        Args:
+            timestamp: Time of the marks (defaults to now)
+            symbols: Symbols to price besides the open positions, e.g. all
+                symbols the instance trades so positions opened later in
+                the cycle are covered
+            fetch_missing: Download symbols that were never fetched
+
+        Returns:
+            The new price snapshot
+        """
+        self._marks = self._market_data.price_snapshot(
+            [*self._positions, *symbols], timestamp, fetch_missing
+        )
+        stale = sorted(s for s in self._marks.stale if s in self._positions)
+        if stale:
+            logger.warning(f"Stale prices for open positions: {stale}")
+        return self._marks
+
+    @property
+    def marks(self) -> Optional[PriceSnapshot]:
+        """The last price snapshot taken with mark_to_market()"""
+        return self._marks
+
+    def _current_marks(self) -> PriceSnapshot:
+        """
+        The cycle's marks, or a one-off snapshot if they miss a position.
+
+        The one-off snapshot never downloads: callers such as the status and
+        stop commands run on the event loop, e.g. for restored instances
+        before their first cycle. Positions without a published price are
+        reported as stale.
+        """
+        marks = self._marks
+        if marks is not None and all(
+            symbol in marks.prices or symbol in marks.stale
+            for symbol in self._positions
+        ):
+            return marks
+        return self._market_data.price_snapshot(self._positions, fetch_missing=False)
+
     def calculate_position_pnl(self, position: Position, current_price: float) -> float:
         """
         Calculate unrealized P&L for a position.
@@ -174,44 +232,78 @@ class PositionManager:
             # Short: profit when price goes down
             return (position.entry_price - current_price) * abs(position.quantity)
 
-    def calculate_portfolio_value(self) -> Tuple[float, float, float]:
+    def value_position(
+        self, symbol: str, prices: Optional[PriceSnapshot] = None
+    ) -> Optional[Tuple[float, float, float]]:
+        """
+        Value one open position at the marked price.
+
+        Args:
+            symbol: Trading symbol
+            prices: Price snapshot (defaults to the current marks)
+
+        Returns:
+            (current_price, unrealized_pnl, position_value), or None if the
+            position does not exist or has no price
+        """
+        position = self._positions.get(symbol)
+        if position is None:
+            return None
+        current_price = (prices or self._current_marks()).price(symbol)
+        if current_price is None:
+            return None
+
+        pnl = self.calculate_position_pnl(position, current_price)
+        if position.trade_type == TradeType.LONG:
+            pos_value = abs(position.quantity) * current_price
+        else:
+            pos_value = position.notional + pnl
+        return current_price, pnl, pos_value
+
+    def calculate_portfolio_value(
+        self, prices: Optional[PriceSnapshot] = None
+    ) -> Tuple[float, float, float]:
         """
         Calculate total portfolio value with breakdown.
 
+        Args:
+            prices: Price snapshot (defaults to the current marks)
+
         Returns:
             Tuple of (total_value, positions_value, total_pnl)
         """
+        prices = prices or self._current_marks()
         total_value = self._cash_management.total_cash
         positions_value = 0.0
         total_pnl = 0.0
 
         for symbol, position in self._positions.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                current_price = ticker.history(period="1d", interval="1m")[
-                    "Close"
-                ].iloc[-1]
-
-                # Calculate unrealized P&L
-                pnl = self.calculate_position_pnl(position, current_price)
-                total_pnl += pnl
-
-                # Calculate position value
-                if position.trade_type == TradeType.LONG:
-                    pos_value = abs(position.quantity) * current_price
-                else:
-                    pos_value = position.notional + pnl
-
-                positions_value += pos_value
-                total_value += pnl
-
-            except Exception as e:
-                logger.warning(f"Failed to get price for {symbol}: {e}")
-                # Fallback to notional
+            valuation = self.value_position(symbol, prices)
+            if valuation is None:
+                # No price: fall back to notional
                 positions_value += position.notional
+                continue
+
+            _, pnl, pos_value = valuation
+            total_pnl += pnl
+            positions_value += pos_value
+            total_value += pnl
 
         return total_value, positions_value, total_pnl
 
+    def get_stale_symbols(self, prices: Optional[PriceSnapshot] = None) -> List[str]:
+        """
+        Get open positions valued without a current price.
+
+        Args:
+            prices: Price snapshot (defaults to the current marks)
+
+        Returns:
+            Sorted symbols whose price is missing or out of date
+        """
+        prices = prices or self._current_marks()
+        return sorted(s for s in self._positions if prices.is_stale(s))
+
     def get_portfolio_summary(self) -> Dict:
         """
         Get complete portfolio summary from trader's perspective.
@@ -219,7 +311,8 @@ class PositionManager:
         Returns:
             Dictionary with all portfolio information
         """
-        total_value, positions_value, total_pnl = self.calculate_portfolio_value()
+        prices = self._current_marks()
+        total_value, positions_value, total_pnl = self.calculate_portfolio_value(prices)
 
         return {
             "cash": {
@@ -230,6 +323,7 @@ class PositionManager:
             "positions": {
                 "count": self.get_positions_count(),
                 "total_value": positions_value,
+                "stale_symbols": self.get_stale_symbols(prices),
             },
             "portfolio": {
                 "total_value": total_value,
@@ -238,6 +332,7 @@ class PositionManager:
                 if self.initial_capital > 0
                 else 0,
             },
+            "marked_at": prices.timestamp,
         }
 
     # ============ History Tracking Section ============
@@ -249,38 +344,39 @@ class PositionManager:
         Args:
             timestamp: Snapshot timestamp
         """
+        prices = self._current_marks()
         for symbol, position in self._positions.items():
-            try:
-                ticker = yf.Ticker(symbol)
-                current_price = ticker.history(period="1d", interval="1m")[
-                    "Close"
-                ].iloc[-1]
-
-                unrealized_pnl = self.calculate_position_pnl(position, current_price)
-
-                snapshot = PositionHistorySnapshot(
-                    timestamp=timestamp,
-                    symbol=symbol,
-                    quantity=position.quantity,
-                    entry_price=position.entry_price,
-                    current_price=current_price,
-                    trade_type=position.trade_type.value,
-                    unrealized_pnl=unrealized_pnl,
-                    notional=position.notional,
-                )
-                self._position_history.append(snapshot)
-
-            except Exception as e:
-                logger.warning(f"Failed to snapshot position for {symbol}: {e}")
-
-    def snapshot_portfolio(self, timestamp: datetime):
+            valuation = self.value_position(symbol, prices)
+            if valuation is None:
+                logger.warning(f"Failed to snapshot position for {symbol}: no price")
+                continue
+
+            current_price, unrealized_pnl, _ = valuation
+            snapshot = PositionHistorySnapshot(
+                timestamp=timestamp,
+                symbol=symbol,
+                quantity=position.quantity,
+                entry_price=position.entry_price,
+                current_price=current_price,
+                trade_type=position.trade_type.value,
+                unrealized_pnl=unrealized_pnl,
+                notional=position.notional,
+                price_stale=prices.is_stale(symbol),
+            )
+            self._position_history.append(snapshot)
+
+    def snapshot_portfolio(self, timestamp: datetime) -> PortfolioValueSnapshot:
         """
         Take a snapshot of the entire portfolio.
 
         Args:
             timestamp: Snapshot timestamp
+
+        Returns:
+            The recorded snapshot
         """
-        total_value, positions_value, total_pnl = self.calculate_portfolio_value()
+        prices = self._current_marks()
+        total_value, positions_value, total_pnl = self.calculate_portfolio_value(prices)
 
         snapshot = PortfolioValueSnapshot(
             timestamp=timestamp,
@@ -290,8 +386,10 @@ class PositionManager:
             positions_value=positions_value,
             positions_count=self.get_positions_count(),
             total_pnl=total_pnl,
+            stale_symbols=self.get_stale_symbols(prices),
         )
         self._portfolio_history.append(snapshot)
+        return snapshot
 
     def get_position_history(self) -> list[PositionHistorySnapshot]:
         """Get all position history snapshots"""
@@ -301,6 +399,34 @@ class PositionManager:
         """Get all portfolio history snapshots"""
         return self._portfolio_history.copy()
 
+    def restore(
+        self,
+        positions: Iterable[Position],
+        available_cash: float,
+        position_history: Iterable[PositionHistorySnapshot] = (),
+        portfolio_history: Iterable[PortfolioValueSnapshot] = (),
+    ):
+        """
+        Replace the current state with a persisted one.
+
+        Args:
+            positions: Open positions
+            available_cash: Cash not deployed in positions
+            position_history: Position snapshots, oldest first
+            portfolio_history: Portfolio snapshots, oldest first
+        """
+        self._positions = {position.symbol: position for position in positions}
+        cash_in_trades = sum(p.notional for p in self._positions.values())
+        self._cash_management = CashManagement(
+            total_cash=available_cash + cash_in_trades,
+            initial_cash=self.initial_capital,
+            available_cash=available_cash,
+            cash_in_trades=cash_in_trades,
+        )
+        self._position_history = list(position_history)
+        self._portfolio_history = list(portfolio_history)
+        self._marks = None
+
     def reset(self, initial_capital: float):
         """Reset to initial state"""
         self.initial_capital = initial_capital
@@ -313,3 +439,4 @@ class PositionManager:
         )
         self._position_history.clear()
         self._portfolio_history.clear()
+        self._marks = None
@@ -0,0 +1,738 @@
+"""Durable state of trading instances: SQLite, a journal and snapshots
+
+Every instance has a row with its configuration and whether it is running.
+Its trades and cycle snapshots are appended to a journal as they happen; a
+cycle's entries are written in one transaction, so a crash loses at most
+the cycle in flight. The journal is append-only and holds the full history.
+
+Every ``STATE_SNAPSHOT_INTERVAL`` entries the live state is written as a
+snapshot: positions, cash, counters and only the newest
+``STATE_HISTORY_TAIL`` trades and portfolio points. Recovery reads the
+snapshot plus the journal after it, so both writing and recovering a
+snapshot stay bounded however long an instance runs; older trades are read
+back from the journal on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiosqlite
+
+from .constants import STATE_HISTORY_TAIL, STATE_SNAPSHOT_INTERVAL
+from .models import (
+    AutoTradingConfig,
+    PortfolioValueSnapshot,
+    Position,
+    TradeHistoryRecord,
+    TradeType,
+    TradingInstanceData,
+)
+from .trading_executor import TradingExecutor
+
+logger = logging.getLogger(__name__)
+
+# Journal entry kinds
+JOURNAL_TRADE = "trade"
+JOURNAL_CYCLE = "cycle"
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """One appended change of an instance"""
+
+    seq: int
+    kind: str
+    payload: Dict[str, Any]
+
+
+@dataclass
+class StoredInstance:
+    """An instance as persisted: the last snapshot plus the journal after it"""
+
+    session_id: str
+    instance_id: str
+    config: AutoTradingConfig
+    active: bool
+    created_at: datetime
+    snapshot: Optional[TradingInstanceData] = None
+    # Seq of the last journal entry the snapshot covers
+    snapshot_seq: int = 0
+    journal: List[JournalEntry] = field(default_factory=list)
+
+    @property
+    def last_seq(self) -> int:
+        """Seq of the newest persisted change"""
+        return self.journal[-1].seq if self.journal else self.snapshot_seq
+
+    def rebuild(self) -> TradingInstanceData:
+        """
+        Recover the instance state.
+
+        Returns:
+            The snapshot (or the initial state) with the journal applied,
+            keeping the newest ``STATE_HISTORY_TAIL`` trades and portfolio
+            points
+        """
+        if self.snapshot is not None:
+            state = self.snapshot.model_copy(deep=True)
+        else:
+            state = TradingInstanceData(
+                instance_id=self.instance_id,
+                session_id=self.session_id,
+                config=self.config,
+                created_at=self.created_at,
+                active=self.active,
+                current_capital=self.config.initial_capital,
+                current_portfolio_value=self.config.initial_capital,
+            )
+        state.active = self.active
+        for entry in self.journal:
+            apply_journal_entry(state, entry)
+        return state
+
+
+def apply_journal_entry(state: TradingInstanceData, entry: JournalEntry) -> None:
+    """
+    Apply one journal entry to an instance state.
+
+    Args:
+        state: State to update in place
+        entry: Journal entry
+    """
+    if entry.kind == JOURNAL_TRADE:
+        record = TradeHistoryRecord.model_validate(entry.payload)
+        if record.action == "opened":
+            trade_type = TradeType(record.trade_type)
+            state.current_positions.append(
+                Position(
+                    symbol=record.symbol,
+                    entry_price=record.price,
+                    quantity=(
+                        record.quantity
+                        if trade_type == TradeType.LONG
+                        else -record.quantity
+                    ),
+                    entry_time=record.timestamp,
+                    trade_type=trade_type,
+                    notional=record.notional,
+                )
+            )
+        elif record.action == "closed":
+            state.current_positions = [
+                p for p in state.current_positions if p.symbol != record.symbol
+            ]
+        state.current_capital = record.cash_after
+        state.trade_history.append(record)
+        del state.trade_history[:-STATE_HISTORY_TAIL]
+        state.total_trades += 1
+
+    elif entry.kind == JOURNAL_CYCLE:
+        payload = entry.payload
+        state.check_count = payload["check_count"]
+        if payload.get("last_check_time"):
+            state.last_check_time = datetime.fromisoformat(payload["last_check_time"])
+        # Position snapshots stay in the journal; they are history only
+        for item in payload["portfolio"]:
+            snapshot = PortfolioValueSnapshot.model_validate(item)
+            state.portfolio_history.append(snapshot)
+            state.current_portfolio_value = snapshot.total_value
+        del state.portfolio_history[:-STATE_HISTORY_TAIL]
+
+    else:
+        logger.warning(f"Skipping unknown journal entry {entry.seq}: {entry.kind}")
+
+
+def capture_state(
+    session_id: str,
+    instance_id: str,
+    config: AutoTradingConfig,
+    created_at: datetime,
+    active: bool,
+    executor: TradingExecutor,
+    check_count: int,
+    last_check_time: Optional[datetime],
+    total_trades: Optional[int] = None,
+) -> TradingInstanceData:
+    """
+    Take a snapshot of the live state of an instance without touching
+    market data.
+
+    Position history is left out and trade and portfolio history are cut
+    to their newest ``STATE_HISTORY_TAIL`` entries; the journal keeps the
+    rest.
+
+    Args:
+        total_trades: Trades made over the whole life of the instance, if
+            the executor does not hold all of them
+
+    Returns:
+        TradingInstanceData valued at the last portfolio snapshot
+    """
+    portfolio_history = executor.get_portfolio_history()
+    trade_history = executor.get_trade_history()
+    return TradingInstanceData(
+        instance_id=instance_id,
+        session_id=session_id,
+        config=config,
+        created_at=created_at,
+        active=active,
+        trade_history=trade_history[-STATE_HISTORY_TAIL:],
+        portfolio_history=portfolio_history[-STATE_HISTORY_TAIL:],
+        current_positions=list(executor.positions.values()),
+        current_capital=executor.get_current_capital(),
+        current_portfolio_value=(
+            portfolio_history[-1].total_value
+            if portfolio_history
+            else config.initial_capital
+        ),
+        check_count=check_count,
+        last_check_time=last_check_time,
+        total_trades=(total_trades if total_trades is not None else len(trade_history)),
+    )
+
+
+class TradingStateStore(ABC):
+    """Abstract storage interface for trading instance state"""
+
+    @abstractmethod
+    async def save_instance(
+        self,
+        session_id: str,
+        instance_id: str,
+        config: AutoTradingConfig,
+        created_at: datetime,
+        active: bool = True,
+    ) -> None: ...
+
+    @abstractmethod
+    async def set_active(self, instance_id: str, active: bool) -> None: ...
+
+    @abstractmethod
+    async def append(
+        self, instance_id: str, entries: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> int:
+        """Append entries atomically and return the seq of the last one"""
+
+    @abstractmethod
+    async def save_snapshot(
+        self, instance_id: str, state: TradingInstanceData, through_seq: int
+    ) -> None:
+        """Store a snapshot covering the journal entries up to through_seq"""
+
+    @abstractmethod
+    async def load_instances(self, active_only: bool = True) -> List[StoredInstance]:
+        """Load instances with their snapshot and the journal after it"""
+
+    @abstractmethod
+    async def load_journal(
+        self,
+        instance_id: str,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[JournalEntry]:
+        """Load the oldest journal entries of an instance, optionally of one kind"""
+
+
+class InMemoryTradingStateStore(TradingStateStore):
+    """In-memory state store, for tests and runs that need no persistence"""
+
+    def __init__(self):
+        self._instances: Dict[str, Dict[str, Any]] = {}
+        self._journal: List[Tuple[str, JournalEntry]] = []
+        self._snapshots: Dict[str, Tuple[int, str]] = {}
+        self._seq = 0
+
+    async def save_instance(
+        self,
+        session_id: str,
+        instance_id: str,
+        config: AutoTradingConfig,
+        created_at: datetime,
+        active: bool = True,
+    ) -> None:
+        self._instances[instance_id] = {
+            "session_id": session_id,
+            "config": config.model_dump_json(),
+            "created_at": created_at,
+            "active": active,
+        }
+
+    async def set_active(self, instance_id: str, active: bool) -> None:
+        if instance_id in self._instances:
+            self._instances[instance_id]["active"] = active
+
+    async def append(
+        self, instance_id: str, entries: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> int:
+        for kind, payload in entries:
+            self._seq += 1
+            # Round-trip like the SQLite store so callers cannot alias it
+            entry = JournalEntry(self._seq, kind, json.loads(json.dumps(payload)))
+            self._journal.append((instance_id, entry))
+        return self._seq
+
+    async def save_snapshot(
+        self, instance_id: str, state: TradingInstanceData, through_seq: int
+    ) -> None:
+        self._snapshots[instance_id] = (through_seq, state.model_dump_json())
+
+    async def load_instances(self, active_only: bool = True) -> List[StoredInstance]:
+        stored = []
+        for instance_id, row in self._instances.items():
+            if active_only and not row["active"]:
+                continue
+            snapshot_seq, snapshot = self._snapshots.get(instance_id, (0, None))
+            stored.append(
+                StoredInstance(
+                    session_id=row["session_id"],
+                    instance_id=instance_id,
+                    config=AutoTradingConfig.model_validate_json(row["config"]),
+                    active=row["active"],
+                    created_at=row["created_at"],
+                    snapshot=(
+                        TradingInstanceData.model_validate_json(snapshot)
+                        if snapshot
+                        else None
+                    ),
+                    snapshot_seq=snapshot_seq,
+                    journal=[
+                        entry
+                        for owner, entry in self._journal
+                        if owner == instance_id and entry.seq > snapshot_seq
+                    ],
+                )
+            )
+        return stored
+
+    async def load_journal(
+        self,
+        instance_id: str,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[JournalEntry]:
+        entries = [
+            entry
+            for owner, entry in self._journal
+            if owner == instance_id and (kind is None or entry.kind == kind)
+        ]
+        return entries[:limit] if limit is not None else entries
+
+
+class SQLiteTradingStateStore(TradingStateStore):
+    """SQLite-backed state store using aiosqlite.
+
+    Lazily creates its tables on first use. Journal rows are only ever
+    inserted.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._initialized = False
+        self._init_lock = None  # lazy to avoid loop-binding in __init__
+
+    async def _ensure_initialized(self) -> None:
+        if self._initialized:
+            return
+        if self._init_lock is None:
+            self._init_lock = asyncio.Lock()
+        async with self._init_lock:
+            if self._initialized:
+                return
+            async with aiosqlite.connect(self.db_path) as db:
+                await db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS trading_instances (
+                      instance_id TEXT PRIMARY KEY,
+                      session_id TEXT NOT NULL,
+                      config TEXT NOT NULL,
+                      active INTEGER NOT NULL,
+                      created_at TEXT NOT NULL,
+                      updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    """
+                )
+                await db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS trading_journal (
+                      seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                      instance_id TEXT NOT NULL,
+                      kind TEXT NOT NULL,
+                      payload TEXT NOT NULL,
+                      created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    """
+                )
+                await db.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_trading_journal_instance
+                    ON trading_journal (instance_id, seq);
+                    """
+                )
+                await db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS trading_snapshots (
+                      instance_id TEXT PRIMARY KEY,
+                      through_seq INTEGER NOT NULL,
+                      state TEXT NOT NULL,
+                      created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    );
+                    """
+                )
+                await db.commit()
+            self._initialized = True
+
+    async def save_instance(
+        self,
+        session_id: str,
+        instance_id: str,
+        config: AutoTradingConfig,
+        created_at: datetime,
+        active: bool = True,
+    ) -> None:
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO trading_instances (
+                    instance_id, session_id, config, active, created_at
+                ) VALUES (?, ?, ?, ?, ?)
+                """,
+                (
+                    instance_id,
+                    session_id,
+                    config.model_dump_json(),
+                    int(active),
+                    created_at.isoformat(),
+                ),
+            )
+            await db.commit()
+
+    async def set_active(self, instance_id: str, active: bool) -> None:
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                UPDATE trading_instances
+                SET active = ?, updated_at = CURRENT_TIMESTAMP
+                WHERE instance_id = ?
+                """,
+                (int(active), instance_id),
+            )
+            await db.commit()
+
+    async def append(
+        self, instance_id: str, entries: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> int:
+        await self._ensure_initialized()
+        seq = 0
+        async with aiosqlite.connect(self.db_path) as db:
+            for kind, payload in entries:
+                cur = await db.execute(
+                    "INSERT INTO trading_journal (instance_id, kind, payload) VALUES (?, ?, ?)",
+                    (instance_id, kind, json.dumps(payload)),
+                )
+                seq = cur.lastrowid
+            await db.commit()
+        return seq
+
+    async def save_snapshot(
+        self, instance_id: str, state: TradingInstanceData, through_seq: int
+    ) -> None:
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                """
+                INSERT OR REPLACE INTO trading_snapshots (instance_id, through_seq, state)
+                VALUES (?, ?, ?)
+                """,
+                (instance_id, through_seq, state.model_dump_json()),
+            )
+            await db.commit()
+
+    async def load_instances(self, active_only: bool = True) -> List[StoredInstance]:
+        await self._ensure_initialized()
+        where = "WHERE active = 1" if active_only else ""
+        stored = []
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = sqlite3.Row
+            cur = await db.execute(
+                f"SELECT * FROM trading_instances {where} ORDER BY created_at ASC"
+            )
+            for row in await cur.fetchall():
+                instance_id = row["instance_id"]
+                cur = await db.execute(
+                    "SELECT through_seq, state FROM trading_snapshots WHERE instance_id = ?",
+                    (instance_id,),
+                )
+                snapshot = await cur.fetchone()
+                snapshot_seq = snapshot["through_seq"] if snapshot else 0
+                cur = await db.execute(
+                    """
+                    SELECT seq, kind, payload FROM trading_journal
+                    WHERE instance_id = ? AND seq > ? ORDER BY seq ASC
+                    """,
+                    (instance_id, snapshot_seq),
+                )
+                journal = [
+                    JournalEntry(r["seq"], r["kind"], json.loads(r["payload"]))
+                    for r in await cur.fetchall()
+                ]
+                stored.append(
+                    StoredInstance(
+                        session_id=row["session_id"],
+                        instance_id=instance_id,
+                        config=AutoTradingConfig.model_validate_json(row["config"]),
+                        active=bool(row["active"]),
+                        created_at=datetime.fromisoformat(row["created_at"]),
+                        snapshot=(
+                            TradingInstanceData.model_validate_json(snapshot["state"])
+                            if snapshot
+                            else None
+                        ),
+                        snapshot_seq=snapshot_seq,
+                        journal=journal,
+                    )
+                )
+        return stored
+
+    async def load_journal(
+        self,
+        instance_id: str,
+        kind: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[JournalEntry]:
+        await self._ensure_initialized()
+        query = "SELECT seq, kind, payload FROM trading_journal WHERE instance_id = ?"
+        params: List[Any] = [instance_id]
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY seq ASC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        async with aiosqlite.connect(self.db_path) as db:
+            db.row_factory = sqlite3.Row
+            cur = await db.execute(query, params)
+            return [
+                JournalEntry(r["seq"], r["kind"], json.loads(r["payload"]))
+                for r in await cur.fetchall()
+            ]
+
+
+class InstanceJournal:
+    """
+    Writes the changes of one running instance to a state store.
+
+    Keeps cursors into the executor's histories so each cycle only appends
+    what is new, and takes a snapshot every ``snapshot_interval`` entries.
+    A resumed instance holds only the newest trades at first;
+    ``backfill_trades`` reads the older ones back from the journal.
+    Storage errors are logged and never interrupt trading.
+    """
+
+    def __init__(
+        self,
+        store: TradingStateStore,
+        session_id: str,
+        instance_id: str,
+        config: AutoTradingConfig,
+        created_at: datetime,
+        snapshot_interval: int = STATE_SNAPSHOT_INTERVAL,
+    ):
+        self.store = store
+        self.session_id = session_id
+        self.instance_id = instance_id
+        self.config = config
+        self.created_at = created_at
+        self.snapshot_interval = snapshot_interval
+        self.last_seq = 0
+        # Journal entries written since the last snapshot
+        self.pending_entries = 0
+        # Trades over the whole life of the instance
+        self.total_trades = 0
+        self._trades = 0
+        self._position_snapshots = 0
+        self._portfolio_snapshots = 0
+
+    @classmethod
+    def resume(
+        cls,
+        store: TradingStateStore,
+        stored: StoredInstance,
+        state: TradingInstanceData,
+        snapshot_interval: int = STATE_SNAPSHOT_INTERVAL,
+    ) -> "InstanceJournal":
+        """
+        Continue the journal of a restored instance.
+
+        Args:
+            store: Store the instance was loaded from
+            stored: The loaded instance
+            state: State rebuilt from it, now held by the executor
+
+        Returns:
+            Journal positioned after everything already persisted
+        """
+        journal = cls(
+            store,
+            stored.session_id,
+            stored.instance_id,
+            stored.config,
+            stored.created_at,
+            snapshot_interval,
+        )
+        journal.last_seq = stored.last_seq
+        journal.pending_entries = len(stored.journal)
+        journal.total_trades = state.total_trades
+        journal._trades = len(state.trade_history)
+        journal._position_snapshots = len(state.position_history)
+        journal._portfolio_snapshots = len(state.portfolio_history)
+        return journal
+
+    async def start(self) -> bool:
+        """Persist the instance as running"""
+        try:
+            await self.store.save_instance(
+                self.session_id, self.instance_id, self.config, self.created_at
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Failed to persist instance {self.instance_id}: {e}")
+            return False
+
+    async def record_cycle(
+        self,
+        executor: TradingExecutor,
+        check_count: int,
+        last_check_time: Optional[datetime],
+    ) -> bool:
+        """
+        Append the trades and snapshots of a finished cycle.
+
+        Args:
+            executor: Executor of the instance
+            check_count: Checks performed so far
+            last_check_time: Time of this check
+
+        Returns:
+            True if the cycle was persisted
+        """
+        trades = executor.get_trade_history()
+        positions = executor.get_position_history()
+        portfolio = executor.get_portfolio_history()
+
+        new_trades = trades[self._trades :]
+        new_positions = positions[self._position_snapshots :]
+        new_portfolio = portfolio[self._portfolio_snapshots :]
+
+        entries: List[Tuple[str, Dict[str, Any]]] = [
+            (JOURNAL_TRADE, record.model_dump(mode="json")) for record in new_trades
+        ]
+        entries.append(
+            (
+                JOURNAL_CYCLE,
+                {
+                    "check_count": check_count,
+                    "last_check_time": (
+                        last_check_time.isoformat() if last_check_time else None
+                    ),
+                    "positions": [p.model_dump(mode="json") for p in new_positions],
+                    "portfolio": [p.model_dump(mode="json") for p in new_portfolio],
+                },
+            )
+        )
+
+        try:
+            self.last_seq = await self.store.append(self.instance_id, entries)
+        except Exception as e:
+            logger.error(f"Failed to journal cycle of {self.instance_id}: {e}")
+            return False
+
+        # Advance by what was written: a backfill may have shifted the
+        # executor's trades while the append was awaited
+        self._trades += len(new_trades)
+        self._position_snapshots += len(new_positions)
+        self._portfolio_snapshots += len(new_portfolio)
+        self.total_trades += len(new_trades)
+        self.pending_entries += len(entries)
+        if self.pending_entries >= self.snapshot_interval:
+            await self.snapshot(executor, check_count, last_check_time)
+        return True
+
+    async def snapshot(
+        self,
+        executor: TradingExecutor,
+        check_count: int,
+        last_check_time: Optional[datetime],
+    ) -> bool:
+        """
+        Write the live state, so recovery starts from here.
+
+        Returns:
+            True if the snapshot was written
+        """
+        state = capture_state(
+            self.session_id,
+            self.instance_id,
+            self.config,
+            self.created_at,
+            True,
+            executor,
+            check_count,
+            last_check_time,
+            self.total_trades,
+        )
+        try:
+            await self.store.save_snapshot(self.instance_id, state, self.last_seq)
+        except Exception as e:
+            logger.error(f"Failed to snapshot instance {self.instance_id}: {e}")
+            return False
+        self.pending_entries = 0
+        logger.info(
+            f"Snapshotted instance {self.instance_id} through entry {self.last_seq}"
+        )
+        return True
+
+    async def backfill_trades(self, executor: TradingExecutor) -> int:
+        """
+        Load the trades a restored snapshot left out into the executor.
+
+        Args:
+            executor: Executor the instance was restored into
+
+        Returns:
+            Number of trades added
+        """
+        missing = self.total_trades - len(executor.get_trade_history())
+        if missing <= 0:
+            return 0
+        try:
+            entries = await self.store.load_journal(
+                self.instance_id, JOURNAL_TRADE, limit=missing
+            )
+        except Exception as e:
+            logger.error(f"Failed to load trades of {self.instance_id}: {e}")
+            return 0
+
+        older = [TradeHistoryRecord.model_validate(e.payload) for e in entries]
+        executor.backfill_trade_history(older)
+        self._trades += len(older)
+        return len(older)
+
+    async def set_active(self, active: bool) -> bool:
+        """Persist whether the instance is running"""
+        try:
+            await self.store.set_active(self.instance_id, active)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to update instance {self.instance_id}: {e}")
+            return False
@@ -0,0 +1,220 @@
+"""Offline backtests on the bundled CSV fixtures."""
+
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from valuecell.agents.auto_trading_agent.backtest import (
+    BacktestEngine,
+    BacktestTrade,
+    FeeModel,
+    RecordedSignalProvider,
+    ReplayDataProvider,
+    RuleSignalProvider,
+    SignalRecorder,
+    SimulatedClock,
+    SlippageModel,
+    available_fixtures,
+    compute_metrics,
+    load_fixtures,
+)
+from valuecell.agents.auto_trading_agent.backtest.metrics import max_drawdown
+from valuecell.agents.auto_trading_agent.exchanges.base_exchange import OrderStatus
+from valuecell.agents.auto_trading_agent.models import (
+    AutoTradingConfig,
+    TradeAction,
+    TradeType,
+)
+
+SYMBOLS = ["BTC-USD", "ETH-USD"]
+# Enough bars for several round trips while keeping the tests quick
+END = datetime(2025, 10, 20, 5, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(scope="module")
+def bars():
+    return load_fixtures(SYMBOLS)
+
+
+@pytest.fixture
+def config():
+    return AutoTradingConfig(initial_capital=100_000, crypto_symbols=SYMBOLS)
+
+
+def make_engine(config, bars, **kwargs):
+    kwargs.setdefault("fee_model", FeeModel(rate_bps=10))
+    kwargs.setdefault("slippage_model", SlippageModel(bps=5))
+    return BacktestEngine(config, bars, **kwargs)
+
+
+def test_fixtures_are_bundled(bars):
+    assert set(SYMBOLS) <= set(available_fixtures())
+    for frame in bars.values():
+        assert list(frame.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert frame.index.is_monotonic_increasing
+        assert str(frame.index.tz) == "UTC"
+
+
+def test_replay_never_shows_future_bars(bars):
+    clock = SimulatedClock()
+    provider = ReplayDataProvider(bars, clock, window=100)
+    assert provider.fetch_bars("BTC-USD") is None
+
+    now = bars["BTC-USD"].index[250]
+    clock.advance_to(now)
+    visible = provider.fetch_bars("BTC-USD")
+
+    assert len(visible) == 100
+    assert visible.index[-1] == now
+    assert provider.get_current_price("BTC-USD") == bars["BTC-USD"]["Close"].iloc[250]
+    with pytest.raises(ValueError):
+        clock.advance_to(bars["BTC-USD"].index[0])
+
+
+def test_cost_models():
+    fees = FeeModel(rate_bps=10, minimum=1.0)
+    slippage = SlippageModel(bps=5)
+
+    assert fees.fee(10_000) == pytest.approx(10.0)
+    assert fees.fee(100) == 1.0
+    assert fees.fee(0) == 0.0
+    assert slippage.fill_price(100.0, "buy") == pytest.approx(100.05)
+    assert slippage.fill_price(100.0, "sell") == pytest.approx(99.95)
+
+
+@pytest.mark.asyncio
+async def test_exchange_charges_fees_and_slippage(config, bars):
+    engine = make_engine(config, bars)
+    engine.clock.advance_to(bars["BTC-USD"].index[100])
+    engine.market_data.refresh(SYMBOLS)
+    close = bars["BTC-USD"]["Close"].iloc[100]
+
+    order = await engine.exchange.execute_buy("BTCUSDT", 0.1)
+
+    assert order.status == OrderStatus.FILLED
+    assert order.price == pytest.approx(close * 1.0005)
+    assert order.fee == pytest.approx(order.price * 0.1 * 0.001)
+    assert engine.exchange.balance == pytest.approx(
+        100_000 - order.price * 0.1 - order.fee
+    )
+    assert order.created_at == bars["BTC-USD"].index[100].to_pydatetime()
+
+    # Cannot pay for the fill after slippage and fees
+    order = await engine.exchange.place_order("BTCUSDT", "buy", 10.0, None, "market")
+    assert order.status == OrderStatus.REJECTED
+
+
+@pytest.mark.asyncio
+async def test_backtest_is_deterministic(config, bars):
+    first = await make_engine(config, bars).run(end=END)
+    second = await make_engine(config, bars).run(end=END)
+
+    assert first.metrics == second.metrics
+    assert first.trades == second.trades
+    assert first.metrics.trade_count > 0
+    assert first.steps == len(first.equity_curve) == 301
+
+    # Fills happen on replayed bars, not at wall-clock time
+    first_bar = bars["BTC-USD"].index[0].to_pydatetime()
+    assert all(first_bar <= trade.timestamp <= END for trade in first.trades)
+    assert first.metrics.total_fees == pytest.approx(
+        sum(trade.fee for trade in first.trades)
+    )
+    assert first.metrics.total_slippage > 0
+
+
+@pytest.mark.asyncio
+async def test_check_interval_and_warmup(bars):
+    config = AutoTradingConfig(
+        initial_capital=100_000, crypto_symbols=["BTC-USD"], check_interval=300
+    )
+    start = datetime(2025, 10, 20, 1, 0, tzinfo=timezone.utc)
+
+    result = await make_engine(config, bars).run(start=start, end=END)
+
+    # One cycle every 5 bars, the equity curve still has every bar
+    assert result.steps == 49
+    assert len(result.equity_curve) == 241
+    assert result.equity_curve[0][0] == start
+
+
+@pytest.mark.asyncio
+async def test_recorded_signals_reproduce_a_run(config, bars, tmp_path):
+    recorder = SignalRecorder(RuleSignalProvider())
+    live = await make_engine(config, bars, signal_provider=recorder).run(end=END)
+    path = tmp_path / "signals.json"
+    recorder.save(path)
+
+    provider = RecordedSignalProvider.from_file(path)
+    replayed = await make_engine(config, bars, signal_provider=provider).run(end=END)
+
+    assert len(provider) == len(recorder.records) > 0
+    assert replayed.metrics == live.metrics
+    assert replayed.trades == live.trades
+
+
+@pytest.mark.asyncio
+async def test_recorded_signals_override_the_technical_signal(config, bars):
+    index = bars["BTC-USD"].index
+    provider = RecordedSignalProvider(
+        [
+            {
+                "symbol": "BTC-USD",
+                "timestamp": index[60].isoformat(),
+                "action": "buy",
+                "trade_type": "long",
+            },
+            {
+                "symbol": "ETH-USD",
+                "timestamp": index[60].isoformat(),
+                "action": "buy",
+                "trade_type": "short",
+            },
+        ]
+    )
+    engine = make_engine(config, bars, signal_provider=provider)
+
+    # Earlier bars only warm up the indicators
+    result = await engine.run(start=index[60], end=index[60])
+
+    assert [(t.symbol, t.side) for t in result.trades] == [("BTC-USD", "buy")]
+    assert result.trades[0].timestamp == index[60]
+    # The spot exchange cannot short
+    assert result.skipped_orders == 1
+
+
+@pytest.mark.asyncio
+async def test_rule_provider_uses_custom_rule(config, bars):
+    provider = RuleSignalProvider(
+        rule=lambda indicators: (TradeAction.HOLD, TradeType.LONG)
+    )
+
+    result = await make_engine(config, bars, signal_provider=provider).run(end=END)
+
+    assert result.trades == []
+    assert result.metrics.final_value == 100_000
+    assert result.metrics.sharpe_ratio == 0.0
+
+
+def test_metrics():
+    start = datetime(2025, 10, 20, tzinfo=timezone.utc)
+    curve = [
+        (start + pd.Timedelta(minutes=i), value)
+        for i, value in enumerate([100.0, 110.0, 99.0, 120.0])
+    ]
+    trades = [
+        BacktestTrade(start, "BTC-USD", "buy", 1.0, 100.0, 0.1),
+        BacktestTrade(start, "BTC-USD", "sell", 1.0, 110.0, 0.1, pnl=9.8),
+        BacktestTrade(start, "ETH-USD", "sell", 1.0, 90.0, 0.1, pnl=-10.2),
+    ]
+
+    metrics = compute_metrics(curve, trades, 100.0, total_slippage=0.5)
+
+    assert metrics.total_return == pytest.approx(0.2)
+    assert metrics.max_drawdown == pytest.approx(0.1)
+    assert metrics.closed_trades == 2
+    assert metrics.win_rate == 0.5
+    assert metrics.total_fees == pytest.approx(0.3)
+    assert metrics.sharpe_ratio > 0
+    assert max_drawdown([]) == 0.0
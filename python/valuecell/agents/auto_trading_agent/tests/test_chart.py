@@ -0,0 +1,163 @@
+"""Portfolio chart series: deltas, snapshots and LTTB downsampling."""
+
+import json
+import math
+from datetime import datetime, timedelta
+
+import pytest
+
+from valuecell.agents.auto_trading_agent.agent import AutoTradingAgent
+from valuecell.agents.auto_trading_agent.chart import PortfolioChartSeries, lttb
+from valuecell.agents.auto_trading_agent.models import (
+    AutoTradingConfig,
+    PortfolioValueSnapshot,
+)
+
+START = datetime(2025, 10, 21, 10, 0)
+
+
+def minute(i):
+    return START + timedelta(minutes=i)
+
+
+def full_rebuild(histories, initial):
+    """The chart the agent used to rebuild from every history each cycle"""
+    models = list(histories)
+    timestamps = sorted({ts for history in histories.values() for ts, _ in history})
+    last = dict(initial)
+    table = [["Time", *models]]
+    for ts in timestamps:
+        row = [ts.strftime("%Y-%m-%d %H:%M:%S")]
+        for model in models:
+            values = [v for t, v in histories[model] if t == ts]
+            if values:
+                last[model] = values[0]
+            row.append(last[model])
+        table.append(row)
+    return table
+
+
+@pytest.fixture
+def series():
+    series = PortfolioChartSeries()
+    series.add_series("model-a", 1000.0)
+    series.add_series("model-b", 500.0)
+    return series
+
+
+def test_series_matches_full_rebuild(series):
+    histories = {"model-a": [], "model-b": []}
+    for i in range(50):
+        series.record(minute(i), "model-a", 1000.0 + i)
+        histories["model-a"].append((minute(i), 1000.0 + i))
+        # model-b skips every third cycle and is forward-filled
+        if i % 3:
+            series.record(minute(i), "model-b", 500.0 - i)
+            histories["model-b"].append((minute(i), 500.0 - i))
+
+    assert series.snapshot() == full_rebuild(
+        histories, {"model-a": 1000.0, "model-b": 500.0}
+    )
+
+
+def test_rows_since_returns_only_changed_rows(series):
+    start = series.revision
+    series.record(minute(0), "model-a", 1001.0)
+    series.record(minute(0), "model-b", 501.0)
+    cursor = series.revision
+
+    assert series.rows_since(cursor) == []
+
+    series.record(minute(1), "model-a", 1002.0)
+    rows = series.rows_since(cursor)
+    assert rows == [["2025-10-21 10:01:00", 1002.0, 501.0]]
+
+    # The second instance of the cycle updates the same row
+    series.record(minute(1), "model-b", 502.0)
+    assert series.rows_since(cursor) == [["2025-10-21 10:01:00", 1002.0, 502.0]]
+    assert len(series.rows_since(start)) == 2
+
+
+def test_layout_changes_require_a_full_snapshot(series):
+    series.record(minute(0), "model-a", 1001.0)
+    series.record(minute(2), "model-a", 1003.0)
+    cursor = series.revision
+
+    series.add_series("model-c", 200.0)
+    assert series.rows_since(cursor) is None
+
+    cursor = series.revision
+    series.record(minute(1), "model-c", 201.0)
+    assert series.rows_since(cursor) is None
+    assert series.snapshot() == [
+        ["Time", "model-a", "model-b", "model-c"],
+        ["2025-10-21 10:00:00", 1001.0, 500.0, 200.0],
+        ["2025-10-21 10:01:00", 1001.0, 500.0, 201.0],
+        ["2025-10-21 10:02:00", 1003.0, 500.0, 201.0],
+    ]
+
+
+def test_unknown_series_is_rejected(series):
+    with pytest.raises(KeyError):
+        series.record(minute(0), "model-x", 1.0)
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    points = [(float(i), math.sin(i / 10)) for i in range(1000)]
+    points[500] = (500.0, 5.0)
+
+    indices = lttb(points, 100)
+
+    assert len(indices) == 100
+    assert indices[0] == 0 and indices[-1] == 999
+    assert indices == sorted(indices)
+    assert 500 in indices
+    assert lttb(points[:50], 100) == list(range(50))
+
+
+def test_snapshot_downsamples_long_sessions(series):
+    for i in range(2000):
+        series.record(minute(i), "model-a", 1000.0 + (i % 100))
+
+    table = series.snapshot(max_points=200)
+
+    assert table[0] == ["Time", "model-a", "model-b"]
+    # Union of the points kept for each line
+    assert 200 <= len(table) - 1 <= 400
+    assert table[1][0] == "2025-10-21 10:00:00"
+    assert table[-1] == series.snapshot()[-1]
+
+
+def test_agent_sends_full_chart_then_deltas():
+    agent = AutoTradingAgent.__new__(AutoTradingAgent)
+    agent.portfolio_charts = {}
+    config = AutoTradingConfig(
+        initial_capital=1000, crypto_symbols=["BTC-USD"], agent_model="model-a"
+    )
+
+    def snapshot(i, value):
+        return PortfolioValueSnapshot(
+            timestamp=minute(i),
+            total_value=value,
+            cash=value,
+            cash_in_trades=0.0,
+            positions_value=0.0,
+            positions_count=0,
+            total_pnl=0.0,
+        )
+
+    assert agent._get_session_portfolio_chart_data("session") == ""
+    agent._record_chart_point("session", config, snapshot(0, 1000.0))
+    series = agent._get_chart_series("session")
+    cursor = series.revision
+    agent._record_chart_point("session", config, snapshot(1, 1010.0))
+
+    full = json.loads(agent._get_session_portfolio_chart_data("session"))
+    delta = json.loads(
+        agent._get_session_portfolio_chart_delta("session", series.rows_since(cursor))
+    )
+
+    assert json.loads(full["data"])[0] == ["Time", "model-a"]
+    assert len(json.loads(full["data"])) == 3
+    assert delta["chart_id"] == "portfolio_chart_session"
+    assert json.loads(delta["data"]) == [["2025-10-21 10:01:00", 1010.0]]
@@ -0,0 +1,211 @@
+"""Incremental indicators verified against the pandas formulas."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuecell.agents.auto_trading_agent.indicators import (
+    ATR,
+    EMA,
+    MACD,
+    BollingerBands,
+    IndicatorEngine,
+    RollingRSI,
+    RollingStats,
+    WilderRSI,
+)
+from valuecell.agents.auto_trading_agent.market_data import MarketDataProvider
+
+
+def random_walk_bars(count=600, start=30_000.0, seed=7):
+    rng = np.random.default_rng(seed)
+    closes = start + np.cumsum(rng.normal(0, 25, count))
+    # A flat stretch exercises the zero-loss RSI branch
+    closes[100:120] = closes[99]
+    spread = np.abs(rng.normal(0, 10, count))
+    index = pd.date_range("2025-01-06", periods=count, freq="1min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes + spread,
+            "Low": closes - spread,
+            "Close": closes,
+            "Volume": rng.integers(100, 1000, count).astype(float),
+        },
+        index=index,
+    )
+
+
+def streamed(indicator, values):
+    return np.array(
+        [np.nan if v is None else v for v in map(indicator.update, values)],
+        dtype=float,
+    )
+
+
+@pytest.fixture
+def bars():
+    return random_walk_bars()
+
+
+@pytest.fixture
+def close(bars):
+    return bars["Close"]
+
+
+def assert_series_close(actual, expected):
+    np.testing.assert_allclose(actual, expected.to_numpy(), rtol=1e-9, atol=1e-8)
+
+
+def test_ema_matches_pandas(close):
+    for span in (12, 26, 50):
+        expected = close.ewm(span=span, adjust=False).mean()
+        assert_series_close(streamed(EMA(span=span), close), expected)
+
+
+def test_macd_matches_pandas(close):
+    fast = close.ewm(span=12, adjust=False).mean()
+    slow = close.ewm(span=26, adjust=False).mean()
+    macd = fast - slow
+    signal = macd.ewm(span=9, adjust=False).mean()
+
+    indicator = MACD()
+    rows = np.array([indicator.update(x) for x in close])
+
+    assert_series_close(rows[:, 0], macd)
+    assert_series_close(rows[:, 1], signal)
+    assert_series_close(rows[:, 2], macd - signal)
+
+
+def test_rolling_mean_and_variance_match_pandas(close):
+    stats = RollingStats(20)
+    rows = [stats.update(x) for x in close]
+    means = np.array([np.nan if m is None else m for m, _ in rows])
+    variances = np.array([np.nan if v is None else v for _, v in rows])
+
+    assert_series_close(means, close.rolling(20).mean())
+    np.testing.assert_allclose(
+        variances, close.rolling(20).var().to_numpy(), rtol=1e-6, atol=1e-6
+    )
+
+
+def test_bollinger_bands_match_pandas(close):
+    middle = close.rolling(20).mean()
+    std = close.rolling(20).std()
+
+    bands = BollingerBands()
+    rows = np.array(
+        [[np.nan if v is None else v for v in bands.update(x)] for x in close]
+    )
+
+    np.testing.assert_allclose(rows[:, 0], (middle + 2 * std).to_numpy(), rtol=1e-9)
+    np.testing.assert_allclose(rows[:, 2], (middle - 2 * std).to_numpy(), rtol=1e-9)
+
+
+def test_rolling_rsi_matches_market_data_provider(close):
+    df = pd.DataFrame({"Close": close})
+    MarketDataProvider._calculate_rsi(df)
+
+    assert_series_close(streamed(RollingRSI(), close), df["rsi"])
+
+
+def test_wilder_rsi_matches_pandas(close):
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).ewm(alpha=1 / 14, adjust=False).mean()
+    loss = (-delta.where(delta < 0, 0)).ewm(alpha=1 / 14, adjust=False).mean()
+    expected = 100 - 100 / (1 + gain / loss)
+
+    actual = streamed(WilderRSI(), close)
+
+    # The first bars have no losses yet, pandas divides by zero there
+    assert_series_close(actual[14:], expected[14:])
+
+
+def test_atr_matches_pandas(bars):
+    prev_close = bars["Close"].shift()
+    true_range = pd.concat(
+        [
+            bars["High"] - bars["Low"],
+            (bars["High"] - prev_close).abs(),
+            (bars["Low"] - prev_close).abs(),
+        ],
+        axis=1,
+    ).max(axis=1)
+    expected = true_range.ewm(alpha=1 / 14, adjust=False).mean()
+
+    atr = ATR()
+    actual = [
+        atr.update(h, low, c) for h, low, c in bars[["High", "Low", "Close"]].values
+    ]
+
+    assert_series_close(np.array(actual), expected)
+
+
+def test_peek_does_not_change_state(close):
+    ema, stats = EMA(span=12), RollingStats(5)
+    for x in close[:10]:
+        ema.update(x)
+        stats.update(x)
+
+    before = (ema.value, stats.peek(1.0))
+    ema.peek(99.0)
+    stats.peek(99.0)
+
+    assert (ema.value, stats.peek(1.0)) == before
+
+
+def test_engine_on_sliding_downloads_matches_full_recompute(bars):
+    engine = IndicatorEngine("BTC-USD")
+    provider = MarketDataProvider()
+    window = 400
+
+    for end in range(window, len(bars) + 1, 3):
+        download = bars.iloc[end - window : end].copy()
+        # The last bar is still forming: its close differs between downloads
+        download.iloc[-1, download.columns.get_loc("Close")] += 5.0
+        actual = engine.sync(download)
+
+    expected = provider.indicators_from_bars(download, "BTC-USD")
+    for field in ("close_price", "rsi", "bb_upper", "bb_middle", "bb_lower"):
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field))
+    # EMAs started earlier than the window; the seed has decayed away
+    for field in ("ema_12", "ema_26", "ema_50", "macd", "macd_signal"):
+        assert getattr(actual, field) == pytest.approx(
+            getattr(expected, field), rel=1e-6, abs=1e-6
+        )
+    # Only new bars were committed, the forming bar never was
+    assert engine.bar_count == end - 1
+
+
+def test_engine_reseeds_without_overlap_and_waits_for_history(bars):
+    engine = IndicatorEngine("BTC-USD")
+
+    assert engine.sync(bars.iloc[:30]) is None
+    assert engine.sync(bars.iloc[200:300]) is not None
+    assert engine.bar_count == 99
+
+
+def test_engine_skips_bars_with_missing_prices(bars):
+    engine = IndicatorEngine("BTC-USD")
+    gappy = bars.copy()
+    gappy.iloc[150, gappy.columns.get_loc("Close")] = np.nan
+    gappy.iloc[160, gappy.columns.get_loc("High")] = np.inf
+    window = 300
+
+    for end in range(window, len(gappy) + 1, 3):
+        actual = engine.sync(gappy.iloc[end - window : end])
+
+    # The gaps are in the committed history, but no state was poisoned
+    for field in ("ema_12", "ema_26", "rsi", "bb_middle", "bb_upper"):
+        assert np.isfinite(getattr(actual, field))
+    expected = MarketDataProvider().indicators_from_bars(
+        bars.iloc[end - window : end], "BTC-USD"
+    )
+    for field in ("close_price", "rsi", "bb_middle"):
+        assert getattr(actual, field) == pytest.approx(getattr(expected, field))
+    assert engine.bar_count == end - 1 - 2
+
+    # A forming bar without a price is evaluated as absent
+    download = bars.iloc[-window:].copy()
+    download.iloc[-1, download.columns.get_loc("Close")] = np.nan
+    assert engine.sync(download).close_price == bars["Close"].iloc[-2]
@@ -0,0 +1,349 @@
+"""Tests for the shared market data hub."""
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuecell.agents.auto_trading_agent.exchanges.paper_trading import PaperTrading
+from valuecell.agents.auto_trading_agent.market_data import MarketDataProvider
+from valuecell.agents.auto_trading_agent.market_hub import MarketDataHub
+from valuecell.agents.auto_trading_agent.models import Position, TradeType
+from valuecell.agents.auto_trading_agent.position_manager import PositionManager
+
+
+def make_bars(count=60, last_close=100.0):
+    closes = np.linspace(last_close - count + 1, last_close, count)
+    index = pd.date_range("2025-01-06 14:30", periods=count, freq="1min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": closes + 0.5,
+            "Low": closes - 0.5,
+            "Close": closes,
+            "Volume": np.full(count, 1000.0),
+        },
+        index=index,
+    )
+
+
+class FakeProvider(MarketDataProvider):
+    def __init__(self, prices=None, delay=0.0):
+        super().__init__()
+        self.prices = prices or {}
+        self.delay = delay
+        self.calls = []
+
+    def fetch_bars(self, symbol, period="5d", interval="1m"):
+        self.calls.append(symbol)
+        time.sleep(self.delay)
+        if symbol not in self.prices:
+            return pd.DataFrame()
+        return make_bars(last_close=self.prices[symbol])
+
+
+@pytest.fixture
+def provider():
+    return FakeProvider({"BTC-USD": 100.0, "ETH-USD": 50.0})
+
+
+@pytest.fixture
+def hub(provider):
+    return MarketDataHub(provider, max_age_seconds=60, market_open=lambda s: True)
+
+
+def test_one_download_per_symbol_per_tick(hub, provider):
+    for _ in range(20):
+        hub.subscribe(["BTC-USD"])
+
+    snapshots = hub.refresh()
+    for _ in range(20):
+        assert hub.get_indicators("BTC-USD") is snapshots["BTC-USD"].indicators
+    hub.refresh()
+
+    assert provider.calls == ["BTC-USD"]
+    snapshot = snapshots["BTC-USD"]
+    assert snapshot.price == 100.0
+    assert snapshot.bar_count == 60
+    assert snapshot.indicators.close_price == 100.0
+
+
+@pytest.mark.asyncio
+async def test_position_manager_and_paper_exchange_share_snapshots(hub, provider):
+    hub.subscribe(["BTC-USD"])
+    hub.refresh()
+
+    manager = PositionManager(10_000, market_data=hub)
+    manager.open_position(
+        "BTC-USD",
+        Position(
+            symbol="BTC-USD",
+            entry_price=90.0,
+            quantity=10,
+            entry_time=datetime.now(timezone.utc),
+            trade_type=TradeType.LONG,
+            notional=900.0,
+        ),
+    )
+    total_value, positions_value, total_pnl = manager.calculate_portfolio_value()
+    manager.snapshot_positions(datetime.now(timezone.utc))
+
+    exchange = PaperTrading(market_data=hub)
+    price = await exchange.get_current_price("BTCUSDT")
+
+    assert total_pnl == pytest.approx(100.0)
+    assert positions_value == pytest.approx(1000.0)
+    assert price == 100.0
+    assert provider.calls == ["BTC-USD"]
+
+
+def open_long(manager, symbol, entry_price, quantity):
+    manager.open_position(
+        symbol,
+        Position(
+            symbol=symbol,
+            entry_price=entry_price,
+            quantity=quantity,
+            entry_time=datetime.now(timezone.utc),
+            trade_type=TradeType.LONG,
+            notional=entry_price * quantity,
+        ),
+    )
+
+
+def test_cycle_values_everything_from_one_price_snapshot(hub, provider):
+    hub.subscribe(["BTC-USD", "ETH-USD"])
+    hub.refresh()
+    manager = PositionManager(10_000, market_data=hub)
+    open_long(manager, "BTC-USD", 90.0, 10)
+    open_long(manager, "ETH-USD", 40.0, 10)
+
+    timestamp = datetime(2025, 1, 6, 15, 0, tzinfo=timezone.utc)
+    marks = manager.mark_to_market(
+        timestamp, ["BTC-USD", "ETH-USD", "SOL-USD"], fetch_missing=False
+    )
+    calls = len(provider.calls)
+
+    # A newer price published during the cycle does not leak into it
+    provider.prices["BTC-USD"] = 200.0
+    hub.max_age_seconds = 0
+    hub.refresh()
+
+    total_value, positions_value, total_pnl = manager.calculate_portfolio_value()
+    manager.snapshot_positions(timestamp)
+    manager.snapshot_portfolio(timestamp)
+
+    assert marks.timestamp == timestamp
+    assert marks.prices == {"BTC-USD": 100.0, "ETH-USD": 50.0}
+    assert total_pnl == pytest.approx(200.0)
+    assert positions_value == pytest.approx(1500.0)
+    assert [p.current_price for p in manager.get_position_history()] == [100.0, 50.0]
+    assert manager.get_portfolio_history()[-1].total_value == total_value
+    assert manager.value_position("BTC-USD") == (100.0, 100.0, 1000.0)
+    # SOL-USD was never fetched and the cycle marks do not download
+    assert marks.is_stale("SOL-USD")
+    assert "SOL-USD" not in provider.calls
+    assert len(provider.calls) - calls == 2
+
+
+def test_missing_and_old_prices_are_flagged_stale(provider):
+    hub = MarketDataHub(provider, max_age_seconds=60, market_open=lambda s: True)
+    hub.refresh(["BTC-USD"])
+    manager = PositionManager(10_000, market_data=hub)
+    open_long(manager, "BTC-USD", 90.0, 10)
+    open_long(manager, "DOGE-USD", 1.0, 100)
+
+    marks = manager.mark_to_market(fetch_missing=False)
+    assert marks.is_stale("DOGE-USD") and not marks.is_stale("BTC-USD")
+
+    hub.max_age_seconds = 0
+    marks = manager.mark_to_market(fetch_missing=False)
+    manager.snapshot_positions(marks.timestamp)
+    manager.snapshot_portfolio(marks.timestamp)
+
+    # The old price is still used, but flagged
+    assert marks.price("BTC-USD") == 100.0
+    assert manager.get_stale_symbols() == ["BTC-USD", "DOGE-USD"]
+    assert manager.get_position_history()[-1].price_stale
+    assert manager.get_portfolio_history()[-1].stale_symbols == [
+        "BTC-USD",
+        "DOGE-USD",
+    ]
+    # The position without a price is valued at its notional
+    _, positions_value, _ = manager.calculate_portfolio_value()
+    assert positions_value == pytest.approx(1100.0)
+    assert provider.calls == ["BTC-USD"]
+
+
+def test_valuation_before_first_cycle_stays_off_the_network(hub, provider):
+    # E.g. a restored instance answering a status command before it traded
+    hub.refresh(["BTC-USD"])
+    manager = PositionManager(10_000, market_data=hub)
+    open_long(manager, "BTC-USD", 90.0, 10)
+    open_long(manager, "ETH-USD", 40.0, 10)
+
+    total_value, positions_value, _ = manager.calculate_portfolio_value()
+
+    assert provider.calls == ["BTC-USD"]
+    assert manager.get_stale_symbols() == ["ETH-USD"]
+    assert positions_value == pytest.approx(1000.0 + 400.0)
+    assert total_value == pytest.approx(10_000 + 100.0)
+
+
+def test_stale_snapshots_are_refreshed_unless_market_closed(provider):
+    market_open = {"BTC-USD": True, "ETH-USD": False}
+    hub = MarketDataHub(
+        provider, max_age_seconds=0, market_open=lambda s: market_open[s]
+    )
+    hub.subscribe(["BTC-USD", "ETH-USD"])
+
+    hub.refresh()
+    hub.refresh()
+
+    assert provider.calls.count("BTC-USD") == 2
+    # The closed market's last snapshot stays valid
+    assert provider.calls.count("ETH-USD") == 1
+
+
+def test_failed_download_keeps_previous_snapshot(hub, provider):
+    first = hub.get("BTC-USD")
+    hub.max_age_seconds = 0
+    del provider.prices["BTC-USD"]
+
+    assert hub.get("BTC-USD") is first
+    assert hub.get("DOGE-USD") is None
+
+
+def test_subscriptions_are_reference_counted(hub):
+    hub.subscribe(["BTC-USD", "ETH-USD"])
+    hub.subscribe(["BTC-USD"])
+    hub.refresh()
+
+    hub.unsubscribe(["BTC-USD", "ETH-USD"])
+
+    assert hub.subscribed_symbols() == ["BTC-USD"]
+    assert hub.subscriber_count("BTC-USD") == 1
+    assert hub.latest("ETH-USD") is None
+    assert hub.latest("BTC-USD") is not None
+
+    hub.unsubscribe(["BTC-USD"])
+    assert hub.subscribed_symbols() == []
+
+
+def test_concurrent_readers_share_one_download():
+    provider = FakeProvider({"BTC-USD": 100.0}, delay=0.05)
+    hub = MarketDataHub(provider, market_open=lambda s: True)
+    prices = []
+
+    def reader():
+        prices.append(hub.get_price("BTC-USD"))
+
+    threads = [threading.Thread(target=reader) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert prices == [100.0] * 8
+    assert provider.calls == ["BTC-USD"]
+
+
+def test_indicators_leave_shared_bars_untouched():
+    bars = make_bars()
+
+    indicators = MarketDataProvider().indicators_from_bars(bars, "BTC-USD")
+
+    assert indicators.rsi is not None
+    assert list(bars.columns) == ["Open", "High", "Low", "Close", "Volume"]
+
+
+class SlowProvider(FakeProvider):
+    def __init__(self, prices, slow_symbols, delay):
+        super().__init__(prices)
+        self.slow_symbols = slow_symbols
+        self.slow_delay = delay
+
+    def fetch_bars(self, symbol, period="5d", interval="1m"):
+        if symbol in self.slow_symbols:
+            time.sleep(self.slow_delay)
+        return super().fetch_bars(symbol, period, interval)
+
+
+@pytest.mark.asyncio
+async def test_async_refresh_skips_symbols_past_deadline():
+    provider = SlowProvider(
+        {"BTC-USD": 100.0, "ETH-USD": 50.0}, slow_symbols={"ETH-USD"}, delay=0.5
+    )
+    hub = MarketDataHub(provider, market_open=lambda s: True)
+    hub.subscribe(["BTC-USD", "ETH-USD"])
+
+    started = time.monotonic()
+    snapshots = await hub.refresh_async(timeout=0.1)
+
+    assert time.monotonic() - started < 0.4
+    assert list(snapshots) == ["BTC-USD"]
+
+    # The slow download finishes in the background and serves the next tick
+    await asyncio.sleep(0.6)
+    assert hub.latest("ETH-USD").price == 50.0
+    assert provider.calls.count("ETH-USD") == 1
+
+
+@pytest.mark.asyncio
+async def test_async_refresh_keeps_event_loop_responsive():
+    provider = FakeProvider({"BTC-USD": 100.0, "ETH-USD": 50.0}, delay=0.2)
+    hub = MarketDataHub(provider, market_open=lambda s: True)
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    beat = asyncio.create_task(heartbeat())
+    snapshots = await hub.refresh_async(["BTC-USD", "ETH-USD"])
+    beat.cancel()
+
+    assert set(snapshots) == {"BTC-USD", "ETH-USD"}
+    assert ticks >= 10
+
+
+@pytest.mark.asyncio
+async def test_concurrent_awaiters_share_one_download():
+    provider = FakeProvider({"BTC-USD": 100.0}, delay=0.05)
+    hub = MarketDataHub(provider, market_open=lambda s: True)
+
+    results = await asyncio.gather(*(hub.aget("BTC-USD") for _ in range(5)))
+
+    assert all(result is results[0] for result in results)
+    assert provider.calls == ["BTC-USD"]
+
+
+@pytest.mark.asyncio
+async def test_slow_ai_signal_falls_back_to_technical(monkeypatch):
+    from valuecell.agents.auto_trading_agent import agent as agent_module
+
+    monkeypatch.setattr(agent_module, "SYMBOL_STAGE_TIMEOUT", 0.05)
+
+    class SlowAISignals:
+        llm_client = None
+
+        async def get_signal(self, indicators):
+            await asyncio.sleep(1)
+
+    hub = MarketDataHub(FakeProvider({"BTC-USD": 100.0}), market_open=lambda s: True)
+    trading_agent = agent_module.AutoTradingAgent.__new__(agent_module.AutoTradingAgent)
+
+    analysis = await trading_agent._analyze_symbol(
+        "BTC-USD", hub.get("BTC-USD"), SlowAISignals()
+    )
+    skipped = await trading_agent._analyze_symbol("BTC-USD", None, SlowAISignals())
+
+    assert analysis.ai_action is None
+    assert analysis.technical_action is not None
+    assert skipped is None
@@ -0,0 +1,99 @@
+"""Notification log: ids, cursors and replay."""
+
+import json
+
+import pytest
+
+from valuecell.agents.auto_trading_agent.agent import AutoTradingAgent
+from valuecell.agents.auto_trading_agent.notifications import NotificationLog
+from valuecell.core.types import FilteredCardPushNotificationComponentData
+
+
+def make_notification(i):
+    return FilteredCardPushNotificationComponentData(
+        title=f"Trade {i}",
+        data=f"trade {i}",
+        filters=["model-a"],
+        table_title="Trade Detail",
+        create_time="2025-10-21 10:00:00",
+    )
+
+
+def test_ids_increase_and_cursor_returns_new_ones():
+    log = NotificationLog()
+
+    ids = [log.append(make_notification(i)) for i in range(3)]
+    assert ids == [1, 2, 3]
+    cursor = log.last_id
+
+    assert log.since(cursor) == []
+    log.append(make_notification(3))
+    log.append(make_notification(4))
+
+    new = log.since(cursor)
+    assert [n.notification_id for n in new] == [4, 5]
+    assert [n.title for n in log.replay()] == [f"Trade {i}" for i in range(5)]
+
+
+def test_evicted_cursor_requires_replay():
+    log = NotificationLog(maxlen=3)
+    for i in range(3):
+        log.append(make_notification(i))
+    cursor = 1
+
+    assert [n.notification_id for n in log.since(cursor)] == [2, 3]
+
+    log.append(make_notification(3))
+    log.append(make_notification(4))
+    # Notification 2 was evicted before the reader saw it
+    assert log.since(cursor) is None
+    assert [n.notification_id for n in log.replay()] == [3, 4, 5]
+
+
+def test_clear_keeps_ids_monotonic():
+    log = NotificationLog()
+    log.append(make_notification(0))
+    log.clear()
+
+    assert len(log) == 0
+    assert log.append(make_notification(1)) == 2
+    assert log.since(0) is None
+    assert [n.notification_id for n in log.since(1)] == [2]
+
+
+@pytest.fixture
+def agent():
+    agent = AutoTradingAgent.__new__(AutoTradingAgent)
+    agent.notification_cache = {}
+    agent.portfolio_charts = {}
+    return agent
+
+
+def test_agent_replays_then_sends_only_new_notifications(agent):
+    assert agent._replay_notifications("session") is None
+    assert agent._get_notifications_since("session", None) is None
+
+    agent._cache_notification("session", make_notification(0))
+    agent._cache_notification("session", make_notification(1))
+
+    replay = agent._replay_notifications("session")
+    batch = json.loads(replay.content)
+    assert [n["notification_id"] for n in batch] == [1, 2]
+    assert replay.metadata["component_id"] == "trading_status_session"
+
+    cursor = agent._get_notification_cursor("session")
+    agent._cache_notification("session", make_notification(2))
+    new = agent._get_notifications_since("session", cursor)
+    assert [n.title for n in new] == ["Trade 2"]
+
+
+@pytest.mark.asyncio
+async def test_replay_command_resends_history(agent):
+    responses = [r async for r in agent._handle_replay_command("session")]
+    assert "No trading history" in responses[0].content
+
+    agent._cache_notification("session", make_notification(0))
+    responses = [r async for r in agent._handle_replay_command("session")]
+
+    assert len(responses) == 1
+    assert json.loads(responses[0].content)[0]["title"] == "Trade 0"
@@ -0,0 +1,139 @@
+"""Panel indicators compared with the per-symbol pandas path."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuecell.agents.auto_trading_agent.market_data import MarketDataProvider
+from valuecell.agents.auto_trading_agent.panel import (
+    _ema_pass_numpy,
+    _ema_pass_scalar,
+    benchmark,
+    build_panel,
+    compute_panel_indicators,
+    right_align,
+)
+
+FIELDS = (
+    "close_price",
+    "volume",
+    "ema_12",
+    "ema_26",
+    "ema_50",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "rsi",
+    "bb_upper",
+    "bb_middle",
+    "bb_lower",
+)
+
+
+def make_bars(count, seed, start="2025-01-06"):
+    rng = np.random.default_rng(seed)
+    closes = 100.0 + np.cumsum(rng.normal(0, 0.5, count))
+    index = pd.date_range(start, periods=count, freq="1min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "Close": closes,
+            "Volume": rng.integers(100, 1000, count).astype(float),
+        },
+        index=index,
+    )
+
+
+@pytest.fixture
+def bars_by_symbol():
+    gappy = make_bars(300, seed=3)
+    flat = make_bars(200, seed=4)
+    flat.iloc[-20:, 0] = flat["Close"].iloc[-21]
+    return {
+        "BTC-USD": make_bars(400, seed=1),
+        # Starts later than the others
+        "ETH-USD": make_bars(120, seed=2, start="2025-01-06 04:40"),
+        # Missing bars in the middle of the history
+        "SOL-USD": gappy.drop(gappy.index[100:130]),
+        # No losses in the RSI window
+        "DOGE-USD": flat,
+        "NEW-USD": make_bars(30, seed=5, start="2025-01-06 06:00"),
+    }
+
+
+def assert_matches(actual, expected):
+    for field in FIELDS:
+        a, e = getattr(actual, field), getattr(expected, field)
+        if e is None:
+            assert a is None, field
+        else:
+            assert a == pytest.approx(e, rel=1e-9, abs=1e-8), field
+
+
+def test_panel_matches_per_symbol_indicators(bars_by_symbol):
+    closes = build_panel(bars_by_symbol)
+    volumes = build_panel(bars_by_symbol, "Volume")
+    assert closes.isna().any().sum() == len(bars_by_symbol) - 1
+
+    results = compute_panel_indicators(closes, volumes, use_numba=False)
+
+    provider = MarketDataProvider()
+    assert set(results) == set(bars_by_symbol)
+    for symbol, bars in bars_by_symbol.items():
+        expected = provider.indicators_from_bars(bars, symbol)
+        if expected is None:
+            assert results[symbol] is None
+        else:
+            assert_matches(results[symbol], expected)
+
+
+def test_scalar_kernel_matches_numpy_pass(bars_by_symbol):
+    aligned, _, _ = right_align(build_panel(bars_by_symbol).to_numpy())
+
+    np.testing.assert_allclose(
+        _ema_pass_scalar(aligned), _ema_pass_numpy(aligned), rtol=1e-12
+    )
+
+
+def test_right_align_keeps_time_order():
+    values = np.array([[1.0, np.nan], [np.nan, 5.0], [3.0, np.nan], [4.0, 6.0]])
+
+    aligned, _, counts = right_align(values)
+
+    np.testing.assert_array_equal(counts, [3, 2])
+    np.testing.assert_array_equal(aligned[1:, 0], [1.0, 3.0, 4.0])
+    np.testing.assert_array_equal(aligned[2:, 1], [5.0, 6.0])
+    assert np.isnan(aligned[0, 0]) and np.isnan(aligned[:2, 1]).all()
+
+
+def test_array_panel_requires_symbols():
+    closes = np.ones((60, 2))
+
+    with pytest.raises(ValueError):
+        compute_panel_indicators(closes)
+    with pytest.raises(ValueError):
+        compute_panel_indicators(closes, symbols=["A"])
+
+    results = compute_panel_indicators(closes, symbols=["A", "B"], use_numba=False)
+    assert results["A"].close_price == 1.0
+    assert results["B"].volume == 0.0
+
+
+def test_benchmark_reports_each_width():
+    results = benchmark(symbol_counts=(1, 5), bars=120, repeats=1, use_numba=False)
+
+    assert [r.symbols for r in results] == [1, 5]
+    assert all(r.panel_ms > 0 and r.per_symbol_ms > 0 for r in results)
+
+
+def test_numba_pass_matches_numpy(bars_by_symbol):
+    pytest.importorskip("numba")
+    closes = build_panel(bars_by_symbol)
+
+    compiled = compute_panel_indicators(closes, use_numba=True)
+    plain = compute_panel_indicators(closes, use_numba=False)
+
+    for symbol, expected in plain.items():
+        if expected is None:
+            assert compiled[symbol] is None
+        else:
+            assert_matches(compiled[symbol], expected)
@@ -0,0 +1,371 @@
+"""Tests for durable trading instance state."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from valuecell.agents.auto_trading_agent.agent import AutoTradingAgent
+from valuecell.agents.auto_trading_agent.market_data import MarketDataProvider
+from valuecell.agents.auto_trading_agent.market_hub import MarketDataHub
+from valuecell.agents.auto_trading_agent.models import (
+    AutoTradingConfig,
+    TechnicalIndicators,
+    TradeAction,
+    TradeType,
+    TradingRequest,
+)
+from valuecell.agents.auto_trading_agent import state_store
+from valuecell.agents.auto_trading_agent.state_store import (
+    JOURNAL_TRADE,
+    InMemoryTradingStateStore,
+    InstanceJournal,
+    SQLiteTradingStateStore,
+    capture_state,
+)
+from valuecell.agents.auto_trading_agent.trading_executor import TradingExecutor
+
+SYMBOLS = ["BTC-USD", "ETH-USD"]
+START = datetime(2025, 10, 20, tzinfo=timezone.utc)
+CREATED_AT = datetime(2025, 10, 20, 8, 0)
+
+
+class PriceProvider(MarketDataProvider):
+    """Serves flat bars at prices the test sets"""
+
+    def __init__(self, prices):
+        super().__init__()
+        self.prices = prices
+
+    def fetch_bars(self, symbol, period="5d", interval="1m"):
+        closes = np.full(60, self.prices[symbol])
+        index = pd.date_range("2025-10-20", periods=60, freq="1min", tz="UTC")
+        return pd.DataFrame(
+            {
+                "Open": closes,
+                "High": closes,
+                "Low": closes,
+                "Close": closes,
+                "Volume": np.full(60, 1000.0),
+            },
+            index=index,
+        )
+
+
+@pytest.fixture
+def prices():
+    return {"BTC-USD": 100.0, "ETH-USD": 50.0}
+
+
+@pytest.fixture
+def hub(prices):
+    return MarketDataHub(
+        PriceProvider(prices), max_age_seconds=0, market_open=lambda s: True
+    )
+
+
+@pytest.fixture
+def config():
+    return AutoTradingConfig(initial_capital=10_000, crypto_symbols=SYMBOLS)
+
+
+@pytest.fixture(params=["sqlite", "memory"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        return SQLiteTradingStateStore(str(tmp_path / "state.db"))
+    return InMemoryTradingStateStore()
+
+
+# (symbol, action, trade_type) per cycle; None holds
+TRADES = [
+    ("BTC-USD", TradeAction.BUY, TradeType.LONG),
+    ("ETH-USD", TradeAction.BUY, TradeType.SHORT),
+    None,
+    ("BTC-USD", TradeAction.SELL, TradeType.LONG),
+    None,
+    ("BTC-USD", TradeAction.BUY, TradeType.LONG),
+]
+
+
+async def run_cycles(executor, journal, hub, prices, trades=TRADES):
+    """Trade like the agent loop: mark, trade, snapshot, journal"""
+    for cycle, trade in enumerate(trades, start=1):
+        prices["BTC-USD"] += 2.0
+        prices["ETH-USD"] -= 1.0
+        timestamp = START + timedelta(minutes=cycle)
+        hub.refresh(SYMBOLS)
+        executor.mark_to_market(timestamp, SYMBOLS)
+        if trade is not None:
+            symbol, action, trade_type = trade
+            indicators = TechnicalIndicators(
+                symbol=symbol,
+                timestamp=timestamp,
+                close_price=prices[symbol],
+                volume=1000.0,
+            )
+            assert executor.execute_trade(symbol, action, trade_type, indicators)
+        executor.snapshot_positions(timestamp)
+        executor.snapshot_portfolio(timestamp)
+        assert await journal.record_cycle(executor, cycle, timestamp)
+
+
+def live_state(executor, config, check_count):
+    return capture_state(
+        "session",
+        "instance",
+        config,
+        CREATED_AT,
+        True,
+        executor,
+        check_count,
+        START + timedelta(minutes=check_count),
+    )
+
+
+@pytest.mark.asyncio
+async def test_journal_replay_matches_live_state(store, config, hub, prices):
+    executor = TradingExecutor(config, hub)
+    journal = InstanceJournal(store, "session", "instance", config, CREATED_AT)
+    assert await journal.start()
+    await run_cycles(executor, journal, hub, prices)
+
+    [stored] = await store.load_instances()
+    state = stored.rebuild()
+
+    assert stored.snapshot is None
+    assert len(stored.journal) == len(TRADES) + 4
+    assert state == live_state(executor, config, len(TRADES))
+    assert state.total_trades == 4
+    assert {p.symbol for p in state.current_positions} == set(SYMBOLS)
+
+    restored = TradingExecutor(config, hub)
+    restored.restore_state(state)
+    restored.mark_to_market(symbols=SYMBOLS)
+    executor.mark_to_market(symbols=SYMBOLS)
+
+    assert restored.positions == executor.positions
+    assert restored.get_current_capital() == pytest.approx(
+        executor.get_current_capital()
+    )
+    assert restored.get_portfolio_value() == pytest.approx(
+        executor.get_portfolio_value()
+    )
+    assert restored.get_trade_statistics() == executor.get_trade_statistics()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_bound_recovery(store, config, hub, prices):
+    executor = TradingExecutor(config, hub)
+    journal = InstanceJournal(
+        store, "session", "instance", config, CREATED_AT, snapshot_interval=3
+    )
+    await journal.start()
+    await run_cycles(executor, journal, hub, prices)
+
+    [stored] = await store.load_instances()
+
+    assert stored.snapshot is not None
+    assert len(stored.journal) < 3
+    assert stored.last_seq == journal.last_seq
+    assert stored.rebuild() == live_state(executor, config, len(TRADES))
+
+
+@pytest.mark.asyncio
+async def test_snapshots_keep_only_recent_history(
+    store, config, hub, prices, monkeypatch
+):
+    monkeypatch.setattr(state_store, "STATE_HISTORY_TAIL", 2)
+    executor = TradingExecutor(config, hub)
+    journal = InstanceJournal(
+        store, "session", "instance", config, CREATED_AT, snapshot_interval=3
+    )
+    await journal.start()
+    await run_cycles(executor, journal, hub, prices)
+
+    [stored] = await store.load_instances()
+    assert len(stored.snapshot.trade_history) <= 2
+    assert len(stored.snapshot.portfolio_history) <= 2
+    assert stored.snapshot.position_history == []
+
+    state = stored.rebuild()
+    assert state.total_trades == 4
+    assert state.trade_history == executor.get_trade_history()[-2:]
+    assert state.portfolio_history == executor.get_portfolio_history()[-2:]
+
+    # The journal still holds every trade; a restored executor reads the
+    # older ones back
+    assert len(await store.load_journal("instance", JOURNAL_TRADE)) == 4
+    restored = TradingExecutor(config, hub)
+    restored.restore_state(state)
+    resumed = InstanceJournal.resume(store, stored, state, snapshot_interval=3)
+    assert await resumed.backfill_trades(restored) == 2
+    assert restored.get_trade_history() == executor.get_trade_history()
+    assert await resumed.backfill_trades(restored) == 0
+
+
+@pytest.mark.asyncio
+async def test_resumed_journal_continues_after_recovery(store, config, hub, prices):
+    executor = TradingExecutor(config, hub)
+    journal = InstanceJournal(
+        store, "session", "instance", config, CREATED_AT, snapshot_interval=4
+    )
+    await journal.start()
+    await run_cycles(executor, journal, hub, prices, TRADES[:3])
+
+    # "Restart": rebuild from the store and keep trading
+    [stored] = await store.load_instances()
+    state = stored.rebuild()
+    restored = TradingExecutor(config, hub)
+    restored.restore_state(state)
+    journal = InstanceJournal.resume(store, stored, state, snapshot_interval=4)
+    for cycle, trade in enumerate(TRADES[3:], start=4):
+        prices["BTC-USD"] += 2.0
+        timestamp = START + timedelta(minutes=cycle)
+        hub.refresh(SYMBOLS)
+        restored.mark_to_market(timestamp, SYMBOLS)
+        if trade is not None:
+            symbol, action, trade_type = trade
+            indicators = TechnicalIndicators(
+                symbol=symbol,
+                timestamp=timestamp,
+                close_price=prices[symbol],
+                volume=1000.0,
+            )
+            assert restored.execute_trade(symbol, action, trade_type, indicators)
+        restored.snapshot_positions(timestamp)
+        restored.snapshot_portfolio(timestamp)
+        await journal.record_cycle(restored, cycle, timestamp)
+
+    [stored] = await store.load_instances()
+    state = stored.rebuild()
+
+    assert state == live_state(restored, config, len(TRADES))
+    assert len(state.portfolio_history) == len(TRADES)
+    assert state.total_trades == 4
+
+
+@pytest.mark.asyncio
+async def test_stopped_instances_are_not_restored(store, config):
+    journal = InstanceJournal(store, "session", "instance", config, CREATED_AT)
+    await journal.start()
+    assert await journal.set_active(False)
+
+    assert await store.load_instances() == []
+    [stored] = await store.load_instances(active_only=False)
+    assert stored.active is False
+    assert stored.rebuild().current_capital == config.initial_capital
+
+
+def make_agent(store, hub):
+    agent = AutoTradingAgent.__new__(AutoTradingAgent)
+    agent.trading_instances = {}
+    agent.portfolio_charts = {}
+    agent.notification_cache = {}
+    agent.background_tasks = set()
+    agent.session_updates = {}
+    agent.market_data = hub
+    agent.state_store = store
+    return agent
+
+
+async def cancel_background_tasks(*agents):
+    tasks = [task for agent in agents for task in agent.background_tasks]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def start_session(agent, monkeypatch):
+    """Create an instance through stream() and disconnect once it trades"""
+
+    async def parse(query):
+        return TradingRequest(crypto_symbols=SYMBOLS, initial_capital=10_000)
+
+    monkeypatch.setattr(agent, "_parse_trading_request", parse)
+    stream = agent.stream("Trade BTC and ETH", "session", "task")
+    async for _ in stream:
+        if agent.background_tasks:
+            break
+    await stream.aclose()
+    [instance_id] = agent.trading_instances["session"]
+    return instance_id
+
+
+@pytest.mark.asyncio
+async def test_agent_restores_and_resumes_instances(store, config, hub, prices):
+    executor = TradingExecutor(config, hub)
+    journal = InstanceJournal(store, "session", "instance", config, CREATED_AT)
+    await journal.start()
+    await run_cycles(executor, journal, hub, prices)
+
+    agent = make_agent(store, hub)
+    assert await agent.restore_instances() == 1
+    # The resumed trading loop and the trade backfill
+    assert len(agent.background_tasks) == 2
+    await cancel_background_tasks(agent)
+
+    instance = agent.trading_instances["session"]["instance"]
+    restored = instance["executor"]
+    assert instance["active"] is True
+    assert instance["check_count"] == len(TRADES)
+    assert instance["ai_signal_generator"] is None
+    assert instance["journal"].last_seq == journal.last_seq
+    assert restored.positions == executor.positions
+    assert restored.get_trade_history() == executor.get_trade_history()
+    assert len(agent.portfolio_charts["session"]) == len(TRADES)
+
+    # Restoring twice does not duplicate running instances
+    assert await agent.restore_instances() == 0
+
+
+@pytest.mark.asyncio
+async def test_disconnected_stream_keeps_trading(store, hub, monkeypatch):
+    agent = make_agent(store, hub)
+    restarted = make_agent(store, hub)
+    try:
+        instance_id = await start_session(agent, monkeypatch)
+
+        # The loop outlives the client, in memory and in the store
+        assert agent.trading_instances["session"][instance_id]["active"]
+        assert any(not task.done() for task in agent.background_tasks)
+        [stored] = await store.load_instances()
+        assert stored.instance_id == instance_id
+
+        # Still running here, so it is not restored twice; a restarted
+        # agent resumes it
+        assert await agent.restore_instances() == 0
+        assert await restarted.restore_instances() == 1
+    finally:
+        await cancel_background_tasks(agent, restarted)
+
+
+@pytest.mark.asyncio
+async def test_stopped_session_is_not_restored(store, hub, monkeypatch):
+    agent = make_agent(store, hub)
+    try:
+        instance_id = await start_session(agent, monkeypatch)
+
+        responses = [r async for r in agent.stream("stop", "session", "stop")]
+        assert responses
+        assert not agent.trading_instances["session"][instance_id]["active"]
+        assert await store.load_instances() == []
+        assert await make_agent(store, hub).restore_instances() == 0
+    finally:
+        await cancel_background_tasks(agent)
+
+
+@pytest.mark.asyncio
+async def test_status_command_sends_report(store, hub, monkeypatch):
+    agent = make_agent(store, hub)
+    try:
+        [empty] = [r async for r in agent.stream("status", "session", "status")]
+        assert "No trading instances" in empty.content
+
+        instance_id = await start_session(agent, monkeypatch)
+        [status] = [r async for r in agent.stream("status", "session", "status")]
+        assert instance_id in status.content
+        assert "Active" in status.content
+    finally:
+        await cancel_background_tasks(agent)
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 from .models import TradeHistoryRecord
 
@@ -281,6 +281,14 @@ class TradeRecorder:
 
         return breakdown
 
+    def restore(self, trades: Iterable[TradeHistoryRecord]):
+        """Replace the history with persisted trades, oldest first"""
+        self._trades = list(trades)
+
+    def backfill(self, older: Iterable[TradeHistoryRecord]):
+        """Prepend persisted trades that are older than the ones held"""
+        self._trades = list(older) + self._trades
+
     def reset(self):
         """Clear all trade history"""
         self._trades.clear()
@@ -2,8 +2,9 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from .market_hub import MarketDataHub, PriceSnapshot
 from .models import (
     AutoTradingConfig,
     PortfolioValueSnapshot,
@@ -13,6 +14,7 @@ from .models import (
     TradeAction,
     TradeHistoryRecord,
     TradeType,
+    TradingInstanceData,
 )
 from .position_manager import PositionManager
 from .trade_recorder import TradeRecorder
@@ -30,18 +32,23 @@ class TradingExecutor:
     - Cash management (via PositionManager)
     """
 
-    def __init__(self, config: AutoTradingConfig):
+    def __init__(
+        self,
+        config: AutoTradingConfig,
+        market_data: Optional[MarketDataHub] = None,
+    ):
         """
         Initialize trading executor.
 
         Args:
             config: Auto trading configuration
+            market_data: Source of current prices (defaults to the shared hub)
         """
         self.config = config
         self.initial_capital = config.initial_capital
 
         # Use specialized modules
-        self._position_manager = PositionManager(config.initial_capital)
+        self._position_manager = PositionManager(config.initial_capital, market_data)
         self._trade_recorder = TradeRecorder()
 
     def execute_trade(
@@ -206,6 +213,23 @@ class TradingExecutor:
 
     # ============ Portfolio Queries ============
 
+    def mark_to_market(
+        self,
+        timestamp: Optional[datetime] = None,
+        symbols: Iterable[str] = (),
+        fetch_missing: bool = True,
+    ) -> PriceSnapshot:
+        """Take the price snapshot of this trading cycle"""
+        return self._position_manager.mark_to_market(timestamp, symbols, fetch_missing)
+
+    def value_position(self, symbol: str) -> Optional[Tuple[float, float, float]]:
+        """Get (current_price, unrealized_pnl, position_value) of a position"""
+        return self._position_manager.value_position(symbol)
+
+    def get_stale_symbols(self) -> List[str]:
+        """Get open positions valued without a current price"""
+        return self._position_manager.get_stale_symbols()
+
     def get_portfolio_value(self) -> float:
         """Get total portfolio value"""
         total_value, _, _ = self._position_manager.calculate_portfolio_value()
@@ -235,9 +259,9 @@ class TradingExecutor:
         """Take a snapshot of all positions"""
         self._position_manager.snapshot_positions(timestamp)
 
-    def snapshot_portfolio(self, timestamp: datetime):
+    def snapshot_portfolio(self, timestamp: datetime) -> PortfolioValueSnapshot:
         """Take a snapshot of portfolio value"""
-        self._position_manager.snapshot_portfolio(timestamp)
+        return self._position_manager.snapshot_portfolio(timestamp)
 
     def get_trade_history(self) -> List[TradeHistoryRecord]:
         """Get all trade history"""
@@ -267,6 +291,30 @@ class TradingExecutor:
 
     # ============ Management ============
 
+    def restore_state(self, state: TradingInstanceData):
+        """
+        Restore positions, cash and history persisted for an instance.
+
+        Args:
+            state: Instance state rebuilt from the state store
+        """
+        self._position_manager.restore(
+            state.current_positions,
+            state.current_capital,
+            state.position_history,
+            state.portfolio_history,
+        )
+        self._trade_recorder.restore(state.trade_history)
+
+    def backfill_trade_history(self, older: List[TradeHistoryRecord]):
+        """
+        Complete a restored trade history with its older trades.
+
+        Args:
+            older: Trades that precede the restored ones, oldest first
+        """
+        self._trade_recorder.backfill(older)
+
     def reset(self, initial_capital: float):
         """Reset executor state"""
         self._position_manager.reset(initial_capital)
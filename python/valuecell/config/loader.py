@@ -27,12 +27,14 @@ Example:
 import logging
 import os
 import re
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
 from .constants import CONFIG_DIR
+from .watcher import FileStamp, file_stamp
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,10 @@ class ConfigLoader:
     1. Base YAML files (system defaults)
     2. .env file values
     3. Environment variables (highest priority)
+
+    Parsed files and resolved configurations are cached by file path and
+    modification time, so an edited file is picked up on the next lookup
+    while unchanged files are never parsed twice.
     """
 
     def __init__(self, config_dir: Optional[Path] = None):
@@ -60,12 +66,76 @@ class ConfigLoader:
             logger.error(f"Config directory not found: {self.config_dir}")
 
         self.environment = os.getenv("APP_ENVIRONMENT", "development")
-        self._cache: Dict[str, Any] = {}
+        # cache key -> (stamps of the source files, resolved config)
+        self._cache: Dict[str, Tuple[Dict[Path, FileStamp], Any]] = {}
+        # file path -> (stamp, parsed YAML)
+        self._files: Dict[Path, Tuple[FileStamp, Any]] = {}
+        self._lock = threading.RLock()
 
         logger.debug(
             f"ConfigLoader initialized: config_dir={self.config_dir}, env={self.environment}"
         )
 
+    def _read_yaml(self, path: Path) -> Dict[str, Any]:
+        """
+        Parse a YAML file, reusing the result while the file is unchanged
+
+        Args:
+            path: YAML file path
+
+        Returns:
+            Parsed content (never mutated by callers)
+        """
+        stamp = file_stamp(path)
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+
+        with self._lock:
+            self._files[path] = (stamp, data)
+        return data
+
+    def _get_cached(self, cache_key: str) -> Optional[Any]:
+        """
+        Get a resolved config if none of its source files changed
+
+        Args:
+            cache_key: Cache key of the config
+
+        Returns:
+            Cached config or None if missing or stale
+        """
+        with self._lock:
+            entry = self._cache.get(cache_key)
+        if entry is None:
+            return None
+        sources, config = entry
+        if any(file_stamp(path) != stamp for path, stamp in sources.items()):
+            return None
+        return config
+
+    def _set_cached(self, cache_key: str, sources: List[Path], config: Any) -> None:
+        """
+        Cache a resolved config together with the stamps of its sources
+
+        Args:
+            cache_key: Cache key of the config
+            sources: Files the config was built from (existing or not)
+            config: Resolved config
+        """
+        with self._lock:
+            # Prefer the stamp taken before the file was parsed, so a write
+            # that races with loading is detected on the next lookup
+            stamps = {
+                path: self._files[path][0] if path in self._files else file_stamp(path)
+                for path in sources
+            }
+            self._cache[cache_key] = (stamps, config)
+
     def _resolve_env_vars(self, value: Any) -> Any:
         """
         Recursively resolve environment variables in config values
@@ -223,8 +293,9 @@ class ConfigLoader:
         """
         cache_key = f"{config_name}_{self.environment}"
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         # Load base config
         base_config_path = self.config_dir / f"{config_name}.yaml"
@@ -232,22 +303,20 @@ class ConfigLoader:
             raise FileNotFoundError(f"Config file not found: {base_config_path}")
 
         logger.info(f"Loading config: {base_config_path}")
-        with open(base_config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = self._read_yaml(base_config_path)
 
         # Load environment-specific overrides
         env_config_path = self.config_dir / f"{config_name}.{self.environment}.yaml"
         if env_config_path.exists():
             logger.info(f"Loading environment config: {env_config_path}")
-            with open(env_config_path, "r", encoding="utf-8") as f:
-                env_config = yaml.safe_load(f) or {}
+            env_config = self._read_yaml(env_config_path)
             config = self._merge_configs(config, env_config)
 
         # Resolve environment variables in config values
         config = self._resolve_env_vars(config)
 
-        # Cache the result
-        self._cache[cache_key] = config
+        # Cache the result; creating the environment file also invalidates it
+        self._set_cached(cache_key, [base_config_path, env_config_path], config)
 
         return config
 
@@ -263,8 +332,9 @@ class ConfigLoader:
         """
         cache_key = f"provider_{provider_name}"
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         provider_path = self.config_dir / "providers" / f"{provider_name}.yaml"
 
@@ -273,8 +343,7 @@ class ConfigLoader:
             return {}
 
         logger.info(f"Loading provider config: {provider_path}")
-        with open(provider_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = self._read_yaml(provider_path)
 
         # Resolve environment variables
         config = self._resolve_env_vars(config)
@@ -284,7 +353,7 @@ class ConfigLoader:
             config = self._apply_env_overrides(config)
 
         # Cache the result
-        self._cache[cache_key] = config
+        self._set_cached(cache_key, [provider_path], config)
 
         return config
 
@@ -305,8 +374,9 @@ class ConfigLoader:
         """
         cache_key = f"agent_{agent_name}"
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         agent_path = self.config_dir / "agents" / f"{agent_name}.yaml"
 
@@ -315,8 +385,7 @@ class ConfigLoader:
             return {}
 
         logger.info(f"Loading agent config: {agent_path}")
-        with open(agent_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = self._read_yaml(agent_path)
 
         # Step 1: Resolve ${VAR} syntax in YAML values
         config = self._resolve_env_vars(config)
@@ -326,7 +395,7 @@ class ConfigLoader:
             config = self._apply_env_overrides(config)
 
         # Cache the result
-        self._cache[cache_key] = config
+        self._set_cached(cache_key, [agent_path], config)
 
         logger.debug(f"Agent config loaded: {agent_name}")
         return config
@@ -343,8 +412,9 @@ class ConfigLoader:
         """
         cache_key = f"third_party_{integration_name}"
 
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
         integration_path = self.config_dir / "third_party" / f"{integration_name}.yaml"
 
@@ -353,8 +423,7 @@ class ConfigLoader:
             return {}
 
         logger.info(f"Loading third-party config: {integration_path}")
-        with open(integration_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = self._read_yaml(integration_path)
 
         # Resolve environment variables
         config = self._resolve_env_vars(config)
@@ -364,7 +433,7 @@ class ConfigLoader:
             config = self._apply_env_overrides(config)
 
         # Cache the result
-        self._cache[cache_key] = config
+        self._set_cached(cache_key, [integration_path], config)
 
         return config
 
@@ -402,7 +471,9 @@ class ConfigLoader:
 
     def clear_cache(self):
         """Clear cache"""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._files.clear()
         logger.info("Configuration cache cleared")
 
     def list_providers(self) -> List[str]:
@@ -6,14 +6,18 @@ Provides a clean API for:
 - Getting agent configurations with full three-tier override
 - Validating configurations
 - Listing available providers and models
+- Reloading configuration when files change
 """
 
 import logging
 import os
+import threading
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from valuecell.config.loader import ConfigLoader, get_config_loader
+from valuecell.config.watcher import ConfigChangeEvent, ConfigWatcher
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +90,97 @@ class ConfigManager:
         """
         self.loader = loader or get_config_loader()
         self._config = self.loader.load_config()
+        self._generation = 0
+        self._reload_lock = threading.Lock()
+        self._reload_listeners: List[Callable[[ConfigChangeEvent], None]] = []
+        self._watcher: Optional[ConfigWatcher] = None
+
+    @property
+    def generation(self) -> int:
+        """Number of reloads since the manager was created"""
+        return self._generation
+
+    def add_reload_listener(
+        self, callback: Callable[[ConfigChangeEvent], None]
+    ) -> None:
+        """
+        Register a callback that runs after every configuration reload
+
+        Args:
+            callback: Called with the ConfigChangeEvent, e.g. to drop cached
+                models
+        """
+        if callback not in self._reload_listeners:
+            self._reload_listeners.append(callback)
+
+    def remove_reload_listener(
+        self, callback: Callable[[ConfigChangeEvent], None]
+    ) -> None:
+        """
+        Unregister a reload callback
+
+        Args:
+            callback: Previously registered callback
+        """
+        if callback in self._reload_listeners:
+            self._reload_listeners.remove(callback)
+
+    def reload(self, paths: Sequence[Path] = ()) -> ConfigChangeEvent:
+        """
+        Re-read configuration and notify reload listeners
+
+        Without paths every cached file is dropped, which also picks up
+        changed environment variables. With paths only files whose
+        modification time changed are parsed again. The new main config is
+        built completely before it replaces the current one, so readers never
+        see a partially loaded configuration.
+
+        Listener errors are logged and do not stop the other listeners.
+
+        Args:
+            paths: Changed configuration files (empty for a full reload)
+
+        Returns:
+            The published change event
+        """
+        with self._reload_lock:
+            if not paths:
+                self.loader.clear_cache()
+            self._config = self.loader.load_config()
+            self._generation += 1
+            event = ConfigChangeEvent(
+                generation=self._generation, paths=tuple(Path(p) for p in paths)
+            )
+
+        for callback in list(self._reload_listeners):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.warning(f"Configuration reload listener failed: {e}")
+        return event
+
+    def start_watching(self, interval: float = 2.0) -> ConfigWatcher:
+        """
+        Reload automatically when a configuration file changes
+
+        Args:
+            interval: Polling interval (or debounce time) in seconds
+
+        Returns:
+            The running watcher
+        """
+        if self._watcher is None:
+            self._watcher = ConfigWatcher(
+                self.loader.config_dir, self.reload, interval=interval
+            )
+        self._watcher.start()
+        return self._watcher
+
+    def stop_watching(self) -> None:
+        """Stop the configuration file watcher if it is running"""
+        if self._watcher is not None:
+            self._watcher.stop()
+            self._watcher = None
 
     @property
     def app_config(self) -> Dict[str, Any]:
@@ -0,0 +1,148 @@
+"""Tests for the mtime-keyed config cache and hot reloading."""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+import yaml
+
+from valuecell.config import loader as loader_module
+from valuecell.config.loader import ConfigLoader
+from valuecell.config.manager import ConfigManager
+from valuecell.config.watcher import ConfigChangeEvent, ConfigWatcher
+
+
+def write_yaml(path, data, bump_ns=0):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.safe_dump(data))
+    if bump_ns:
+        # Guarantee a new mtime even on coarse-grained filesystems
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump_ns))
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("APP_ENVIRONMENT", "test")
+    monkeypatch.setenv("FAKE_BASE_URL", "https://fake.example")
+    write_yaml(tmp_path / "config.yaml", {"models": {"primary_provider": "fake"}})
+    write_yaml(
+        tmp_path / "providers" / "fake.yaml",
+        {"connection": {"base_url": "${FAKE_BASE_URL}"}, "default_model": "m1"},
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    calls = []
+    safe_load = yaml.safe_load
+
+    def counting_safe_load(stream):
+        calls.append(getattr(stream, "name", None))
+        return safe_load(stream)
+
+    monkeypatch.setattr(loader_module.yaml, "safe_load", counting_safe_load)
+    return calls
+
+
+def test_unchanged_files_are_parsed_once(config_dir, parse_count):
+    loader = ConfigLoader(config_dir)
+
+    first = loader.load_provider_config("fake")
+    second = loader.load_provider_config("fake")
+
+    assert first is second
+    assert first["connection"]["base_url"] == "https://fake.example"
+    assert len(parse_count) == 1
+
+
+def test_modified_file_is_reloaded(config_dir, parse_count):
+    loader = ConfigLoader(config_dir)
+    assert loader.load_provider_config("fake")["default_model"] == "m1"
+
+    write_yaml(
+        config_dir / "providers" / "fake.yaml",
+        {"default_model": "m2"},
+        bump_ns=10_000_000,
+    )
+
+    assert loader.load_provider_config("fake")["default_model"] == "m2"
+    assert len(parse_count) == 2
+
+
+def test_new_environment_file_invalidates_main_config(config_dir):
+    loader = ConfigLoader(config_dir)
+    assert loader.load_config()["models"]["primary_provider"] == "fake"
+
+    write_yaml(config_dir / "config.test.yaml", {"models": {"primary_provider": "x"}})
+
+    assert loader.load_config()["models"]["primary_provider"] == "x"
+
+
+def test_watcher_poll_reports_changes(config_dir):
+    watcher = ConfigWatcher(config_dir, on_change=lambda paths: None)
+    assert watcher.poll() == ()
+
+    provider = config_dir / "providers" / "fake.yaml"
+    write_yaml(provider, {"default_model": "m2"}, bump_ns=10_000_000)
+    added = config_dir / "agents" / "new_agent.yaml"
+    write_yaml(added, {"name": "new_agent"})
+
+    assert watcher.poll() == tuple(sorted([provider, added]))
+
+    added.unlink()
+    assert watcher.poll() == (added,)
+    assert watcher.poll() == ()
+
+
+def test_manager_reloads_on_file_change(config_dir):
+    manager = ConfigManager(loader=ConfigLoader(config_dir))
+    events = []
+    received = threading.Event()
+
+    def listener(event):
+        events.append(event)
+        received.set()
+
+    manager.add_reload_listener(listener)
+    manager.start_watching(interval=0.05)
+    try:
+        write_yaml(
+            config_dir / "config.yaml",
+            {"models": {"primary_provider": "other"}},
+            bump_ns=10_000_000,
+        )
+        assert received.wait(5)
+    finally:
+        manager.stop_watching()
+
+    assert manager.generation == 1
+    assert events[0].paths == (config_dir / "config.yaml",)
+    assert manager._config["models"]["primary_provider"] == "other"
+
+
+def test_listener_errors_do_not_block_others(config_dir):
+    manager = ConfigManager(loader=ConfigLoader(config_dir))
+    events = []
+
+    def broken(event):
+        raise RuntimeError("boom")
+
+    manager.add_reload_listener(broken)
+    manager.add_reload_listener(events.append)
+
+    event = manager.reload()
+
+    assert events == [event]
+    assert event.generation == 1
+
+
+def test_change_event_scope():
+    event = ConfigChangeEvent(1, paths=(Path("configs/providers/google.yaml"),))
+
+    assert event.touches("providers")
+    assert not event.touches("agents")
+    # A manual reload touches everything
+    assert ConfigChangeEvent(2).touches("agents")
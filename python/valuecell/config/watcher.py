@@ -0,0 +1,188 @@
+"""
+Configuration file watcher
+
+Watches the YAML files under the configs directory and reports changes so
+configuration can be reloaded without restarting the process.
+
+Two backends are supported:
+- watchfiles (inotify/FSEvents) when the package is installed
+- Polling of file modification times otherwise
+
+Example:
+    from valuecell.config.manager import get_config_manager
+
+    manager = get_config_manager()
+    manager.add_reload_listener(lambda event: print(event.paths))
+    manager.start_watching(interval=2.0)
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of a file, None if it does not exist
+FileStamp = Optional[Tuple[int, int]]
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """
+    Get the modification stamp of a file
+
+    Args:
+        path: File path
+
+    Returns:
+        (mtime_ns, size) or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@dataclass(frozen=True)
+class ConfigChangeEvent:
+    """Published after configuration was reloaded"""
+
+    generation: int
+    # Changed files; empty for a manual full reload
+    paths: Tuple[Path, ...] = ()
+
+    def touches(self, subdir: str) -> bool:
+        """
+        Check whether the change affects a configs subdirectory
+
+        Args:
+            subdir: Subdirectory name, e.g. "providers" or "agents"
+
+        Returns:
+            True for a full reload or if any changed file lives in subdir
+        """
+        if not self.paths:
+            return True
+        return any(subdir in path.parts for path in self.paths)
+
+
+class ConfigWatcher:
+    """
+    Background watcher for configuration files
+
+    Calls ``on_change`` from the watcher thread with the sorted tuple of
+    created, modified or deleted YAML files.
+    """
+
+    def __init__(
+        self,
+        config_dir: Path,
+        on_change: Callable[[Tuple[Path, ...]], None],
+        interval: float = 2.0,
+        use_native: bool = True,
+    ):
+        """
+        Initialize the watcher
+
+        Args:
+            config_dir: Directory to watch recursively
+            on_change: Called with the changed file paths
+            interval: Polling interval in seconds
+            use_native: Use watchfiles when it is installed
+        """
+        self.config_dir = Path(config_dir)
+        self.on_change = on_change
+        self.interval = interval
+        self.use_native = use_native
+        self._stamps: Dict[Path, FileStamp] = self._scan()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _scan(self) -> Dict[Path, FileStamp]:
+        """Stamp every YAML file under the config directory"""
+        if not self.config_dir.exists():
+            return {}
+        return {path: file_stamp(path) for path in self.config_dir.rglob("*.yaml")}
+
+    def poll(self) -> Tuple[Path, ...]:
+        """
+        Compare the files against the last scan
+
+        Returns:
+            Changed file paths (empty if nothing changed)
+        """
+        stamps = self._scan()
+        changed = {
+            path
+            for path in stamps.keys() | self._stamps.keys()
+            if stamps.get(path) != self._stamps.get(path)
+        }
+        self._stamps = stamps
+        return tuple(sorted(changed))
+
+    def _notify(self, paths: Tuple[Path, ...]) -> None:
+        if not paths:
+            return
+        logger.info(f"Configuration files changed: {[str(p) for p in paths]}")
+        try:
+            self.on_change(paths)
+        except Exception as e:
+            logger.error(f"Failed to apply configuration change: {e}")
+
+    def _run_polling(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._notify(self.poll())
+
+    def _run_native(self, watch) -> None:
+        for _changes in watch(
+            self.config_dir,
+            stop_event=self._stop,
+            debounce=int(self.interval * 1000),
+        ):
+            # Re-stat instead of trusting the event list: editors often
+            # write through temporary files
+            self._notify(self.poll())
+
+    def start(self) -> None:
+        """Start watching on a daemon thread"""
+        if self.running:
+            return
+
+        target: Callable[[], None] = self._run_polling
+        backend = "polling"
+        if self.use_native:
+            try:
+                from watchfiles import watch
+            except ImportError:
+                pass
+            else:
+
+                def target() -> None:
+                    self._run_native(watch)
+
+                backend = "watchfiles"
+
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=target, name="config-watcher", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Watching {self.config_dir} for changes ({backend})")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the watcher thread
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
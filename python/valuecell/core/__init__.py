@@ -1,30 +1,58 @@
-# Conversation management
-from .agent.decorator import create_wrapped_agent
-from .agent.responses import notification, streaming
-from .conversation import (
-    Conversation,
-    ConversationManager,
-    ConversationStatus,
-    ConversationStore,
-    InMemoryConversationStore,
-)
-from .conversation.item_store import (
-    InMemoryItemStore,
-    ItemStore,
-    SQLiteItemStore,
-)
-
-# Task management
-from .task import Task, TaskManager, TaskStatus
-
-# Type system
-from .types import (
-    BaseAgent,
-    RemoteAgentResponse,
-    StreamResponse,
-    UserInput,
-    UserInputMetadata,
-)
+# The exports below are imported on first access: the agent and task modules
+# pull in agno and a2a, which would slow down every import of a core
+# submodule such as ``valuecell.core.conversation``.
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Conversation management
+    from .agent.decorator import create_wrapped_agent
+    from .agent.responses import notification, streaming
+    from .conversation import (
+        Conversation,
+        ConversationManager,
+        ConversationStatus,
+        ConversationStore,
+        InMemoryConversationStore,
+    )
+    from .conversation.item_store import (
+        InMemoryItemStore,
+        ItemStore,
+        SQLiteItemStore,
+    )
+
+    # Task management
+    from .task import Task, TaskManager, TaskStatus
+
+    # Type system
+    from .types import (
+        BaseAgent,
+        RemoteAgentResponse,
+        StreamResponse,
+        UserInput,
+        UserInputMetadata,
+    )
+
+_LAZY_EXPORTS = {
+    "Conversation": ".conversation",
+    "ConversationStatus": ".conversation",
+    "ConversationManager": ".conversation",
+    "ConversationStore": ".conversation",
+    "InMemoryConversationStore": ".conversation",
+    "ItemStore": ".conversation.item_store",
+    "InMemoryItemStore": ".conversation.item_store",
+    "SQLiteItemStore": ".conversation.item_store",
+    "Task": ".task",
+    "TaskStatus": ".task",
+    "TaskManager": ".task",
+    "UserInput": ".types",
+    "UserInputMetadata": ".types",
+    "BaseAgent": ".types",
+    "StreamResponse": ".types",
+    "RemoteAgentResponse": ".types",
+    "create_wrapped_agent": ".agent.decorator",
+    "streaming": ".agent.responses",
+    "notification": ".agent.responses",
+}
 
 __all__ = [
     # Conversation exports
@@ -52,3 +80,13 @@ __all__ = [
     "streaming",
     "notification",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,30 @@
 """Agent module initialization"""
 
-# Core agent functionality
-from .client import AgentClient
-from .connect import RemoteConnections
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import AgentClient
+    from .connect import RemoteConnections
+
+# Core agent functionality, imported on use because the clients pull in a2a
+# and httpx while submodules like ``responses`` are needed much earlier
+_LAZY_EXPORTS = {
+    "AgentClient": ".client",
+    "RemoteConnections": ".connect",
+}
 
 __all__ = [
     # Core agent exports
     "AgentClient",
     "RemoteConnections",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
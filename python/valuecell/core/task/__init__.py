@@ -1,9 +1,20 @@
 """Task module public API"""
 
-from .executor import TaskExecutor
-from .manager import TaskManager
+from typing import TYPE_CHECKING
+
 from .models import Task, TaskPattern, TaskStatus
 
+if TYPE_CHECKING:
+    from .executor import TaskExecutor
+    from .manager import TaskManager
+
+# The executor depends on the agent clients (a2a, agno); import it on use so
+# that the task models stay cheap to import
+_LAZY_EXPORTS = {
+    "TaskManager": ".manager",
+    "TaskExecutor": ".executor",
+}
+
 __all__ = [
     "Task",
     "TaskStatus",
@@ -11,3 +22,13 @@ __all__ = [
     "TaskManager",
     "TaskExecutor",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
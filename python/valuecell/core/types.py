@@ -155,7 +155,9 @@ class ComponentType(str, Enum):
     SCHEDULED_TASK_CONTROLLER = "scheduled_task_controller"
     SCHEDULED_TASK_RESULT = "scheduled_task_result"
     FILTERED_LINE_CHART = "filtered_line_chart"
+    FILTERED_LINE_CHART_DELTA = "filtered_line_chart_delta"
     FILTERED_CARD_PUSH_NOTIFICATION = "filtered_card_push_notification"
+    FILTERED_CARD_PUSH_NOTIFICATION_DELTA = "filtered_card_push_notification_delta"
 
 
 class ScheduledTaskComponentContent(BaseModel):
@@ -214,6 +216,29 @@ class FilteredLineChartComponentData(BaseModel):
     )
 
 
+class FilteredLineChartDeltaComponentData(BaseModel):
+    """Rows appended to a filtered line chart.
+    Each row replaces the chart's last row if it has the same x axis value and
+    is appended otherwise. Data format:
+    [
+        ['timestamp1', value1, value2, value3, value4],
+        ['timestamp2', value1, value2, value3, value4],
+    ]
+    """
+
+    chart_id: str = Field(
+        ..., description="The component id of the line chart the rows belong to"
+    )
+    data: str = Field(
+        ...,
+        description="The new rows, format: [['x_axis_value', value1, value2, value3, value4], ...]",
+    )
+    create_time: str = Field(
+        ...,
+        description="The delta create time, UTC time, YYYY-MM-DD HH:MM:SS format",
+    )
+
+
 class FilteredCardPushNotificationComponentData(BaseModel):
     """Filtered card push notification component data payload."""
 
@@ -228,6 +253,23 @@ class FilteredCardPushNotificationComponentData(BaseModel):
         ...,
         description="The card push notification create time, UTC time, YYYY-MM-DD HH:MM:SS format",
     )
+    notification_id: Optional[int] = Field(
+        None,
+        description="Monotonically increasing id of the notification within its session",
+    )
+
+
+class FilteredCardPushNotificationDeltaComponentData(BaseModel):
+    """Card push notifications appended to an existing notification component.
+    Notifications whose notification_id the component already holds are skipped.
+    """
+
+    card_id: str = Field(
+        ..., description="The component id of the notifications the new ones extend"
+    )
+    notifications: List[FilteredCardPushNotificationComponentData] = Field(
+        ..., description="The new notifications, oldest first"
+    )
 
 
 ResponsePayload = Union[
@@ -1,5 +1,6 @@
 """FastAPI application factory for ValueCell Server."""
 
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
@@ -7,7 +8,10 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
 from ...adapters.assets import get_adapter_manager
+from ...config.manager import get_config_manager
 from ..config.settings import get_settings
+from ..db.asset_snapshot import enrich_assets
+from ..db.connection import get_database_manager
 from .exceptions import (
     APIException,
     api_exception_handler,
@@ -36,33 +40,22 @@ def create_app() -> FastAPI:
             f"ValueCell Server starting up on {settings.API_HOST}:{settings.API_PORT}..."
         )
 
-        # Initialize and configure adapters
-        try:
-            print("Configuring data adapters...")
-            manager = get_adapter_manager()
-
-            # Configure Yahoo Finance (free, no API key required)
-            try:
-                manager.configure_yfinance()
-                print("✓ Yahoo Finance adapter configured")
-            except Exception as e:
-                print(f"✗ Yahoo Finance adapter failed: {e}")
-
-            # Configure AKShare (free, no API key required, optimized)
-            try:
-                manager.configure_akshare()
-                print("✓ AKShare adapter configured (optimized)")
-            except Exception as e:
-                print(f"✗ AKShare adapter failed: {e}")
+        # The adapters import their data libraries (yfinance, akshare, pandas),
+        # which takes seconds; configure them on a worker thread so the server
+        # accepts requests right away. Asset routes await this task first
+        app.state.adapters_ready = asyncio.create_task(
+            asyncio.to_thread(_configure_adapters)
+        )
 
-            print("Data adapters configuration completed")
-
-        except Exception as e:
-            print(f"Error configuring adapters: {e}")
+        # Apply edits to configs/ without a restart
+        if settings.CONFIG_WATCH_INTERVAL > 0:
+            get_config_manager().start_watching(settings.CONFIG_WATCH_INTERVAL)
 
         yield
         # Shutdown
         print("ValueCell Server shutting down...")
+        get_config_manager().stop_watching()
+        await get_database_manager().dispose_async()
 
     app = FastAPI(
         title="ValueCell Server API",
@@ -85,6 +78,37 @@ def create_app() -> FastAPI:
     return app
 
 
+def _configure_adapters() -> None:
+    """Configure the asset data adapters."""
+    try:
+        print("Configuring data adapters...")
+        manager = get_adapter_manager()
+
+        # Configure Yahoo Finance (free, no API key required)
+        try:
+            manager.configure_yfinance()
+            print("✓ Yahoo Finance adapter configured")
+        except Exception as e:
+            print(f"✗ Yahoo Finance adapter failed: {e}")
+
+        # Configure AKShare (free, no API key required, optimized)
+        try:
+            manager.configure_akshare()
+            print("✓ AKShare adapter configured (optimized)")
+        except Exception as e:
+            print(f"✗ AKShare adapter failed: {e}")
+
+        # Serve asset info from the database, refreshing it in the background
+        manager.enable_asset_metadata_cache()
+        # Enrich the seeded asset snapshot without delaying start-up
+        enrich_assets(manager=manager)
+
+        print("Data adapters configuration completed")
+
+    except Exception as e:
+        print(f"Error configuring adapters: {e}")
+
+
 def _add_middleware(app: FastAPI, settings) -> None:
     """Add middleware to the application."""
     # CORS middleware
@@ -1,13 +1,18 @@
 """Watchlist related API routes."""
 
+import asyncio
+import json
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from fastapi.responses import StreamingResponse
 from starlette.concurrency import run_in_threadpool
 
 from ....utils.i18n_utils import parse_and_validate_utc_dates
-from ...db.repositories.watchlist_repository import get_watchlist_repository
+from ...db.connection import run_with_session
+from ...db.repositories.watchlist_repository import WatchlistRepository
 from ...services.assets.asset_service import get_asset_service
+from ...services.assets.quote_stream import get_quote_stream_hub
 from ..schemas import (
     AddAssetRequest,
     AssetDetailData,
@@ -27,13 +32,28 @@ from ..schemas import (
 DEFAULT_USER_ID = "default_user"
 
 
+async def wait_for_adapters(request: Request) -> None:
+    """Hold asset requests until the data adapters are configured.
+
+    Adapters are configured in the background at start-up; before that the
+    adapter manager has no adapters and answers with empty results.
+    """
+    adapters_ready = getattr(request.app.state, "adapters_ready", None)
+    if adapters_ready is not None and not adapters_ready.done():
+        # Shielded: a client going away must not cancel the start-up task
+        await asyncio.shield(adapters_ready)
+
+
 def create_watchlist_router() -> APIRouter:
     """Create watchlist related routes."""
-    router = APIRouter(prefix="/watchlist", tags=["Watchlist"])
+    router = APIRouter(
+        prefix="/watchlist",
+        tags=["Watchlist"],
+        dependencies=[Depends(wait_for_adapters)],
+    )
 
     # Get dependencies
     asset_service = get_asset_service()
-    watchlist_repo = get_watchlist_repository()
 
     @router.get(
         "/asset/search",
@@ -61,8 +81,7 @@ def create_watchlist_router() -> APIRouter:
             countries_list = countries.split(",") if countries else None
 
             # Perform search using asset service
-            result = await run_in_threadpool(
-                asset_service.search_assets,
+            result = await asset_service.search_assets_async(
                 query=q,
                 asset_types=asset_types_list,
                 exchanges=exchanges_list,
@@ -108,9 +127,7 @@ def create_watchlist_router() -> APIRouter:
     ):
         """Get detailed asset information."""
         try:
-            result = await run_in_threadpool(
-                asset_service.get_asset_info, ticker, language=language
-            )
+            result = await asset_service.get_asset_info_async(ticker, language=language)
 
             if not result.get("success", False):
                 if "not found" in result.get("error", "").lower():
@@ -149,8 +166,8 @@ def create_watchlist_router() -> APIRouter:
     ):
         """Get current asset price."""
         try:
-            result = await run_in_threadpool(
-                asset_service.get_asset_price, ticker, language=language
+            result = await asset_service.get_asset_price_async(
+                ticker, language=language
             )
 
             if not result.get("success", False):
@@ -186,7 +203,12 @@ def create_watchlist_router() -> APIRouter:
     async def get_watchlists():
         """Get all watchlists for the default user."""
         try:
-            watchlists = watchlist_repo.get_user_watchlists(DEFAULT_USER_ID)
+            watchlists = await run_with_session(
+                lambda session: WatchlistRepository(session).get_user_watchlists(
+                    DEFAULT_USER_ID
+                ),
+                read_only=True,
+            )
 
             watchlist_data = []
             for watchlist in watchlists:
@@ -215,6 +237,61 @@ def create_watchlist_router() -> APIRouter:
                 status_code=500, detail=f"Failed to get watchlists: {str(e)}"
             )
 
+    @router.get(
+        "/quotes/stream",
+        summary="Stream watchlist quotes",
+        description=(
+            "Stream quote updates for a watchlist or explicit tickers as "
+            "Server-Sent Events. Only changed quote fields are pushed."
+        ),
+    )
+    async def stream_watchlist_quotes(
+        request: Request,
+        tickers: Optional[str] = Query(
+            None, description="Comma-separated tickers, defaults to the watchlist"
+        ),
+        watchlist_name: Optional[str] = Query(
+            None, description="Watchlist name, defaults to the default watchlist"
+        ),
+        heartbeat: float = Query(
+            15.0, description="Keep-alive interval in seconds", ge=1, le=60
+        ),
+    ):
+        """Stream quote deltas of watchlist assets."""
+        if tickers:
+            ticker_list = [t.strip() for t in tickers.split(",") if t.strip()]
+        else:
+            ticker_list = await run_in_threadpool(
+                asset_service.get_watchlist_tickers, DEFAULT_USER_ID, watchlist_name
+            )
+            if ticker_list is None:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"Watchlist '{watchlist_name or 'default'}' not found",
+                )
+
+        async def generate_stream():
+            """Generate SSE formatted quote deltas."""
+            # Subscribe only once the body is streamed: a client gone before
+            # that never runs this generator, and nothing would close it
+            async with get_quote_stream_hub().subscribe(ticker_list) as subscription:
+                while not await request.is_disconnected():
+                    deltas = await subscription.next_deltas(timeout=heartbeat)
+                    if deltas:
+                        yield f"data: {json.dumps({'quotes': deltas})}\n\n"
+                    else:
+                        # Comment line keeps proxies from closing the stream
+                        yield ": keep-alive\n\n"
+
+        return StreamingResponse(
+            generate_stream(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "Connection": "keep-alive",
+            },
+        )
+
     @router.get(
         "/{watchlist_name}",
         response_model=SuccessResponse[WatchlistData],
@@ -231,8 +308,7 @@ def create_watchlist_router() -> APIRouter:
         """Get a specific watchlist."""
         try:
             # Use asset service to get watchlist with prices
-            result = await run_in_threadpool(
-                asset_service.get_watchlist,
+            result = await asset_service.get_watchlist_async(
                 user_id=DEFAULT_USER_ID,
                 watchlist_name=watchlist_name,
                 include_prices=include_prices,
@@ -312,12 +388,14 @@ def create_watchlist_router() -> APIRouter:
     ):
         """Create a new watchlist."""
         try:
-            watchlist = watchlist_repo.create_watchlist(
-                user_id=DEFAULT_USER_ID,
-                name=request.name,
-                description=request.description or "",
-                is_default=request.is_default,
-                is_public=request.is_public,
+            watchlist = await run_with_session(
+                lambda session: WatchlistRepository(session).create_watchlist(
+                    user_id=DEFAULT_USER_ID,
+                    name=request.name,
+                    description=request.description or "",
+                    is_default=request.is_default,
+                    is_public=request.is_public,
+                )
             )
 
             if not watchlist:
@@ -342,6 +420,48 @@ def create_watchlist_router() -> APIRouter:
                 status_code=500, detail=f"Failed to create watchlist: {str(e)}"
             )
 
+    @router.post(
+        "/{watchlist_name}/refresh",
+        response_model=SuccessResponse[dict],
+        summary="Refresh watchlist asset info",
+        description="Refresh cached asset info of all assets in a watchlist in the background",
+    )
+    async def refresh_watchlist_assets(
+        watchlist_name: str = Path(..., description="Watchlist name"),
+        force: bool = Query(False, description="Also refresh fresh asset info"),
+    ):
+        """Schedule a refresh of a watchlist's asset info."""
+        try:
+            result = await run_in_threadpool(
+                asset_service.refresh_watchlist_assets,
+                user_id=DEFAULT_USER_ID,
+                watchlist_name=watchlist_name,
+                force=force,
+            )
+
+            if not result.get("success", False):
+                if "not found" in result.get("error", "").lower():
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"Watchlist '{watchlist_name}' not found",
+                    )
+                raise HTTPException(
+                    status_code=500,
+                    detail=result.get("error", "Failed to refresh watchlist"),
+                )
+
+            return SuccessResponse.create(
+                data={"watchlist_name": watchlist_name, "tickers": result["tickers"]},
+                msg="Asset info refresh scheduled",
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Failed to refresh watchlist: {str(e)}"
+            )
+
     @router.post(
         "/asset",
         response_model=SuccessResponse[dict],
@@ -351,12 +471,14 @@ def create_watchlist_router() -> APIRouter:
     async def add_asset_to_watchlist(request: AddAssetRequest):
         """Add a asset to a watchlist."""
         try:
-            success = watchlist_repo.add_asset_to_watchlist(
-                user_id=DEFAULT_USER_ID,
-                ticker=request.ticker,
-                watchlist_name=request.watchlist_name,
-                display_name=request.display_name,
-                notes=request.notes or "",
+            success = await run_with_session(
+                lambda session: WatchlistRepository(session).add_asset_to_watchlist(
+                    user_id=DEFAULT_USER_ID,
+                    ticker=request.ticker,
+                    watchlist_name=request.watchlist_name,
+                    display_name=request.display_name,
+                    notes=request.notes or "",
+                )
             )
 
             if not success:
@@ -395,8 +517,14 @@ def create_watchlist_router() -> APIRouter:
     ):
         """Remove a asset from a watchlist."""
         try:
-            success = watchlist_repo.remove_asset_from_watchlist(
-                user_id=DEFAULT_USER_ID, ticker=ticker, watchlist_name=watchlist_name
+            success = await run_with_session(
+                lambda session: WatchlistRepository(
+                    session
+                ).remove_asset_from_watchlist(
+                    user_id=DEFAULT_USER_ID,
+                    ticker=ticker,
+                    watchlist_name=watchlist_name,
+                )
             )
 
             if not success:
@@ -431,8 +559,11 @@ def create_watchlist_router() -> APIRouter:
     ):
         """Delete a watchlist."""
         try:
-            success = watchlist_repo.delete_watchlist(
-                user_id=DEFAULT_USER_ID, watchlist_name=watchlist_name
+            success = await run_with_session(
+                lambda session: WatchlistRepository(session).delete_watchlist(
+                    user_id=DEFAULT_USER_ID,
+                    watchlist_name=watchlist_name,
+                )
             )
 
             if not success:
@@ -468,11 +599,13 @@ def create_watchlist_router() -> APIRouter:
     ):
         """Update notes for a asset in a watchlist."""
         try:
-            success = watchlist_repo.update_asset_notes(
-                user_id=DEFAULT_USER_ID,
-                ticker=ticker,
-                notes=request.notes,
-                watchlist_name=watchlist_name,
+            success = await run_with_session(
+                lambda session: WatchlistRepository(session).update_asset_notes(
+                    user_id=DEFAULT_USER_ID,
+                    ticker=ticker,
+                    notes=request.notes,
+                    watchlist_name=watchlist_name,
+                )
             )
 
             if not success:
@@ -524,8 +657,7 @@ def create_watchlist_router() -> APIRouter:
             start_dt, end_dt = parse_and_validate_utc_dates(start_date, end_date)
 
             # Get historical price data
-            result = await run_in_threadpool(
-                asset_service.get_historical_prices,
+            result = await asset_service.get_historical_prices_async(
                 ticker,
                 start_dt,
                 end_dt,
@@ -0,0 +1,50 @@
+"""Start-up regression tests for the FastAPI app factory."""
+
+from valuecell.server.startup_profile import (
+    HEAVY_MODULES,
+    StartupProfile,
+    parse_importtime,
+    profile_startup,
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   json.decoder
+2025-03-05 12:00:00 - valuecell - INFO - unrelated log line
+import time:       300 |        420 | json
+import time:     15000 |      15000 |     pandas.core
+"""
+
+
+def test_parse_importtime():
+    timings = parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [t.module for t in timings] == ["json.decoder", "json", "pandas.core"]
+    assert [t.depth for t in timings] == [1, 0, 2]
+    assert timings[1].self_us == 300
+    assert timings[1].cumulative_us == 420
+
+
+def test_heavy_modules_match_packages_only():
+    profile = StartupProfile(
+        target="app:create_app",
+        import_ms=1.0,
+        wall_ms=1.0,
+        modules=["pandas", "pandas.core", "pandasql", "valuecell.core.types"],
+        imports=parse_importtime(IMPORTTIME_OUTPUT),
+    )
+
+    assert profile.heavy_modules() == ["pandas", "pandas.core"]
+    assert profile.slowest(1)[0].module == "pandas.core"
+
+
+def test_create_app_import_set():
+    # No model API keys: creating the app must not build any model
+    profile = profile_startup(
+        env={"OPENROUTER_API_KEY": "", "GOOGLE_API_KEY": "", "SILICONFLOW_API_KEY": ""}
+    )
+
+    assert profile.heavy_modules(HEAVY_MODULES) == []
+    assert "fastapi" in profile.modules
+    assert profile.imports
+    assert profile.wall_ms >= profile.import_ms > 0
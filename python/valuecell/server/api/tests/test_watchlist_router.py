@@ -0,0 +1,66 @@
+"""Tests for the watchlist router."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from valuecell.server.api.routers import watchlist
+from valuecell.server.api.routers.watchlist import wait_for_adapters
+from valuecell.server.services.assets.quote_stream import QuoteStreamHub
+
+
+def make_request(adapters_ready=None):
+    state = SimpleNamespace()
+    if adapters_ready is not None:
+        state.adapters_ready = adapters_ready
+    return SimpleNamespace(app=SimpleNamespace(state=state))
+
+
+@pytest.mark.asyncio
+async def test_asset_requests_wait_for_adapters():
+    ready = asyncio.get_running_loop().create_future()
+    waiter = asyncio.create_task(wait_for_adapters(make_request(ready)))
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    ready.set_result(None)
+    await asyncio.wait_for(waiter, 1)
+
+    # Without a start-up task (e.g. the router mounted alone) nothing waits
+    await asyncio.wait_for(wait_for_adapters(make_request()), 1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_does_not_cancel_start_up():
+    ready = asyncio.get_running_loop().create_future()
+    waiter = asyncio.create_task(wait_for_adapters(make_request(ready)))
+    await asyncio.sleep(0.01)
+
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert not ready.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_quote_stream_subscribes_only_when_streamed(monkeypatch):
+    hub = QuoteStreamHub(fetch_prices=lambda tickers: asyncio.sleep(0, {}))
+    monkeypatch.setattr(watchlist, "get_quote_stream_hub", lambda: hub)
+    [route] = [
+        route
+        for route in watchlist.create_watchlist_router().routes
+        if route.path == "/watchlist/quotes/stream"
+    ]
+    request = SimpleNamespace(is_disconnected=lambda: asyncio.sleep(0, True))
+
+    # A client gone before the body starts leaves nothing subscribed
+    response = await route.endpoint(
+        request=request, tickers="NASDAQ:AAPL", watchlist_name=None, heartbeat=15.0
+    )
+    assert hub.tickers == []
+
+    # Streaming subscribes and unsubscribes when the client leaves
+    async for _ in response.body_iterator:
+        pass
+    assert hub.tickers == []
+    hub.close()
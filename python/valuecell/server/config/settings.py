@@ -43,6 +43,14 @@ class Settings:
 
         # Database Configuration
         self.DATABASE_URL = os.getenv("VALUECELL_SQLITE_DB", _default_db_path())
+        # Milliseconds SQLite waits for a lock before failing with "database is locked"
+        self.DB_BUSY_TIMEOUT_MS = int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000"))
+        # Read-only connections of the async engine; writes use one connection
+        self.DB_READER_POOL_SIZE = int(os.getenv("DB_READER_POOL_SIZE", "4"))
+
+        # Seconds between checks for changed files in configs/; 0 disables
+        # hot reloading of provider, agent and model configuration
+        self.CONFIG_WATCH_INTERVAL = float(os.getenv("CONFIG_WATCH_INTERVAL", "2"))
 
         # File Paths
         self.BASE_DIR = Path(__file__).parent.parent.parent
@@ -54,7 +62,11 @@ class Settings:
 
     def get_database_config(self) -> dict:
         """Get database configuration."""
-        return {"url": self.DATABASE_URL}
+        return {
+            "url": self.DATABASE_URL,
+            "busy_timeout_ms": self.DB_BUSY_TIMEOUT_MS,
+            "reader_pool_size": self.DB_READER_POOL_SIZE,
+        }
 
     def update_language(self, language: str) -> None:
         """Update current language setting.
@@ -2,8 +2,11 @@
 
 from .connection import (
     DatabaseManager,
+    get_async_db,
+    get_async_read_db,
     get_database_manager,
     get_db,
+    run_with_session,
 )
 from .init_db import DatabaseInitializer, init_database
 from .models import Agent, Asset, Base
@@ -13,6 +16,9 @@ __all__ = [
     "DatabaseManager",
     "get_database_manager",
     "get_db",
+    "get_async_db",
+    "get_async_read_db",
+    "run_with_session",
     # Database initialization
     "DatabaseInitializer",
     "init_database",
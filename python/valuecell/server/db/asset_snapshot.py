@@ -0,0 +1,93 @@
+"""Offline asset snapshot used to seed the ``assets`` table.
+
+The default asset universe ships with the package as a JSON snapshot, so a
+fresh database is seeded without network access in a single batched
+upsert. Richer info is fetched from the data adapters afterwards, in the
+background, by the adapter manager's asset metadata cache.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ASSET_SNAPSHOT_PATH = Path(__file__).parent / "data" / "asset_snapshot.json"
+
+
+def load_asset_snapshot(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Load asset records from a snapshot file.
+
+    Args:
+        path: Snapshot file, defaults to the bundled one
+
+    Returns:
+        Asset fields as accepted by ``AssetRepository.bulk_upsert_assets``,
+        empty if the file cannot be read
+    """
+    path = Path(path or ASSET_SNAPSHOT_PATH)
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not load asset snapshot {path}: {e}")
+        return []
+
+    assets = []
+    for entry in snapshot.get("assets", []):
+        symbol = entry.get("symbol")
+        if not symbol or ":" not in symbol or not entry.get("name"):
+            logger.warning(f"Skipping invalid asset snapshot entry: {entry}")
+            continue
+        assets.append(
+            {
+                "symbol": symbol,
+                "name": entry["name"],
+                "asset_type": entry.get("asset_type", "stock"),
+                "description": entry.get("description"),
+                "sector": entry.get("sector"),
+                "is_active": entry.get("is_active", True),
+                "asset_metadata": {
+                    **entry.get("metadata", {}),
+                    "source": "snapshot",
+                    "snapshot_version": snapshot.get("version"),
+                },
+            }
+        )
+    return assets
+
+
+def snapshot_tickers(path: Optional[Path] = None) -> List[str]:
+    """Get the tickers of a snapshot file."""
+    return [asset["symbol"] for asset in load_asset_snapshot(path)]
+
+
+def enrich_assets(
+    tickers: Optional[Iterable[str]] = None, manager=None, wait: bool = False
+) -> int:
+    """Refresh seeded assets from the data adapters.
+
+    Only tickers that were never fetched, or whose info is stale, are
+    fetched; concurrently and at background priority.
+
+    Args:
+        tickers: Tickers to refresh, defaults to the bundled snapshot
+        manager: Adapter manager, defaults to the global one
+        wait: Block until done instead of refreshing on a background thread
+
+    Returns:
+        Number of tickers refreshed, 0 when not waiting
+    """
+    if manager is None:
+        from ...adapters.assets import get_adapter_manager
+
+        manager = get_adapter_manager()
+
+    cache = manager.metadata_cache or manager.enable_asset_metadata_cache()
+    tickers = list(tickers) if tickers is not None else snapshot_tickers()
+
+    if wait:
+        return cache.refresh_many(tickers)
+    cache.refresh_in_background(tickers)
+    return 0
@@ -1,53 +1,202 @@
-"""Database connection and session management for ValueCell Server."""
+"""Database connection and session management for ValueCell Server.
 
-from typing import Generator
+SQLite databases are opened in WAL mode with a busy timeout, so readers do
+not block the writer and concurrent writers wait for the lock instead of
+failing right away.
 
-from sqlalchemy import Engine, create_engine
+Besides the synchronous engine used by the repositories, an async engine
+(``sqlite+aiosqlite``) serves async request handlers without blocking the
+event loop. It has a pool of read-only connections for queries and a single
+connection for writes, SQLite's one-writer model. Existing synchronous
+repositories run unchanged on async sessions through ``run_with_session``.
+"""
+
+from typing import AsyncGenerator, Callable, Generator, Optional, TypeVar
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from ..config.settings import get_settings
 from .models.base import Base
 
+T = TypeVar("T")
+
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_READER_POOL_SIZE = 4
+
+
+def is_sqlite_url(url: str) -> bool:
+    """Check whether a database URL points to SQLite."""
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def is_memory_sqlite_url(url: str) -> bool:
+    """Check whether a database URL is an in-memory SQLite database."""
+    database = make_url(url).database
+    return is_sqlite_url(url) and database in (None, "", ":memory:")
+
+
+def to_async_url(url: str) -> str:
+    """Convert a synchronous database URL to its async driver variant.
+
+    Args:
+        url: Database URL, e.g. ``sqlite:///valuecell.db``
+
+    Returns:
+        URL using an async driver, e.g. ``sqlite+aiosqlite:///valuecell.db``
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.get_driver_name() in (
+        "pysqlite",
+        "",
+    ):
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+def configure_sqlite_connection(
+    engine: Engine,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    read_only: bool = False,
+) -> None:
+    """Apply SQLite pragmas to every new connection of an engine.
+
+    Args:
+        engine: Synchronous engine, or ``AsyncEngine.sync_engine``
+        busy_timeout_ms: Milliseconds to wait for a lock
+        read_only: Reject writes on these connections
+    """
+    in_memory = is_memory_sqlite_url(str(engine.url))
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            if not in_memory:
+                # WAL lets readers run concurrently with the single writer
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
 
 class DatabaseManager:
     """Database connection and session manager."""
 
-    def __init__(self):
-        """Initialize database manager."""
+    def __init__(self, database_url: Optional[str] = None):
+        """Initialize database manager.
+
+        Args:
+            database_url: Database URL; defaults to the configured one
+        """
         self.settings = get_settings()
+        database_config = self.settings.get_database_config()
+        self.database_url = database_url or database_config["url"]
+        self.busy_timeout_ms = database_config.get(
+            "busy_timeout_ms", DEFAULT_BUSY_TIMEOUT_MS
+        )
+        self.reader_pool_size = database_config.get(
+            "reader_pool_size", DEFAULT_READER_POOL_SIZE
+        )
+
         self.engine: Engine = None
         self.SessionLocal = None
+        self._async_engine: Optional[AsyncEngine] = None
+        self._async_read_engine: Optional[AsyncEngine] = None
+        self._async_sessionmaker: Optional[async_sessionmaker] = None
+        self._async_read_sessionmaker: Optional[async_sessionmaker] = None
         self._initialize_engine()
 
     def _initialize_engine(self) -> None:
         """Initialize database engine."""
-        database_config = self.settings.get_database_config()
+        url = self.database_url
 
-        # SQLite specific configuration
-        connect_args = {}
-        if database_config["url"].startswith("sqlite"):
-            connect_args = {
+        kwargs = {}
+        if is_sqlite_url(url):
+            kwargs["connect_args"] = {
                 "check_same_thread": False,
-                "timeout": 20,
+                "timeout": self.busy_timeout_ms / 1000,
             }
+            # An in-memory database only exists within its one connection
+            if is_memory_sqlite_url(url):
+                kwargs["poolclass"] = StaticPool
 
-        self.engine = create_engine(
-            database_config["url"],
-            connect_args=connect_args,
-            poolclass=StaticPool
-            if database_config["url"].startswith("sqlite")
-            else None,
-        )
+        self.engine = create_engine(url, **kwargs)
+        if is_sqlite_url(url):
+            configure_sqlite_connection(self.engine, self.busy_timeout_ms)
 
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
 
+    def _create_async_engine(self, read_only: bool) -> AsyncEngine:
+        url = to_async_url(self.database_url)
+        kwargs = {}
+        if is_sqlite_url(url):
+            if is_memory_sqlite_url(url):
+                kwargs["poolclass"] = StaticPool
+            else:
+                kwargs["pool_size"] = self.reader_pool_size if read_only else 1
+                kwargs["max_overflow"] = 0
+
+        engine = create_async_engine(url, **kwargs)
+        if is_sqlite_url(url):
+            configure_sqlite_connection(
+                engine.sync_engine, self.busy_timeout_ms, read_only=read_only
+            )
+        return engine
+
     def get_engine(self) -> Engine:
         """Get database engine."""
         return self.engine
 
+    def get_async_engine(self, read_only: bool = False) -> AsyncEngine:
+        """Get the async engine, created on first use.
+
+        Args:
+            read_only: Get the engine of the read-only connection pool.
+                In-memory databases share one engine for reads and writes.
+
+        Returns:
+            Async engine
+        """
+        if self._async_engine is None:
+            self._async_engine = self._create_async_engine(read_only=False)
+        if not read_only or is_memory_sqlite_url(self.database_url):
+            return self._async_engine
+
+        if self._async_read_engine is None:
+            self._async_read_engine = self._create_async_engine(read_only=True)
+        return self._async_read_engine
+
+    def get_async_sessionmaker(self, read_only: bool = False) -> async_sessionmaker:
+        """Get the async session factory for writes or read-only queries."""
+        if read_only:
+            if self._async_read_sessionmaker is None:
+                self._async_read_sessionmaker = async_sessionmaker(
+                    self.get_async_engine(read_only=True),
+                    autoflush=False,
+                    expire_on_commit=False,
+                )
+            return self._async_read_sessionmaker
+
+        if self._async_sessionmaker is None:
+            self._async_sessionmaker = async_sessionmaker(
+                self.get_async_engine(), autoflush=False, expire_on_commit=False
+            )
+        return self._async_sessionmaker
+
     def create_tables(self) -> None:
         """Create all tables defined in models."""
         Base.metadata.create_all(bind=self.engine)
@@ -68,6 +217,43 @@ class DatabaseManager:
         finally:
             db.close()
 
+    async def get_async_db_session(
+        self, read_only: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        """Get async database session for dependency injection."""
+        async with self.get_async_sessionmaker(read_only)() as session:
+            yield session
+
+    async def run_with_session(
+        self, fn: Callable[[Session], T], read_only: bool = False
+    ) -> T:
+        """Run synchronous session code on an async connection.
+
+        This is the migration path for the existing repositories: they keep
+        their synchronous code but do their I/O without blocking the event
+        loop, e.g.
+        ``await run_with_session(lambda s: WatchlistRepository(s).get_user_watchlists(user_id))``.
+
+        Args:
+            fn: Callable receiving a synchronous Session
+            read_only: Use a connection of the read-only pool
+
+        Returns:
+            The callable's result
+        """
+        async with self.get_async_sessionmaker(read_only)() as session:
+            return await session.run_sync(fn)
+
+    async def dispose_async(self) -> None:
+        """Close all connections of the async engines."""
+        for engine in (self._async_engine, self._async_read_engine):
+            if engine is not None:
+                await engine.dispose()
+        self._async_engine = None
+        self._async_read_engine = None
+        self._async_sessionmaker = None
+        self._async_read_sessionmaker = None
+
 
 # Global database manager instance
 _db_manager: DatabaseManager = None
@@ -87,6 +273,23 @@ def get_db() -> Generator[Session, None, None]:
     yield from db_manager.get_db_session()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session for FastAPI dependency injection."""
+    async for session in get_database_manager().get_async_db_session():
+        yield session
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only async database session for FastAPI dependency injection."""
+    async for session in get_database_manager().get_async_db_session(read_only=True):
+        yield session
+
+
+async def run_with_session(fn: Callable[[Session], T], read_only: bool = False) -> T:
+    """Run synchronous session code on the global async engine."""
+    return await get_database_manager().run_with_session(fn, read_only=read_only)
+
+
 def get_engine() -> Engine:
     """Get database engine."""
     return get_database_manager().get_engine()
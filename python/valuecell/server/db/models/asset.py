@@ -81,6 +81,11 @@ class Asset(Base):
     )
 
     # Timestamps
+    refreshed_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When asset info was last fetched from the data adapters",
+    )
     created_at = Column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
@@ -107,6 +112,9 @@ class Asset(Base):
             "is_active": self.is_active,
             "metadata": self.asset_metadata,
             "config": self.config,
+            "refreshed_at": self.refreshed_at.isoformat()
+            if self.refreshed_at
+            else None,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
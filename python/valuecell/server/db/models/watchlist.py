@@ -74,7 +74,10 @@ class Watchlist(Base):
 
     # Relationships
     items = relationship(
-        "WatchlistItem", back_populates="watchlist", cascade="all, delete-orphan"
+        "WatchlistItem",
+        back_populates="watchlist",
+        cascade="all, delete-orphan",
+        order_by="WatchlistItem.order_index",
     )
 
     # Unique constraint for user_id + name
@@ -7,6 +7,8 @@ from .asset_repository import (
 )
 from .user_profile_repository import UserProfileRepository
 from .watchlist_repository import (
+    WatchlistDTO,
+    WatchlistItemDTO,
     WatchlistRepository,
     get_watchlist_repository,
     reset_watchlist_repository,
@@ -17,6 +19,8 @@ __all__ = [
     "get_asset_repository",
     "reset_asset_repository",
     "UserProfileRepository",
+    "WatchlistDTO",
+    "WatchlistItemDTO",
     "WatchlistRepository",
     "get_watchlist_repository",
     "reset_watchlist_repository",
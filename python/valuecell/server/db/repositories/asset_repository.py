@@ -4,10 +4,13 @@ ValueCell Server - Asset Repository
 This module provides database operations for asset management.
 """
 
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 
 from ..connection import get_database_manager
 from ..models.asset import Asset
@@ -112,6 +115,33 @@ class AssetRepository:
             if not self.db_session:
                 session.close()
 
+    def get_assets_by_symbols(self, symbols: List[str]) -> List[Asset]:
+        """Get assets by a list of symbols in a single query.
+
+        Args:
+            symbols: Asset symbols/tickers
+
+        Returns:
+            List of Asset objects found (missing symbols are skipped)
+        """
+        if not symbols:
+            return []
+
+        session = self._get_session()
+
+        try:
+            assets = session.query(Asset).filter(Asset.symbol.in_(symbols)).all()
+
+            # Expunge all assets to avoid session issues
+            for asset in assets:
+                session.expunge(asset)
+
+            return assets
+
+        finally:
+            if not self.db_session:
+                session.close()
+
     def get_asset_by_id(self, asset_id: int) -> Optional[Asset]:
         """Get asset by ID.
 
@@ -171,6 +201,40 @@ class AssetRepository:
             if not self.db_session:
                 session.close()
 
+    def get_assets_updated_since(
+        self, since: Optional[datetime] = None, is_active: Optional[bool] = True
+    ) -> List[Asset]:
+        """Get assets created or updated at or after a point in time.
+
+        Args:
+            since: Lower bound for ``updated_at`` (None for all assets)
+            is_active: Filter by active status (None for all)
+
+        Returns:
+            List of Asset objects ordered by ``updated_at``
+        """
+        session = self._get_session()
+
+        try:
+            query = session.query(Asset)
+
+            if since is not None:
+                query = query.filter(Asset.updated_at >= since)
+            if is_active is not None:
+                query = query.filter(Asset.is_active == is_active)
+
+            assets = query.order_by(Asset.updated_at).all()
+
+            # Expunge all assets to avoid session issues
+            for asset in assets:
+                session.expunge(asset)
+
+            return assets
+
+        finally:
+            if not self.db_session:
+                session.close()
+
     def update_asset(
         self,
         symbol: str,
@@ -260,8 +324,9 @@ class AssetRepository:
             if not asset:
                 return None
 
-            # Merge metadata
-            existing_metadata = asset.asset_metadata or {}
+            # Merge metadata into a copy; in-place changes of JSON columns
+            # are not detected
+            existing_metadata = dict(asset.asset_metadata or {})
             existing_metadata.update(metadata_updates)
             asset.asset_metadata = existing_metadata
 
@@ -339,6 +404,7 @@ class AssetRepository:
         is_active: bool = True,
         asset_metadata: Optional[dict] = None,
         config: Optional[dict] = None,
+        refreshed_at: Optional[datetime] = None,
     ) -> Optional[Asset]:
         """Create or update an asset by symbol.
 
@@ -355,6 +421,7 @@ class AssetRepository:
             is_active: Whether the asset is active
             asset_metadata: Additional metadata
             config: Asset-specific configuration parameters
+            refreshed_at: When the data was fetched from the data adapters
 
         Returns:
             Created or updated Asset object or None if operation fails
@@ -380,6 +447,8 @@ class AssetRepository:
                     asset.asset_metadata = asset_metadata
                 if config is not None:
                     asset.config = config
+                if refreshed_at is not None:
+                    asset.refreshed_at = refreshed_at
             else:
                 # Create new asset
                 asset = Asset(
@@ -392,6 +461,7 @@ class AssetRepository:
                     is_active=is_active,
                     asset_metadata=asset_metadata,
                     config=config,
+                    refreshed_at=refreshed_at,
                 )
                 session.add(asset)
 
@@ -410,6 +480,78 @@ class AssetRepository:
             if not self.db_session:
                 session.close()
 
+    def bulk_upsert_assets(
+        self, assets: List[Dict[str, Any]], overwrite_refreshed: bool = False
+    ) -> Optional[int]:
+        """Create or update many assets with one ``INSERT ... ON CONFLICT``.
+
+        The rows are sent as a single batched statement in one transaction,
+        instead of a query and commit per asset.
+
+        Args:
+            assets: Asset fields as accepted by ``upsert_asset`` (symbol,
+                name, asset_type, description, sector, is_active,
+                asset_metadata, config)
+            overwrite_refreshed: Also overwrite assets whose info was already
+                fetched from the data adapters (``refreshed_at`` is set)
+
+        Returns:
+            Number of assets written, or None if the operation fails
+        """
+        if not assets:
+            return 0
+
+        rows = [
+            {
+                "symbol": asset["symbol"],
+                "name": asset["name"],
+                "asset_type": asset["asset_type"],
+                "description": asset.get("description"),
+                "sector": asset.get("sector"),
+                "is_active": asset.get("is_active", True),
+                "asset_metadata": asset.get("asset_metadata"),
+                "config": asset.get("config"),
+            }
+            for asset in assets
+        ]
+
+        session = self._get_session()
+
+        try:
+            dialect = session.get_bind().dialect.name
+            if dialect == "sqlite":
+                insert = sqlite.insert
+            elif dialect == "postgresql":
+                insert = postgresql.insert
+            else:
+                raise NotImplementedError(f"Bulk upsert not supported on {dialect}")
+
+            # Core insert: ORM bulk inserts split rows by their None fields
+            stmt = insert(Asset.__table__)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Asset.symbol],
+                set_={
+                    **{
+                        column: stmt.excluded[column]
+                        for column in rows[0]
+                        if column != "symbol"
+                    },
+                    "updated_at": func.now(),
+                },
+                # Keep info fetched from the adapters, it is newer
+                where=None if overwrite_refreshed else Asset.refreshed_at.is_(None),
+            )
+            session.execute(stmt, rows)
+            session.commit()
+            return len(rows)
+
+        except Exception:
+            session.rollback()
+            return None
+        finally:
+            if not self.db_session:
+                session.close()
+
 
 # Global repository instance
 _asset_repository: Optional[AssetRepository] = None
@@ -2,18 +2,155 @@
 ValueCell Server - Watchlist Repository
 
 This module provides database operations for watchlist management.
+
+Reads eager-load watchlist items in the same round-trip and return plain
+DTOs, so callers never trigger lazy loads on detached ORM objects. Writes
+resolve the watchlist inside the statement that modifies it wherever
+possible.
 """
 
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
 
-from sqlalchemy import asc, desc
+from sqlalchemy import and_, asc, case, delete, desc, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from ..connection import get_database_manager
 from ..models.asset import Asset
 from ..models.watchlist import Watchlist, WatchlistItem
 
+DEFAULT_WATCHLIST_NAME = "My Watchlist"
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+@dataclass
+class WatchlistItemDTO:
+    """Detached watchlist item."""
+
+    id: int
+    watchlist_id: int
+    ticker: str
+    display_name: Optional[str]
+    notes: Optional[str]
+    order_index: int
+    added_at: Optional[datetime]
+    updated_at: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, item: WatchlistItem) -> "WatchlistItemDTO":
+        """Copy a loaded WatchlistItem row."""
+        return cls(
+            id=item.id,
+            watchlist_id=item.watchlist_id,
+            ticker=item.ticker,
+            display_name=item.display_name,
+            notes=item.notes,
+            order_index=item.order_index,
+            added_at=item.added_at,
+            updated_at=item.updated_at,
+        )
+
+    @property
+    def exchange(self) -> str:
+        """Extract exchange from ticker format 'EXCHANGE:SYMBOL'."""
+        return self.ticker.split(":")[0] if ":" in self.ticker else ""
+
+    @property
+    def symbol(self) -> str:
+        """Extract symbol from ticker format 'EXCHANGE:SYMBOL'."""
+        return self.ticker.split(":")[1] if ":" in self.ticker else self.ticker
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert watchlist item to dictionary representation."""
+        return {
+            "id": self.id,
+            "watchlist_id": self.watchlist_id,
+            "ticker": self.ticker,
+            "display_name": self.display_name,
+            "notes": self.notes,
+            "order_index": self.order_index,
+            "added_at": _isoformat(self.added_at),
+            "updated_at": _isoformat(self.updated_at),
+        }
+
+
+@dataclass
+class WatchlistDTO:
+    """Detached watchlist with its items in display order."""
+
+    id: int
+    user_id: str
+    name: str
+    description: Optional[str]
+    is_default: bool
+    is_public: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    items: List[WatchlistItemDTO] = field(default_factory=list)
+
+    @classmethod
+    def from_model(
+        cls, watchlist: Watchlist, include_items: bool = True
+    ) -> "WatchlistDTO":
+        """Copy a Watchlist row, with items if they were eager-loaded."""
+        items = (
+            [WatchlistItemDTO.from_model(item) for item in watchlist.items]
+            if include_items
+            else []
+        )
+        return cls(
+            id=watchlist.id,
+            user_id=watchlist.user_id,
+            name=watchlist.name,
+            description=watchlist.description,
+            is_default=watchlist.is_default,
+            is_public=watchlist.is_public,
+            created_at=watchlist.created_at,
+            updated_at=watchlist.updated_at,
+            items=sorted(items, key=lambda item: item.order_index),
+        )
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tickers in display order."""
+        return [item.ticker for item in self.items]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert watchlist to dictionary representation."""
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "name": self.name,
+            "description": self.description,
+            "is_default": self.is_default,
+            "is_public": self.is_public,
+            "created_at": _isoformat(self.created_at),
+            "updated_at": _isoformat(self.updated_at),
+            "items_count": len(self.items),
+        }
+
+
+def _watchlist_filter(user_id: str, watchlist_name: Optional[str]):
+    """Filter selecting a named watchlist, or the user's default one."""
+    if watchlist_name:
+        return and_(Watchlist.user_id == user_id, Watchlist.name == watchlist_name)
+    return and_(Watchlist.user_id == user_id, Watchlist.is_default)
+
+
+def _watchlist_id_subquery(user_id: str, watchlist_name: Optional[str]):
+    """Scalar subquery of a watchlist's ID, for single-statement writes."""
+    return (
+        select(Watchlist.id)
+        .where(_watchlist_filter(user_id, watchlist_name))
+        .limit(1)
+        .scalar_subquery()
+    )
+
 
 class WatchlistRepository:
     """Repository class for watchlist database operations."""
@@ -28,6 +165,44 @@ class WatchlistRepository:
             return self.db_session
         return get_database_manager().get_session()
 
+    def _get_or_create_watchlist_id(
+        self, session: Session, user_id: str, watchlist_name: Optional[str]
+    ) -> Optional[int]:
+        """ID of a watchlist; the default watchlist is created if missing."""
+        watchlist_id = session.execute(
+            select(Watchlist.id).where(_watchlist_filter(user_id, watchlist_name))
+        ).scalar()
+        if watchlist_id is not None or watchlist_name:
+            return watchlist_id
+
+        # Create default watchlist if it doesn't exist
+        watchlist = Watchlist(
+            user_id=user_id,
+            name=DEFAULT_WATCHLIST_NAME,
+            description="Default watchlist",
+            is_default=True,
+        )
+        session.add(watchlist)
+        session.flush()  # Get the ID without committing
+        return watchlist.id
+
+    def _get_one(self, *criteria) -> Optional[WatchlistDTO]:
+        """Load one watchlist with its items in a single query."""
+        session = self._get_session()
+
+        try:
+            watchlist = (
+                session.query(Watchlist)
+                .options(joinedload(Watchlist.items))
+                .filter(*criteria)
+                .first()
+            )
+            return WatchlistDTO.from_model(watchlist) if watchlist else None
+
+        finally:
+            if not self.db_session:
+                session.close()
+
     def create_watchlist(
         self,
         user_id: str,
@@ -35,7 +210,7 @@ class WatchlistRepository:
         description: str = "",
         is_default: bool = False,
         is_public: bool = False,
-    ) -> Optional[Watchlist]:
+    ) -> Optional[WatchlistDTO]:
         """Create a new watchlist for a user."""
         session = self._get_session()
 
@@ -58,10 +233,7 @@ class WatchlistRepository:
             session.commit()
             session.refresh(watchlist)
 
-            # Expunge to avoid session issues
-            session.expunge(watchlist)
-
-            return watchlist
+            return WatchlistDTO.from_model(watchlist, include_items=False)
 
         except IntegrityError:
             session.rollback()
@@ -73,121 +245,40 @@ class WatchlistRepository:
             if not self.db_session:
                 session.close()
 
-    def get_watchlist(self, user_id: str, watchlist_name: str) -> Optional[Watchlist]:
+    def get_watchlist(
+        self, user_id: str, watchlist_name: str
+    ) -> Optional[WatchlistDTO]:
         """Get a specific watchlist by user ID and name."""
-        session = self._get_session()
+        return self._get_one(
+            Watchlist.user_id == user_id, Watchlist.name == watchlist_name
+        )
 
-        try:
-            watchlist = (
-                session.query(Watchlist)
-                .filter(Watchlist.user_id == user_id, Watchlist.name == watchlist_name)
-                .first()
-            )
-
-            if watchlist:
-                # Eagerly load items to avoid lazy loading issues
-                _ = len(watchlist.items)  # This triggers the lazy load
-                for item in watchlist.items:
-                    # Access all needed properties while session is active
-                    _ = (
-                        item.ticker,
-                        item.notes,
-                        item.order_index,
-                        item.added_at,
-                        item.updated_at,
-                    )
-
-            return watchlist
-
-        finally:
-            if not self.db_session:
-                session.close()
-
-    def get_watchlist_by_id(self, watchlist_id: int) -> Optional[Watchlist]:
+    def get_watchlist_by_id(self, watchlist_id: int) -> Optional[WatchlistDTO]:
         """Get a watchlist by ID."""
-        session = self._get_session()
-
-        try:
-            watchlist = (
-                session.query(Watchlist).filter(Watchlist.id == watchlist_id).first()
-            )
-
-            if watchlist:
-                # Eagerly load items to avoid lazy loading issues
-                _ = len(watchlist.items)  # This triggers the lazy load
-                for item in watchlist.items:
-                    # Access all needed properties while session is active
-                    _ = (
-                        item.ticker,
-                        item.notes,
-                        item.order_index,
-                        item.added_at,
-                        item.updated_at,
-                    )
-
-            return watchlist
-
-        finally:
-            if not self.db_session:
-                session.close()
+        return self._get_one(Watchlist.id == watchlist_id)
 
-    def get_default_watchlist(self, user_id: str) -> Optional[Watchlist]:
+    def get_default_watchlist(self, user_id: str) -> Optional[WatchlistDTO]:
         """Get user's default watchlist."""
-        session = self._get_session()
+        return self._get_one(Watchlist.user_id == user_id, Watchlist.is_default)
 
-        try:
-            watchlist = (
-                session.query(Watchlist)
-                .filter(Watchlist.user_id == user_id, Watchlist.is_default)
-                .first()
-            )
+    def get_user_watchlists(self, user_id: str) -> List[WatchlistDTO]:
+        """Get all watchlists for a user.
 
-            if watchlist:
-                # Eagerly load items to avoid lazy loading issues
-                _ = len(watchlist.items)  # This triggers the lazy load
-                for item in watchlist.items:
-                    # Access all needed properties while session is active
-                    _ = (
-                        item.ticker,
-                        item.notes,
-                        item.order_index,
-                        item.added_at,
-                        item.updated_at,
-                    )
-
-            return watchlist
-
-        finally:
-            if not self.db_session:
-                session.close()
-
-    def get_user_watchlists(self, user_id: str) -> List[Watchlist]:
-        """Get all watchlists for a user."""
+        Items of all watchlists are loaded with one additional query,
+        independent of the number of watchlists.
+        """
         session = self._get_session()
 
         try:
             watchlists = (
                 session.query(Watchlist)
+                .options(selectinload(Watchlist.items))
                 .filter(Watchlist.user_id == user_id)
                 .order_by(desc(Watchlist.is_default), asc(Watchlist.name))
                 .all()
             )
 
-            # Eagerly load items for all watchlists to avoid lazy loading issues
-            for watchlist in watchlists:
-                # Force loading of items while session is still active
-                _ = len(watchlist.items)  # This triggers the lazy load
-                for item in watchlist.items:
-                    # Access all needed properties while session is active
-                    _ = (
-                        item.ticker,
-                        item.notes,
-                        item.order_index,
-                        item.added_at,
-                        item.updated_at,
-                    )
-
-            return watchlists
+            return [WatchlistDTO.from_model(watchlist) for watchlist in watchlists]
 
         finally:
             if not self.db_session:
@@ -198,19 +289,18 @@ class WatchlistRepository:
         session = self._get_session()
 
         try:
-            watchlist = (
-                session.query(Watchlist)
-                .filter(Watchlist.user_id == user_id, Watchlist.name == watchlist_name)
-                .first()
+            watchlist_id = _watchlist_id_subquery(user_id, watchlist_name)
+            session.execute(
+                delete(WatchlistItem).where(WatchlistItem.watchlist_id == watchlist_id)
+            )
+            result = session.execute(
+                delete(Watchlist).where(
+                    Watchlist.user_id == user_id, Watchlist.name == watchlist_name
+                )
             )
-
-            if not watchlist:
-                return False
-
-            session.delete(watchlist)
             session.commit()
 
-            return True
+            return result.rowcount > 0
 
         except Exception:
             session.rollback()
@@ -228,65 +318,42 @@ class WatchlistRepository:
         notes: str = "",
         order_index: Optional[int] = None,
     ) -> bool:
-        """Add a asset to a watchlist."""
+        """Add a asset to a watchlist.
+
+        The display name defaults to the asset's name in the assets table and
+        the order index to ``MAX(order_index) + 1``; both are computed inside
+        the INSERT statement.
+        """
         session = self._get_session()
 
         try:
-            # Get watchlist within the same session to avoid detached objects
-            if watchlist_name:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(
-                        Watchlist.user_id == user_id, Watchlist.name == watchlist_name
-                    )
-                    .first()
-                )
-            else:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(Watchlist.user_id == user_id, Watchlist.is_default)
-                    .first()
-                )
-
-                if not watchlist:
-                    # Create default watchlist if it doesn't exist
-                    watchlist = Watchlist(
-                        user_id=user_id,
-                        name="My Watchlist",
-                        description="Default watchlist",
-                        is_default=True,
-                    )
-                    session.add(watchlist)
-                    session.flush()  # Get the ID without committing
-
-            if not watchlist:
+            watchlist_id = self._get_or_create_watchlist_id(
+                session, user_id, watchlist_name
+            )
+            if watchlist_id is None:
                 return False
 
-            # If display_name is not provided, try to get it from assets table
             if not display_name:
-                asset = session.query(Asset).filter(Asset.symbol == ticker).first()
-                if asset and asset.name:
-                    display_name = asset.name
+                display_name = (
+                    select(Asset.name).where(Asset.symbol == ticker).scalar_subquery()
+                )
 
-            # Set order_index if not provided
             if order_index is None:
-                max_order = (
-                    session.query(WatchlistItem)
-                    .filter(WatchlistItem.watchlist_id == watchlist.id)
-                    .count()
+                order_index = (
+                    select(func.coalesce(func.max(WatchlistItem.order_index) + 1, 0))
+                    .where(WatchlistItem.watchlist_id == watchlist_id)
+                    .scalar_subquery()
                 )
-                order_index = max_order
-
-            # Create watchlist item
-            item = WatchlistItem(
-                watchlist_id=watchlist.id,
-                ticker=ticker,
-                display_name=display_name,
-                notes=notes,
-                order_index=order_index,
-            )
 
-            session.add(item)
+            session.execute(
+                insert(WatchlistItem).values(
+                    watchlist_id=watchlist_id,
+                    ticker=ticker,
+                    display_name=display_name,
+                    notes=notes,
+                    order_index=order_index,
+                )
+            )
             session.commit()
 
             return True
@@ -301,49 +368,176 @@ class WatchlistRepository:
             if not self.db_session:
                 session.close()
 
+    def add_assets_to_watchlist(
+        self,
+        user_id: str,
+        tickers: List[str],
+        watchlist_name: Optional[str] = None,
+        display_names: Optional[Dict[str, str]] = None,
+    ) -> int:
+        """Append many assets to a watchlist in one transaction.
+
+        Tickers already in the watchlist are skipped. Display names default
+        to the asset names in the assets table.
+
+        Args:
+            user_id: User identifier
+            tickers: Tickers to add, in display order
+            watchlist_name: Watchlist name (default watchlist if None)
+            display_names: Optional ticker -> display name overrides
+
+        Returns:
+            Number of assets added
+        """
+        display_names = display_names or {}
+        session = self._get_session()
+
+        try:
+            watchlist_id = self._get_or_create_watchlist_id(
+                session, user_id, watchlist_name
+            )
+            if watchlist_id is None:
+                return 0
+
+            existing = session.execute(
+                select(WatchlistItem.ticker, WatchlistItem.order_index).where(
+                    WatchlistItem.watchlist_id == watchlist_id
+                )
+            ).all()
+            present = {row.ticker for row in existing}
+            new_tickers = [t for t in dict.fromkeys(tickers) if t not in present]
+            if not new_tickers:
+                session.commit()
+                return 0
+
+            missing_names = [t for t in new_tickers if not display_names.get(t)]
+            asset_names = (
+                dict(
+                    session.execute(
+                        select(Asset.symbol, Asset.name).where(
+                            Asset.symbol.in_(missing_names)
+                        )
+                    ).all()
+                )
+                if missing_names
+                else {}
+            )
+
+            next_index = max((row.order_index for row in existing), default=-1) + 1
+            session.execute(
+                insert(WatchlistItem),
+                [
+                    {
+                        "watchlist_id": watchlist_id,
+                        "ticker": ticker,
+                        "display_name": display_names.get(ticker)
+                        or asset_names.get(ticker),
+                        "notes": "",
+                        "order_index": next_index + offset,
+                    }
+                    for offset, ticker in enumerate(new_tickers)
+                ],
+            )
+            session.commit()
+
+            return len(new_tickers)
+
+        except Exception:
+            session.rollback()
+            return 0
+        finally:
+            if not self.db_session:
+                session.close()
+
     def remove_asset_from_watchlist(
         self, user_id: str, ticker: str, watchlist_name: Optional[str] = None
     ) -> bool:
         """Remove a asset from a watchlist."""
+        return self.remove_assets_from_watchlist(user_id, [ticker], watchlist_name) > 0
+
+    def remove_assets_from_watchlist(
+        self,
+        user_id: str,
+        tickers: List[str],
+        watchlist_name: Optional[str] = None,
+    ) -> int:
+        """Remove many assets from a watchlist with a single DELETE.
+
+        Args:
+            user_id: User identifier
+            tickers: Tickers to remove
+            watchlist_name: Watchlist name (default watchlist if None)
+
+        Returns:
+            Number of assets removed
+        """
+        if not tickers:
+            return 0
+
         session = self._get_session()
 
         try:
-            # Get watchlist within the same session
-            if watchlist_name:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(
-                        Watchlist.user_id == user_id, Watchlist.name == watchlist_name
-                    )
-                    .first()
-                )
-            else:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(Watchlist.user_id == user_id, Watchlist.is_default)
-                    .first()
+            result = session.execute(
+                delete(WatchlistItem).where(
+                    WatchlistItem.watchlist_id
+                    == _watchlist_id_subquery(user_id, watchlist_name),
+                    WatchlistItem.ticker.in_(tickers),
                 )
+            )
+            session.commit()
 
-            if not watchlist:
-                return False
+            return result.rowcount
 
-            # Find and delete the item
-            item = (
-                session.query(WatchlistItem)
-                .filter(
-                    WatchlistItem.watchlist_id == watchlist.id,
-                    WatchlistItem.ticker == ticker,
-                )
-                .first()
-            )
+        except Exception:
+            session.rollback()
+            return 0
+        finally:
+            if not self.db_session:
+                session.close()
 
-            if not item:
-                return False
+    def reorder_watchlist(
+        self,
+        user_id: str,
+        tickers: List[str],
+        watchlist_name: Optional[str] = None,
+    ) -> bool:
+        """Reorder a watchlist with a single UPDATE.
+
+        Listed tickers are moved to the front in the given order; the others
+        follow in their previous relative order.
+
+        Args:
+            user_id: User identifier
+            tickers: Tickers in their new display order
+            watchlist_name: Watchlist name (default watchlist if None)
 
-            session.delete(item)
+        Returns:
+            True if the watchlist exists and was reordered
+        """
+        tickers = list(dict.fromkeys(tickers))
+        session = self._get_session()
+
+        try:
+            new_index = (
+                case(
+                    {ticker: index for index, ticker in enumerate(tickers)},
+                    value=WatchlistItem.ticker,
+                    else_=WatchlistItem.order_index + len(tickers),
+                )
+                if tickers
+                else WatchlistItem.order_index
+            )
+            result = session.execute(
+                update(WatchlistItem)
+                .where(
+                    WatchlistItem.watchlist_id
+                    == _watchlist_id_subquery(user_id, watchlist_name)
+                )
+                .values(order_index=new_index)
+            )
             session.commit()
 
-            return True
+            return result.rowcount > 0
 
         except Exception:
             session.rollback()
@@ -354,42 +548,20 @@ class WatchlistRepository:
 
     def get_watchlist_assets(
         self, user_id: str, watchlist_name: Optional[str] = None
-    ) -> List[WatchlistItem]:
+    ) -> List[WatchlistItemDTO]:
         """Get all assets in a watchlist."""
         session = self._get_session()
 
         try:
-            # Get watchlist within the same session
-            if watchlist_name:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(
-                        Watchlist.user_id == user_id, Watchlist.name == watchlist_name
-                    )
-                    .first()
-                )
-            else:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(Watchlist.user_id == user_id, Watchlist.is_default)
-                    .first()
-                )
-
-            if not watchlist:
-                return []
-
             items = (
                 session.query(WatchlistItem)
-                .filter(WatchlistItem.watchlist_id == watchlist.id)
+                .join(Watchlist, WatchlistItem.watchlist_id == Watchlist.id)
+                .filter(_watchlist_filter(user_id, watchlist_name))
                 .order_by(asc(WatchlistItem.order_index))
                 .all()
             )
 
-            # Expunge items to avoid session issues
-            for item in items:
-                session.expunge(item)
-
-            return items
+            return [WatchlistItemDTO.from_model(item) for item in items]
 
         finally:
             if not self.db_session:
@@ -402,26 +574,20 @@ class WatchlistRepository:
         session = self._get_session()
 
         try:
-            # Get watchlist
-            if watchlist_name:
-                watchlist = self.get_watchlist(user_id, watchlist_name)
-            else:
-                watchlist = self.get_default_watchlist(user_id)
-
-            if not watchlist:
-                return False
-
-            item = (
-                session.query(WatchlistItem)
-                .filter(
-                    WatchlistItem.watchlist_id == watchlist.id,
-                    WatchlistItem.ticker == ticker,
-                )
-                .first()
+            return bool(
+                session.execute(
+                    select(
+                        select(WatchlistItem.id)
+                        .join(Watchlist, WatchlistItem.watchlist_id == Watchlist.id)
+                        .where(
+                            _watchlist_filter(user_id, watchlist_name),
+                            WatchlistItem.ticker == ticker,
+                        )
+                        .exists()
+                    )
+                ).scalar()
             )
 
-            return item is not None
-
         finally:
             if not self.db_session:
                 session.close()
@@ -437,42 +603,18 @@ class WatchlistRepository:
         session = self._get_session()
 
         try:
-            # Get watchlist within the same session
-            if watchlist_name:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(
-                        Watchlist.user_id == user_id, Watchlist.name == watchlist_name
-                    )
-                    .first()
-                )
-            else:
-                watchlist = (
-                    session.query(Watchlist)
-                    .filter(Watchlist.user_id == user_id, Watchlist.is_default)
-                    .first()
-                )
-
-            if not watchlist:
-                return False
-
-            # Update the item
-            item = (
-                session.query(WatchlistItem)
-                .filter(
-                    WatchlistItem.watchlist_id == watchlist.id,
+            result = session.execute(
+                update(WatchlistItem)
+                .where(
+                    WatchlistItem.watchlist_id
+                    == _watchlist_id_subquery(user_id, watchlist_name),
                     WatchlistItem.ticker == ticker,
                 )
-                .first()
+                .values(notes=notes)
             )
-
-            if not item:
-                return False
-
-            item.notes = notes
             session.commit()
 
-            return True
+            return result.rowcount > 0
 
         except Exception:
             session.rollback()
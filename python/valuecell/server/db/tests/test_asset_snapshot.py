@@ -0,0 +1,145 @@
+"""Tests for seeding assets from the offline snapshot."""
+
+import json
+
+import pytest
+from sqlalchemy import event
+
+from valuecell.adapters.assets.asset_metadata import asset_from_record
+from valuecell.server.db.asset_snapshot import (
+    enrich_assets,
+    load_asset_snapshot,
+    snapshot_tickers,
+)
+from valuecell.server.db.connection import DatabaseManager
+from valuecell.server.db.init_db import DatabaseInitializer
+from valuecell.server.db.repositories.asset_repository import AssetRepository
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'seed.db'}")
+    manager.create_tables()
+    yield manager
+    manager.engine.dispose()
+
+
+@pytest.fixture
+def repository(db_manager):
+    class SessionRepository(AssetRepository):
+        def _get_session(self):
+            return db_manager.get_session()
+
+    return SessionRepository()
+
+
+def test_bundled_snapshot_covers_default_universe():
+    assets = load_asset_snapshot()
+    symbols = [asset["symbol"] for asset in assets]
+
+    assert {"NASDAQ:IXIC", "HKEX:HSI", "SSE:000001"} <= set(symbols)
+    assert len(symbols) == len(set(symbols))
+    for asset in assets:
+        metadata = asset["asset_metadata"]
+        assert metadata["exchange"] == asset["symbol"].split(":")[0]
+        assert metadata["names"]["en-US"] == asset["name"]
+        assert metadata["source"] == "snapshot"
+
+
+def test_invalid_snapshot_entries_are_skipped(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": 2,
+                "assets": [
+                    {"symbol": "AAPL", "name": "No exchange"},
+                    {"symbol": "NASDAQ:AAPL", "name": "Apple Inc."},
+                ],
+            }
+        )
+    )
+
+    assert snapshot_tickers(path) == ["NASDAQ:AAPL"]
+    assert load_asset_snapshot(tmp_path / "missing.json") == []
+
+
+def test_seed_writes_snapshot_in_one_statement(db_manager, repository):
+    statements = []
+    event.listen(
+        db_manager.engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+
+    assert DatabaseInitializer(db_manager=db_manager).seed_assets()
+
+    inserts = [s for s in statements if s.upper().startswith("INSERT")]
+    assert len(inserts) == 1
+    assert "ON CONFLICT" in inserts[0].upper()
+
+    records = repository.get_assets_by_symbols(snapshot_tickers())
+    assert len(records) == len(snapshot_tickers())
+
+    moutai = asset_from_record(repository.get_asset_by_symbol("SSE:600519"))
+    assert moutai.get_localized_name("zh-Hans") == "贵州茅台"
+    assert moutai.market_info.timezone == "Asia/Shanghai"
+
+
+def test_reseed_keeps_assets_fetched_from_adapters(db_manager, repository):
+    initializer = DatabaseInitializer(db_manager=db_manager)
+    assert initializer.seed_assets()
+
+    fetched = repository.get_asset_by_symbol("NASDAQ:AAPL")
+    repository.upsert_asset(
+        symbol="NASDAQ:AAPL",
+        name="Apple Inc. (fetched)",
+        asset_type="stock",
+        refreshed_at=fetched.created_at,
+    )
+    repository.update_asset(symbol="NASDAQ:MSFT", name="Renamed")
+
+    assert initializer.seed_assets()
+
+    assert repository.get_asset_by_symbol("NASDAQ:AAPL").name == (
+        "Apple Inc. (fetched)"
+    )
+    assert repository.get_asset_by_symbol("NASDAQ:MSFT").name == (
+        "Microsoft Corporation"
+    )
+
+
+def test_empty_bulk_upsert(repository):
+    assert repository.bulk_upsert_assets([]) == 0
+
+
+class FakeCache:
+    def __init__(self):
+        self.refreshed = []
+        self.background = []
+
+    def refresh_many(self, tickers):
+        self.refreshed.extend(tickers)
+        return len(tickers)
+
+    def refresh_in_background(self, tickers):
+        self.background.extend(tickers)
+
+
+class FakeManager:
+    def __init__(self):
+        self.metadata_cache = None
+
+    def enable_asset_metadata_cache(self):
+        self.metadata_cache = FakeCache()
+        return self.metadata_cache
+
+
+def test_enrichment_runs_through_metadata_cache():
+    manager = FakeManager()
+
+    assert enrich_assets(manager=manager) == 0
+    assert manager.metadata_cache.background == snapshot_tickers()
+
+    assert enrich_assets(["NASDAQ:AAPL"], manager=manager, wait=True) == 1
+    assert manager.metadata_cache.refreshed == ["NASDAQ:AAPL"]
@@ -0,0 +1,113 @@
+"""Tests for the SQLite engine configuration and async session path."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from valuecell.server.db.connection import DatabaseManager, to_async_url
+from valuecell.server.db.repositories.watchlist_repository import (
+    WatchlistDTO,
+    WatchlistRepository,
+)
+
+USER = "user-1"
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'server.db'}")
+    manager.create_tables()
+    yield manager
+    asyncio.run(manager.dispose_async())
+    manager.engine.dispose()
+
+
+def test_to_async_url():
+    assert to_async_url("sqlite:///./valuecell.db") == (
+        "sqlite+aiosqlite:///./valuecell.db"
+    )
+    assert to_async_url("sqlite+aiosqlite:///x.db") == "sqlite+aiosqlite:///x.db"
+    assert to_async_url("postgresql://u:p@host/db") == "postgresql://u:p@host/db"
+
+
+def test_sync_engine_uses_wal_and_busy_timeout(manager):
+    with manager.get_engine().connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == (
+            manager.busy_timeout_ms
+        )
+
+
+def test_memory_database_keeps_a_single_connection():
+    manager = DatabaseManager("sqlite:///:memory:")
+    manager.create_tables()
+
+    repository = WatchlistRepository(manager.get_session())
+    assert repository.create_watchlist(USER, "Tech") is not None
+    assert WatchlistRepository(manager.get_session()).get_watchlist(USER, "Tech")
+    manager.engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_engines_apply_pragmas(manager):
+    async with manager.get_async_engine().connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 0
+
+    async with manager.get_async_engine(read_only=True).connect() as conn:
+        assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+        with pytest.raises(OperationalError):
+            await conn.execute(
+                text("INSERT INTO watchlists (user_id, name) VALUES ('u', 'w')")
+            )
+
+    assert manager.get_async_engine(read_only=True).pool.size() == (
+        manager.reader_pool_size
+    )
+    assert manager.get_async_engine().pool.size() == 1
+
+
+@pytest.mark.asyncio
+async def test_repositories_run_on_async_sessions(manager):
+    created = await manager.run_with_session(
+        lambda session: WatchlistRepository(session).create_watchlist(
+            USER, "Tech", is_default=True
+        )
+    )
+    assert isinstance(created, WatchlistDTO)
+
+    added = await manager.run_with_session(
+        lambda session: WatchlistRepository(session).add_assets_to_watchlist(
+            USER, ["NASDAQ:AAPL", "NASDAQ:MSFT"], "Tech"
+        )
+    )
+    assert added == 2
+
+    # Concurrent reads share the read-only pool
+    results = await asyncio.gather(
+        *(
+            manager.run_with_session(
+                lambda session: WatchlistRepository(session).get_watchlist(
+                    USER, "Tech"
+                ),
+                read_only=True,
+            )
+            for _ in range(10)
+        )
+    )
+    assert all(r.tickers == ["NASDAQ:AAPL", "NASDAQ:MSFT"] for r in results)
+
+    # Writes through the async engine are visible to the sync engine
+    synced = WatchlistRepository(manager.get_session()).get_default_watchlist(USER)
+    assert synced.name == "Tech"
+
+
+@pytest.mark.asyncio
+async def test_async_session_dependency(manager):
+    sessions = manager.get_async_db_session(read_only=True)
+    session = await anext(sessions)
+    count = (await session.execute(text("SELECT COUNT(*) FROM watchlists"))).scalar()
+    assert count == 0
+    await sessions.aclose()
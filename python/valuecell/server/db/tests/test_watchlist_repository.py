@@ -0,0 +1,205 @@
+"""Tests for WatchlistRepository queries and bulk operations."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from valuecell.server.db.models.asset import Asset
+from valuecell.server.db.models.base import Base
+from valuecell.server.db.repositories.watchlist_repository import (
+    WatchlistDTO,
+    WatchlistRepository,
+)
+
+USER = "user-1"
+
+
+class QueryCounter:
+    """Counts SQL statements executed on an engine."""
+
+    def __init__(self, engine):
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @contextmanager
+    def count(self):
+        start = len(self.statements)
+        counted = []
+        yield counted
+        counted.extend(
+            statement
+            for statement in self.statements[start:]
+            # Transaction control is not a query
+            if not statement.upper().startswith(("BEGIN", "COMMIT", "ROLLBACK"))
+        )
+
+
+class SessionRepository(WatchlistRepository):
+    """Watchlist repository opening sessions on a test database."""
+
+    def __init__(self, session_factory):
+        super().__init__()
+        self.session_factory = session_factory
+
+    def _get_session(self):
+        return self.session_factory()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'watchlists.db'}")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def repository(engine):
+    return SessionRepository(sessionmaker(bind=engine))
+
+
+@pytest.fixture
+def queries(engine):
+    return QueryCounter(engine)
+
+
+def test_reads_use_constant_query_counts(repository, queries):
+    for index in range(3):
+        repository.create_watchlist(USER, f"List {index}", is_default=index == 0)
+        repository.add_assets_to_watchlist(
+            USER, [f"NASDAQ:T{i}" for i in range(10)], f"List {index}"
+        )
+
+    with queries.count() as single:
+        watchlist = repository.get_watchlist(USER, "List 1")
+    assert len(single) == 1
+    assert isinstance(watchlist, WatchlistDTO)
+    assert len(watchlist.items) == 10
+
+    with queries.count() as default:
+        repository.get_default_watchlist(USER)
+    assert len(default) == 1
+
+    with queries.count() as listed:
+        watchlists = repository.get_user_watchlists(USER)
+    # One query for the watchlists, one for all their items
+    assert len(listed) == 2
+    assert [w.name for w in watchlists] == ["List 0", "List 1", "List 2"]
+
+    # DTOs are usable after the session closed
+    assert watchlists[2].to_dict()["items_count"] == 10
+    assert watchlists[2].items[3].symbol == "T3"
+
+
+def test_add_computes_order_index_inside_insert(repository, queries):
+    repository.create_watchlist(USER, "Tech", is_default=True)
+    repository.add_asset_to_watchlist(USER, "NASDAQ:AAPL", order_index=5)
+
+    with queries.count() as added:
+        assert repository.add_asset_to_watchlist(USER, "NASDAQ:MSFT")
+    # Watchlist lookup and the INSERT
+    assert len(added) == 2
+    assert "max(" in added[-1].lower()
+
+    items = repository.get_watchlist_assets(USER)
+    assert [(item.ticker, item.order_index) for item in items] == [
+        ("NASDAQ:AAPL", 5),
+        ("NASDAQ:MSFT", 6),
+    ]
+
+    # Duplicates violate the unique constraint
+    assert not repository.add_asset_to_watchlist(USER, "NASDAQ:MSFT")
+
+
+def test_add_uses_asset_name_and_creates_default_watchlist(repository, engine):
+    session = sessionmaker(bind=engine)()
+    session.add(Asset(symbol="NASDAQ:NVDA", name="NVIDIA", asset_type="stock"))
+    session.commit()
+    session.close()
+
+    assert repository.add_asset_to_watchlist(USER, "NASDAQ:NVDA")
+
+    watchlist = repository.get_default_watchlist(USER)
+    assert watchlist.name == "My Watchlist"
+    assert watchlist.items[0].display_name == "NVIDIA"
+    assert watchlist.items[0].order_index == 0
+
+
+def test_bulk_add_remove_and_reorder(repository, queries):
+    repository.create_watchlist(USER, "Bulk")
+    repository.add_asset_to_watchlist(USER, "NASDAQ:AAPL", "Bulk")
+
+    tickers = ["NASDAQ:AAPL", "NASDAQ:MSFT", "NASDAQ:NVDA", "NASDAQ:AMZN"]
+    with queries.count() as added:
+        assert repository.add_assets_to_watchlist(USER, tickers, "Bulk") == 3
+    # Watchlist, existing items, asset names and one batched INSERT
+    assert len(added) <= 4
+    assert repository.get_watchlist(USER, "Bulk").tickers == tickers
+
+    with queries.count() as reordered:
+        assert repository.reorder_watchlist(
+            USER, ["NASDAQ:AMZN", "NASDAQ:MSFT"], "Bulk"
+        )
+    assert len(reordered) == 1
+    assert repository.get_watchlist(USER, "Bulk").tickers == [
+        "NASDAQ:AMZN",
+        "NASDAQ:MSFT",
+        "NASDAQ:AAPL",
+        "NASDAQ:NVDA",
+    ]
+
+    with queries.count() as removed:
+        assert (
+            repository.remove_assets_from_watchlist(
+                USER, ["NASDAQ:AAPL", "NASDAQ:NVDA", "NASDAQ:TSLA"], "Bulk"
+            )
+            == 2
+        )
+    assert len(removed) == 1
+    assert repository.get_watchlist(USER, "Bulk").tickers == [
+        "NASDAQ:AMZN",
+        "NASDAQ:MSFT",
+    ]
+
+    # Appending continues after the highest order index
+    repository.add_asset_to_watchlist(USER, "NASDAQ:META", "Bulk")
+    assert repository.get_watchlist(USER, "Bulk").tickers[-1] == "NASDAQ:META"
+
+
+def test_single_statement_updates(repository, queries):
+    repository.create_watchlist(USER, "Notes")
+    repository.add_asset_to_watchlist(USER, "NASDAQ:AAPL", "Notes")
+
+    with queries.count() as updated:
+        assert repository.update_asset_notes(USER, "NASDAQ:AAPL", "long", "Notes")
+    assert len(updated) == 1
+    assert repository.get_watchlist(USER, "Notes").items[0].notes == "long"
+
+    assert repository.is_asset_in_watchlist(USER, "NASDAQ:AAPL", "Notes")
+    assert not repository.is_asset_in_watchlist(USER, "NASDAQ:MSFT", "Notes")
+    assert not repository.update_asset_notes(USER, "NASDAQ:MSFT", "x", "Notes")
+    assert not repository.remove_asset_from_watchlist(USER, "NASDAQ:AAPL", "Other")
+
+
+def test_missing_watchlists(repository):
+    assert repository.get_watchlist(USER, "Nope") is None
+    assert repository.get_watchlist_assets(USER, "Nope") == []
+    assert not repository.add_asset_to_watchlist(USER, "NASDAQ:AAPL", "Nope")
+    assert repository.add_assets_to_watchlist(USER, ["NASDAQ:AAPL"], "Nope") == 0
+    assert not repository.reorder_watchlist(USER, ["NASDAQ:AAPL"], "Nope")
+    assert not repository.delete_watchlist(USER, "Nope")
+
+
+def test_delete_watchlist_removes_items(repository):
+    created = repository.create_watchlist(USER, "Temp")
+    assert created.to_dict()["items_count"] == 0
+    repository.add_assets_to_watchlist(USER, ["NASDAQ:AAPL", "NASDAQ:MSFT"], "Temp")
+
+    assert repository.delete_watchlist(USER, "Temp")
+    assert repository.get_watchlist(USER, "Temp") is None
+    assert repository.get_watchlist_by_id(created.id) is None
@@ -3,12 +3,13 @@ Agent stream service for handling streaming agent interactions.
 """
 
 import logging
-from typing import AsyncGenerator, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 
-from valuecell.core.coordinate.orchestrator import AgentOrchestrator
-from valuecell.core.types import UserInput, UserInputMetadata
 from valuecell.utils.uuid import generate_conversation_id
 
+if TYPE_CHECKING:
+    from valuecell.core.coordinate.orchestrator import AgentOrchestrator
+
 logger = logging.getLogger(__name__)
 
 
@@ -17,9 +18,23 @@ class AgentStreamService:
 
     def __init__(self):
         """Initialize the agent stream service."""
-        self.orchestrator = AgentOrchestrator()
+        self._orchestrator: Optional["AgentOrchestrator"] = None
         logger.info("Agent stream service initialized")
 
+    @property
+    def orchestrator(self) -> "AgentOrchestrator":
+        """Lazy load the orchestrator on the first query.
+
+        The orchestrator pulls in the agent framework and creates the planner
+        model, which is slow and needs model API keys, so server start-up
+        does not wait for it.
+        """
+        if self._orchestrator is None:
+            from valuecell.core.coordinate.orchestrator import AgentOrchestrator
+
+            self._orchestrator = AgentOrchestrator()
+        return self._orchestrator
+
     async def stream_query_agent(
         self,
         query: str,
@@ -38,6 +53,8 @@ class AgentStreamService:
             str: Content chunks from the agent response
         """
         try:
+            from valuecell.core.types import UserInput, UserInputMetadata
+
             logger.info(f"Processing streaming query: {query[:100]}...")
 
             user_id = "default_user"
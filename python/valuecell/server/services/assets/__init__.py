@@ -34,6 +34,12 @@ from .asset_service import (
     reset_asset_service,
     search_assets,
 )
+from .quote_stream import (
+    QuoteStreamHub,
+    QuoteSubscription,
+    get_quote_stream_hub,
+    reset_quote_stream_hub,
+)
 
 __version__ = "1.0.0"
 
@@ -48,4 +54,9 @@ __all__ = [
     "get_asset_price",
     "add_to_watchlist",
     "get_watchlist",
+    # Quote streaming
+    "QuoteStreamHub",
+    "QuoteSubscription",
+    "get_quote_stream_hub",
+    "reset_quote_stream_hub",
 ]
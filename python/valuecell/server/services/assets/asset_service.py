@@ -4,13 +4,20 @@ This module provides high-level service functions for asset search, watchlist ma
 and price data retrieval with i18n support.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ....adapters.assets.i18n_integration import get_asset_i18n_service
 from ....adapters.assets.manager import get_adapter_manager, get_watchlist_manager
-from ....adapters.assets.types import AssetSearchQuery, AssetType
+from ....adapters.assets.types import (
+    Asset,
+    AssetPrice,
+    AssetSearchQuery,
+    AssetSearchResult,
+    AssetType,
+)
 from ...config.i18n import get_i18n_config
 
 logger = logging.getLogger(__name__)
@@ -35,6 +42,79 @@ class AssetService:
             self._watchlist_repository = get_watchlist_repository()
         return self._watchlist_repository
 
+    def _build_search_query(
+        self,
+        query: str,
+        asset_types: Optional[List[str]],
+        exchanges: Optional[List[str]],
+        countries: Optional[List[str]],
+        limit: int,
+        language: Optional[str],
+    ) -> AssetSearchQuery:
+        # Convert string asset types to enum
+        parsed_asset_types = None
+        if asset_types:
+            parsed_asset_types = []
+            for asset_type_str in asset_types:
+                try:
+                    parsed_asset_types.append(AssetType(asset_type_str.lower()))
+                except ValueError:
+                    logger.warning(f"Invalid asset type: {asset_type_str}")
+
+        return AssetSearchQuery(
+            query=query,
+            asset_types=parsed_asset_types,
+            exchanges=exchanges,
+            countries=countries,
+            limit=limit,
+            language=language or get_i18n_config().language,
+        )
+
+    def _format_search_results(
+        self,
+        results: List[AssetSearchResult],
+        query: str,
+        asset_types: Optional[List[str]],
+        exchanges: Optional[List[str]],
+        countries: Optional[List[str]],
+        limit: int,
+        language: Optional[str],
+    ) -> Dict[str, Any]:
+        # Localize results
+        localized_results = self.i18n_service.localize_search_results(results, language)
+
+        # Convert to dictionary format
+        result_dicts = []
+        for result in localized_results:
+            result_dict = {
+                "ticker": result.ticker,
+                "asset_type": result.asset_type.value,
+                "asset_type_display": self.i18n_service.get_asset_type_display_name(
+                    result.asset_type, language
+                ),
+                "names": result.names,
+                "display_name": result.get_display_name(
+                    language or get_i18n_config().language
+                ),
+                "exchange": result.exchange,
+                "country": result.country,
+            }
+            result_dicts.append(result_dict)
+
+        return {
+            "success": True,
+            "results": result_dicts,
+            "count": len(result_dicts),
+            "query": query,
+            "filters": {
+                "asset_types": asset_types,
+                "exchanges": exchanges,
+                "countries": countries,
+                "limit": limit,
+            },
+            "language": language or get_i18n_config().language,
+        }
+
     def search_assets(
         self,
         query: str,
@@ -58,70 +138,80 @@ class AssetService:
             Dictionary containing search results and metadata
         """
         try:
-            # Convert string asset types to enum
-            parsed_asset_types = None
-            if asset_types:
-                parsed_asset_types = []
-                for asset_type_str in asset_types:
-                    try:
-                        parsed_asset_types.append(AssetType(asset_type_str.lower()))
-                    except ValueError:
-                        logger.warning(f"Invalid asset type: {asset_type_str}")
-
-            # Create search query
-            search_query = AssetSearchQuery(
-                query=query,
-                asset_types=parsed_asset_types,
-                exchanges=exchanges,
-                countries=countries,
-                limit=limit,
-                language=language or get_i18n_config().language,
+            search_query = self._build_search_query(
+                query, asset_types, exchanges, countries, limit, language
             )
-
-            # Perform search
             results = self.adapter_manager.search_assets(search_query)
-
-            # Localize results
-            localized_results = self.i18n_service.localize_search_results(
-                results, language
+            return self._format_search_results(
+                results, query, asset_types, exchanges, countries, limit, language
             )
 
-            # Convert to dictionary format
-            result_dicts = []
-            for result in localized_results:
-                result_dict = {
-                    "ticker": result.ticker,
-                    "asset_type": result.asset_type.value,
-                    "asset_type_display": self.i18n_service.get_asset_type_display_name(
-                        result.asset_type, language
-                    ),
-                    "names": result.names,
-                    "display_name": result.get_display_name(
-                        language or get_i18n_config().language
-                    ),
-                    "exchange": result.exchange,
-                    "country": result.country,
-                }
-                result_dicts.append(result_dict)
+        except Exception as e:
+            logger.error(f"Error searching assets: {e}")
+            return {"success": False, "error": str(e), "results": [], "count": 0}
 
-            return {
-                "success": True,
-                "results": result_dicts,
-                "count": len(result_dicts),
-                "query": query,
-                "filters": {
-                    "asset_types": asset_types,
-                    "exchanges": exchanges,
-                    "countries": countries,
-                    "limit": limit,
-                },
-                "language": language or get_i18n_config().language,
-            }
+    async def search_assets_async(
+        self,
+        query: str,
+        asset_types: Optional[List[str]] = None,
+        exchanges: Optional[List[str]] = None,
+        countries: Optional[List[str]] = None,
+        limit: int = 50,
+        language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of ``search_assets``."""
+        try:
+            search_query = self._build_search_query(
+                query, asset_types, exchanges, countries, limit, language
+            )
+            results = await self.adapter_manager.search_assets_async(search_query)
+            return self._format_search_results(
+                results, query, asset_types, exchanges, countries, limit, language
+            )
 
         except Exception as e:
             logger.error(f"Error searching assets: {e}")
             return {"success": False, "error": str(e), "results": [], "count": 0}
 
+    def _format_asset_info(
+        self, ticker: str, asset: Optional[Asset], language: Optional[str]
+    ) -> Dict[str, Any]:
+        if not asset:
+            return {"success": False, "error": "Asset not found", "ticker": ticker}
+
+        # Localize asset
+        localized_asset = self.i18n_service.localize_asset(asset, language)
+
+        # Convert to dictionary
+        return {
+            "success": True,
+            "ticker": localized_asset.ticker,
+            "asset_type": localized_asset.asset_type.value,
+            "asset_type_display": self.i18n_service.get_asset_type_display_name(
+                localized_asset.asset_type, language
+            ),
+            "names": localized_asset.names.names,
+            "display_name": localized_asset.get_localized_name(
+                language or get_i18n_config().language
+            ),
+            "descriptions": localized_asset.descriptions,
+            "market_info": {
+                "exchange": localized_asset.market_info.exchange,
+                "country": localized_asset.market_info.country,
+                "currency": localized_asset.market_info.currency,
+                "timezone": localized_asset.market_info.timezone,
+                "trading_hours": localized_asset.market_info.trading_hours,
+                "market_status": localized_asset.market_info.market_status.value,
+            },
+            "source_mappings": {
+                k.value: v for k, v in localized_asset.source_mappings.items()
+            },
+            "properties": localized_asset.properties,
+            "created_at": localized_asset.created_at.isoformat(),
+            "updated_at": localized_asset.updated_at.isoformat(),
+            "is_active": localized_asset.is_active,
+        }
+
     def get_asset_info(
         self, ticker: str, language: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -136,49 +226,98 @@ class AssetService:
         """
         try:
             asset = self.adapter_manager.get_asset_info(ticker)
+            return self._format_asset_info(ticker, asset, language)
 
-            if not asset:
-                return {"success": False, "error": "Asset not found", "ticker": ticker}
-
-            # Localize asset
-            localized_asset = self.i18n_service.localize_asset(asset, language)
-
-            # Convert to dictionary
-            asset_dict = {
-                "success": True,
-                "ticker": localized_asset.ticker,
-                "asset_type": localized_asset.asset_type.value,
-                "asset_type_display": self.i18n_service.get_asset_type_display_name(
-                    localized_asset.asset_type, language
-                ),
-                "names": localized_asset.names.names,
-                "display_name": localized_asset.get_localized_name(
-                    language or get_i18n_config().language
-                ),
-                "descriptions": localized_asset.descriptions,
-                "market_info": {
-                    "exchange": localized_asset.market_info.exchange,
-                    "country": localized_asset.market_info.country,
-                    "currency": localized_asset.market_info.currency,
-                    "timezone": localized_asset.market_info.timezone,
-                    "trading_hours": localized_asset.market_info.trading_hours,
-                    "market_status": localized_asset.market_info.market_status.value,
-                },
-                "source_mappings": {
-                    k.value: v for k, v in localized_asset.source_mappings.items()
-                },
-                "properties": localized_asset.properties,
-                "created_at": localized_asset.created_at.isoformat(),
-                "updated_at": localized_asset.updated_at.isoformat(),
-                "is_active": localized_asset.is_active,
-            }
+        except Exception as e:
+            logger.error(f"Error getting asset info for {ticker}: {e}")
+            return {"success": False, "error": str(e), "ticker": ticker}
 
-            return asset_dict
+    async def get_asset_info_async(
+        self, ticker: str, language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_asset_info``."""
+        try:
+            asset = await self.adapter_manager.get_asset_info_async(ticker)
+            return self._format_asset_info(ticker, asset, language)
 
         except Exception as e:
             logger.error(f"Error getting asset info for {ticker}: {e}")
             return {"success": False, "error": str(e), "ticker": ticker}
 
+    def _get_asset_types(self, tickers: List[str]) -> Dict[str, str]:
+        """Get asset types of tickers from the database, for price formatting."""
+        asset_types = {}
+        try:
+            from ...db.repositories.asset_repository import get_asset_repository
+
+            asset_repo = get_asset_repository()
+            for ticker in tickers:
+                db_asset = asset_repo.get_asset_by_symbol(ticker)
+                if db_asset:
+                    asset_types[ticker] = db_asset.asset_type
+        except Exception as e:
+            # If asset not in database, it will be treated as a regular asset with currency
+            logger.debug(f"Could not get asset_types from database: {e}")
+        return asset_types
+
+    def _format_price(
+        self,
+        ticker: str,
+        price_data: Optional[AssetPrice],
+        asset_type: Optional[str],
+        language: Optional[str],
+    ) -> Dict[str, Any]:
+        if not price_data:
+            return {
+                "success": False,
+                "error": "Price data not available",
+                "ticker": ticker,
+            }
+
+        # Format price data with localization
+        return {
+            "success": True,
+            "ticker": price_data.ticker,
+            "price": float(price_data.price),
+            "price_formatted": self.i18n_service.format_currency_amount(
+                float(price_data.price),
+                price_data.currency,
+                language,
+                asset_type,
+            ),
+            "currency": price_data.currency,
+            "timestamp": price_data.timestamp.isoformat(),
+            "volume": float(price_data.volume) if price_data.volume else None,
+            "open_price": float(price_data.open_price)
+            if price_data.open_price
+            else None,
+            "high_price": float(price_data.high_price)
+            if price_data.high_price
+            else None,
+            "low_price": float(price_data.low_price) if price_data.low_price else None,
+            "close_price": float(price_data.close_price)
+            if price_data.close_price
+            else None,
+            "change": float(price_data.change) if price_data.change else None,
+            "change_percent": float(price_data.change_percent)
+            if price_data.change_percent
+            else None,
+            "change_percent_formatted": self.i18n_service.format_percentage_change(
+                float(price_data.change_percent), language
+            )
+            if price_data.change_percent
+            else None,
+            "market_cap": float(price_data.market_cap)
+            if price_data.market_cap
+            else None,
+            "market_cap_formatted": self.i18n_service.format_market_cap(
+                float(price_data.market_cap), price_data.currency, language
+            )
+            if price_data.market_cap
+            else None,
+            "source": price_data.source.value if price_data.source else None,
+        }
+
     def get_asset_price(
         self, ticker: str, language: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -193,81 +332,80 @@ class AssetService:
         """
         try:
             price_data = self.adapter_manager.get_real_time_price(ticker)
-
-            if not price_data:
-                return {
-                    "success": False,
-                    "error": "Price data not available",
-                    "ticker": ticker,
-                }
-
             # Get asset_type from database to handle formatting correctly
-            asset_type = None
-            try:
-                from ...db.repositories.asset_repository import get_asset_repository
+            asset_type = (
+                self._get_asset_types([ticker]).get(ticker) if price_data else None
+            )
+            return self._format_price(ticker, price_data, asset_type, language)
 
-                asset_repo = get_asset_repository()
-                db_asset = asset_repo.get_asset_by_symbol(ticker)
-                if db_asset:
-                    asset_type = db_asset.asset_type
-            except Exception as e:
-                logger.debug(
-                    f"Could not get asset_type from database for {ticker}: {e}"
-                )
-                # If asset not in database, it will be treated as a regular asset with currency
-
-            # Format price data with localization
-            formatted_price = {
-                "success": True,
-                "ticker": price_data.ticker,
-                "price": float(price_data.price),
-                "price_formatted": self.i18n_service.format_currency_amount(
-                    float(price_data.price),
-                    price_data.currency,
-                    language,
-                    asset_type,
-                ),
-                "currency": price_data.currency,
-                "timestamp": price_data.timestamp.isoformat(),
-                "volume": float(price_data.volume) if price_data.volume else None,
-                "open_price": float(price_data.open_price)
-                if price_data.open_price
-                else None,
-                "high_price": float(price_data.high_price)
-                if price_data.high_price
-                else None,
-                "low_price": float(price_data.low_price)
-                if price_data.low_price
-                else None,
-                "close_price": float(price_data.close_price)
-                if price_data.close_price
-                else None,
-                "change": float(price_data.change) if price_data.change else None,
-                "change_percent": float(price_data.change_percent)
-                if price_data.change_percent
-                else None,
-                "change_percent_formatted": self.i18n_service.format_percentage_change(
-                    float(price_data.change_percent), language
-                )
-                if price_data.change_percent
-                else None,
-                "market_cap": float(price_data.market_cap)
-                if price_data.market_cap
-                else None,
-                "market_cap_formatted": self.i18n_service.format_market_cap(
-                    float(price_data.market_cap), price_data.currency, language
-                )
-                if price_data.market_cap
-                else None,
-                "source": price_data.source.value if price_data.source else None,
-            }
+        except Exception as e:
+            logger.error(f"Error getting price for {ticker}: {e}")
+            return {"success": False, "error": str(e), "ticker": ticker}
 
-            return formatted_price
+    async def get_asset_price_async(
+        self, ticker: str, language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_asset_price``."""
+        try:
+            price_data, asset_types = await asyncio.gather(
+                self.adapter_manager.get_real_time_price_async(ticker),
+                asyncio.to_thread(self._get_asset_types, [ticker]),
+            )
+            return self._format_price(
+                ticker, price_data, asset_types.get(ticker), language
+            )
 
         except Exception as e:
             logger.error(f"Error getting price for {ticker}: {e}")
             return {"success": False, "error": str(e), "ticker": ticker}
 
+    def _format_multiple_prices(
+        self,
+        tickers: List[str],
+        price_data: Dict[str, Optional[AssetPrice]],
+        asset_types: Dict[str, str],
+        language: Optional[str],
+    ) -> Dict[str, Any]:
+        formatted_prices = {}
+
+        for ticker, price in price_data.items():
+            if price:
+                asset_type = asset_types.get(ticker)
+                formatted_prices[ticker] = {
+                    "price": float(price.price),
+                    "price_formatted": self.i18n_service.format_currency_amount(
+                        float(price.price), price.currency, language, asset_type
+                    ),
+                    "currency": price.currency,
+                    "timestamp": price.timestamp.isoformat(),
+                    "change": float(price.change) if price.change else None,
+                    "change_percent": float(price.change_percent)
+                    if price.change_percent
+                    else None,
+                    "change_percent_formatted": self.i18n_service.format_percentage_change(
+                        float(price.change_percent), language
+                    )
+                    if price.change_percent
+                    else None,
+                    "volume": float(price.volume) if price.volume else None,
+                    "market_cap": float(price.market_cap) if price.market_cap else None,
+                    "market_cap_formatted": self.i18n_service.format_market_cap(
+                        float(price.market_cap), price.currency, language
+                    )
+                    if price.market_cap
+                    else None,
+                    "source": price.source.value if price.source else None,
+                }
+            else:
+                formatted_prices[ticker] = None
+
+        return {
+            "success": True,
+            "prices": formatted_prices,
+            "count": len([p for p in formatted_prices.values() if p is not None]),
+            "requested_count": len(tickers),
+        }
+
     def get_multiple_prices(
         self, tickers: List[str], language: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -282,66 +420,87 @@ class AssetService:
         """
         try:
             price_data = self.adapter_manager.get_multiple_prices(tickers)
+            asset_types = self._get_asset_types(tickers)
+            return self._format_multiple_prices(
+                tickers, price_data, asset_types, language
+            )
 
-            # Get asset_types from database for all tickers in batch
-            asset_types = {}
-            try:
-                from ...db.repositories.asset_repository import get_asset_repository
-
-                asset_repo = get_asset_repository()
-                for ticker in tickers:
-                    db_asset = asset_repo.get_asset_by_symbol(ticker)
-                    if db_asset:
-                        asset_types[ticker] = db_asset.asset_type
-            except Exception as e:
-                logger.debug(f"Could not get asset_types from database: {e}")
-
-            formatted_prices = {}
-
-            for ticker, price in price_data.items():
-                if price:
-                    asset_type = asset_types.get(ticker)
-                    formatted_prices[ticker] = {
-                        "price": float(price.price),
-                        "price_formatted": self.i18n_service.format_currency_amount(
-                            float(price.price), price.currency, language, asset_type
-                        ),
-                        "currency": price.currency,
-                        "timestamp": price.timestamp.isoformat(),
-                        "change": float(price.change) if price.change else None,
-                        "change_percent": float(price.change_percent)
-                        if price.change_percent
-                        else None,
-                        "change_percent_formatted": self.i18n_service.format_percentage_change(
-                            float(price.change_percent), language
-                        )
-                        if price.change_percent
-                        else None,
-                        "volume": float(price.volume) if price.volume else None,
-                        "market_cap": float(price.market_cap)
-                        if price.market_cap
-                        else None,
-                        "market_cap_formatted": self.i18n_service.format_market_cap(
-                            float(price.market_cap), price.currency, language
-                        )
-                        if price.market_cap
-                        else None,
-                        "source": price.source.value if price.source else None,
-                    }
-                else:
-                    formatted_prices[ticker] = None
+        except Exception as e:
+            logger.error(f"Error getting multiple prices: {e}")
+            return {"success": False, "error": str(e), "prices": {}}
 
-            return {
-                "success": True,
-                "prices": formatted_prices,
-                "count": len([p for p in formatted_prices.values() if p is not None]),
-                "requested_count": len(tickers),
-            }
+    async def get_multiple_prices_async(
+        self, tickers: List[str], language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_multiple_prices``."""
+        try:
+            price_data, asset_types = await asyncio.gather(
+                self.adapter_manager.get_multiple_prices_async(tickers),
+                asyncio.to_thread(self._get_asset_types, tickers),
+            )
+            return self._format_multiple_prices(
+                tickers, price_data, asset_types, language
+            )
 
         except Exception as e:
             logger.error(f"Error getting multiple prices: {e}")
             return {"success": False, "error": str(e), "prices": {}}
 
+    def _format_historical_prices(
+        self,
+        ticker: str,
+        historical_prices: List[AssetPrice],
+        start_date: datetime,
+        end_date: datetime,
+        interval: str,
+    ) -> Dict[str, Any]:
+        if not historical_prices:
+            return {
+                "success": False,
+                "error": "Historical price data not available",
+                "ticker": ticker,
+            }
+
+        # Format historical price data with localization
+        formatted_prices = []
+        for price_data in historical_prices:
+            formatted_price = {
+                "ticker": price_data.ticker,
+                "timestamp": price_data.timestamp.isoformat(),
+                "price": float(price_data.price),
+                "open_price": float(price_data.open_price)
+                if price_data.open_price
+                else None,
+                "high_price": float(price_data.high_price)
+                if price_data.high_price
+                else None,
+                "low_price": float(price_data.low_price)
+                if price_data.low_price
+                else None,
+                "close_price": float(price_data.close_price)
+                if price_data.close_price
+                else None,
+                "volume": float(price_data.volume) if price_data.volume else None,
+                "change": float(price_data.change) if price_data.change else None,
+                "change_percent": float(price_data.change_percent)
+                if price_data.change_percent
+                else None,
+                "currency": price_data.currency,
+                "source": price_data.source.value if price_data.source else None,
+            }
+            formatted_prices.append(formatted_price)
+
+        return {
+            "success": True,
+            "ticker": ticker,
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "interval": interval,
+            "currency": historical_prices[0].currency if historical_prices else "USD",
+            "prices": formatted_prices,
+            "count": len(formatted_prices),
+        }
+
     def get_historical_prices(
         self,
         ticker: str,
@@ -366,55 +525,30 @@ class AssetService:
             historical_prices = self.adapter_manager.get_historical_prices(
                 ticker, start_date, end_date, interval
             )
+            return self._format_historical_prices(
+                ticker, historical_prices, start_date, end_date, interval
+            )
 
-            if not historical_prices:
-                return {
-                    "success": False,
-                    "error": "Historical price data not available",
-                    "ticker": ticker,
-                }
-
-            # Format historical price data with localization
-            formatted_prices = []
-            for price_data in historical_prices:
-                formatted_price = {
-                    "ticker": price_data.ticker,
-                    "timestamp": price_data.timestamp.isoformat(),
-                    "price": float(price_data.price),
-                    "open_price": float(price_data.open_price)
-                    if price_data.open_price
-                    else None,
-                    "high_price": float(price_data.high_price)
-                    if price_data.high_price
-                    else None,
-                    "low_price": float(price_data.low_price)
-                    if price_data.low_price
-                    else None,
-                    "close_price": float(price_data.close_price)
-                    if price_data.close_price
-                    else None,
-                    "volume": float(price_data.volume) if price_data.volume else None,
-                    "change": float(price_data.change) if price_data.change else None,
-                    "change_percent": float(price_data.change_percent)
-                    if price_data.change_percent
-                    else None,
-                    "currency": price_data.currency,
-                    "source": price_data.source.value if price_data.source else None,
-                }
-                formatted_prices.append(formatted_price)
+        except Exception as e:
+            logger.error(f"Error getting historical prices for {ticker}: {e}")
+            return {"success": False, "error": str(e), "ticker": ticker}
 
-            return {
-                "success": True,
-                "ticker": ticker,
-                "start_date": start_date.isoformat(),
-                "end_date": end_date.isoformat(),
-                "interval": interval,
-                "currency": historical_prices[0].currency
-                if historical_prices
-                else "USD",
-                "prices": formatted_prices,
-                "count": len(formatted_prices),
-            }
+    async def get_historical_prices_async(
+        self,
+        ticker: str,
+        start_date: datetime,
+        end_date: datetime,
+        interval: str = "1d",
+        language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_historical_prices``."""
+        try:
+            historical_prices = await self.adapter_manager.get_historical_prices_async(
+                ticker, start_date, end_date, interval
+            )
+            return self._format_historical_prices(
+                ticker, historical_prices, start_date, end_date, interval
+            )
 
         except Exception as e:
             logger.error(f"Error getting historical prices for {ticker}: {e}")
@@ -540,6 +674,135 @@ class AssetService:
             logger.error(f"Error removing {ticker} from watchlist: {e}")
             return {"success": False, "error": str(e), "ticker": ticker}
 
+    def _load_watchlist(self, user_id: str, watchlist_name: Optional[str]):
+        # Get watchlist from database
+        if watchlist_name:
+            return self.watchlist_repository.get_watchlist(user_id, watchlist_name)
+        return self.watchlist_repository.get_default_watchlist(user_id)
+
+    def get_watchlist_tickers(
+        self, user_id: str, watchlist_name: Optional[str] = None
+    ) -> Optional[List[str]]:
+        """Get the tickers of a watchlist in display order.
+
+        Args:
+            user_id: User identifier
+            watchlist_name: Watchlist name (uses default if None)
+
+        Returns:
+            List of tickers, or None if the watchlist does not exist
+        """
+        try:
+            watchlist = self._load_watchlist(user_id, watchlist_name)
+            if not watchlist:
+                return None
+            return [
+                item.ticker
+                for item in sorted(watchlist.items, key=lambda x: x.order_index)
+            ]
+
+        except Exception as e:
+            logger.error(f"Error getting watchlist tickers: {e}")
+            return None
+
+    def refresh_watchlist_assets(
+        self,
+        user_id: str,
+        watchlist_name: Optional[str] = None,
+        force: bool = False,
+        wait: bool = False,
+    ) -> Dict[str, Any]:
+        """Refresh cached asset info of all tickers in a watchlist.
+
+        Args:
+            user_id: User identifier
+            watchlist_name: Watchlist name (uses default if None)
+            force: Also refresh info that is not stale yet
+            wait: Wait for the refresh instead of running it in the background
+
+        Returns:
+            Dictionary with the number of tickers and, if waited for, the
+            number of tickers refreshed
+        """
+        try:
+            tickers = self.get_watchlist_tickers(user_id, watchlist_name)
+            if tickers is None:
+                return {
+                    "success": False,
+                    "error": "Watchlist not found",
+                    "user_id": user_id,
+                    "watchlist_name": watchlist_name,
+                }
+
+            cache = self.adapter_manager.metadata_cache
+            if cache is None:
+                return {
+                    "success": False,
+                    "error": "Asset metadata cache is disabled",
+                    "watchlist_name": watchlist_name,
+                }
+
+            refreshed = None
+            if wait:
+                refreshed = cache.refresh_many(tickers, force=force)
+            else:
+                cache.refresh_in_background(tickers, force=force)
+
+            return {
+                "success": True,
+                "watchlist_name": watchlist_name,
+                "tickers": len(tickers),
+                "refreshed": refreshed,
+            }
+
+        except Exception as e:
+            logger.error(f"Error refreshing watchlist assets: {e}")
+            return {"success": False, "error": str(e), "user_id": user_id}
+
+    def _format_watchlist(
+        self,
+        watchlist,
+        prices_data: Dict[str, Any],
+        language: Optional[str],
+    ) -> Dict[str, Any]:
+        items = sorted(watchlist.items, key=lambda x: x.order_index)
+        display_names = self.i18n_service.get_localized_asset_names(
+            [item.ticker for item in items], language
+        )
+
+        # Build asset data
+        assets_data = []
+        for item in items:
+            asset_data = {
+                "ticker": item.ticker,
+                "display_name": display_names[item.ticker],
+                "added_at": item.added_at.isoformat(),
+                "order": item.order_index,
+                "notes": item.notes or "",
+                "alerts": [],  # Database model doesn't have alerts field
+            }
+
+            # Add price data if available
+            if item.ticker in prices_data and prices_data[item.ticker]:
+                asset_data["price_data"] = prices_data[item.ticker]
+
+            assets_data.append(asset_data)
+
+        return {
+            "success": True,
+            "watchlist": {
+                "user_id": watchlist.user_id,
+                "name": watchlist.name,
+                "description": watchlist.description or "",
+                "created_at": watchlist.created_at.isoformat(),
+                "updated_at": watchlist.updated_at.isoformat(),
+                "is_default": watchlist.is_default,
+                "is_public": watchlist.is_public,
+                "items_count": len(watchlist.items),
+                "assets": assets_data,
+            },
+        }
+
     def get_watchlist(
         self,
         user_id: str,
@@ -559,13 +822,7 @@ class AssetService:
             Dictionary containing watchlist data
         """
         try:
-            # Get watchlist from database
-            if watchlist_name:
-                watchlist = self.watchlist_repository.get_watchlist(
-                    user_id, watchlist_name
-                )
-            else:
-                watchlist = self.watchlist_repository.get_default_watchlist(user_id)
+            watchlist = self._load_watchlist(user_id, watchlist_name)
 
             if not watchlist:
                 return {
@@ -575,50 +832,52 @@ class AssetService:
                     "watchlist_name": watchlist_name,
                 }
 
-            # Get asset information and prices
-            assets_data = []
-            tickers = [item.ticker for item in watchlist.items]
-
             # Get prices if requested
+            tickers = [item.ticker for item in watchlist.items]
             prices_data = {}
             if include_prices and tickers:
                 prices_result = self.get_multiple_prices(tickers, language)
                 if prices_result["success"]:
                     prices_data = prices_result["prices"]
 
-            # Build asset data
-            for item in sorted(watchlist.items, key=lambda x: x.order_index):
-                asset_data = {
-                    "ticker": item.ticker,
-                    "display_name": self.i18n_service.get_localized_asset_name(
-                        item.ticker, language
-                    ),
-                    "added_at": item.added_at.isoformat(),
-                    "order": item.order_index,
-                    "notes": item.notes or "",
-                    "alerts": [],  # Database model doesn't have alerts field
-                }
+            return self._format_watchlist(watchlist, prices_data, language)
+
+        except Exception as e:
+            logger.error(f"Error getting watchlist: {e}")
+            return {"success": False, "error": str(e), "user_id": user_id}
 
-                # Add price data if available
-                if item.ticker in prices_data and prices_data[item.ticker]:
-                    asset_data["price_data"] = prices_data[item.ticker]
+    async def get_watchlist_async(
+        self,
+        user_id: str,
+        watchlist_name: Optional[str] = None,
+        include_prices: bool = True,
+        language: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Async variant of ``get_watchlist``."""
+        try:
+            watchlist = await asyncio.to_thread(
+                self._load_watchlist, user_id, watchlist_name
+            )
 
-                assets_data.append(asset_data)
+            if not watchlist:
+                return {
+                    "success": False,
+                    "error": "Watchlist not found",
+                    "user_id": user_id,
+                    "watchlist_name": watchlist_name,
+                }
 
-            return {
-                "success": True,
-                "watchlist": {
-                    "user_id": watchlist.user_id,
-                    "name": watchlist.name,
-                    "description": watchlist.description or "",
-                    "created_at": watchlist.created_at.isoformat(),
-                    "updated_at": watchlist.updated_at.isoformat(),
-                    "is_default": watchlist.is_default,
-                    "is_public": watchlist.is_public,
-                    "items_count": len(watchlist.items),
-                    "assets": assets_data,
-                },
-            }
+            tickers = [item.ticker for item in watchlist.items]
+            prices_data = {}
+            if include_prices and tickers:
+                prices_result = await self.get_multiple_prices_async(tickers, language)
+                if prices_result["success"]:
+                    prices_data = prices_result["prices"]
+
+            # Name localization may hit the database or adapters
+            return await asyncio.to_thread(
+                self._format_watchlist, watchlist, prices_data, language
+            )
 
         except Exception as e:
             logger.error(f"Error getting watchlist: {e}")
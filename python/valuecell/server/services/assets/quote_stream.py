@@ -0,0 +1,316 @@
+"""Push-based quote streaming for watchlists.
+
+Instead of every client polling its watchlist, connected clients subscribe to
+the tickers they display. The hub keeps one entry per unique ticker across
+all subscribers, refreshes each ticker on a market-aware cadence and pushes
+only the quote fields that changed. Upstream load therefore scales with the
+number of distinct tickers, not with users times poll rate.
+
+Slow consumers never block the hub: pending deltas are coalesced per ticker,
+so a subscriber that falls behind just receives the latest values.
+"""
+
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+
+from ....adapters.assets.market_calendar import get_calendar_for_ticker
+from ....adapters.assets.types import AssetPrice
+
+logger = logging.getLogger(__name__)
+
+# Refresh interval in seconds while the ticker's market is open, and the
+# longest pause while it is closed
+OPEN_MARKET_INTERVAL = 5.0
+CLOSED_MARKET_INTERVAL = 3600.0
+
+# Quote fields compared between refreshes; only changed ones are pushed
+QUOTE_FIELDS = ("price", "change", "change_percent", "volume", "currency")
+
+PriceFetcher = Callable[[List[str]], Awaitable[Dict[str, Optional[AssetPrice]]]]
+
+
+def default_refresh_interval(ticker: str) -> float:
+    """Refresh interval for a ticker depending on its market's calendar.
+
+    While the market is closed the ticker is not refreshed again until it
+    reopens, capped at ``CLOSED_MARKET_INTERVAL``.
+    """
+    calendar = get_calendar_for_ticker(ticker)
+    if calendar is None or calendar.is_open():
+        return OPEN_MARKET_INTERVAL
+    until_open = calendar.seconds_until_open()
+    if until_open is None:
+        return CLOSED_MARKET_INTERVAL
+    return max(OPEN_MARKET_INTERVAL, min(until_open, CLOSED_MARKET_INTERVAL))
+
+
+def quote_from_price(price: AssetPrice) -> Dict[str, Any]:
+    """Convert an adapter price into a JSON-serializable quote."""
+    return {
+        "price": float(price.price),
+        "change": float(price.change) if price.change is not None else None,
+        "change_percent": float(price.change_percent)
+        if price.change_percent is not None
+        else None,
+        "volume": float(price.volume) if price.volume is not None else None,
+        "currency": price.currency,
+        "timestamp": price.timestamp.isoformat(),
+    }
+
+
+def quote_delta(
+    previous: Optional[Dict[str, Any]], current: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Fields of ``current`` that differ from ``previous``.
+
+    Returns an empty dict if no compared field changed. The timestamp only
+    travels along with a real change.
+    """
+    if previous is None:
+        return dict(current)
+    delta = {
+        field: current.get(field)
+        for field in QUOTE_FIELDS
+        if current.get(field) != previous.get(field)
+    }
+    if delta:
+        delta["timestamp"] = current.get("timestamp")
+    return delta
+
+
+class QuoteSubscription:
+    """A client's subscription to a set of tickers."""
+
+    def __init__(self, hub: "QuoteStreamHub", tickers: Iterable[str]):
+        self.hub = hub
+        self.tickers: Set[str] = set(tickers)
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._event = asyncio.Event()
+        self.closed = False
+
+    def push(self, ticker: str, delta: Dict[str, Any]) -> None:
+        """Queue a delta, merging it into any not yet delivered one."""
+        self._pending.setdefault(ticker, {}).update(delta)
+        self._event.set()
+
+    async def next_deltas(
+        self, timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Wait for pending deltas.
+
+        Args:
+            timeout: Maximum seconds to wait, None waits indefinitely
+
+        Returns:
+            Deltas keyed by ticker; empty if the timeout expired
+        """
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout)
+            except asyncio.TimeoutError:
+                return {}
+        deltas, self._pending = self._pending, {}
+        self._event.clear()
+        return deltas
+
+    def close(self) -> None:
+        """Stop receiving quotes."""
+        if not self.closed:
+            self.closed = True
+            self.hub.unsubscribe(self)
+
+    async def __aenter__(self) -> "QuoteSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+class QuoteStreamHub:
+    """Shares quote refreshes of unique tickers across all subscribers."""
+
+    def __init__(
+        self,
+        fetch_prices: PriceFetcher,
+        refresh_interval: Callable[[str], float] = default_refresh_interval,
+        batch_size: int = 50,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize quote stream hub.
+
+        Args:
+            fetch_prices: Async batch price fetcher, usually
+                ``AdapterManager.get_multiple_prices_async``
+            refresh_interval: Seconds between refreshes of a ticker
+            batch_size: Maximum tickers per upstream batch request
+            clock: Monotonic clock, injectable for tests
+        """
+        self.fetch_prices = fetch_prices
+        self.refresh_interval = refresh_interval
+        self.batch_size = batch_size
+        self._clock = clock
+        self._subscribers: Dict[str, Set[QuoteSubscription]] = {}
+        self._next_due: Dict[str, float] = {}
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def tickers(self) -> List[str]:
+        """Tickers with at least one subscriber."""
+        return list(self._subscribers)
+
+    def subscribe(self, tickers: Iterable[str]) -> QuoteSubscription:
+        """Subscribe to quote deltas of tickers.
+
+        Known quotes are delivered right away; tickers new to the hub are
+        refreshed on the next cycle. Must be called from the event loop.
+
+        Args:
+            tickers: Internal tickers to follow
+
+        Returns:
+            Subscription to read deltas from; close it when done
+        """
+        subscription = QuoteSubscription(self, tickers)
+        now = self._clock()
+        for ticker in subscription.tickers:
+            if ticker not in self._subscribers:
+                self._subscribers[ticker] = set()
+                self._next_due[ticker] = now
+            self._subscribers[ticker].add(subscription)
+            if ticker in self._last:
+                subscription.push(ticker, dict(self._last[ticker]))
+
+        self._ensure_running()
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription) -> None:
+        """Remove a subscription, forgetting tickers nobody follows anymore."""
+        for ticker in subscription.tickers:
+            subscribers = self._subscribers.get(ticker)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[ticker]
+                self._next_due.pop(ticker, None)
+                self._last.pop(ticker, None)
+
+        if not self._subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._wakeup.set()
+
+    async def refresh_due(self) -> int:
+        """Refresh all tickers whose interval elapsed and push deltas.
+
+        Returns:
+            Number of tickers whose quote changed
+        """
+        now = self._clock()
+        due = [ticker for ticker, at in self._next_due.items() if at <= now]
+        if not due:
+            return 0
+
+        for ticker in due:
+            self._next_due[ticker] = now + self.refresh_interval(ticker)
+
+        prices: Dict[str, Optional[AssetPrice]] = {}
+        for i in range(0, len(due), self.batch_size):
+            batch = due[i : i + self.batch_size]
+            try:
+                prices.update(await self.fetch_prices(batch))
+            except Exception as e:
+                logger.warning(f"Quote refresh failed for {len(batch)} tickers: {e}")
+
+        changed = 0
+        for ticker in due:
+            price = prices.get(ticker)
+            # Tickers may have been unsubscribed while fetching
+            if price is None or ticker not in self._subscribers:
+                continue
+            quote = quote_from_price(price)
+            delta = quote_delta(self._last.get(ticker), quote)
+            if not delta:
+                continue
+            self._last[ticker] = quote
+            changed += 1
+            for subscription in self._subscribers[ticker]:
+                subscription.push(ticker, delta)
+
+        return changed
+
+    async def _run(self) -> None:
+        while self._subscribers:
+            try:
+                await self.refresh_due()
+            except Exception as e:
+                logger.error(f"Quote stream refresh cycle failed: {e}")
+
+            if not self._next_due:
+                break
+            delay = max(0.0, min(self._next_due.values()) - self._clock())
+            # New subscriptions wake the loop early
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> Dict[str, int]:
+        """Number of followed tickers and open subscriptions."""
+        subscriptions = set()
+        for subscribers in self._subscribers.values():
+            subscriptions.update(subscribers)
+        return {"tickers": len(self._subscribers), "subscriptions": len(subscriptions)}
+
+    def close(self) -> None:
+        """Stop the refresh loop and drop all subscriptions."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._subscribers.clear()
+        self._next_due.clear()
+        self._last.clear()
+
+
+# Global hub instance
+_quote_stream_hub: Optional[QuoteStreamHub] = None
+
+
+def get_quote_stream_hub() -> QuoteStreamHub:
+    """Get global quote stream hub instance."""
+    global _quote_stream_hub
+    if _quote_stream_hub is None:
+        from ....adapters.assets.manager import get_adapter_manager
+
+        _quote_stream_hub = QuoteStreamHub(
+            fetch_prices=get_adapter_manager().get_multiple_prices_async
+        )
+    return _quote_stream_hub
+
+
+def reset_quote_stream_hub() -> None:
+    """Reset global quote stream hub instance (mainly for testing)."""
+    global _quote_stream_hub
+    if _quote_stream_hub is not None:
+        _quote_stream_hub.close()
+    _quote_stream_hub = None
@@ -0,0 +1,179 @@
+"""Tests for push-based watchlist quote streaming."""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from valuecell.adapters.assets.market_calendar import get_calendar_for_ticker
+from valuecell.adapters.assets.types import AssetPrice, DataSource
+from valuecell.server.services.assets.quote_stream import (
+    CLOSED_MARKET_INTERVAL,
+    OPEN_MARKET_INTERVAL,
+    QuoteStreamHub,
+    default_refresh_interval,
+    quote_delta,
+)
+
+
+class FakePrices:
+    """Async batch price fetcher recording requested tickers."""
+
+    def __init__(self, prices):
+        self.prices = dict(prices)
+        self.requests = []
+
+    async def __call__(self, tickers):
+        self.requests.append(list(tickers))
+        return {
+            ticker: AssetPrice(
+                ticker=ticker,
+                price=Decimal(str(self.prices[ticker])),
+                currency="USD",
+                timestamp=datetime(2025, 1, 2, 15, 0),
+                source=DataSource.YFINANCE,
+            )
+            if ticker in self.prices
+            else None
+            for ticker in tickers
+        }
+
+    def fetch_count(self, ticker):
+        return sum(batch.count(ticker) for batch in self.requests)
+
+
+def make_hub(prices, interval=0.05, **kwargs):
+    fetcher = FakePrices(prices)
+    hub = QuoteStreamHub(fetcher, refresh_interval=lambda ticker: interval, **kwargs)
+    return hub, fetcher
+
+
+def test_quote_delta_only_contains_changed_fields():
+    previous = {"price": 1.0, "change": 0.1, "volume": 10.0, "timestamp": "t1"}
+    current = {"price": 1.5, "change": 0.1, "volume": 10.0, "timestamp": "t2"}
+
+    assert quote_delta(previous, current) == {"price": 1.5, "timestamp": "t2"}
+    assert quote_delta(previous, dict(previous, timestamp="t3")) == {}
+    assert quote_delta(None, current) == current
+
+
+def test_refresh_interval_follows_market_calendar(monkeypatch):
+    assert default_refresh_interval("CRYPTO:BTC") == OPEN_MARKET_INTERVAL
+
+    calendar = get_calendar_for_ticker("NASDAQ:AAPL")
+    monkeypatch.setattr(calendar, "is_open", lambda at=None: False)
+
+    # Closed: wait for the reopening, but never longer than the cap
+    monkeypatch.setattr(calendar, "seconds_until_open", lambda at=None: 120.0)
+    assert default_refresh_interval("NASDAQ:AAPL") == 120.0
+    monkeypatch.setattr(calendar, "seconds_until_open", lambda at=None: 2 * 86400)
+    assert default_refresh_interval("NASDAQ:AAPL") == CLOSED_MARKET_INTERVAL
+
+
+class TestQuoteStreamHub:
+    @pytest.mark.asyncio
+    async def test_shared_tickers_are_fetched_once(self):
+        hub, fetcher = make_hub({"NASDAQ:AAPL": 100, "NASDAQ:MSFT": 200}, interval=60)
+        try:
+            first = hub.subscribe(["NASDAQ:AAPL", "NASDAQ:MSFT"])
+            second = hub.subscribe(["NASDAQ:AAPL"])
+
+            deltas = await first.next_deltas(timeout=1)
+            assert set(deltas) == {"NASDAQ:AAPL", "NASDAQ:MSFT"}
+            assert deltas["NASDAQ:AAPL"]["price"] == 100.0
+            assert (await second.next_deltas(timeout=1))["NASDAQ:AAPL"]["price"] == 100
+
+            assert fetcher.fetch_count("NASDAQ:AAPL") == 1
+            assert hub.stats() == {"tickers": 2, "subscriptions": 2}
+        finally:
+            hub.close()
+
+    @pytest.mark.asyncio
+    async def test_only_changed_quotes_are_pushed(self):
+        hub, fetcher = make_hub({"NASDAQ:AAPL": 100, "NASDAQ:MSFT": 200})
+        try:
+            subscription = hub.subscribe(["NASDAQ:AAPL", "NASDAQ:MSFT"])
+            await subscription.next_deltas(timeout=1)
+
+            fetcher.prices["NASDAQ:AAPL"] = 101
+            deltas = await subscription.next_deltas(timeout=1)
+
+            assert set(deltas) == {"NASDAQ:AAPL"}
+            assert deltas["NASDAQ:AAPL"]["price"] == 101.0
+            assert "currency" not in deltas["NASDAQ:AAPL"]
+            # Unchanged quotes keep being refreshed but are not pushed
+            assert await subscription.next_deltas(timeout=0.2) == {}
+            assert fetcher.fetch_count("NASDAQ:MSFT") > 1
+        finally:
+            hub.close()
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_gets_snapshot_without_fetch(self):
+        hub, fetcher = make_hub({"NASDAQ:AAPL": 100}, interval=60)
+        try:
+            first = hub.subscribe(["NASDAQ:AAPL"])
+            await first.next_deltas(timeout=1)
+
+            late = hub.subscribe(["NASDAQ:AAPL"])
+            deltas = await late.next_deltas(timeout=1)
+
+            assert deltas["NASDAQ:AAPL"]["price"] == 100.0
+            assert fetcher.fetch_count("NASDAQ:AAPL") == 1
+        finally:
+            hub.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_receives_coalesced_deltas(self):
+        hub, fetcher = make_hub({"NASDAQ:AAPL": 100})
+        try:
+            subscription = hub.subscribe(["NASDAQ:AAPL"])
+            await subscription.next_deltas(timeout=1)
+
+            for price in (101, 102, 103):
+                fetcher.prices["NASDAQ:AAPL"] = price
+                await asyncio.sleep(0.1)
+
+            deltas = await subscription.next_deltas(timeout=1)
+            assert deltas == {
+                "NASDAQ:AAPL": {"price": 103.0, "timestamp": "2025-01-02T15:00:00"}
+            }
+        finally:
+            hub.close()
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_drops_unfollowed_tickers(self):
+        hub, fetcher = make_hub({"NASDAQ:AAPL": 100, "NASDAQ:MSFT": 200})
+
+        async with hub.subscribe(["NASDAQ:AAPL"]):
+            async with hub.subscribe(["NASDAQ:AAPL", "NASDAQ:MSFT"]):
+                assert set(hub.tickers) == {"NASDAQ:AAPL", "NASDAQ:MSFT"}
+            assert hub.tickers == ["NASDAQ:AAPL"]
+
+        assert hub.tickers == []
+        assert hub.stats() == {"tickers": 0, "subscriptions": 0}
+
+        # The refresh loop stopped with the last subscriber
+        requests = len(fetcher.requests)
+        await asyncio.sleep(0.15)
+        assert len(fetcher.requests) == requests
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_streaming(self):
+        hub, fetcher = make_hub({"NASDAQ:AAPL": 100})
+        calls = 0
+
+        async def flaky(tickers):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("upstream down")
+            return await fetcher(tickers)
+
+        hub.fetch_prices = flaky
+        try:
+            subscription = hub.subscribe(["NASDAQ:AAPL"])
+            deltas = await subscription.next_deltas(timeout=1)
+            assert deltas["NASDAQ:AAPL"]["price"] == 100.0
+        finally:
+            hub.close()
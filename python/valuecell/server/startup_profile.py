@@ -0,0 +1,206 @@
+"""Start-up budget harness for the ValueCell FastAPI server.
+
+Imports the app factory in a fresh interpreter with ``-X importtime``,
+calls it, and reports how long that took, which imports dominated and
+whether heavy dependencies were loaded although no request needs them yet.
+
+Usage:
+    python -m valuecell.server.startup_profile
+    python -m valuecell.server.startup_profile --top 30 --budget-ms 2500
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_TARGET = "valuecell.server.api.app:create_app"
+
+# Modules that must not be imported to create the app. They are loaded on
+# first use: the market data libraries when the adapters are configured,
+# the agent framework and model factories when the first agent query runs.
+HEAVY_MODULES = (
+    "akshare",
+    "yfinance",
+    "pandas",
+    "numpy",
+    "agno",
+    "openai",
+    "valuecell.adapters.assets.akshare_adapter",
+    "valuecell.adapters.assets.yfinance_adapter",
+    "valuecell.adapters.models",
+    "valuecell.core.agent.client",
+    "valuecell.core.coordinate",
+    "valuecell.core.plan",
+)
+
+_CHILD_SCRIPT = """
+import importlib, json, sys, time
+module_name, _, attr = sys.argv[1].partition(":")
+start = time.perf_counter()
+factory = getattr(importlib.import_module(module_name), attr)
+imported = time.perf_counter()
+factory()
+done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "wall_ms": (done - start) * 1000,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+@dataclass
+class ImportTiming:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Timings and loaded modules of one app factory run."""
+
+    target: str
+    import_ms: float
+    wall_ms: float
+    modules: List[str]
+    imports: List[ImportTiming] = field(default_factory=list)
+
+    def slowest(self, count: int = 20) -> List[ImportTiming]:
+        """Imports with the highest cumulative time."""
+        return sorted(self.imports, key=lambda t: t.cumulative_us, reverse=True)[:count]
+
+    def heavy_modules(self, heavy: Sequence[str] = HEAVY_MODULES) -> List[str]:
+        """Loaded modules that belong to one of the heavy packages."""
+        return [
+            module
+            for module in self.modules
+            if any(module == name or module.startswith(name + ".") for name in heavy)
+        ]
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """Parse the ``-X importtime`` report from interpreter stderr.
+
+    Args:
+        output: Captured stderr; other lines are ignored
+
+    Returns:
+        Import timings in the order they were reported
+    """
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            # Header line
+            continue
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=self_us,
+                cumulative_us=cumulative_us,
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def profile_startup(
+    target: str = DEFAULT_TARGET,
+    env: Optional[Dict[str, str]] = None,
+    timeout: float = 120.0,
+) -> StartupProfile:
+    """Import and call an app factory in a fresh interpreter.
+
+    Args:
+        target: Factory as ``module:attribute``
+        env: Extra environment variables for the interpreter
+        timeout: Seconds to wait for the interpreter
+
+    Returns:
+        Start-up profile
+
+    Raises:
+        RuntimeError: If the factory fails
+    """
+    project_root = Path(__file__).resolve().parents[2]
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT, target],
+        capture_output=True,
+        text=True,
+        cwd=project_root,
+        env={**os.environ, **(env or {})},
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        errors = [
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise RuntimeError(
+            f"Creating {target} failed:\n" + "\n".join(errors[-20:]).strip()
+        )
+
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+    return StartupProfile(
+        target=target,
+        import_ms=report["import_ms"],
+        wall_ms=report["wall_ms"],
+        modules=report["modules"],
+        imports=parse_importtime(result.stderr),
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Print a start-up profile and check it against a budget."""
+    parser = argparse.ArgumentParser(description="Profile ValueCell server start-up")
+    parser.add_argument("--target", default=DEFAULT_TARGET, help="module:factory")
+    parser.add_argument("--top", type=int, default=20, help="Slowest imports shown")
+    parser.add_argument(
+        "--budget-ms", type=float, help="Fail if start-up takes longer than this"
+    )
+    args = parser.parse_args(argv)
+
+    profile = profile_startup(args.target)
+
+    print(f"{profile.target}")
+    print(f"  import: {profile.import_ms:8.1f} ms")
+    print(f"  total:  {profile.wall_ms:8.1f} ms ({len(profile.modules)} modules)")
+    print("\nSlowest imports (cumulative ms):")
+    for timing in profile.slowest(args.top):
+        indent = "  " * timing.depth
+        print(f"  {timing.cumulative_us / 1000:8.1f}  {indent}{timing.module}")
+
+    status = 0
+    heavy = profile.heavy_modules()
+    if heavy:
+        print(f"\nHeavy modules loaded at start-up: {', '.join(heavy)}")
+        status = 1
+    if args.budget_ms is not None and profile.wall_ms > args.budget_ms:
+        print(
+            f"\nStart-up budget exceeded: {profile.wall_ms:.0f} > {args.budget_ms:.0f} ms"
+        )
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())